@@ -36,6 +36,7 @@ from .exceptions import (
     ErrorAggregator,
     MermaidRenderError,
     RenderingError,
+    ServiceOverloadedError,
     TemplateError,
     ThemeError,
     UnsupportedFormatError,
@@ -167,6 +168,7 @@ __all__ = [
     "MermaidRenderError",
     "ValidationError",
     "RenderingError",
+    "ServiceOverloadedError",
     "ConfigurationError",
     "UnsupportedFormatError",
     "TemplateError",
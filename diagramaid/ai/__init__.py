@@ -38,6 +38,7 @@ from .analysis import (
     DiagramAnalyzer,
     EnhancementResult,
     EnhancementType,
+    GraphAnalysis,
     QualityMetrics,
 )
 
@@ -81,6 +82,7 @@ from .providers import (
     RateLimitError,
     create_default_provider_manager,
 )
+from .response_cache import AIResponseCache
 from .suggestions import (
     Suggestion,
     SuggestionEngine,
@@ -139,6 +141,7 @@ __all__ = [
     # Analysis
     "DiagramAnalyzer",
     "ComplexityAnalysis",
+    "GraphAnalysis",
     "QualityMetrics",
     "AnalysisReport",
     # AI providers
@@ -154,6 +157,7 @@ __all__ = [
     "ProviderFactory",
     "ProviderManager",
     "GenerationResponse",
+    "AIResponseCache",
     "create_default_provider_manager",
     # Provider exceptions
     "ProviderError",
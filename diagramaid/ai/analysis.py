@@ -1,11 +1,14 @@
 """AI-powered diagram analysis and quality assessment."""
 
 import re
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from ..models.adjacency import AdjacencyIndex
+
 
 class EnhancementType(Enum):
     """Types of diagram enhancement."""
@@ -58,6 +61,39 @@ class ComplexityAnalysis:
         }
 
 
+@dataclass
+class GraphAnalysis:
+    """Structural analysis of a diagram's connection graph."""
+
+    node_count: int
+    connection_count: int
+    max_in_degree: int
+    max_out_degree: int
+    entry_nodes: list[Hashable]
+    exit_nodes: list[Hashable]
+    isolated_nodes: list[Hashable]
+    unreachable_nodes: list[Hashable]
+    cycle: list[Hashable] | None = None
+
+    @property
+    def has_cycle(self) -> bool:
+        return self.cycle is not None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "node_count": self.node_count,
+            "connection_count": self.connection_count,
+            "max_in_degree": self.max_in_degree,
+            "max_out_degree": self.max_out_degree,
+            "entry_nodes": self.entry_nodes,
+            "exit_nodes": self.exit_nodes,
+            "isolated_nodes": self.isolated_nodes,
+            "unreachable_nodes": self.unreachable_nodes,
+            "has_cycle": self.has_cycle,
+            "cycle": self.cycle,
+        }
+
+
 @dataclass
 class QualityMetrics:
     """Quality metrics for diagram assessment."""
@@ -175,6 +211,55 @@ class DiagramAnalyzer:
             complexity_level=complexity_level,
         )
 
+    def analyze_graph(
+        self,
+        adjacency: AdjacencyIndex,
+        node_ids: Iterable[Hashable] | None = None,
+    ) -> GraphAnalysis:
+        """
+        Analyze the structure of a diagram model's connection graph.
+
+        Works on the adjacency index maintained by ``FlowchartDiagram`` and
+        the interactive ``DiagramBuilder``, so no Mermaid code is parsed.
+
+        Args:
+            adjacency: Adjacency index of the diagram
+            node_ids: All node IDs, including unconnected ones. Defaults to
+                the nodes that appear in the index.
+
+        Returns:
+            Graph analysis with degree, reachability and cycle information
+        """
+        nodes = list(node_ids) if node_ids is not None else adjacency.nodes()
+
+        entry_nodes = [n for n in nodes if not adjacency.in_degree(n)]
+        connected_entries = [n for n in entry_nodes if adjacency.out_degree(n)]
+
+        reached: set[Hashable] = set()
+        for node in connected_entries:
+            if node not in reached:
+                reached |= adjacency.reachable(node)
+
+        return GraphAnalysis(
+            node_count=len(nodes),
+            connection_count=len(adjacency),
+            max_in_degree=max((adjacency.in_degree(n) for n in nodes), default=0),
+            max_out_degree=max((adjacency.out_degree(n) for n in nodes), default=0),
+            entry_nodes=connected_entries,
+            exit_nodes=[
+                n
+                for n in nodes
+                if adjacency.in_degree(n) and not adjacency.out_degree(n)
+            ],
+            isolated_nodes=[n for n in entry_nodes if not adjacency.out_degree(n)],
+            unreachable_nodes=(
+                [n for n in nodes if adjacency.degree(n) and n not in reached]
+                if connected_entries
+                else []
+            ),
+            cycle=adjacency.find_cycle(),
+        )
+
     def assess_quality(self, diagram_code: str) -> QualityMetrics:
         """Assess diagram quality across multiple dimensions."""
         readability_score = self._assess_readability(diagram_code)
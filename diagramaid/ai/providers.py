@@ -6,16 +6,21 @@ with the diagramaid library, including OpenAI, Anthropic, OpenRouter, and
 custom providers.
 """
 
+import functools
 import importlib.util
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from typing import Any, cast
 from urllib.parse import urljoin
 
 import requests
 
+from .response_cache import AIResponseCache
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -79,6 +84,40 @@ class ModelNotFoundError(ProviderError):
     pass
 
 
+_GenerateText = Callable[..., GenerationResponse]
+
+
+def _cached_generation(generate_text: _GenerateText) -> _GenerateText:
+    """
+    Serve ``generate_text`` from the provider's response cache, if any.
+
+    Only successful, complete responses of the provider itself are stored;
+    fallback and streaming responses always go through. A call with
+    ``use_cache=False`` neither reads nor writes the cache.
+    """
+
+    @functools.wraps(generate_text)
+    def wrapper(self: "AIProvider", prompt: str, **kwargs: Any) -> GenerationResponse:
+        use_cache = kwargs.pop("use_cache", True)
+        cache = self.response_cache
+        if cache is None or not use_cache or kwargs.get("stream"):
+            return generate_text(self, prompt, **kwargs)
+
+        key = self._cache_key(prompt, kwargs)
+        cached = cache.get(key)
+        if cached is not None:
+            cached["metadata"] = {**(cached.get("metadata") or {}), "cached": True}
+            return GenerationResponse(**cached)
+
+        started = time.perf_counter()
+        response = generate_text(self, prompt, **kwargs)
+        if response.provider == self.provider_name and response.content:
+            cache.put(key, asdict(response), time.perf_counter() - started)
+        return response
+
+    return wrapper
+
+
 class AIProvider(ABC):
     """
     Abstract base class for AI providers.
@@ -87,6 +126,9 @@ class AIProvider(ABC):
     to be compatible with the diagramaid AI module.
     """
 
+    # Cache of generated responses (opt-in, see enable_cache)
+    response_cache: AIResponseCache | None = None
+
     def __init__(self, config: ProviderConfig | None = None) -> None:
         """Initialize the provider with configuration."""
         self.config: ProviderConfig = config or ProviderConfig()
@@ -148,6 +190,38 @@ class AIProvider(ABC):
             )
         return True
 
+    def enable_cache(self, cache: AIResponseCache | None = None) -> AIResponseCache:
+        """
+        Serve repeated generation requests from a response cache.
+
+        Args:
+            cache: Cache to use (a new in-memory cache if None); one cache
+                can be shared by several providers
+
+        Returns:
+            The cache in use
+        """
+        self.response_cache = cache if cache is not None else AIResponseCache()
+        return self.response_cache
+
+    def disable_cache(self) -> None:
+        """Send every generation request to the provider again."""
+        self.response_cache = None
+
+    def _cache_key(self, prompt: str, kwargs: dict[str, Any]) -> str:
+        """Build the response cache key of a generation request."""
+        params = dict(kwargs)
+        messages = params.pop("messages", [{"role": "user", "content": prompt}])
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        return AIResponseCache.make_key(
+            self.provider_name,
+            params.pop("model", None) or self.config.model,
+            messages,
+            params,
+            endpoint=self.config.base_url,
+        )
+
     def _handle_http_error(self, response: requests.Response) -> None:
         """Handle HTTP errors from API responses."""
         if response.status_code == 401:
@@ -245,6 +319,7 @@ class OpenAIProvider(AIProvider):
         """Get the model name."""
         return self.config.model
 
+    @_cached_generation
     def generate_text(self, prompt: str, **kwargs: Any) -> GenerationResponse:
         """Generate text using OpenAI API."""
         try:
@@ -418,6 +493,7 @@ class AnthropicProvider(AIProvider):
         """Get the model name."""
         return self.config.model
 
+    @_cached_generation
     def generate_text(self, prompt: str, **kwargs: Any) -> GenerationResponse:
         """Generate text using Anthropic API."""
         try:
@@ -577,6 +653,7 @@ class LocalModelProvider(AIProvider):
         """Get the model name."""
         return self.config.model or "local-template"
 
+    @_cached_generation
     def generate_text(self, prompt: str, **kwargs: Any) -> GenerationResponse:
         """Generate text using local model or templates."""
         # Mark kwargs as intentionally unused for linters
@@ -699,6 +776,7 @@ class OpenRouterProvider(AIProvider):
 
         super().__init__(config)
 
+    @_cached_generation
     def generate_text(self, prompt: str, **kwargs: Any) -> GenerationResponse:
         """Generate text using OpenRouter API."""
         try:
@@ -984,6 +1062,7 @@ class CustomProvider(AIProvider):
         self.custom_config = custom_config
         self.provider_name = custom_config.name.lower()
 
+    @_cached_generation
     def generate_text(self, prompt: str, **kwargs: Any) -> GenerationResponse:
         """Generate text using custom provider API."""
         try:
@@ -1342,16 +1421,49 @@ class ProviderFactory:
 class ProviderManager:
     """Manager for handling multiple AI providers with fallback support."""
 
-    def __init__(self, providers: list[AIProvider] | None = None) -> None:
-        """Initialize provider manager."""
+    def __init__(
+        self,
+        providers: list[AIProvider] | None = None,
+        cache: AIResponseCache | None = None,
+    ) -> None:
+        """
+        Initialize provider manager.
+
+        Args:
+            providers: Providers to try, in order
+            cache: Response cache shared by providers that have none
+        """
         self.providers: list[AIProvider] = providers or []
         self.primary_provider: AIProvider | None = None
+        self.response_cache: AIResponseCache | None = None
 
         if self.providers:
             self.primary_provider = self.providers[0]
+        if cache is not None:
+            self.enable_cache(cache)
+
+    def enable_cache(self, cache: AIResponseCache | None = None) -> AIResponseCache:
+        """
+        Share a response cache with every provider that has none.
+
+        Providers added later get the cache too.
+
+        Args:
+            cache: Cache to use (a new in-memory cache if None)
+
+        Returns:
+            The cache in use
+        """
+        self.response_cache = cache if cache is not None else AIResponseCache()
+        for provider in self.providers:
+            if provider.response_cache is None:
+                provider.enable_cache(self.response_cache)
+        return self.response_cache
 
     def add_provider(self, provider: AIProvider, primary: bool = False) -> None:
         """Add a provider to the manager."""
+        if self.response_cache is not None and provider.response_cache is None:
+            provider.enable_cache(self.response_cache)
         if primary or not self.providers:
             self.providers.insert(0, provider)
             self.primary_provider = provider
@@ -1369,7 +1481,9 @@ class ProviderManager:
         """
         Generate text using providers with automatic fallback.
 
-        Tries providers in order until one succeeds or all fail.
+        Tries providers in order until one succeeds or all fail. With a
+        response cache, a provider answers repeated requests from it;
+        ``use_cache=False`` is passed on to skip the cache.
         """
         if not self.providers:
             raise ProviderError("No providers available")
@@ -1423,9 +1537,16 @@ class ProviderManager:
         return {p.provider_name: p.is_available() for p in self.providers}
 
 
-def create_default_provider_manager() -> ProviderManager:
-    """Create a default provider manager with common providers."""
-    manager = ProviderManager()
+def create_default_provider_manager(
+    cache: AIResponseCache | None = None,
+) -> ProviderManager:
+    """
+    Create a default provider manager with common providers.
+
+    Args:
+        cache: Response cache for the providers (no caching if None)
+    """
+    manager = ProviderManager(cache=cache)
 
     # Try to add providers based on available API keys
     openai_key = os.getenv("OPENAI_API_KEY")
@@ -0,0 +1,278 @@
+"""
+Response cache for AI providers.
+
+Generating the same diagram twice from the same prompt, model and sampling
+parameters costs a full round trip and the tokens each time. An
+``AIResponseCache`` attached to a provider (or to a ``ProviderManager``)
+keeps successful responses keyed on a normalized hash of the request, in
+memory and optionally in a directory shared between runs, so repeated
+generations are answered locally.
+
+Caching is opt-in. A single call skips the cache with ``use_cache=False``.
+
+Example:
+    >>> provider = OpenAIProvider()
+    >>> provider.enable_cache(AIResponseCache(directory=".diagramaid/ai-cache"))
+    >>> provider.generate_text("Flowchart of a login process")  # remote call
+    >>> provider.generate_text("Flowchart of a login process")  # from cache
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+# Maximum number of responses kept in memory
+DEFAULT_AI_CACHE_SIZE = 512
+
+# Maximum number of responses kept in a cache directory
+DEFAULT_AI_DISK_CACHE_SIZE = 10_000
+
+# Seconds a response stays valid
+DEFAULT_AI_CACHE_TTL = 7 * 24 * 3600.0
+
+# Share of max_disk_entries kept when a cache directory is pruned
+_DISK_PRUNE_RATIO = 0.9
+
+# Prefix of the files an AIResponseCache writes to its directory
+_CACHE_FILE_PREFIX = "ai-response-"
+
+# Fields of a stored entry
+_ENTRY_FIELDS = {"response", "latency", "expires"}
+
+
+class AIResponseCache:
+    """
+    LRU cache of generation responses with a TTL, optionally on disk.
+
+    Entries hold the response fields as a dict, with the time the original
+    request took; every hit adds that time and the response's token usage
+    to the savings reported by ``get_stats``. With a directory, responses
+    are also written to JSON files there and read back on a memory miss.
+    Once the directory holds more than ``max_disk_entries`` responses, the
+    oldest are removed down to 90% of that limit.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_AI_CACHE_SIZE,
+        ttl: float | None = DEFAULT_AI_CACHE_TTL,
+        directory: str | Path | None = None,
+        max_disk_entries: int = DEFAULT_AI_DISK_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept in memory
+            ttl: Seconds a response stays valid (never expires if None)
+            directory: Directory to persist responses in (memory only if None)
+            max_disk_entries: Maximum number of responses kept in the directory
+        """
+        if max_entries < 1 or max_disk_entries < 1:
+            raise ValueError("Cache sizes must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory = Path(directory) if directory is not None else None
+        self.max_disk_entries = max_disk_entries
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # Responses in the directory; counted on the first write
+        self._disk_entries: int | None = None
+        self._lock = threading.Lock()
+        self._stats: dict[str, Any] = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "saved_seconds": 0.0,
+            "saved_tokens": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str | None,
+        messages: list[dict[str, Any]],
+        params: Mapping[str, Any] | None = None,
+        endpoint: str | None = None,
+    ) -> str:
+        """
+        Build the cache key of a generation request.
+
+        Parameters set to None are left out, so passing a parameter as None
+        and omitting it give the same key.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            messages: Chat messages sent to the model
+            params: Sampling and other generation parameters
+            endpoint: Base URL of the API, if configurable
+
+        Returns:
+            Hex digest identifying the request
+        """
+        request = {
+            "provider": provider,
+            "model": model,
+            "endpoint": endpoint,
+            "messages": messages,
+            "params": {k: v for k, v in (params or {}).items() if v is not None},
+        }
+        encoded = json.dumps(
+            request, sort_keys=True, separators=(",", ":"), default=repr
+        ).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a response and count what the hit saved.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            Copy of the cached response fields, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None and self.directory is not None:
+            entry = self._read(key)
+            if entry is not None and not self._expired(entry):
+                self._remember(key, entry)
+
+        if entry is not None and self._expired(entry):
+            self._discard(key)
+            entry = None
+            with self._lock:
+                self._stats["expired"] += 1
+
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            usage = entry["response"].get("usage") or {}
+            self._stats["hits"] += 1
+            self._stats["saved_seconds"] += entry["latency"]
+            self._stats["saved_tokens"] += int(usage.get("total_tokens") or 0)
+            return copy.deepcopy(entry["response"])
+
+    def put(self, key: str, response: Mapping[str, Any], latency: float) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from ``make_key``
+            response: Response fields (JSON-serializable)
+            latency: Seconds the request took
+        """
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        entry = {
+            "response": copy.deepcopy(dict(response)),
+            "latency": latency,
+            "expires": expires,
+        }
+        self._remember(key, entry)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            added = not path.exists()
+            temporary = path.with_suffix(f".{threading.get_ident()}.tmp")
+            temporary.write_text(json.dumps(entry, default=repr), encoding="utf-8")
+            temporary.replace(path)
+            with self._lock:
+                if self._disk_entries is None:
+                    self._disk_entries = len(self._files())
+                elif added:
+                    self._disk_entries += 1
+                if self._disk_entries > self.max_disk_entries:
+                    self._prune_directory()
+
+    def clear(self) -> None:
+        """Drop all responses, including persisted ones."""
+        with self._lock:
+            self._entries.clear()
+        if self.directory is not None and self.directory.is_dir():
+            for path in self._files():
+                path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_entries = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Number of entries, counts of hits, misses and expired entries,
+            and the request time and tokens saved by hits
+        """
+        with self._lock:
+            return {"entries": len(self._entries), **self._stats}
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.directory is not None:
+            try:
+                self._path(key).unlink()
+            except OSError:
+                return
+            with self._lock:
+                if self._disk_entries:
+                    self._disk_entries -= 1
+
+    def _expired(self, entry: dict[str, Any]) -> bool:
+        return entry["expires"] is not None and entry["expires"] <= time.time()
+
+    def _remember(self, key: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{_CACHE_FILE_PREFIX}{key}.json"
+
+    def _files(self) -> list[Path]:
+        assert self.directory is not None
+        return list(self.directory.glob(f"{_CACHE_FILE_PREFIX}*.json"))
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        try:
+            entry = json.loads(self._path(key).read_text("utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not _ENTRY_FIELDS <= entry.keys():
+            return None
+        return entry
+
+    def _prune_directory(self) -> None:
+        """Remove the oldest files, leaving headroom for further writes."""
+        paths = self._files()
+        keep = int(self.max_disk_entries * _DISK_PRUNE_RATIO)
+        self._disk_entries = min(len(paths), keep)
+        if len(paths) <= keep:
+            return
+
+        def modified(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        paths.sort(key=modified)
+        for path in paths[: len(paths) - keep]:
+            path.unlink(missing_ok=True)
@@ -15,9 +15,13 @@ from .exceptions import RenderingError, ValidationError
 
 def main() -> int:
     """Main CLI entry point."""
+    if sys.argv[1:2] == ["serve"]:
+        return serve(sys.argv[2:])
+
     parser = argparse.ArgumentParser(
         description="Render Mermaid diagrams from the command line",
         prog="diagramaid",
+        epilog="Run 'diagramaid serve --help' to start a render service.",
     )
 
     parser.add_argument(
@@ -133,5 +137,63 @@ def main() -> int:
         return 1
 
 
+def serve(argv: list[str] | None = None) -> int:
+    """Run a self-hosted, mermaid.ink-compatible render service."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Serve the mermaid.ink URL scheme (/svg/<payload>, /img/<payload>) "
+            "and a JSON batch endpoint from local renderers"
+        ),
+        prog="diagramaid serve",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=3000, help="Bind port")
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Concurrent renders (default: 4)"
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=32,
+        help="Renders allowed to wait before answering 429 (default: 32)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        help="Rendered results kept in memory (default: 256)",
+    )
+    parser.add_argument(
+        "--renderer",
+        action="append",
+        dest="renderers",
+        help="Local renderer to use, in order of preference (repeatable; "
+        "default: playwright, nodejs)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        from .interactive.server.render_service import (
+            LOCAL_RENDERERS,
+            start_render_service,
+        )
+    except ImportError as e:
+        print(
+            f"❌ Render service requires the interactive extras: {e}",
+            file=sys.stderr,
+        )
+        return 1
+
+    start_render_service(
+        host=args.host,
+        port=args.port,
+        max_workers=args.workers,
+        max_queue=args.queue_size,
+        cache_size=args.cache_size,
+        renderers=args.renderers or LOCAL_RENDERERS,
+    )
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
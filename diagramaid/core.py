@@ -4,12 +4,15 @@ Core classes for the Mermaid Render library.
 This module contains the main classes that form the foundation of the library:
 - MermaidRenderer: Main rendering engine
 - MermaidDiagram: Base class for all diagram types
+- TrackedElement: Base class for diagram elements that report mutations
 - MermaidTheme: Theme configuration
 - MermaidConfig: Global configuration management
 """
 
+import io
 import os
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Hashable, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -302,6 +305,145 @@ class MermaidTheme:
         return result
 
 
+#: Approximate size in characters of the chunks yielded by ``iter_mermaid``
+MERMAID_CHUNK_SIZE = 64 * 1024
+
+
+def iter_text_chunks(
+    lines: Iterable[str], chunk_size: int = MERMAID_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Join lines with newlines, yielding the text in chunks of about ``chunk_size``.
+
+    Concatenating the chunks gives exactly ``"\n".join(lines)``, but only one
+    chunk is held in memory at a time.
+
+    Args:
+        lines: Output lines without trailing newlines
+        chunk_size: Approximate number of characters per chunk
+
+    Yields:
+        Consecutive pieces of the joined text
+    """
+    batch: list[str] = []
+    size = 0
+    separator = ""
+    for line in lines:
+        batch.append(line)
+        size += len(line) + 1
+        if size >= chunk_size:
+            yield separator + "\n".join(batch)
+            separator = "\n"
+            batch = []
+            size = 0
+    if batch:
+        yield separator + "\n".join(batch)
+
+
+def write_chunks(fp: Any, chunks: Iterable[str], encoding: str = "utf-8") -> int:
+    """
+    Write text chunks to a text stream, binary stream or socket.
+
+    Args:
+        fp: Text file object, binary file object or socket (``sendall``)
+        chunks: Text chunks to write
+        encoding: Encoding used for binary streams and sockets
+
+    Returns:
+        Number of characters written to a text stream, or bytes written to a
+        binary stream or socket
+    """
+    if hasattr(fp, "sendall"):
+        send = fp.sendall
+    elif isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(
+        fp, "mode", ""
+    ):
+        send = fp.write
+    else:
+        written = 0
+        for chunk in chunks:
+            fp.write(chunk)
+            written += len(chunk)
+        return written
+
+    written = 0
+    for chunk in chunks:
+        data = chunk.encode(encoding)
+        send(data)
+        written += len(data)
+    return written
+
+
+class TrackedElement:
+    """
+    Base class for diagram elements that report mutations to their owner.
+
+    Elements added to a diagram through its ``add_*`` methods are bound to the
+    diagram (or to a parent element such as a subgraph, loop or section). Any
+    assignment to a public attribute afterwards marks the element's cached
+    Mermaid fragment as dirty, so the next ``to_mermaid()`` call re-emits only
+    that fragment instead of regenerating the whole diagram.
+
+    Example:
+        >>> diagram = FlowchartDiagram()
+        >>> node = diagram.add_node("A", "Start")
+        >>> diagram.to_mermaid()
+        >>> node.label = "Begin"  # Only the line for node A is re-emitted
+        >>> "A[Begin]" in diagram.to_mermaid()
+        True
+    """
+
+    __slots__ = ("_owner", "_fragment")
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "TrackedElement":
+        # Start unbound, so assignments in __init__ skip the owner lookup
+        # without raising AttributeError for the unset slots.
+        element = super().__new__(cls)
+        object.__setattr__(element, "_owner", None)
+        object.__setattr__(element, "_fragment", None)
+        return element
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if self._owner is not None and name[0] != "_":
+            self._owner._element_changed(self)
+
+    def _bind(
+        self,
+        owner: Any,
+        section: str | None = None,
+        key: Hashable | None = None,
+    ) -> None:
+        """
+        Attach this element to its owner.
+
+        Args:
+            owner: Owning diagram, storage table or parent element. Owners
+                receive mutations through ``_element_changed(element)``
+            section: Fragment section name when the owner is a diagram
+            key: Fragment key within the section when the owner is a diagram
+        """
+        object.__setattr__(self, "_owner", owner)
+        object.__setattr__(
+            self, "_fragment", (section, key) if section is not None else None
+        )
+
+    def _unbind(self) -> None:
+        """Detach this element from its owner."""
+        object.__setattr__(self, "_owner", None)
+        object.__setattr__(self, "_fragment", None)
+
+    def _touch(self) -> None:
+        """Propagate a mutation of this element to its owner."""
+        owner = getattr(self, "_owner", None)
+        if owner is not None:
+            owner._element_changed(self)
+
+    def _element_changed(self, element: "TrackedElement") -> None:
+        """Treat a mutation of a nested element as a mutation of this one."""
+        self._touch()
+
+
 class MermaidDiagram(ABC):
     """
     Abstract base class for all Mermaid diagram types.
@@ -315,6 +457,13 @@ class MermaidDiagram(ABC):
     from this base class and must implement the abstract methods to define their
     specific diagram type and syntax generation logic.
 
+    Subclasses with many elements can opt into fragment caching by listing
+    their element sections in ``_FRAGMENT_SECTIONS`` and implementing
+    ``_generate_header_lines``, ``_fragment_source`` and ``_render_fragment``.
+    The emitted text of every element is then cached per section, mutators
+    mark individual fragments dirty, and ``to_mermaid()`` re-emits only the
+    dirty fragments before splicing the cached output back together.
+
     Attributes:
         title (Optional[str]): Optional diagram title
         _elements (List[str]): Internal list of diagram elements
@@ -330,6 +479,9 @@ class MermaidDiagram(ABC):
         >>> mermaid_code = diagram.to_mermaid()
     """
 
+    #: Ordered element sections for fragment caching (empty disables it)
+    _FRAGMENT_SECTIONS: tuple[str, ...] = ()
+
     def __init__(self, title: str | None = None) -> None:
         """
         Initialize diagram with optional title.
@@ -341,12 +493,21 @@ class MermaidDiagram(ABC):
             >>> # This is called by concrete diagram classes
             >>> diagram = FlowchartDiagram(title="User Registration Process")
         """
+        self._cached_mermaid: str | None = None
+        self._fragments: dict[str, dict[Hashable, str]] = {}
+        self._dirty_fragments: dict[str, dict[Hashable, None]] = {}
         self.title = title
         self._elements: list[str] = []
         self._config: dict[str, Any] = {}
-        self._cached_mermaid: str | None = None
         self._is_disposed: bool = False
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Reassigning a public attribute (title, direction, element containers)
+        # may change any part of the output, so drop every cached fragment.
+        if not name.startswith("_") and "_fragments" in self.__dict__:
+            self.clear_cache()
+
     @abstractmethod
     def get_diagram_type(self) -> str:
         """
@@ -372,7 +533,8 @@ class MermaidDiagram(ABC):
 
         This method generates the complete Mermaid syntax string for the diagram,
         including the diagram type declaration and all diagram elements. It uses
-        caching to improve performance for repeated calls.
+        caching to improve performance for repeated calls; diagrams that support
+        fragment caching re-emit only the elements changed since the last call.
 
         Returns:
             Complete Mermaid syntax string for the diagram
@@ -395,9 +557,64 @@ class MermaidDiagram(ABC):
             return self._cached_mermaid
 
         # Generate new Mermaid syntax
-        self._cached_mermaid = self._generate_mermaid()
+        if self._FRAGMENT_SECTIONS:
+            self._cached_mermaid = self._assemble_fragments()
+        else:
+            self._cached_mermaid = self._generate_mermaid()
         return self._cached_mermaid
 
+    def iter_mermaid(self, chunk_size: int = MERMAID_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Generate Mermaid syntax for this diagram as a stream of text chunks.
+
+        Unlike ``to_mermaid()``, the complete text is never built in memory:
+        lines are emitted one element at a time and handed out in chunks of
+        about ``chunk_size`` characters. Diagrams with fragment caching still
+        refresh their fragment caches, so a later ``to_mermaid()`` only has
+        to join them.
+
+        Args:
+            chunk_size: Approximate number of characters per chunk
+
+        Yields:
+            Consecutive pieces of the Mermaid text; concatenated they equal
+            ``to_mermaid()``
+
+        Raises:
+            RuntimeError: If the diagram has been disposed
+
+        Example:
+            >>> diagram = FlowchartDiagram()
+            >>> diagram.add_node("A", "Start")
+            >>> "".join(diagram.iter_mermaid()) == diagram.to_mermaid()
+            True
+        """
+        self._check_disposed()
+
+        if self._cached_mermaid is not None:
+            yield self._cached_mermaid
+            return
+
+        yield from iter_text_chunks(self._iter_mermaid_lines(), chunk_size)
+
+    def write_mermaid(self, fp: Any, chunk_size: int = MERMAID_CHUNK_SIZE) -> int:
+        """
+        Write Mermaid syntax for this diagram directly to a file or socket.
+
+        Args:
+            fp: Text file object, binary file object (UTF-8 encoded) or socket
+            chunk_size: Approximate number of characters per write
+
+        Returns:
+            Number of characters written to a text stream, or bytes written
+            to a binary stream or socket
+
+        Example:
+            >>> with open("diagram.mmd", "w", encoding="utf-8") as f:
+            ...     diagram.write_mermaid(f)
+        """
+        return write_chunks(fp, self.iter_mermaid(chunk_size))
+
     @abstractmethod
     def _generate_mermaid(self) -> str:
         """
@@ -416,6 +633,191 @@ class MermaidDiagram(ABC):
         """
         pass
 
+    def _iter_mermaid_lines(self) -> Iterator[str]:
+        """
+        Yield the output lines used by ``iter_mermaid()``.
+
+        Diagrams with fragment caching stream their fragments. Other diagrams
+        yield the result of ``_generate_mermaid()`` as a single item unless
+        they override this method to emit line by line.
+
+        Yields:
+            Output lines (items may contain embedded newlines)
+        """
+        if self._FRAGMENT_SECTIONS:
+            yield from self._iter_fragment_lines()
+        else:
+            yield self._generate_mermaid()
+
+    def _generate_header_lines(self) -> list[str]:
+        """
+        Generate the lines preceding all element fragments.
+
+        Only used by diagrams that declare ``_FRAGMENT_SECTIONS``. The header
+        (diagram type, direction, title) is cheap and regenerated on every call.
+
+        Returns:
+            List of header lines
+        """
+        raise NotImplementedError
+
+    def _fragment_source(self, section: str) -> Collection[Hashable]:
+        """
+        Return the live element keys of a section in emission order.
+
+        Args:
+            section: Section name from ``_FRAGMENT_SECTIONS``
+
+        Returns:
+            Sized collection of fragment keys (e.g. a dict or list of elements)
+        """
+        raise NotImplementedError
+
+    def _render_fragment(self, section: str, key: Hashable) -> str:
+        """
+        Emit the Mermaid text for a single element.
+
+        Args:
+            section: Section name from ``_FRAGMENT_SECTIONS``
+            key: Fragment key as returned by ``_fragment_source``
+
+        Returns:
+            Indented Mermaid text for the element (may span several lines)
+        """
+        raise NotImplementedError
+
+    def _generate_fragment_lines(self) -> list[str]:
+        """Generate all output lines without consulting the fragment cache."""
+        lines = self._generate_header_lines()
+        for section in self._FRAGMENT_SECTIONS:
+            lines.extend(
+                self._render_fragment(section, key)
+                for key in self._fragment_source(section)
+            )
+        return lines
+
+    def _assemble_fragments(self) -> str:
+        """
+        Build the output from cached fragments, re-emitting only dirty ones.
+
+        Returns:
+            Complete Mermaid syntax string for the diagram
+        """
+        return "\n".join(self._iter_fragment_lines())
+
+    def _iter_fragment_lines(self) -> Iterator[str]:
+        """
+        Yield the output lines from cached fragments, re-emitting dirty ones.
+
+        Each section keeps an ordered mapping of fragment key to emitted text.
+        New keys are appended in the order they were marked, which matches the
+        append-only order of the element containers. If a section's container
+        was mutated directly and no longer lines up with the cache, the section
+        is rebuilt from scratch. A section's cache is brought up to date
+        before any of its lines are yielded.
+
+        Yields:
+            Header lines followed by the fragments of every section
+        """
+        yield from self._generate_header_lines()
+
+        for section in self._FRAGMENT_SECTIONS:
+            source = self._fragment_source(section)
+            cache = self._fragments.get(section)
+            dirty = self._dirty_fragments.pop(section, None)
+
+            if cache is not None and dirty:
+                try:
+                    for key in dirty:
+                        cache[key] = self._render_fragment(section, key)
+                except LookupError:
+                    cache = None
+
+            if cache is None or len(cache) != len(source):
+                cache = {key: self._render_fragment(section, key) for key in source}
+
+            if len(cache) == len(source):
+                self._fragments[section] = cache
+            else:
+                # Duplicate keys (e.g. the same edge object listed twice)
+                # cannot be cached by identity; emit the section uncached.
+                self._fragments.pop(section, None)
+                yield from (self._render_fragment(section, key) for key in source)
+                continue
+
+            yield from cache.values()
+
+    def _mark_dirty(self) -> None:
+        """Invalidate the assembled output while keeping cached fragments."""
+        self._cached_mermaid = None
+
+    def _element_changed(self, element: TrackedElement) -> None:
+        """
+        Receive a mutation notification from a bound element.
+
+        Args:
+            element: The element whose public attributes changed
+        """
+        fragment = getattr(element, "_fragment", None)
+        if fragment is not None:
+            self._mark_fragment_dirty(*fragment)
+        else:
+            self._mark_dirty()
+
+    def _drop_section(self, section: str) -> None:
+        """
+        Forget every cached fragment of a section.
+
+        Used when fragment keys of a section are renumbered, e.g. after a
+        columnar storage table compacts its rows.
+
+        Args:
+            section: Section name from ``_FRAGMENT_SECTIONS``
+        """
+        self._cached_mermaid = None
+        self._fragments.pop(section, None)
+        self._dirty_fragments.pop(section, None)
+
+    def _mark_fragment_dirty(self, section: str, key: Hashable) -> None:
+        """
+        Mark one element fragment for re-emission on the next ``to_mermaid()``.
+
+        Args:
+            section: Section name from ``_FRAGMENT_SECTIONS``
+            key: Fragment key of the added or modified element
+        """
+        self._cached_mermaid = None
+        if section in self._fragments:
+            self._dirty_fragments.setdefault(section, {})[key] = None
+
+    def _mark_fragments_dirty(self, section: str, keys: Iterable[Hashable]) -> None:
+        """
+        Mark several element fragments at once (used by bulk loaders).
+
+        Args:
+            section: Section name from ``_FRAGMENT_SECTIONS``
+            keys: Fragment keys of the added or modified elements
+        """
+        self._cached_mermaid = None
+        if section in self._fragments:
+            self._dirty_fragments.setdefault(section, {}).update(dict.fromkeys(keys))
+
+    def _drop_fragment(self, section: str, key: Hashable) -> None:
+        """
+        Forget the cached fragment of a removed element.
+
+        Args:
+            section: Section name from ``_FRAGMENT_SECTIONS``
+            key: Fragment key of the removed element
+        """
+        self._cached_mermaid = None
+        cache = self._fragments.get(section)
+        if cache is not None:
+            cache.pop(key, None)
+        dirty = self._dirty_fragments.get(section)
+        if dirty is not None:
+            dirty.pop(key, None)
+
     def add_config(self, key: str, value: Any) -> None:
         """
         Add configuration option to the diagram.
@@ -551,6 +953,8 @@ class MermaidDiagram(ABC):
             >>> diagram.clear_cache()  # Free cached data
         """
         self._cached_mermaid = None
+        self._fragments.clear()
+        self._dirty_fragments.clear()
 
     def dispose(self) -> None:
         """
@@ -570,8 +974,8 @@ class MermaidDiagram(ABC):
         # Clear all data structures
         self._elements.clear()
         self._config.clear()
-        self._cached_mermaid = None
         self.title = None
+        self.clear_cache()
 
         # Mark as disposed
         self._is_disposed = True
@@ -538,6 +538,33 @@ class NetworkError(RenderingError):
         return " - ".join(parts)
 
 
+class ServiceOverloadedError(RenderingError):
+    """
+    Raised when a render service cannot accept more work.
+
+    This exception is raised when:
+    - The bounded render queue is full
+    - A batch needs more queue slots than are free
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """
+        Initialize service overloaded error.
+
+        Args:
+            message: Error message
+            retry_after: Suggested delay in seconds before retrying
+        """
+        super().__init__(message, status_code=429)
+        self.retry_after = retry_after
+
+    def __str__(self) -> str:
+        """Return detailed error message."""
+        if self.retry_after:
+            return f"{self.message} - Retry after: {self.retry_after:g}s"
+        return self.message
+
+
 class ThemeError(ConfigurationError):
     """
     Raised when theme-related operations fail.
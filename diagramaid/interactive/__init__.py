@@ -38,6 +38,7 @@ from .builder import (
     FlowchartGenerator,
     FlowchartParser,
     SequenceDiagramGenerator,
+    TextEdit,
 )
 from .export import ExportFormat, ExportManager
 from .models import (
@@ -51,9 +52,19 @@ from .models import (
 from .routes import (
     create_elements_router,
     create_preview_router,
+    create_render_queue_router,
+    create_render_router,
     create_sessions_router,
 )
-from .server import InteractiveServer, create_app, start_server
+from .scheduler import JobSupersededError, RenderPriority, RenderScheduler
+from .server import (
+    InteractiveServer,
+    RenderService,
+    create_app,
+    create_render_service_app,
+    start_render_service,
+    start_server,
+)
 from .templates import InteractiveTemplate, TemplateLibrary
 from .ui_components import (
     CodeEditor,
@@ -95,6 +106,7 @@ __all__ = [
     "ClassDiagramGenerator",
     "DiagramParser",
     "FlowchartParser",
+    "TextEdit",
     # WebSocket sub-components
     "SessionManager",
     "BroadcastService",
@@ -108,12 +120,20 @@ __all__ = [
     "InteractiveServer",
     "start_server",
     "create_app",
+    "RenderService",
+    "create_render_service_app",
+    "start_render_service",
+    "RenderScheduler",
+    "RenderPriority",
+    "JobSupersededError",
     "WebSocketHandler",
     "DiagramSession",
     # Route factories
     "create_sessions_router",
     "create_elements_router",
     "create_preview_router",
+    "create_render_router",
+    "create_render_queue_router",
     # UI components
     "UIComponent",
     "NodeComponent",
@@ -11,6 +11,7 @@ from datetime import datetime
 from typing import Any
 
 from ..exceptions import DiagramError
+from ..models.constants import EMPTY_STYLE
 from .models import (
     DiagramConnection,
     DiagramElement,
@@ -98,7 +99,7 @@ class DiagramBuilder:
             position=position,
             size=size,
             properties=properties or {},
-            style=style or {},
+            style=style or EMPTY_STYLE,
         )
 
         self.elements[element.id] = element
@@ -225,7 +226,7 @@ class DiagramBuilder:
             target_id=target_id,
             label=label,
             connection_type=connection_type,
-            style=style or {},
+            style=style or EMPTY_STYLE,
             properties=properties or {},
         )
 
@@ -21,8 +21,10 @@ from .parsers import (
     DiagramParser,
     ERDiagramParser,
     FlowchartParser,
+    IncrementalParser,
     SequenceDiagramParser,
     StateDiagramParser,
+    TextEdit,
 )
 from .serialization import DiagramSerializer
 
@@ -47,4 +49,6 @@ __all__ = [
     "ClassDiagramParser",
     "StateDiagramParser",
     "ERDiagramParser",
+    "IncrementalParser",
+    "TextEdit",
 ]
@@ -5,8 +5,10 @@ This module provides the abstract base class for Mermaid code generators.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any
 
+from ....core import MERMAID_CHUNK_SIZE, iter_text_chunks, write_chunks
 from ...models import DiagramConnection, DiagramElement
 
 
@@ -14,7 +16,9 @@ class CodeGenerator(ABC):
     """
     Abstract base class for Mermaid code generators.
 
-    Subclasses implement specific diagram type code generation.
+    Subclasses implement specific diagram type code generation. Generators
+    that override ``iter_lines`` can also be streamed with ``iter_chunks``
+    and ``write`` without building the whole code string.
     """
 
     @abstractmethod
@@ -37,11 +41,70 @@ class CodeGenerator(ABC):
         """
         pass
 
+    def iter_lines(
+        self,
+        elements: dict[str, DiagramElement],
+        connections: dict[str, DiagramConnection],
+        metadata: dict[str, Any],
+    ) -> Iterator[str]:
+        """
+        Yield the Mermaid code line by line.
+
+        The default implementation yields the result of ``generate()`` as a
+        single item; subclasses override it to emit one line at a time.
+
+        Args:
+            elements: Dictionary of diagram elements
+            connections: Dictionary of diagram connections
+            metadata: Diagram metadata
+
+        Yields:
+            Lines of Mermaid code
+        """
+        yield self.generate(elements, connections, metadata)
+
+    def iter_chunks(
+        self,
+        elements: dict[str, DiagramElement],
+        connections: dict[str, DiagramConnection],
+        metadata: dict[str, Any],
+        chunk_size: int = MERMAID_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """
+        Yield the Mermaid code in chunks of about ``chunk_size`` characters.
+
+        Returns:
+            Iterator of text chunks; concatenated they equal ``generate()``
+        """
+        return iter_text_chunks(
+            self.iter_lines(elements, connections, metadata), chunk_size
+        )
+
+    def write(
+        self,
+        fp: Any,
+        elements: dict[str, DiagramElement],
+        connections: dict[str, DiagramConnection],
+        metadata: dict[str, Any],
+    ) -> int:
+        """
+        Write the Mermaid code directly to a file object or socket.
+
+        Returns:
+            Number of characters (text streams) or bytes (binary streams and
+            sockets) written
+        """
+        return write_chunks(fp, self.iter_chunks(elements, connections, metadata))
+
+    def _title_comment_lines(self, metadata: dict[str, Any]) -> list[str]:
+        """Return the title comment lines for the metadata (may be empty)."""
+        if metadata.get("title"):
+            return [f"    %% {metadata['title']}", ""]
+        return []
+
     def _add_title_comment(self, lines: list[str], metadata: dict[str, Any]) -> None:
         """Add title as comment if present in metadata."""
-        if metadata.get("title"):
-            lines.append(f"    %% {metadata['title']}")
-            lines.append("")
+        lines.extend(self._title_comment_lines(metadata))
 
     def _add_description_comment(
         self, lines: list[str], metadata: dict[str, Any]
@@ -4,6 +4,7 @@ Class diagram code generator for the interactive diagram builder.
 This module provides Mermaid code generation for class diagrams.
 """
 
+from collections.abc import Iterator
 from typing import Any
 
 from ...models import DiagramConnection, DiagramElement
@@ -47,12 +48,31 @@ class ClassDiagramGenerator(CodeGenerator):
         Returns:
             Generated Mermaid class diagram code
         """
-        lines = ["classDiagram"]
+        return "\n".join(self.iter_lines(elements, connections, metadata))
+
+    def iter_lines(
+        self,
+        elements: dict[str, DiagramElement],
+        connections: dict[str, DiagramConnection],
+        metadata: dict[str, Any],
+    ) -> Iterator[str]:
+        """
+        Yield class diagram Mermaid code line by line.
+
+        Args:
+            elements: Dictionary of diagram elements
+            connections: Dictionary of diagram connections
+            metadata: Diagram metadata
+
+        Yields:
+            Lines of Mermaid class diagram code
+        """
+        yield "classDiagram"
 
         # Add title if present
         if metadata.get("title"):
-            lines.append(f"    title {metadata['title']}")
-            lines.append("")
+            yield f"    title {metadata['title']}"
+            yield ""
 
         # Process elements as classes
         for element in elements.values():
@@ -60,20 +80,20 @@ class ClassDiagramGenerator(CodeGenerator):
                 class_name = element.id
 
                 # Basic class declaration
-                lines.append(f"    class {class_name} {{")
+                yield f"    class {class_name} {{"
 
                 # Add attributes and methods if stored in properties
                 attributes = element.properties.get("attributes", [])
                 methods = element.properties.get("methods", [])
 
                 for attr in attributes:
-                    lines.append(f"        {attr}")
+                    yield f"        {attr}"
 
                 for method in methods:
-                    lines.append(f"        {method}")
+                    yield f"        {method}"
 
-                lines.append("    }")
-                lines.append("")
+                yield "    }"
+                yield ""
 
         # Process connections as relationships
         for connection in connections.values():
@@ -84,11 +104,9 @@ class ClassDiagramGenerator(CodeGenerator):
             relationship = self._get_relationship_syntax(connection.connection_type)
 
             if connection.label:
-                lines.append(f"    {source} {relationship} {target} : {connection.label}")
+                yield f"    {source} {relationship} {target} : {connection.label}"
             else:
-                lines.append(f"    {source} {relationship} {target}")
-
-        return "\n".join(lines)
+                yield f"    {source} {relationship} {target}"
 
     def _get_relationship_syntax(self, connection_type: str) -> str:
         """
@@ -4,6 +4,7 @@ Flowchart code generator for the interactive diagram builder.
 This module provides Mermaid code generation for flowchart diagrams.
 """
 
+from collections.abc import Iterator
 from typing import Any
 
 from ...models import DiagramConnection, DiagramElement, ElementType
@@ -63,35 +64,51 @@ class FlowchartGenerator(CodeGenerator):
         Returns:
             Generated Mermaid flowchart code
         """
+        return "\n".join(self.iter_lines(elements, connections, metadata))
+
+    def iter_lines(
+        self,
+        elements: dict[str, DiagramElement],
+        connections: dict[str, DiagramConnection],
+        metadata: dict[str, Any],
+    ) -> Iterator[str]:
+        """
+        Yield flowchart Mermaid code line by line.
+
+        Args:
+            elements: Dictionary of diagram elements
+            connections: Dictionary of diagram connections
+            metadata: Diagram metadata
+
+        Yields:
+            Lines of Mermaid flowchart code
+        """
         direction = metadata.get("direction", "TD")
-        lines = [f"flowchart {direction}"]
+        yield f"flowchart {direction}"
 
         # Add title if present
-        self._add_title_comment(lines, metadata)
+        yield from self._title_comment_lines(metadata)
 
         # Add nodes
         for element in elements.values():
             if element.element_type == ElementType.NODE:
                 shape = element.properties.get("shape", "rectangle")
                 node_syntax = self._get_node_syntax(element.id, element.label, shape)
-                lines.append(f"    {node_syntax}")
+                yield f"    {node_syntax}"
 
         if elements:
-            lines.append("")
+            yield ""
 
         # Add connections
         for connection in connections.values():
             arrow = self._get_arrow_syntax(connection.connection_type)
             if connection.label:
-                lines.append(
-                    f"    {connection.source_id} {arrow}|{connection.label}| {connection.target_id}"
+                yield (
+                    f"    {connection.source_id} {arrow}|{connection.label}| "
+                    f"{connection.target_id}"
                 )
             else:
-                lines.append(
-                    f"    {connection.source_id} {arrow} {connection.target_id}"
-                )
-
-        return "\n".join(lines)
+                yield f"    {connection.source_id} {arrow} {connection.target_id}"
 
     def _get_node_syntax(self, node_id: str, label: str, shape: str) -> str:
         """
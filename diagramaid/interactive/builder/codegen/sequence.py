@@ -4,6 +4,7 @@ Sequence diagram code generator for the interactive diagram builder.
 This module provides Mermaid code generation for sequence diagrams.
 """
 
+from collections.abc import Iterator
 from typing import Any
 
 from ...models import DiagramConnection, DiagramElement
@@ -47,35 +48,48 @@ class SequenceDiagramGenerator(CodeGenerator):
         Returns:
             Generated Mermaid sequence diagram code
         """
-        lines = ["sequenceDiagram"]
+        return "\n".join(self.iter_lines(elements, connections, metadata))
+
+    def iter_lines(
+        self,
+        elements: dict[str, DiagramElement],
+        connections: dict[str, DiagramConnection],
+        metadata: dict[str, Any],
+    ) -> Iterator[str]:
+        """
+        Yield sequence diagram Mermaid code line by line.
+
+        Args:
+            elements: Dictionary of diagram elements
+            connections: Dictionary of diagram connections
+            metadata: Diagram metadata
+
+        Yields:
+            Lines of Mermaid sequence diagram code
+        """
+        yield "sequenceDiagram"
 
         # Add title if present
         if metadata.get("title"):
-            lines.append(f"    title {metadata['title']}")
-            lines.append("")
-
-        # Collect participants
-        participants: set[str] = set()
+            yield f"    title {metadata['title']}"
+            yield ""
 
-        # Process elements to find participants
+        # Collect participants (first element wins for a repeated id)
+        participants: dict[str, DiagramElement] = {}
         for element in elements.values():
             if element.properties.get("type") == "participant":
-                participants.add(element.id)
+                participants.setdefault(element.id, element)
 
         # Add participant declarations
         for participant in sorted(participants):
-            participant_element = next(
-                (e for e in elements.values() if e.id == participant), None
-            )
-            if participant_element and participant_element.label != participant:
-                lines.append(
-                    f"    participant {participant} as {participant_element.label}"
-                )
+            participant_element = participants[participant]
+            if participant_element.label != participant:
+                yield f"    participant {participant} as {participant_element.label}"
             else:
-                lines.append(f"    participant {participant}")
+                yield f"    participant {participant}"
 
         if participants:
-            lines.append("")
+            yield ""
 
         # Process connections as messages
         for connection in connections.values():
@@ -87,11 +101,9 @@ class SequenceDiagramGenerator(CodeGenerator):
             arrow = self._get_arrow_syntax(connection.connection_type)
 
             if connection.label:
-                lines.append(f"    {source}{arrow}{target}: {label}")
+                yield f"    {source}{arrow}{target}: {label}"
             else:
-                lines.append(f"    {source}{arrow}{target}: ")
-
-        return "\n".join(lines)
+                yield f"    {source}{arrow}{target}: "
 
     def _get_arrow_syntax(self, connection_type: str) -> str:
         """
@@ -2,13 +2,17 @@
 Connection management for the interactive diagram builder.
 
 This module provides connection CRUD operations and arrow type mappings.
+Connections are indexed by source and target element so neighbour queries
+and element removal only visit the connections of that element.
 """
 
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from typing import Any
 
+from ...models.adjacency import AdjacencyIndex
+from ...models.constants import EMPTY_STYLE
 from ..models import DiagramConnection
 
 
@@ -51,7 +55,8 @@ class ConnectionManager:
 
     def __init__(self) -> None:
         """Initialize connection manager."""
-        self.connections: dict[str, DiagramConnection] = {}
+        self._connections: dict[str, DiagramConnection] = {}
+        self._index = AdjacencyIndex()
 
         # Event handlers
         self._connection_added_handlers: list[Callable[[DiagramConnection], None]] = []
@@ -62,6 +67,34 @@ class ConnectionManager:
             Callable[[DiagramConnection], None]
         ] = []
 
+    @property
+    def connections(self) -> dict[str, DiagramConnection]:
+        """Connections by ID."""
+        return self._connections
+
+    @connections.setter
+    def connections(self, connections: dict[str, DiagramConnection]) -> None:
+        self._connections = connections
+        self._reindex()
+
+    @property
+    def adjacency(self) -> AdjacencyIndex:
+        """
+        Index of connection IDs by source and target element ID.
+
+        Use it for degree, reachability and cycle checks over the diagram.
+        """
+        # Connections added to the dict directly bypass the index
+        if len(self._index) != len(self._connections):
+            self._reindex()
+        return self._index
+
+    def _reindex(self) -> None:
+        self._index = AdjacencyIndex(
+            (conn_id, conn.source_id, conn.target_id)
+            for conn_id, conn in self._connections.items()
+        )
+
     def add_connection(
         self,
         source_id: str,
@@ -93,11 +126,12 @@ class ConnectionManager:
             target_id=target_id,
             label=label,
             connection_type=connection_type,
-            style=style or {},
+            style=style or EMPTY_STYLE,
             properties=properties or {},
         )
 
-        self.connections[connection.id] = connection
+        self._connections[connection.id] = connection
+        self._index.add(connection.id, source_id, target_id)
 
         # Notify handlers
         for handler in self._connection_added_handlers:
@@ -158,10 +192,11 @@ class ConnectionManager:
         Returns:
             Removed connection or None if not found
         """
-        if connection_id not in self.connections:
+        if connection_id not in self._connections:
             return None
 
-        connection = self.connections.pop(connection_id)
+        connection = self._connections.pop(connection_id)
+        self._index.discard(connection_id)
 
         # Notify handlers
         for handler in self._connection_removed_handlers:
@@ -179,16 +214,34 @@ class ConnectionManager:
         Returns:
             List of removed connection IDs
         """
-        connections_to_remove = [
-            conn_id
-            for conn_id, conn in self.connections.items()
-            if conn.source_id == element_id or conn.target_id == element_id
-        ]
+        connections_to_remove = self.adjacency.touching(element_id)
+
+        for conn_id in connections_to_remove:
+            self.remove_connection(conn_id)  # type: ignore[arg-type]
+
+        return connections_to_remove  # type: ignore[return-value]
+
+    def remove_connections_for_elements(self, element_ids: Iterable[str]) -> list[str]:
+        """
+        Remove all connections involving any of several elements.
+
+        Args:
+            element_ids: Element IDs to remove connections for
+
+        Returns:
+            List of removed connection IDs
+        """
+        index = self.adjacency
+        connections_to_remove: dict[str, None] = {}
+        for element_id in element_ids:
+            connections_to_remove.update(
+                dict.fromkeys(index.touching(element_id))  # type: ignore[arg-type]
+            )
 
         for conn_id in connections_to_remove:
             self.remove_connection(conn_id)
 
-        return connections_to_remove
+        return list(connections_to_remove)
 
     def get_connection(self, connection_id: str) -> DiagramConnection | None:
         """Get connection by ID."""
@@ -201,13 +254,15 @@ class ConnectionManager:
     def get_connections_from(self, element_id: str) -> list[DiagramConnection]:
         """Get all connections originating from an element."""
         return [
-            conn for conn in self.connections.values() if conn.source_id == element_id
+            self._connections[conn_id]  # type: ignore[index]
+            for conn_id in self.adjacency.outgoing(element_id)
         ]
 
     def get_connections_to(self, element_id: str) -> list[DiagramConnection]:
         """Get all connections targeting an element."""
         return [
-            conn for conn in self.connections.values() if conn.target_id == element_id
+            self._connections[conn_id]  # type: ignore[index]
+            for conn_id in self.adjacency.incoming(element_id)
         ]
 
     def has_connection(self, connection_id: str) -> bool:
@@ -216,7 +271,8 @@ class ConnectionManager:
 
     def clear(self) -> None:
         """Remove all connections."""
-        self.connections.clear()
+        self._connections.clear()
+        self._index.clear()
 
     def get_flowchart_arrow(self, connection_type: str) -> str:
         """Get flowchart arrow syntax for connection type."""
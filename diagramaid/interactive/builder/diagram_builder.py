@@ -5,11 +5,15 @@ This module provides the main DiagramBuilder class that orchestrates
 element management, connection management, code generation, and parsing.
 """
 
-from collections.abc import Callable
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from typing import Any
 
+from ...core import MERMAID_CHUNK_SIZE, write_chunks
 from ...exceptions import DiagramError
+from ...models.adjacency import AdjacencyIndex
 from ..models import (
     DiagramConnection,
     DiagramElement,
@@ -25,11 +29,19 @@ from .parsers import (
     ClassDiagramParser,
     ERDiagramParser,
     FlowchartParser,
+    IncrementalParser,
     SequenceDiagramParser,
     StateDiagramParser,
+    TextEdit,
 )
 from .serialization import DiagramSerializer
 
+#: Number of revisions kept for delta synchronization
+CHANGE_LOG_SIZE = 1000
+
+# (revision, collection, item id, "add" | "replace" | "remove")
+Change = tuple[int, str, str, str]
+
 
 class DiagramBuilder:
     """
@@ -82,6 +94,24 @@ class DiagramBuilder:
             "updated_at": datetime.now().isoformat(),
         }
 
+        # Incremented on every change; keys caches of derived output
+        self.revision = 0
+        # Identifies this revision history; a client's revision is only
+        # meaningful together with the history it was taken from
+        self.history_id = uuid.uuid4().hex
+        # Recent changes for delta sync, covering revisions after _changes_from
+        self._changes: deque[Change] = deque()
+        self._changes_from = 0
+
+        # Code the diagram was last loaded from or edited into, valid while
+        # the revision stays at _code_revision; its per-line parse results
+        # are built on the first incremental edit
+        self._code: str | None = None
+        self._code_revision = -1
+        self._code_parser: IncrementalParser | None = None
+        self._code_pairs: dict[tuple[str, str], list[str]] = {}
+        self._code_next_y = 50.0
+
     # ==================== Element Operations ====================
 
     @property
@@ -120,7 +150,7 @@ class DiagramBuilder:
             properties=properties,
             style=style,
         )
-        self._update_metadata()
+        self._update_metadata([("elements", element.id, "add")])
         return element
 
     def update_element(
@@ -155,7 +185,7 @@ class DiagramBuilder:
             style=style,
         )
         if success:
-            self._update_metadata()
+            self._update_metadata([("elements", element_id, "replace")])
         return success
 
     def remove_element(self, element_id: str) -> bool:
@@ -169,13 +199,48 @@ class DiagramBuilder:
             True if element was removed
         """
         # Remove associated connections first
-        self._connection_manager.remove_connections_for_element(element_id)
+        removed_connections = self._connection_manager.remove_connections_for_element(
+            element_id
+        )
+        changes = [
+            ("connections", connection_id, "remove")
+            for connection_id in removed_connections
+        ]
 
         element = self._element_manager.remove_element(element_id)
         if element:
-            self._update_metadata()
-            return True
-        return False
+            changes.append(("elements", element_id, "remove"))
+        if changes:
+            self._update_metadata(changes)
+        return element is not None
+
+    def remove_elements(self, element_ids: Iterable[str]) -> list[str]:
+        """
+        Remove several elements and every connection involving them.
+
+        Args:
+            element_ids: IDs of elements to remove
+
+        Returns:
+            IDs of the elements that were removed
+        """
+        element_ids = list(dict.fromkeys(element_ids))
+        removed_connections = self._connection_manager.remove_connections_for_elements(
+            element_ids
+        )
+
+        removed = [
+            element_id
+            for element_id in element_ids
+            if self._element_manager.remove_element(element_id)
+        ]
+        changes = [
+            ("connections", connection_id, "remove")
+            for connection_id in removed_connections
+        ] + [("elements", element_id, "remove") for element_id in removed]
+        if changes:
+            self._update_metadata(changes)
+        return removed
 
     # ==================== Connection Operations ====================
 
@@ -184,6 +249,11 @@ class DiagramBuilder:
         """Get all connections."""
         return self._connection_manager.connections
 
+    @property
+    def adjacency(self) -> AdjacencyIndex:
+        """Index of connection IDs by source and target element ID."""
+        return self._connection_manager.adjacency
+
     def add_connection(
         self,
         source_id: str,
@@ -221,7 +291,7 @@ class DiagramBuilder:
             style=style,
             properties=properties,
         )
-        self._update_metadata()
+        self._update_metadata([("connections", connection.id, "add")])
         return connection
 
     def update_connection(
@@ -253,7 +323,7 @@ class DiagramBuilder:
             properties=properties,
         )
         if success:
-            self._update_metadata()
+            self._update_metadata([("connections", connection_id, "replace")])
         return success
 
     def remove_connection(self, connection_id: str) -> bool:
@@ -268,7 +338,7 @@ class DiagramBuilder:
         """
         connection = self._connection_manager.remove_connection(connection_id)
         if connection:
-            self._update_metadata()
+            self._update_metadata([("connections", connection_id, "remove")])
             return True
         return False
 
@@ -292,6 +362,43 @@ class DiagramBuilder:
             f"Code generation not implemented for {self.diagram_type}"
         )
 
+    def iter_mermaid_code(
+        self, chunk_size: int = MERMAID_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """
+        Generate Mermaid diagram code as a stream of text chunks.
+
+        Args:
+            chunk_size: Approximate number of characters per chunk
+
+        Returns:
+            Iterator of chunks; concatenated they equal the generated code
+        """
+        generator = self._code_generators.get(self.diagram_type)
+        if generator:
+            return generator.iter_chunks(
+                self._element_manager.elements,
+                self._connection_manager.connections,
+                self.metadata,
+                chunk_size,
+            )
+        raise DiagramError(
+            f"Code generation not implemented for {self.diagram_type}"
+        )
+
+    def write_mermaid_code(self, fp: Any) -> int:
+        """
+        Write Mermaid diagram code directly to a file object or socket.
+
+        Args:
+            fp: Text file object, binary file object (UTF-8 encoded) or socket
+
+        Returns:
+            Number of characters (text streams) or bytes (binary streams and
+            sockets) written
+        """
+        return write_chunks(fp, self.iter_mermaid_code())
+
     # ==================== Parsing ====================
 
     def load_from_mermaid_code(self, code: str) -> None:
@@ -304,10 +411,13 @@ class DiagramBuilder:
         # Clear existing elements and connections
         self._element_manager.clear()
         self._connection_manager.clear()
+        self._code_parser = None
 
         # Parse the code
         lines = [line.strip() for line in code.strip().split("\n") if line.strip()]
         if not lines:
+            self._update_metadata()
+            self._code, self._code_revision = code, self.revision
             return
 
         # Determine diagram type from first line
@@ -326,6 +436,199 @@ class DiagramBuilder:
             self._connection_manager.connections = connections
 
         self._update_metadata()
+        self._code, self._code_revision = code, self.revision
+
+    def apply_code_edit(
+        self, edit: TextEdit, base_code: str | None = None
+    ) -> list[dict[str, Any]] | None:
+        """
+        Apply an edit of the diagram's Mermaid code incrementally.
+
+        Only the edited lines are re-parsed. The result is diffed against the
+        current elements and connections by element ID and by connection
+        endpoints (the n-th connection between two elements matches the n-th
+        one parsed), and only differences are applied, so unchanged items
+        keep their identity and edited ones are updated in place. Positions
+        of existing elements are kept; new elements are placed below the
+        others.
+
+        Args:
+            edit: Text edit of the code
+            base_code: Code the edit applies to; defaults to the code last
+                loaded or edited, or the generated code if the diagram has
+                changed otherwise since
+
+        Returns:
+            Operations applied, like ``changes_since()``, or None if the edit
+            changed the diagram type and the code was loaded as a whole
+
+        Raises:
+            ValueError: If the edit range lies outside the code
+        """
+        parser = self._code_parser
+        fresh = self._code_revision == self.revision
+        full_diff = False
+        if (
+            parser is None
+            or not fresh
+            or (base_code is not None and base_code != parser.text)
+        ):
+            if base_code is None:
+                base_code = self._code if fresh else None
+            if base_code is None:
+                base_code = self.generate_mermaid_code()
+            parser = self._start_code_parser(base_code)
+            if parser is None:
+                self.load_from_mermaid_code(_apply_edit(base_code, edit))
+                return None
+            full_diff = True
+
+        affected = parser.apply(edit)
+        if affected is None:
+            # The declaration changed; keep going only for the same type
+            previous_type = self.diagram_type
+            self._detect_and_set_diagram_type(parser.header.lower())
+            if self.diagram_type != previous_type:
+                self.diagram_type = previous_type
+                self.load_from_mermaid_code(parser.text)
+                return None
+            full_diff = True
+
+        if full_diff:
+            element_ids: set[str] = set(parser.element_ids()) | set(self.elements)
+            pairs = set(parser.pairs()) | set(self._code_pairs)
+        else:
+            assert affected is not None
+            element_ids, pairs = affected
+
+        changes = self._apply_parsed(parser, element_ids, pairs)
+        if changes:
+            self._update_metadata(changes)
+        self._code, self._code_revision = None, self.revision
+        return _change_ops(self, changes)
+
+    def _start_code_parser(self, code: str) -> IncrementalParser | None:
+        """Build per-line parse results of code of the current diagram type."""
+        declaration = next((line for line in code.split("\n") if line.strip()), "")
+        previous_type = self.diagram_type
+        self._detect_and_set_diagram_type(declaration.strip().lower())
+        diagram_type, self.diagram_type = self.diagram_type, previous_type
+        parser = self._parsers.get(diagram_type)
+        if diagram_type != previous_type or parser is None:
+            return None
+
+        self._code_parser = IncrementalParser(parser)
+        self._code_parser.load(code)
+        self._code_pairs = {}
+        for connection in self.connections.values():
+            pair = (connection.source_id, connection.target_id)
+            self._code_pairs.setdefault(pair, []).append(connection.id)
+        self._code_next_y = (
+            max(element.position.y for element in self.elements.values()) + 100
+            if self.elements
+            else 50.0
+        )
+        return self._code_parser
+
+    def _apply_parsed(
+        self,
+        parser: IncrementalParser,
+        element_ids: Iterable[str],
+        pairs: Iterable[tuple[str, str]],
+    ) -> list[tuple[str, str, str]]:
+        """Bring the given elements and connection pairs in line with the code."""
+        changes: list[tuple[str, str, str]] = []
+        removed_elements: list[str] = []
+
+        # Sorted, so generated IDs and change order do not depend on hashing
+        for element_id in sorted(element_ids):
+            parsed = parser.element(element_id)
+            current = self.elements.get(element_id)
+            if parsed is None:
+                if current is not None:
+                    removed_elements.append(element_id)
+            elif current is None:
+                self._element_manager.add_element(
+                    element_type=parsed.element_type,
+                    label=parsed.label,
+                    position=Position(100, self._code_next_y),
+                    size=parsed.size,
+                    properties=dict(parsed.properties),
+                    element_id=element_id,
+                )
+                self._code_next_y += 100
+                changes.append(("elements", element_id, "add"))
+            elif (
+                current.label != parsed.label
+                or current.element_type != parsed.element_type
+                or _differs(current.properties, parsed.properties)
+            ):
+                current.element_type = parsed.element_type
+                self._element_manager.update_element(
+                    element_id, label=parsed.label, properties=parsed.properties
+                )
+                changes.append(("elements", element_id, "replace"))
+
+        for pair in sorted(pairs):
+            parsed_connections = parser.connections_between(pair)
+            current_ids = [
+                connection_id
+                for connection_id in self._code_pairs.get(pair, [])
+                if connection_id in self.connections
+            ]
+            for connection_id, parsed_connection in zip(
+                current_ids, parsed_connections, strict=False
+            ):
+                connection = self.connections[connection_id]
+                if (
+                    connection.label != parsed_connection.label
+                    or connection.connection_type != parsed_connection.connection_type
+                    or _differs(connection.properties, parsed_connection.properties)
+                ):
+                    self._connection_manager.update_connection(
+                        connection_id,
+                        label=parsed_connection.label,
+                        connection_type=parsed_connection.connection_type,
+                        properties=parsed_connection.properties,
+                    )
+                    changes.append(("connections", connection_id, "replace"))
+            for connection_id in current_ids[len(parsed_connections) :]:
+                self._connection_manager.remove_connection(connection_id)
+                changes.append(("connections", connection_id, "remove"))
+            for parsed_connection in parsed_connections[len(current_ids) :]:
+                connection = self._connection_manager.add_connection(
+                    source_id=parsed_connection.source_id,
+                    target_id=parsed_connection.target_id,
+                    label=parsed_connection.label,
+                    connection_type=parsed_connection.connection_type,
+                    properties=dict(parsed_connection.properties),
+                    connection_id=self._new_connection_id(parsed_connection.id),
+                )
+                current_ids.append(connection.id)
+                changes.append(("connections", connection.id, "add"))
+            kept = current_ids[: len(parsed_connections)]
+            if kept:
+                self._code_pairs[pair] = kept
+            else:
+                self._code_pairs.pop(pair, None)
+
+        for element_id in removed_elements:
+            # Connections added outside the code go with their element
+            for connection_id in (
+                self._connection_manager.remove_connections_for_element(element_id)
+            ):
+                changes.append(("connections", connection_id, "remove"))
+            self._element_manager.remove_element(element_id)
+            changes.append(("elements", element_id, "remove"))
+        return changes
+
+    def _new_connection_id(self, parsed_id: str) -> str:
+        """Derive an unused ID from a parsed ID like ``conn_A_B_0``."""
+        prefix = parsed_id.rsplit("_", 1)[0]
+        index = len(self.connections)
+        while f"{prefix}_{index}" in self.connections:
+            index += 1
+        return f"{prefix}_{index}"
 
     def _detect_and_set_diagram_type(self, first_line: str) -> None:
         """Detect diagram type from first line and set it."""
@@ -392,8 +695,80 @@ class DiagramBuilder:
 
     # ==================== Helper Methods ====================
 
-    def _update_metadata(self) -> None:
-        """Update diagram metadata."""
+    def changes_since(
+        self, revision: int, history_id: str | None = None
+    ) -> list[dict[str, Any]] | None:
+        """
+        Get the operations turning the state at ``revision`` into the current one.
+
+        Operations are JSON-patch-like (``{"op", "path", "value"}``) with paths
+        ``/elements/<id>`` and ``/connections/<id>``; each item changed since
+        the revision appears once, carrying its current state.
+
+        Args:
+            revision: Revision the caller has
+            history_id: ``history_id`` the revision was taken from; if it
+                differs from the current one, no delta is possible
+
+        Returns:
+            List of operations, or None if the revision is unknown or older
+            than the change log (a full state sync is needed)
+        """
+        if history_id is not None and history_id != self.history_id:
+            return None
+        if revision < self._changes_from or revision > self.revision:
+            return None
+
+        first_ops: dict[tuple[str, str], str] = {}
+        for change_revision, collection, item_id, op in self._changes:
+            if change_revision > revision:
+                first_ops.setdefault((collection, item_id), op)
+
+        ops: list[dict[str, Any]] = []
+        for (collection, item_id), first_op in first_ops.items():
+            items = self.elements if collection == "elements" else self.connections
+            item = items.get(item_id)
+            path = f"/{collection}/{item_id}"
+            if item is not None:
+                op = "add" if first_op == "add" else "replace"
+                ops.append({"op": op, "path": path, "value": item.to_dict()})
+            elif first_op != "add":
+                ops.append({"op": "remove", "path": path})
+        return ops
+
+    def _record_changes(self, changes: list[tuple[str, str, str]] | None) -> None:
+        """
+        Advance the revision and log the changed items.
+
+        Args:
+            changes: ``(collection, item id, op)`` tuples, or None if the
+                state was replaced as a whole (deltas restart from here)
+        """
+        self.revision += 1
+        if changes is None:
+            self.history_id = uuid.uuid4().hex
+            self._changes.clear()
+            self._changes_from = self.revision
+            return
+        for collection, item_id, op in changes:
+            self._changes.append((self.revision, collection, item_id, op))
+        while len(self._changes) > CHANGE_LOG_SIZE:
+            dropped_revision = self._changes.popleft()[0]
+            # A revision is only resumable if all of its changes are kept
+            self._changes_from = dropped_revision
+            while self._changes and self._changes[0][0] == dropped_revision:
+                self._changes.popleft()
+
+    def _update_metadata(
+        self, changes: list[tuple[str, str, str]] | None = None
+    ) -> None:
+        """
+        Update diagram metadata and advance the revision.
+
+        Args:
+            changes: Changed items (see ``_record_changes``)
+        """
+        self._record_changes(changes)
         self.metadata["updated_at"] = datetime.now().isoformat()
         self.metadata["element_count"] = len(self._element_manager.elements)
         self.metadata["connection_count"] = len(self._connection_manager.connections)
@@ -401,3 +776,31 @@ class DiagramBuilder:
     def _get_default_size(self, element_type: ElementType) -> Size:
         """Get default size for element type."""
         return self._element_manager.get_default_size(element_type)
+
+
+def _differs(current: dict[str, Any], parsed: dict[str, Any]) -> bool:
+    """Check if parsed properties are not all present in the current ones."""
+    return any(current.get(key) != value for key, value in parsed.items())
+
+
+def _apply_edit(code: str, edit: TextEdit) -> str:
+    lines = code.split("\n")
+    first, count, replacement = edit.splice(lines)
+    return "\n".join(lines[:first] + replacement + lines[first + count :])
+
+
+def _change_ops(
+    builder: DiagramBuilder, changes: list[tuple[str, str, str]]
+) -> list[dict[str, Any]]:
+    """Describe changes as JSON-patch-like operations (see ``changes_since``)."""
+    ops: list[dict[str, Any]] = []
+    for collection, item_id, op in changes:
+        path = f"/{collection}/{item_id}"
+        if op == "remove":
+            ops.append({"op": "remove", "path": path})
+        else:
+            items: dict[str, Any] = (
+                builder.elements if collection == "elements" else builder.connections
+            )
+            ops.append({"op": op, "path": path, "value": items[item_id].to_dict()})
+    return ops
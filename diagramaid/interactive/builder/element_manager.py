@@ -9,6 +9,7 @@ from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
+from ...models.constants import EMPTY_STYLE
 from ..models import DiagramElement, ElementType, Position, Size
 
 
@@ -71,7 +72,7 @@ class ElementManager:
             position=position,
             size=size,
             properties=properties or {},
-            style=style or {},
+            style=style or EMPTY_STYLE,
         )
 
         self.elements[element.id] = element
@@ -8,6 +8,7 @@ from .base import DiagramParser
 from .class_diagram import ClassDiagramParser
 from .er_diagram import ERDiagramParser
 from .flowchart import FlowchartParser
+from .incremental import IncrementalParser, TextEdit
 from .sequence import SequenceDiagramParser
 from .state_diagram import StateDiagramParser
 
@@ -18,4 +19,6 @@ __all__ = [
     "ClassDiagramParser",
     "StateDiagramParser",
     "ERDiagramParser",
+    "IncrementalParser",
+    "TextEdit",
 ]
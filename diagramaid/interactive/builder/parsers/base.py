@@ -16,6 +16,10 @@ class DiagramParser(ABC):
     Subclasses implement specific diagram type parsing.
     """
 
+    #: Whether a declaration redefines an element declared or implied by an
+    #: earlier line (otherwise the first definition wins)
+    declarations_override = True
+
     @abstractmethod
     def parse(
         self, lines: list[str]
@@ -0,0 +1,288 @@
+"""
+Incremental parsing for the interactive diagram builder.
+
+This module keeps the per-line parse results of a Mermaid document, so a
+text edit from the code editor only re-parses the lines it touches.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from ...models import DiagramConnection, DiagramElement
+from .base import DiagramParser
+
+# (source ID, target ID) of a connection
+Pair = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class TextEdit:
+    """
+    Replacement of a text range, as sent by code editors.
+
+    Lines and columns are 0-based; the range ends before ``end_column``.
+    """
+
+    start_line: int
+    start_column: int
+    end_line: int
+    end_column: int
+    text: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TextEdit":
+        """Create edit from dictionary."""
+        return cls(
+            start_line=int(data["start_line"]),
+            start_column=int(data["start_column"]),
+            end_line=int(data["end_line"]),
+            end_column=int(data["end_column"]),
+            text=str(data.get("text", "")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert edit to dictionary."""
+        return {
+            "start_line": self.start_line,
+            "start_column": self.start_column,
+            "end_line": self.end_line,
+            "end_column": self.end_column,
+            "text": self.text,
+        }
+
+    def splice(self, lines: list[str]) -> tuple[int, int, list[str]]:
+        """
+        Work out the lines replacing the edited ones.
+
+        Args:
+            lines: Lines of the document before the edit
+
+        Returns:
+            Tuple of (first edited line, number of lines replaced,
+            replacement lines)
+
+        Raises:
+            ValueError: If the range lies outside the document
+        """
+        if not (0 <= self.start_line <= self.end_line < len(lines)):
+            raise ValueError(f"Edit lines out of range: {self}")
+        if not 0 <= self.start_column <= len(lines[self.start_line]):
+            raise ValueError(f"Edit start column out of range: {self}")
+        if not 0 <= self.end_column <= len(lines[self.end_line]):
+            raise ValueError(f"Edit end column out of range: {self}")
+        if self.start_line == self.end_line and self.start_column > self.end_column:
+            raise ValueError(f"Edit range is reversed: {self}")
+
+        prefix = lines[self.start_line][: self.start_column]
+        suffix = lines[self.end_line][self.end_column :]
+        replacement = (prefix + self.text + suffix).split("\n")
+        return self.start_line, self.end_line - self.start_line + 1, replacement
+
+
+class _ParsedLine:
+    """Elements and connections contributed by one line."""
+
+    __slots__ = ("elements", "connections", "explicit")
+
+    def __init__(
+        self,
+        elements: dict[str, DiagramElement],
+        connections: list[DiagramConnection],
+    ) -> None:
+        self.elements = elements
+        self.connections = connections
+        # Elements of connection lines are implicit endpoint placeholders
+        self.explicit = not connections
+
+
+_BLANK = _ParsedLine({}, [])
+
+
+class IncrementalParser:
+    """
+    Mermaid document with per-line parse results.
+
+    Lines are parsed one at a time with the diagram type's parser; the
+    document's elements and connections are the merged line results, with
+    declarations taking precedence over elements implied by connections the
+    same way as when parsing the whole document. ``apply()`` re-parses only
+    the edited lines and reports which element IDs and connection endpoint
+    pairs the edit may have changed.
+    """
+
+    def __init__(self, parser: DiagramParser) -> None:
+        """
+        Initialize incremental parser.
+
+        Args:
+            parser: Parser of the document's diagram type
+        """
+        self.parser = parser
+        self.lines: list[str] = [""]
+        self.lines_parsed = 0
+        self._parsed: list[_ParsedLine] = [_BLANK]
+        self._header_index = -1
+        self._element_lines: dict[str, list[_ParsedLine]] = {}
+        self._pair_lines: dict[Pair, list[_ParsedLine]] = {}
+
+    @property
+    def text(self) -> str:
+        """Current document text."""
+        return "\n".join(self.lines)
+
+    @property
+    def header(self) -> str:
+        """Diagram declaration line (first non-blank line), stripped."""
+        if self._header_index < 0:
+            return ""
+        return self.lines[self._header_index].strip()
+
+    def load(self, code: str) -> None:
+        """
+        Parse a whole document.
+
+        Args:
+            code: Mermaid code including the diagram declaration
+        """
+        self.lines = code.split("\n")
+        self._header_index = next(
+            (i for i, line in enumerate(self.lines) if line.strip()), -1
+        )
+        self._element_lines.clear()
+        self._pair_lines.clear()
+        self._parsed = [
+            self._parse_line(index, line) for index, line in enumerate(self.lines)
+        ]
+
+    def apply(self, edit: TextEdit) -> tuple[set[str], set[Pair]] | None:
+        """
+        Apply a text edit, re-parsing the lines it touches.
+
+        Args:
+            edit: Text edit
+
+        Returns:
+            Tuple of (element IDs, connection endpoint pairs) whose merged
+            result may have changed, or None if the edit touched the diagram
+            declaration (the document was re-parsed as a whole)
+
+        Raises:
+            ValueError: If the edit range lies outside the document
+        """
+        first, count, replacement = edit.splice(self.lines)
+        if first <= self._header_index or self._header_index < 0:
+            lines = self.lines[:first] + replacement + self.lines[first + count :]
+            self.load("\n".join(lines))
+            return None
+
+        removed = self._parsed[first : first + count]
+        for parsed in removed:
+            self._unregister(parsed)
+        self.lines[first : first + count] = replacement
+        added = [
+            self._parse_line(first + offset, line)
+            for offset, line in enumerate(replacement)
+        ]
+        self._parsed[first : first + count] = added
+
+        element_ids: set[str] = set()
+        pairs: set[Pair] = set()
+        for parsed in (*removed, *added):
+            element_ids.update(parsed.elements)
+            pairs.update(_pair(connection) for connection in parsed.connections)
+        return element_ids, pairs
+
+    def element_ids(self) -> list[str]:
+        """IDs of all elements in the document."""
+        return list(self._element_lines)
+
+    def pairs(self) -> list[Pair]:
+        """Endpoint pairs of all connections in the document."""
+        return list(self._pair_lines)
+
+    def element(self, element_id: str) -> DiagramElement | None:
+        """
+        Get the merged definition of an element.
+
+        Args:
+            element_id: Element ID
+
+        Returns:
+            The element as parsing the whole document would define it, or
+            None if no line mentions it
+        """
+        lines = self._ordered(self._element_lines.get(element_id))
+        if not lines:
+            return None
+        source = lines[0]
+        if self.parser.declarations_override:
+            explicit = [parsed for parsed in lines if parsed.explicit]
+            if explicit:
+                source = explicit[-1]
+        return source.elements[element_id]
+
+    def connections_between(self, pair: Pair) -> list[DiagramConnection]:
+        """
+        Get the connections between two elements in document order.
+
+        Args:
+            pair: (source ID, target ID)
+
+        Returns:
+            Parsed connections from the source to the target
+        """
+        return [
+            connection
+            for parsed in self._ordered(self._pair_lines.get(pair))
+            for connection in parsed.connections
+            if _pair(connection) == pair
+        ]
+
+    def _ordered(self, lines: list[_ParsedLine] | None) -> list[_ParsedLine]:
+        if not lines or len(lines) == 1:
+            return lines or []
+        # Contributing lines are few; locate them instead of keeping
+        # line numbers that every insertion would shift
+        return sorted(lines, key=self._parsed.index)
+
+    def _parse_line(self, index: int, line: str) -> _ParsedLine:
+        if index <= self._header_index or self.parser._skip_line(line):
+            return _BLANK
+        elements, connections = self.parser.parse([line])
+        self.lines_parsed += 1
+        if not elements and not connections:
+            return _BLANK
+
+        parsed = _ParsedLine(elements, list(connections.values()))
+        for element_id in elements:
+            self._element_lines.setdefault(element_id, []).append(parsed)
+        for pair in {_pair(connection) for connection in parsed.connections}:
+            self._pair_lines.setdefault(pair, []).append(parsed)
+        return parsed
+
+    def _unregister(self, parsed: _ParsedLine) -> None:
+        if parsed is _BLANK:
+            return
+        for element_id in parsed.elements:
+            _discard(self._element_lines, element_id, parsed)
+        for pair in {_pair(connection) for connection in parsed.connections}:
+            _discard(self._pair_lines, pair, parsed)
+
+
+def _pair(connection: DiagramConnection) -> Pair:
+    return (connection.source_id, connection.target_id)
+
+
+def _discard(
+    index: dict[Any, list[_ParsedLine]], key: Any, parsed: _ParsedLine
+) -> None:
+    lines = index.get(key)
+    if lines is None:
+        return
+    # Identity, not equality: distinct lines may parse alike
+    for position, candidate in enumerate(lines):
+        if candidate is parsed:
+            del lines[position]
+            break
+    if not lines:
+        del index[key]
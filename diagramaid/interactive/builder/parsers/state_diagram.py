@@ -15,6 +15,8 @@ class StateDiagramParser(DiagramParser):
     Supports state definitions and transitions.
     """
 
+    declarations_override = False
+
     def parse(
         self, lines: list[str]
     ) -> tuple[dict[str, DiagramElement], dict[str, DiagramConnection]]:
@@ -98,6 +98,7 @@ class DiagramSerializer:
         builder._element_manager.elements = elements
         builder._connection_manager.connections = connections
         builder.metadata = metadata
+        builder._record_changes(None)
 
     @staticmethod
     def export_to_json(
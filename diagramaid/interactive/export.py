@@ -2,11 +2,13 @@
 
 import json
 from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from ..core import MermaidRenderer
 from .builder import DiagramBuilder
+from .scheduler import RenderPriority, RenderScheduler
 
 
 class ExportFormat(Enum):
@@ -22,14 +24,20 @@ class ExportFormat(Enum):
 class ExportManager:
     """Manages diagram export functionality."""
 
-    def __init__(self, renderer: MermaidRenderer | None = None) -> None:
+    def __init__(
+        self,
+        renderer: MermaidRenderer | None = None,
+        scheduler: RenderScheduler | None = None,
+    ) -> None:
         """
         Initialize export manager.
 
         Args:
             renderer: MermaidRenderer instance for rendering diagrams
+            scheduler: RenderScheduler used by ``export_diagram_async``
         """
         self.renderer = renderer or MermaidRenderer()
+        self.scheduler = scheduler
         self.supported_formats = list(ExportFormat)
 
     def export_diagram(
@@ -64,6 +72,40 @@ class ExportManager:
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
+    async def export_diagram_async(
+        self,
+        diagram_data: dict[str, Any] | DiagramBuilder,
+        format: ExportFormat,
+        session_id: str = "export",
+    ) -> str | bytes:
+        """
+        Export a diagram, running SVG/PNG/PDF renders through the scheduler.
+
+        Rendered formats wait behind interactive previews, so exports cannot
+        starve the live editing of other sessions.
+
+        Args:
+            diagram_data: Diagram data dictionary or DiagramBuilder instance
+            format: Export format
+            session_id: Session the export is accounted to for fairness
+
+        Returns:
+            Exported content as string or bytes
+
+        Raises:
+            ServiceOverloadedError: If the render queue is full
+        """
+        if format not in [ExportFormat.SVG, ExportFormat.PNG, ExportFormat.PDF]:
+            return self.export_diagram(diagram_data, format)
+
+        if self.scheduler is None:
+            self.scheduler = RenderScheduler()
+        return await self.scheduler.submit(
+            session_id,
+            partial(self.export_diagram, diagram_data, format),
+            RenderPriority.EXPORT,
+        )
+
     def export_to_file(
         self,
         diagram_data: dict[str, Any] | DiagramBuilder,
@@ -6,16 +6,18 @@ diagram elements and connections.
 """
 
 import uuid
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 from ...exceptions import DiagramError
+from ...models.constants import EMPTY_STYLE
 from .enums import ElementType
 from .geometry import Position, Size
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagramElement:
     """
     Represents a visual element in the diagram builder.
@@ -30,7 +32,7 @@ class DiagramElement:
     label: str
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     properties: dict[str, Any] = field(default_factory=dict)
-    style: dict[str, Any] = field(default_factory=dict)
+    style: Mapping[str, Any] = field(default_factory=lambda: EMPTY_STYLE)
     metadata: dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
@@ -59,7 +61,7 @@ class DiagramElement:
 
     def update_style(self, style: dict[str, Any]) -> None:
         """Update element styling."""
-        self.style.update(style)
+        self.style = {**self.style, **style}
         self.updated_at = datetime.now()
 
     def move(self, position: Position) -> None:
@@ -108,7 +110,7 @@ class DiagramElement:
             size=Size(self.size.width, self.size.height),
             label=self.label,
             properties=self.properties.copy(),
-            style=self.style.copy(),
+            style=dict(self.style),
             metadata=self.metadata.copy(),
         )
 
@@ -121,7 +123,7 @@ class DiagramElement:
             "position": self.position.to_dict(),
             "size": self.size.to_dict(),
             "properties": self.properties,
-            "style": self.style,
+            "style": dict(self.style),
             "metadata": self.metadata,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
@@ -145,14 +147,14 @@ class DiagramElement:
             label=data["label"],
             id=data.get("id", str(uuid.uuid4())),
             properties=data.get("properties", {}),
-            style=data.get("style", {}),
+            style=data.get("style") or EMPTY_STYLE,
             metadata=data.get("metadata", {}),
             created_at=created_at,
             updated_at=updated_at,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagramConnection:
     """
     Represents a connection between diagram elements.
@@ -166,7 +168,7 @@ class DiagramConnection:
     target_id: str
     label: str = ""
     connection_type: str = "default"
-    style: dict[str, Any] = field(default_factory=dict)
+    style: Mapping[str, Any] = field(default_factory=lambda: EMPTY_STYLE)
     properties: dict[str, Any] = field(default_factory=dict)
     control_points: list[Position] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
@@ -183,7 +185,7 @@ class DiagramConnection:
 
     def update_style(self, style: dict[str, Any]) -> None:
         """Update connection styling."""
-        self.style.update(style)
+        self.style = {**self.style, **style}
         self.updated_at = datetime.now()
 
     def add_control_point(self, position: Position) -> None:
@@ -199,7 +201,7 @@ class DiagramConnection:
             "target_id": self.target_id,
             "label": self.label,
             "connection_type": self.connection_type,
-            "style": self.style,
+            "style": dict(self.style),
             "properties": self.properties,
             "control_points": [cp.to_dict() for cp in self.control_points],
             "created_at": self.created_at.isoformat(),
@@ -215,7 +217,7 @@ class DiagramConnection:
             target_id=data["target_id"],
             label=data.get("label", ""),
             connection_type=data.get("connection_type", "default"),
-            style=data.get("style", {}),
+            style=data.get("style") or EMPTY_STYLE,
             properties=data.get("properties", {}),
             control_points=[
                 Position.from_dict(cp) for cp in data.get("control_points", [])
@@ -8,7 +8,7 @@ representing visual element geometry.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """2D position for visual elements."""
 
@@ -33,7 +33,7 @@ class Position:
         return Position(self.x + dx, self.y + dy)
 
 
-@dataclass
+@dataclass(slots=True)
 class Size:
     """Size dimensions for visual elements."""
 
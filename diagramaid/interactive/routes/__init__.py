@@ -6,11 +6,14 @@ interactive diagram building server.
 """
 
 from .elements import create_elements_router
-from .preview import create_preview_router
+from .preview import create_preview_router, create_render_queue_router
+from .render import create_render_router
 from .sessions import create_sessions_router
 
 __all__ = [
     "create_sessions_router",
     "create_elements_router",
     "create_preview_router",
+    "create_render_queue_router",
+    "create_render_router",
 ]
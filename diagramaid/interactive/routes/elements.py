@@ -6,6 +6,7 @@ and connections within editing sessions.
 """
 
 import logging
+from collections.abc import MutableMapping
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
@@ -16,14 +17,14 @@ from ..websocket import DiagramSession, WebSocketHandler
 
 
 def create_elements_router(
-    sessions: dict[str, DiagramSession],
+    sessions: MutableMapping[str, DiagramSession],
     websocket_handler: WebSocketHandler,
 ) -> APIRouter:
     """
     Create the elements router with the given dependencies.
 
     Args:
-        sessions: Dictionary of active sessions
+        sessions: Active sessions by ID
         websocket_handler: WebSocket handler for real-time updates
 
     Returns:
@@ -43,6 +44,7 @@ def create_elements_router(
             if session_id not in sessions:
                 raise HTTPException(status_code=404, detail="Session not found")
 
+            await websocket_handler.follow_session(session_id)
             session = sessions[session_id]
 
             # Sanitize and validate element data
@@ -64,6 +66,7 @@ def create_elements_router(
                 session_id,
                 {
                     "type": "element_added",
+                    "revision": session.builder.revision,
                     "element": element.to_dict(),
                 },
             )
@@ -98,6 +101,7 @@ def create_elements_router(
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        await websocket_handler.follow_session(session_id)
         session = sessions[session_id]
 
         # Extract update parameters
@@ -123,6 +127,7 @@ def create_elements_router(
             session_id,
             {
                 "type": "element_updated",
+                "revision": session.builder.revision,
                 "element_id": element_id,
                 "updates": element_data,
             },
@@ -142,6 +147,7 @@ def create_elements_router(
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        await websocket_handler.follow_session(session_id)
         session = sessions[session_id]
         success = session.builder.remove_element(element_id)
 
@@ -153,6 +159,7 @@ def create_elements_router(
             session_id,
             {
                 "type": "element_removed",
+                "revision": session.builder.revision,
                 "element_id": element_id,
             },
         )
@@ -173,6 +180,7 @@ def create_elements_router(
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        await websocket_handler.follow_session(session_id)
         session = sessions[session_id]
 
         connection = session.builder.add_connection(
@@ -192,6 +200,7 @@ def create_elements_router(
             session_id,
             {
                 "type": "connection_added",
+                "revision": session.builder.revision,
                 "connection": connection.to_dict(),
             },
         )
@@ -212,6 +221,7 @@ def create_elements_router(
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        await websocket_handler.follow_session(session_id)
         session = sessions[session_id]
 
         # Extract update parameters
@@ -235,6 +245,7 @@ def create_elements_router(
             session_id,
             {
                 "type": "connection_updated",
+                "revision": session.builder.revision,
                 "connection_id": connection_id,
                 "updates": connection_data,
             },
@@ -254,6 +265,7 @@ def create_elements_router(
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        await websocket_handler.follow_session(session_id)
         session = sessions[session_id]
         success = session.builder.remove_connection(connection_id)
 
@@ -265,6 +277,7 @@ def create_elements_router(
             session_id,
             {
                 "type": "connection_removed",
+                "revision": session.builder.revision,
                 "connection_id": connection_id,
             },
         )
@@ -5,33 +5,45 @@ This module provides API endpoints for generating Mermaid code
 and rendering diagram previews.
 """
 
+import math
+from collections.abc import MutableMapping
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
 from ...core import MermaidRenderer
+from ...exceptions import ServiceOverloadedError
 from ...validators.validator import MermaidValidator
+from ..scheduler import JobSupersededError, RenderScheduler
 from ..security import InputSanitizer
-from ..websocket import DiagramSession
+from ..websocket import DiagramSession, PreviewService, WebSocketHandler
 
 
 def create_preview_router(
-    sessions: dict[str, DiagramSession],
+    sessions: MutableMapping[str, DiagramSession],
     renderer: MermaidRenderer,
     validator: MermaidValidator,
+    scheduler: RenderScheduler | None = None,
+    preview_service: PreviewService | None = None,
+    websocket_handler: WebSocketHandler | None = None,
 ) -> APIRouter:
     """
     Create the preview router with the given dependencies.
 
     Args:
-        sessions: Dictionary of active sessions
+        sessions: Active sessions by ID
         renderer: MermaidRenderer instance for rendering diagrams
         validator: MermaidValidator instance for code validation
+        scheduler: RenderScheduler running the preview renders
+        preview_service: PreviewService caching previews by revision
+        websocket_handler: WebSocket handler whose backplane keeps the
+            sessions current with other workers
 
     Returns:
         Configured APIRouter for preview endpoints
     """
     router = APIRouter(prefix="/api/sessions", tags=["preview"])
+    preview_service = preview_service or PreviewService(renderer, scheduler)
 
     @router.get("/{session_id}/code")
     async def get_mermaid_code(session_id: str) -> dict[str, Any]:
@@ -45,6 +57,8 @@ def create_preview_router(
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        if websocket_handler is not None:
+            await websocket_handler.follow_session(session_id)
         session = sessions[session_id]
 
         try:
@@ -70,7 +84,9 @@ def create_preview_router(
             }
 
     @router.get("/{session_id}/preview")
-    async def get_preview(session_id: str, format: str = "svg") -> dict[str, Any]:
+    async def get_preview(
+        session_id: str, format: str = "svg", theme: str | None = None
+    ) -> dict[str, Any]:
         """Get rendered preview of diagram."""
         try:
             # Sanitize session ID
@@ -81,17 +97,28 @@ def create_preview_router(
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        if websocket_handler is not None:
+            await websocket_handler.follow_session(session_id)
         session = sessions[session_id]
 
         try:
-            code = session.builder.generate_mermaid_code()
-            rendered_content = renderer.render_raw(code, format)
+            revision = session.builder.revision
+            rendered_content = await preview_service.render(session, theme, format)
 
             return {
                 "format": format,
                 "content": rendered_content,
+                "revision": revision,
                 "generated_at": session.updated_at.isoformat(),
             }
+        except JobSupersededError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except ServiceOverloadedError as e:
+            raise HTTPException(
+                status_code=429,
+                detail=str(e),
+                headers={"Retry-After": str(math.ceil(e.retry_after or 1))},
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=500, detail=f"Rendering failed: {str(e)}"
@@ -111,6 +138,8 @@ def create_preview_router(
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        if websocket_handler is not None:
+            await websocket_handler.follow_session(session_id)
         session = sessions[session_id]
 
         # Use provided code or generate from session
@@ -135,3 +164,23 @@ def create_preview_router(
             }
 
     return router
+
+
+def create_render_queue_router(scheduler: RenderScheduler) -> APIRouter:
+    """
+    Create the router exposing render queue metrics.
+
+    Args:
+        scheduler: RenderScheduler whose metrics are reported
+
+    Returns:
+        Configured APIRouter for render queue endpoints
+    """
+    router = APIRouter(prefix="/api/render-queue", tags=["preview"])
+
+    @router.get("/metrics")
+    async def get_render_queue_metrics() -> dict[str, Any]:
+        """Get render queue depth and wait-time metrics."""
+        return scheduler.get_metrics()
+
+    return router
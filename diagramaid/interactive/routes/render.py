@@ -0,0 +1,194 @@
+"""
+mermaid.ink-compatible render routes.
+
+This module provides the URL scheme of mermaid.ink (``/svg/<payload>``,
+``/img/<payload>``, ``/pdf/<payload>``), POST variants taking the payload as
+the request body, and a JSON batch endpoint, all backed by a ``RenderService``.
+"""
+
+import base64
+import math
+from typing import TYPE_CHECKING, Any
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from ...exceptions import (
+    RenderingError,
+    ServiceOverloadedError,
+    UnsupportedFormatError,
+)
+from ...renderers.remote import decode_payload
+
+if TYPE_CHECKING:
+    from ..server.render_service import RenderService
+
+_MEDIA_TYPES = {
+    "svg": "image/svg+xml",
+    "png": "image/png",
+    "pdf": "application/pdf",
+}
+
+# Query parameters mermaid.ink forwards into the Mermaid configuration
+_CONFIG_PARAMS = {
+    "bgColor": "backgroundColor",
+    "width": "width",
+    "height": "height",
+    "scale": "scale",
+}
+
+
+def create_render_router(service: "RenderService", max_batch: int = 50) -> APIRouter:
+    """
+    Create the render router for a render service.
+
+    Args:
+        service: RenderService that renders the diagrams
+        max_batch: Maximum number of diagrams per batch request
+
+    Returns:
+        Configured APIRouter for render endpoints
+    """
+    router = APIRouter(tags=["render"])
+
+    async def render_payload(
+        payload: str, format: str, params: dict[str, str]
+    ) -> Response:
+        try:
+            code, config = decode_payload(payload)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        for param, key in _CONFIG_PARAMS.items():
+            if param in params:
+                config[key] = params[param]
+        theme = params.get("theme") or config.pop("theme", None)
+
+        content = await _render(service, code, format, theme, config or None)
+        return Response(
+            content=content,
+            media_type=_MEDIA_TYPES[format],
+            headers={"Cache-Control": "public, max-age=86400"},
+        )
+
+    def image_format(params: dict[str, str]) -> str:
+        image_type = params.get("type", "png")
+        if image_type != "png":
+            raise HTTPException(
+                status_code=400, detail=f"Unsupported image type '{image_type}'"
+            )
+        return "png"
+
+    @router.get("/svg/{payload:path}")
+    async def get_svg(payload: str, request: Request) -> Response:
+        """Render an SVG from a URL payload."""
+        return await render_payload(payload, "svg", dict(request.query_params))
+
+    @router.get("/img/{payload:path}")
+    async def get_image(payload: str, request: Request) -> Response:
+        """Render an image from a URL payload."""
+        params = dict(request.query_params)
+        return await render_payload(payload, image_format(params), params)
+
+    @router.get("/pdf/{payload:path}")
+    async def get_pdf(payload: str, request: Request) -> Response:
+        """Render a PDF from a URL payload."""
+        return await render_payload(payload, "pdf", dict(request.query_params))
+
+    @router.post("/svg")
+    async def post_svg(request: Request) -> Response:
+        """Render an SVG from a payload sent as the request body."""
+        body = (await request.body()).decode("ascii", "replace")
+        return await render_payload(body, "svg", dict(request.query_params))
+
+    @router.post("/img")
+    async def post_image(request: Request) -> Response:
+        """Render an image from a payload sent as the request body."""
+        params = dict(request.query_params)
+        body = (await request.body()).decode("ascii", "replace")
+        return await render_payload(body, image_format(params), params)
+
+    @router.post("/batch")
+    async def render_batch(batch: dict[str, Any]) -> dict[str, Any]:
+        """
+        Render several diagrams in one request.
+
+        The body is ``{"diagrams": [{"code", "format", "theme", "config"}]}``.
+        SVG results are returned as text, binary formats as base64. A failed
+        diagram yields an ``error`` entry without failing the batch.
+        """
+        diagrams = batch.get("diagrams")
+        if not isinstance(diagrams, list) or not diagrams:
+            raise HTTPException(status_code=400, detail="No diagrams provided")
+        if len(diagrams) > max_batch:
+            raise HTTPException(
+                status_code=400, detail=f"Batch exceeds {max_batch} diagrams"
+            )
+
+        requests = []
+        for item in diagrams:
+            if not isinstance(item, dict) or not item.get("code"):
+                raise HTTPException(status_code=400, detail="Diagram code missing")
+            requests.append(
+                (
+                    item["code"],
+                    item.get("format", "svg"),
+                    item.get("theme"),
+                    item.get("config"),
+                )
+            )
+
+        try:
+            results = await service.render_many(requests, return_exceptions=True)
+        except ServiceOverloadedError as e:
+            raise _overloaded(e)
+        except UnsupportedFormatError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        entries = []
+        for (_, format, _, _), result in zip(requests, results, strict=True):
+            if isinstance(result, Exception):
+                entries.append({"format": format, "error": str(result)})
+            elif format == "svg":
+                entries.append({"format": format, "content": result.decode("utf-8")})
+            else:
+                entries.append(
+                    {
+                        "format": format,
+                        "content": base64.b64encode(result).decode("ascii"),
+                        "encoding": "base64",
+                    }
+                )
+        return {"results": entries}
+
+    @router.get("/health")
+    async def health() -> dict[str, Any]:
+        """Report queue, cache and render statistics."""
+        return {"status": "ok", **service.get_stats()}
+
+    return router
+
+
+async def _render(
+    service: "RenderService",
+    code: str,
+    format: str,
+    theme: str | None,
+    config: dict[str, Any] | None,
+) -> bytes:
+    """Render through the service, mapping errors to HTTP responses."""
+    try:
+        return await service.render(code, format, theme, config)
+    except ServiceOverloadedError as e:
+        raise _overloaded(e)
+    except UnsupportedFormatError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except RenderingError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _overloaded(error: ServiceOverloadedError) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=str(error),
+        headers={"Retry-After": str(math.ceil(error.retry_after or 1))},
+    )
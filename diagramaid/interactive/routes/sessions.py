@@ -7,6 +7,7 @@ and managing diagram editing sessions.
 
 import logging
 import uuid
+from collections.abc import MutableMapping
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
@@ -17,7 +18,7 @@ from ..websocket import DiagramSession, WebSocketHandler
 
 
 def create_sessions_router(
-    sessions: dict[str, DiagramSession],
+    sessions: MutableMapping[str, DiagramSession],
     websocket_handler: WebSocketHandler,
     max_sessions: int = 100,
 ) -> APIRouter:
@@ -25,7 +26,7 @@ def create_sessions_router(
     Create the sessions router with the given dependencies.
 
     Args:
-        sessions: Dictionary of active sessions
+        sessions: Active sessions by ID
         websocket_handler: WebSocket handler for real-time updates
         max_sessions: Maximum number of concurrent sessions
 
@@ -51,7 +52,10 @@ def create_sessions_router(
             builder_obj: DiagramBuilder = DiagramBuilder(DiagramType(diagram_type))
             session = DiagramSession(session_id, builder_obj)
 
+            await websocket_handler.follow_session(session_id)
             sessions[session_id] = session
+            # Other workers load the session from the store
+            await websocket_handler.session_manager.checkpoint_async([session_id])
 
             return {
                 "session_id": session_id,
@@ -81,6 +85,7 @@ def create_sessions_router(
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
 
+        await websocket_handler.follow_session(session_id)
         session = sessions[session_id]
         builder_state = session.builder.to_dict()
         return {
@@ -104,6 +109,7 @@ def create_sessions_router(
             raise HTTPException(status_code=404, detail="Session not found")
 
         del sessions[session_id]
+        await websocket_handler.announce_removal(session_id)
 
         return {"success": True, "message": f"Session {session_id} deleted"}
 
@@ -0,0 +1,297 @@
+"""
+Render job scheduling for the interactive server.
+
+Rendering a preview or export can take hundreds of milliseconds, so the
+interactive server runs renders through ``RenderScheduler`` instead of inside
+the request. The scheduler bounds how many renders run at once and how many
+may wait, serves previews before exports, rotates between sessions so one busy
+session cannot starve the others, and cancels queued previews of a session
+once a newer one arrives.
+
+Example:
+    >>> scheduler = RenderScheduler(max_concurrency=4)
+    >>> svg = await scheduler.submit(
+    ...     session_id, lambda: renderer.render_raw(code, "svg")
+    ... )
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+from ..exceptions import ServiceOverloadedError
+
+
+class RenderPriority(IntEnum):
+    """Priority classes of render jobs; lower values run first."""
+
+    PREVIEW = 0
+    EXPORT = 1
+
+
+class JobSupersededError(Exception):
+    """Raised for a preview job replaced by a newer one before it started."""
+
+
+@dataclass
+class RenderJob:
+    """A queued render."""
+
+    session_id: str
+    priority: RenderPriority
+    func: Callable[[], Any]
+    future: "asyncio.Future[Any]"
+    revision: int | None = None
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+
+
+class RenderScheduler:
+    """
+    Bounded, prioritized and per-session fair render job queue.
+
+    Jobs are plain callables run on a thread pool of ``max_concurrency``
+    threads. Within a priority class, sessions take turns (one job each, in
+    round-robin order). Exports that have waited longer than
+    ``starvation_timeout`` are served like previews so they always progress.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        max_queue: int = 64,
+        starvation_timeout: float = 5.0,
+        retry_after: float = 1.0,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Number of renders running at once
+            max_queue: Number of jobs allowed to wait
+            starvation_timeout: Wait time after which an export is promoted
+            retry_after: Delay suggested to clients when the queue is full
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.starvation_timeout = starvation_timeout
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="render-scheduler"
+        )
+        # Per priority: session id -> that session's jobs, in turn order
+        self._queues: dict[RenderPriority, OrderedDict[str, deque[RenderJob]]] = {
+            priority: OrderedDict() for priority in RenderPriority
+        }
+        self._queued = 0
+        self._running = 0
+        self._latest_revision: dict[str, int] = {}
+        self._metrics: dict[str, Any] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "superseded": 0,
+            "rejected": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0,
+            "total_run_time": 0.0,
+        }
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting to start."""
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        """Number of jobs currently running."""
+        return self._running
+
+    async def submit(
+        self,
+        session_id: str,
+        func: Callable[[], Any],
+        priority: RenderPriority = RenderPriority.PREVIEW,
+        revision: int | None = None,
+    ) -> Any:
+        """
+        Queue a render and wait for its result.
+
+        A preview replaces the queued (not yet running) previews of the same
+        session. With revisions, a preview older than the newest revision
+        seen for the session is rejected immediately.
+
+        Args:
+            session_id: Session the job belongs to
+            func: Callable performing the render on a worker thread
+            priority: Priority class of the job
+            revision: Optional diagram revision the job renders
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            ServiceOverloadedError: If the queue is full
+            JobSupersededError: If a newer preview replaced this one
+        """
+        preview = priority == RenderPriority.PREVIEW
+        if preview:
+            latest = self._latest_revision.get(session_id)
+            if revision is not None and latest is not None and revision < latest:
+                self._metrics["superseded"] += 1
+                raise JobSupersededError(
+                    f"Revision {revision} is older than revision {latest}"
+                )
+
+        # Check capacity before superseding, so a rejected preview leaves the
+        # session's queued one in place
+        replaced = len(self._queues[priority].get(session_id, ())) if preview else 0
+        if self._queued - replaced >= self.max_queue:
+            self._metrics["rejected"] += 1
+            raise ServiceOverloadedError(
+                f"Render queue is full ({self._queued} jobs waiting)",
+                retry_after=self.retry_after,
+            )
+
+        if preview:
+            self._supersede(session_id)
+            if revision is not None:
+                self._latest_revision[session_id] = revision
+
+        job = RenderJob(
+            session_id=session_id,
+            priority=priority,
+            func=func,
+            future=asyncio.get_running_loop().create_future(),
+            revision=revision,
+        )
+        self._queues[priority].setdefault(session_id, deque()).append(job)
+        self._queued += 1
+        self._metrics["submitted"] += 1
+        self._dispatch()
+        return await job.future
+
+    def forget_session(self, session_id: str) -> None:
+        """
+        Drop the revision tracked for a removed session.
+
+        Args:
+            session_id: Session ID to forget
+        """
+        self._latest_revision.pop(session_id, None)
+
+    def _supersede(self, session_id: str) -> None:
+        """Cancel the queued previews of a session."""
+        jobs = self._queues[RenderPriority.PREVIEW].pop(session_id, None)
+        for job in jobs or ():
+            self._queued -= 1
+            self._metrics["superseded"] += 1
+            if not job.future.done():
+                job.future.set_exception(
+                    JobSupersededError("Replaced by a newer preview")
+                )
+
+    def _next_job(self) -> RenderJob | None:
+        """Pick the next job: starving exports, then by priority, round-robin."""
+        exports = self._queues[RenderPriority.EXPORT]
+        if exports:
+            oldest = min(exports.values(), key=lambda jobs: jobs[0].submitted_at)
+            if time.monotonic() - oldest[0].submitted_at > self.starvation_timeout:
+                return self._take(exports, oldest[0].session_id)
+
+        for priority in RenderPriority:
+            sessions = self._queues[priority]
+            if sessions:
+                return self._take(sessions, next(iter(sessions)))
+        return None
+
+    def _take(
+        self, sessions: OrderedDict[str, deque[RenderJob]], session_id: str
+    ) -> RenderJob:
+        """Pop a session's first job and move the session to the back."""
+        jobs = sessions[session_id]
+        job = jobs.popleft()
+        if jobs:
+            sessions.move_to_end(session_id)
+        else:
+            del sessions[session_id]
+        self._queued -= 1
+        return job
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while workers are free."""
+        while self._running < self.max_concurrency:
+            job = self._next_job()
+            if job is None:
+                return
+            if job.future.done():
+                # The caller went away while the job was queued
+                continue
+            self._running += 1
+            job.started_at = time.monotonic()
+            wait_time = job.started_at - job.submitted_at
+            self._metrics["total_wait_time"] += wait_time
+            self._metrics["max_wait_time"] = max(
+                self._metrics["max_wait_time"], wait_time
+            )
+            asyncio.ensure_future(self._run(job))
+
+    async def _run(self, job: RenderJob) -> None:
+        started_at = time.monotonic()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, job.func
+            )
+        except Exception as e:
+            self._metrics["failed"] += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            self._metrics["completed"] += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self._running -= 1
+            self._metrics["total_run_time"] += time.monotonic() - started_at
+            self._dispatch()
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get queue depth, wait-time and throughput metrics."""
+        started = self._metrics["completed"] + self._metrics["failed"]
+        return {
+            **self._metrics,
+            "queue_depth": self._queued,
+            "queue_depth_by_priority": {
+                priority.name.lower(): sum(
+                    len(jobs) for jobs in self._queues[priority].values()
+                )
+                for priority in RenderPriority
+            },
+            "running": self._running,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "average_wait_time": (
+                self._metrics["total_wait_time"] / (started + self._running)
+                if started + self._running
+                else 0.0
+            ),
+            "average_run_time": (
+                self._metrics["total_run_time"] / started if started else 0.0
+            ),
+        }
+
+    def shutdown(self) -> None:
+        """Cancel queued jobs and stop the worker threads."""
+        for sessions in self._queues.values():
+            for jobs in sessions.values():
+                for job in jobs:
+                    if not job.future.done():
+                        job.future.cancel()
+            sessions.clear()
+        self._queued = 0
+        self._executor.shutdown(wait=False, cancel_futures=True)
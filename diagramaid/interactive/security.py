@@ -1,10 +1,15 @@
 """Security utilities for the interactive module."""
 
+import asyncio
+import math
 import re
+import threading
 import time
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .websocket.resp import RespClient
 
 
 @dataclass
@@ -14,67 +19,179 @@ class RateLimitConfig:
     max_requests: int = 100  # Maximum requests per window
     window_seconds: int = 60  # Time window in seconds
     burst_limit: int = 10  # Maximum burst requests
+    cleanup_interval: float = 60.0  # Seconds between idle client sweeps
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientInfo:
-    """Information about a client for rate limiting."""
+    """Token buckets of a client for rate limiting."""
 
-    requests: list[float] = field(default_factory=list)
-    blocked_until: float = 0.0
+    tokens: float
+    burst_tokens: float
+    updated: float
 
 
 class RateLimiter:
-    """Rate limiter for API endpoints and WebSocket connections."""
+    """
+    Rate limiter for API endpoints and WebSocket connections.
+
+    Each client has two token buckets: one holding ``max_requests`` tokens
+    refilled over ``window_seconds`` (the sustained rate) and one holding
+    ``burst_limit`` tokens refilled every second. A request takes a token
+    from both, so checking a client is O(1). Clients whose buckets have
+    refilled completely carry no state and are swept every
+    ``cleanup_interval`` seconds.
+
+    After ``share()`` the counts live in Redis instead, so limits hold across
+    workers and hosts (see ``_is_allowed_shared``).
+    """
 
     def __init__(self, config: RateLimitConfig):
         self.config = config
-        self.clients: dict[str, ClientInfo] = defaultdict(ClientInfo)
+        self.clients: dict[str, ClientInfo] = {}
+        self.prefix = "diagramaid:ratelimit:"
+        self._rate = config.max_requests / config.window_seconds
+        self._burst_rate = float(config.burst_limit)
+        # Time after which both buckets of an untouched client are full
+        self._idle_after = max(float(config.window_seconds), 1.0)
+        self._next_cleanup = time.monotonic() + config.cleanup_interval
+        self._lock = threading.Lock()
+        self._shared: RespClient | None = None
+
+    def share(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "diagramaid:ratelimit:",
+        client: "RespClient | None" = None,
+    ) -> None:
+        """
+        Keep the counts in Redis, shared with other workers using the prefix.
+
+        Args:
+            url: Redis URL
+            prefix: Key prefix of the counters (one per limiter)
+            client: RespClient to use instead of connecting to ``url``
+        """
+        from .websocket.resp import RespClient
+
+        self.prefix = prefix
+        self._shared = client or RespClient(url)
+        with self._lock:
+            self.clients.clear()
 
     def is_allowed(self, client_id: str) -> bool:
         """Check if client is allowed to make a request."""
-        now = time.time()
-        client = self.clients[client_id]
-
-        # Check if client is currently blocked
-        if client.blocked_until > now:
-            return False
-
-        # Clean old requests outside the window
-        cutoff = now - self.config.window_seconds
-        client.requests = [
-            req_time for req_time in client.requests if req_time > cutoff
-        ]
-
-        # Check rate limit
-        if len(client.requests) >= self.config.max_requests:
-            # Block client for the window duration
-            client.blocked_until = now + self.config.window_seconds
-            return False
-
-        # Check burst limit
-        recent_cutoff = now - 1.0  # Last second
-        recent_requests = [
-            req_time for req_time in client.requests if req_time > recent_cutoff
-        ]
-        if len(recent_requests) >= self.config.burst_limit:
-            return False
-
-        # Allow request and record it
-        client.requests.append(now)
-        return True
+        if self._shared is not None:
+            return self._is_allowed_shared(client_id)
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_cleanup:
+                self._cleanup(now)
+            client = self._refill(client_id, now)
+            if client.tokens < 1 or client.burst_tokens < 1:
+                return False
+            client.tokens -= 1
+            client.burst_tokens -= 1
+            return True
+
+    async def is_allowed_async(self, client_id: str) -> bool:
+        """Like ``is_allowed()``; shared counts are queried on a worker thread."""
+        if self._shared is not None:
+            return await asyncio.to_thread(self._is_allowed_shared, client_id)
+        return self.is_allowed(client_id)
 
     def get_remaining_requests(self, client_id: str) -> int:
         """Get remaining requests for client in current window."""
-        now = time.time()
-        client = self.clients[client_id]
-
-        cutoff = now - self.config.window_seconds
-        client.requests = [
-            req_time for req_time in client.requests if req_time > cutoff
+        if self._shared is not None:
+            sustained, _ = self._shared_counts(client_id, increment=False)
+            return max(0, self.config.max_requests - math.ceil(sustained))
+        with self._lock:
+            client = self._refill(client_id, time.monotonic())
+            return int(client.tokens)
+
+    def cleanup(self) -> int:
+        """
+        Forget clients that have been idle long enough to be at full quota.
+
+        Returns:
+            Number of clients removed
+        """
+        with self._lock:
+            return self._cleanup(time.monotonic())
+
+    def _cleanup(self, now: float) -> int:
+        cutoff = now - self._idle_after
+        idle = [
+            client_id
+            for client_id, client in self.clients.items()
+            if client.updated <= cutoff
         ]
-
-        return max(0, self.config.max_requests - len(client.requests))
+        for client_id in idle:
+            del self.clients[client_id]
+        self._next_cleanup = now + self.config.cleanup_interval
+        return len(idle)
+
+    def _refill(self, client_id: str, now: float) -> ClientInfo:
+        client = self.clients.get(client_id)
+        if client is None:
+            client = ClientInfo(
+                float(self.config.max_requests), float(self.config.burst_limit), now
+            )
+            self.clients[client_id] = client
+            return client
+        elapsed = now - client.updated
+        if elapsed > 0:
+            client.tokens = min(
+                float(self.config.max_requests), client.tokens + elapsed * self._rate
+            )
+            client.burst_tokens = min(
+                float(self.config.burst_limit),
+                client.burst_tokens + elapsed * self._burst_rate,
+            )
+            client.updated = now
+        return client
+
+    def _is_allowed_shared(self, client_id: str) -> bool:
+        """
+        Check a client against counts shared through Redis.
+
+        Uses sliding-window counters: the count of the current fixed window
+        plus the previous window's count weighted by how much of it still
+        overlaps the sliding window, for the sustained and the one-second
+        burst window. One round trip per check; keys expire on their own, so
+        idle clients leave nothing behind. Rejected requests count as well.
+        """
+        sustained, burst = self._shared_counts(client_id, increment=True)
+        return (
+            sustained <= self.config.max_requests and burst <= self.config.burst_limit
+        )
+
+    def _shared_counts(self, client_id: str, increment: bool) -> tuple[float, float]:
+        """Get the sliding-window counts, optionally counting a request."""
+        assert self._shared is not None
+        now = time.time()
+        commands: list[tuple[Any, ...]] = []
+        weights: list[float] = []
+        for window in (self.config.window_seconds, 1):
+            index, offset = divmod(now, window)
+            key = f"{self.prefix}{client_id}:{window}:"
+            current, previous = key + str(int(index)), key + str(int(index) - 1)
+            if increment:
+                commands.append(("INCR", current))
+                commands.append(("EXPIRE", current, window * 2))
+            else:
+                commands.append(("GET", current))
+            commands.append(("GET", previous))
+            weights.append(1 - offset / window)
+
+        replies = self._shared.pipeline(*commands)
+        step = len(commands) // 2
+        counts = []
+        for i, weight in enumerate(weights):
+            current_count = int(replies[i * step] or 0)
+            previous_count = int(replies[i * step + step - 1] or 0)
+            counts.append(current_count + previous_count * weight)
+        return counts[0], counts[1]
 
 
 class InputSanitizer:
@@ -284,3 +401,14 @@ api_rate_limiter = RateLimiter(RateLimitConfig(max_requests=100, window_seconds=
 websocket_rate_limiter = RateLimiter(
     RateLimitConfig(max_requests=200, window_seconds=60)
 )
+
+
+def share_rate_limits(url: str) -> None:
+    """
+    Share the global API and WebSocket rate limits through Redis.
+
+    Args:
+        url: Redis URL used by every worker
+    """
+    api_rate_limiter.share(url, prefix="diagramaid:ratelimit:api:")
+    websocket_rate_limiter.share(url, prefix="diagramaid:ratelimit:ws:")
@@ -9,6 +9,11 @@ from .app_factory import create_fastapi_app
 from .interactive_server import InteractiveServer, create_app, start_server
 from .middleware import setup_exception_handler, setup_security_middleware
 from .page_routes import setup_page_routes
+from .render_service import (
+    RenderService,
+    create_render_service_app,
+    start_render_service,
+)
 from .router_registration import register_api_routers
 from .websocket_endpoint import setup_websocket_endpoint
 
@@ -22,4 +27,7 @@ __all__ = [
     "setup_page_routes",
     "register_api_routers",
     "setup_websocket_endpoint",
+    "RenderService",
+    "create_render_service_app",
+    "start_render_service",
 ]
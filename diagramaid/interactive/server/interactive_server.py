@@ -5,6 +5,8 @@ This module provides the main InteractiveServer class and convenience functions.
 """
 
 import logging
+import os
+from collections.abc import MutableMapping
 from pathlib import Path
 from typing import Any
 
@@ -13,7 +15,19 @@ from fastapi import FastAPI
 
 from ...core import MermaidRenderer
 from ...validators.validator import MermaidValidator
-from ..websocket import DiagramSession, WebSocketHandler
+from ..scheduler import RenderScheduler
+from ..security import share_rate_limits
+from ..websocket import (
+    Backplane,
+    DiagramSession,
+    PreviewService,
+    RedisBackplane,
+    RedisSessionStore,
+    SessionManager,
+    SessionMapping,
+    SessionStore,
+    WebSocketHandler,
+)
 from .app_factory import create_fastapi_app
 from .middleware import setup_exception_handler, setup_security_middleware
 from .page_routes import setup_page_routes
@@ -35,6 +49,9 @@ class InteractiveServer:
         port: int = 8080,
         static_dir: Path | None = None,
         templates_dir: Path | None = None,
+        session_store: SessionStore | None = None,
+        session_idle_timeout: float = 300.0,
+        backplane: Backplane | None = None,
     ) -> None:
         """
         Initialize interactive server.
@@ -44,6 +61,12 @@ class InteractiveServer:
             port: Server port
             static_dir: Directory for static files
             templates_dir: Directory for templates
+            session_store: Store for snapshots of idle collaboration sessions;
+                sessions are then evicted after ``session_idle_timeout``
+                seconds and survive restarts
+            session_idle_timeout: Idle seconds before a session is evicted
+            backplane: Backplane connecting workers that serve the same
+                sessions (use with a shared ``session_store``)
         """
         self.host = host
         self.port = port
@@ -55,18 +78,36 @@ class InteractiveServer:
         # Create FastAPI app
         self.app = self._create_app()
 
-        # WebSocket handler for real-time updates
-        self.websocket_handler = WebSocketHandler()
-
-        # Active diagram sessions
-        self.sessions: dict[str, DiagramSession] = {}
-
         # Renderer for preview generation
         self.renderer = MermaidRenderer()
 
         # Validator for live validation
         self.validator = MermaidValidator()
 
+        # Bounded, prioritized queue for preview and export renders
+        self.render_scheduler = RenderScheduler()
+
+        # Revision-keyed previews, pushed to clients after edits
+        self.preview_service = PreviewService(self.renderer, self.render_scheduler)
+
+        # WebSocket handler for real-time updates
+        session_manager = SessionManager(
+            max_sessions=100,
+            store=session_store,
+            max_idle=session_idle_timeout if session_store else None,
+        )
+        self.websocket_handler = WebSocketHandler(
+            preview_service=self.preview_service,
+            session_manager=session_manager,
+            backplane=backplane,
+        )
+        self.backplane = backplane
+
+        # Active diagram sessions, shared by the REST API and WebSocket clients
+        self.sessions: MutableMapping[str, DiagramSession] = SessionMapping(
+            session_manager
+        )
+
         # Setup logging
         self.logger = logging.getLogger(__name__)
 
@@ -96,7 +137,16 @@ class InteractiveServer:
             renderer=self.renderer,
             validator=self.validator,
             max_sessions=100,
+            scheduler=self.render_scheduler,
+            preview_service=self.preview_service,
         )
+        self.app.router.on_shutdown.append(self.render_scheduler.shutdown)
+
+        session_manager = self.websocket_handler.session_manager
+        self.app.router.on_startup.append(session_manager.start_maintenance)
+        self.app.router.on_shutdown.append(session_manager.close)
+        if self.backplane is not None:
+            self.app.router.on_shutdown.append(self.backplane.close)
 
         # Setup WebSocket endpoint
         setup_websocket_endpoint(self.app, self.websocket_handler)
@@ -112,9 +162,14 @@ class InteractiveServer:
         uvicorn.run(app=self.app, host=self.host, port=self.port, **kwargs)
 
 
+#: Environment variable with the Redis URL shared by the workers of a server
+REDIS_URL_ENV = "DIAGRAMAID_REDIS_URL"
+
+
 def create_app(
     static_dir: Path | None = None,
     templates_dir: Path | None = None,
+    redis_url: str | None = None,
 ) -> FastAPI:
     """
     Create FastAPI application for interactive builder.
@@ -122,13 +177,20 @@ def create_app(
     Args:
         static_dir: Directory for static files
         templates_dir: Directory for templates
+        redis_url: Redis URL for sharing sessions, edits and rate limits with
+            other workers (defaults to the ``DIAGRAMAID_REDIS_URL`` variable)
 
     Returns:
         Configured FastAPI application
     """
+    redis_url = redis_url or os.environ.get(REDIS_URL_ENV)
+    if redis_url:
+        share_rate_limits(redis_url)
     server = InteractiveServer(
         static_dir=static_dir,
         templates_dir=templates_dir,
+        session_store=RedisSessionStore(redis_url) if redis_url else None,
+        backplane=RedisBackplane(redis_url) if redis_url else None,
     )
     return server.app
 
@@ -138,6 +200,8 @@ def start_server(
     port: int = 8080,
     static_dir: Path | None = None,
     templates_dir: Path | None = None,
+    workers: int = 1,
+    redis_url: str | None = None,
     **kwargs: Any,
 ) -> None:
     """
@@ -148,18 +212,44 @@ def start_server(
         port: Server port
         static_dir: Directory for static files
         templates_dir: Directory for templates
+        workers: Number of worker processes; more than one requires
+            ``redis_url`` and uses the default static and template directories
+        redis_url: Redis URL for sharing sessions, edits and rate limits
+            between workers (also between servers on several hosts)
         **kwargs: Additional uvicorn options
 
+    Raises:
+        ValueError: If several workers are requested without a Redis URL
+
     Example:
         >>> from diagramaid.interactive import start_server
         >>> start_server(host="0.0.0.0", port=8080)
         >>> # Access at http://localhost:8080
     """
+    if workers > 1:
+        if not redis_url:
+            raise ValueError("Running several workers requires a Redis URL")
+        # Each worker process builds its own app from the environment
+        os.environ[REDIS_URL_ENV] = redis_url
+        uvicorn.run(
+            f"{__name__}:create_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            **kwargs,
+        )
+        return
+
+    if redis_url:
+        share_rate_limits(redis_url)
     server = InteractiveServer(
         host=host,
         port=port,
         static_dir=static_dir,
         templates_dir=templates_dir,
+        session_store=RedisSessionStore(redis_url) if redis_url else None,
+        backplane=RedisBackplane(redis_url) if redis_url else None,
     )
 
     server.run(**kwargs)
@@ -33,7 +33,7 @@ def setup_security_middleware(app: FastAPI) -> None:
 
         # Check rate limit for API endpoints
         if request.url.path.startswith("/api/"):
-            if not api_rate_limiter.is_allowed(client_ip):
+            if not await api_rate_limiter.is_allowed_async(client_ip):
                 return JSONResponse(
                     status_code=429,
                     content={
@@ -0,0 +1,385 @@
+"""
+Self-hosted, mermaid.ink-compatible render service.
+
+``RenderService`` renders diagrams on a pool of worker threads, each holding
+its own warm ``RendererManager`` (so browser-based renderers are started once
+per worker, not per request). Results are kept in an LRU cache, identical
+concurrent requests share one render, and a bounded queue rejects work with
+``ServiceOverloadedError`` (HTTP 429) instead of letting latency grow without
+limit.
+
+``create_render_service_app`` exposes the service with the mermaid.ink URL
+scheme, so ``SVGRenderer(server_url=...)`` and ``PNGRenderer`` work against it
+unchanged.
+
+Example:
+    >>> from diagramaid.interactive.server import start_render_service
+    >>> start_render_service(host="0.0.0.0", port=3000, max_workers=4)
+    >>> # SVGRenderer(server_url="http://render-tier:3000", post_url=...)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI
+
+from ...exceptions import (
+    RenderingError,
+    ServiceOverloadedError,
+    UnsupportedFormatError,
+)
+from ...renderers.manager import RendererManager
+from .app_factory import create_fastapi_app
+
+#: Renderers that run on this host; remote renderers are never used so that a
+#: service pointed at by ``MERMAID_INK_SERVER`` cannot call itself.
+LOCAL_RENDERERS = ("playwright", "nodejs")
+
+#: Output formats the service can produce
+SERVICE_FORMATS = ("svg", "png", "pdf")
+
+RenderFunction = Callable[[str, str, str | None, dict[str, Any] | None], str | bytes]
+
+
+class RenderService:
+    """
+    Render pool with a result cache and a bounded work queue.
+
+    At most ``max_workers`` renders run at once and at most ``max_queue``
+    more wait for a worker; further requests fail fast with
+    ``ServiceOverloadedError``. Cache hits and requests that join an
+    identical in-flight render do not use queue slots.
+    """
+
+    def __init__(
+        self,
+        render_function: RenderFunction | None = None,
+        renderers: Iterable[str] = LOCAL_RENDERERS,
+        max_workers: int = 4,
+        max_queue: int = 32,
+        cache_size: int = 256,
+        retry_after: float = 1.0,
+    ) -> None:
+        """
+        Initialize the render service.
+
+        Args:
+            render_function: Callable ``(code, format, theme, config)`` used
+                instead of the local renderer pool (mainly for tests)
+            renderers: Renderer names tried in order by the default pool
+            max_workers: Number of concurrent renders
+            max_queue: Number of renders allowed to wait for a worker
+            cache_size: Maximum number of cached results (0 disables caching)
+            retry_after: Delay suggested to clients when the queue is full
+        """
+        self.renderers = tuple(renderers)
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.cache_size = cache_size
+        self.retry_after = retry_after
+        self._render_function = render_function or self._render_with_pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="render-service"
+        )
+        self._local = threading.local()
+        self._managers: list[RendererManager] = []
+        self._managers_lock = threading.Lock()
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+        self._pending = 0
+        self._metrics = {
+            "requests": 0,
+            "renders": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "rejected": 0,
+            "errors": 0,
+            "total_render_time": 0.0,
+        }
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of renders running or waiting at once."""
+        return self.max_workers + self.max_queue
+
+    @property
+    def pending(self) -> int:
+        """Number of renders currently running or waiting."""
+        return self._pending
+
+    async def render(
+        self,
+        mermaid_code: str,
+        format: str = "svg",
+        theme: str | None = None,
+        config: dict[str, Any] | None = None,
+    ) -> bytes:
+        """
+        Render a diagram, using the cache and queue.
+
+        Args:
+            mermaid_code: Raw Mermaid diagram syntax
+            format: Output format ("svg", "png" or "pdf")
+            theme: Optional theme name
+            config: Optional configuration dictionary
+
+        Returns:
+            Rendered content as bytes (SVG is UTF-8 encoded)
+
+        Raises:
+            ServiceOverloadedError: If the queue is full
+            UnsupportedFormatError: If the format is not supported
+            RenderingError: If rendering fails
+        """
+        return (await self.render_many([(mermaid_code, format, theme, config)]))[0]
+
+    async def render_many(
+        self,
+        requests: list[tuple[str, str, str | None, dict[str, Any] | None]],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Render several diagrams concurrently.
+
+        Queue slots for every render are reserved before any work starts, so
+        a batch is either admitted as a whole or rejected as a whole.
+
+        Args:
+            requests: ``(code, format, theme, config)`` tuples
+            return_exceptions: Return per-item exceptions instead of raising
+                the first one
+
+        Returns:
+            Rendered content (or exceptions) in request order
+
+        Raises:
+            ServiceOverloadedError: If the queue cannot hold the batch
+        """
+        self._metrics["requests"] += len(requests)
+        keys = []
+        for mermaid_code, format, theme, config in requests:
+            if format not in SERVICE_FORMATS:
+                raise UnsupportedFormatError(
+                    f"Unsupported format '{format}'. "
+                    f"Available: {', '.join(SERVICE_FORMATS)}"
+                )
+            keys.append(_cache_key(mermaid_code, format, theme, config))
+
+        # Renders that need a worker: not cached, not in flight, not repeated
+        new_keys = {
+            key for key in keys if key not in self._cache and key not in self._inflight
+        }
+        if self._pending + len(new_keys) > self.capacity:
+            self._metrics["rejected"] += len(requests)
+            raise ServiceOverloadedError(
+                f"Render queue is full ({self._pending}/{self.capacity} pending)",
+                retry_after=self.retry_after,
+            )
+
+        loop = asyncio.get_running_loop()
+        waiters: list[asyncio.Future[bytes]] = []
+        for key, request in zip(keys, requests, strict=True):
+            cached = self._cache_get(key)
+            if cached is not None:
+                self._metrics["cache_hits"] += 1
+                future: asyncio.Future[bytes] = loop.create_future()
+                future.set_result(cached)
+            elif key in self._inflight:
+                self._metrics["coalesced"] += 1
+                future = self._inflight[key]
+            else:
+                # Count the slot now so concurrent requests see it taken
+                self._pending += 1
+                future = asyncio.ensure_future(self._run(key, *request))
+                self._inflight[key] = future
+            waiters.append(future)
+
+        return list(
+            await asyncio.gather(
+                *(asyncio.shield(waiter) for waiter in waiters),
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    async def _run(
+        self,
+        key: str,
+        mermaid_code: str,
+        format: str,
+        theme: str | None,
+        config: dict[str, Any] | None,
+    ) -> bytes:
+        """Render on a worker thread and cache the result."""
+        start_time = time.time()
+        try:
+            content = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                self._render_function,
+                mermaid_code,
+                format,
+                theme,
+                config,
+            )
+            data = content.encode("utf-8") if isinstance(content, str) else content
+            self._cache_put(key, data)
+            self._metrics["renders"] += 1
+            return data
+        except Exception:
+            self._metrics["errors"] += 1
+            raise
+        finally:
+            self._metrics["total_render_time"] += time.time() - start_time
+            self._pending -= 1
+            self._inflight.pop(key, None)
+
+    def _render_with_pool(
+        self,
+        mermaid_code: str,
+        format: str,
+        theme: str | None,
+        config: dict[str, Any] | None,
+    ) -> str | bytes:
+        """Render with this worker thread's renderer manager."""
+        manager = getattr(self._local, "manager", None)
+        if manager is None:
+            manager = RendererManager(default_fallback_enabled=False)
+            self._local.manager = manager
+            self._local.candidates = {}
+            with self._managers_lock:
+                self._managers.append(manager)
+
+        # Availability checks can start processes, so do them once per worker
+        candidates = self._local.candidates.get(format)
+        if candidates is None:
+            available = manager.registry.list_renderers(format, available_only=True)
+            candidates = [name for name in self.renderers if name in available]
+            self._local.candidates[format] = candidates
+        if not candidates:
+            raise UnsupportedFormatError(
+                f"No local renderer available for format '{format}'"
+            )
+
+        errors = []
+        for name in candidates:
+            try:
+                result = manager.render(
+                    mermaid_code, format, theme, config, preferred_renderer=name
+                )
+                return result.content
+            except RenderingError as e:
+                errors.append(f"{name}: {e}")
+        raise RenderingError("; ".join(errors), format=format)
+
+    def _cache_get(self, key: str) -> bytes | None:
+        data = self._cache.get(key)
+        if data is not None:
+            self._cache.move_to_end(key)
+        return data
+
+    def _cache_put(self, key: str, data: bytes) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = data
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Remove all cached results."""
+        self._cache.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue, cache and render statistics."""
+        renders = self._metrics["renders"]
+        return {
+            **self._metrics,
+            "pending": self._pending,
+            "capacity": self.capacity,
+            "max_workers": self.max_workers,
+            "cached_entries": len(self._cache),
+            "average_render_time": (
+                self._metrics["total_render_time"] / renders if renders else 0.0
+            ),
+        }
+
+    def close(self) -> None:
+        """Stop the worker threads and release renderer resources."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._managers_lock:
+            for manager in self._managers:
+                manager.cleanup()
+            self._managers.clear()
+
+
+def _cache_key(
+    mermaid_code: str, format: str, theme: str | None, config: dict[str, Any] | None
+) -> str:
+    data = json.dumps(
+        {"code": mermaid_code, "format": format, "theme": theme, "config": config},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def create_render_service_app(service: RenderService | None = None) -> FastAPI:
+    """
+    Create the FastAPI application for a render service.
+
+    Args:
+        service: Render service to expose (a default pool if not provided)
+
+    Returns:
+        Configured FastAPI application; the service is ``app.state.render_service``
+    """
+    from ..routes.render import create_render_router
+
+    service = service or RenderService()
+    app = create_fastapi_app(
+        title="Mermaid Render Service",
+        description="Self-hosted, mermaid.ink-compatible diagram rendering",
+    )
+    app.state.render_service = service
+    app.include_router(create_render_router(service))
+    app.router.on_shutdown.append(service.close)
+    return app
+
+
+def start_render_service(
+    host: str = "localhost",
+    port: int = 3000,
+    max_workers: int = 4,
+    max_queue: int = 32,
+    cache_size: int = 256,
+    renderers: Iterable[str] = LOCAL_RENDERERS,
+    **kwargs: Any,
+) -> None:
+    """
+    Start a render service.
+
+    Args:
+        host: Server host
+        port: Server port
+        max_workers: Number of concurrent renders
+        max_queue: Number of renders allowed to wait for a worker
+        cache_size: Maximum number of cached results
+        renderers: Local renderer names tried in order
+        **kwargs: Additional uvicorn options
+    """
+    service = RenderService(
+        renderers=renderers,
+        max_workers=max_workers,
+        max_queue=max_queue,
+        cache_size=cache_size,
+    )
+    uvicorn.run(app=create_render_service_app(service), host=host, port=port, **kwargs)
@@ -4,6 +4,8 @@ Router registration for the interactive diagram builder.
 This module provides functions to register API routers.
 """
 
+from collections.abc import MutableMapping
+
 from fastapi import FastAPI
 
 from ...core import MermaidRenderer
@@ -11,30 +13,38 @@ from ...validators.validator import MermaidValidator
 from ..routes import (
     create_elements_router,
     create_preview_router,
+    create_render_queue_router,
     create_sessions_router,
 )
-from ..websocket import DiagramSession, WebSocketHandler
+from ..scheduler import RenderScheduler
+from ..websocket import DiagramSession, PreviewService, WebSocketHandler
 
 
 def register_api_routers(
     app: FastAPI,
-    sessions: dict[str, DiagramSession],
+    sessions: MutableMapping[str, DiagramSession],
     websocket_handler: WebSocketHandler,
     renderer: MermaidRenderer,
     validator: MermaidValidator,
     max_sessions: int = 100,
+    scheduler: RenderScheduler | None = None,
+    preview_service: PreviewService | None = None,
 ) -> None:
     """
     Register all API routers.
 
     Args:
         app: FastAPI application
-        sessions: Dictionary of active sessions
+        sessions: Active sessions by ID
         websocket_handler: WebSocket handler for real-time updates
         renderer: MermaidRenderer instance for rendering diagrams
         validator: MermaidValidator instance for code validation
         max_sessions: Maximum number of concurrent sessions
+        scheduler: RenderScheduler running preview renders
+        preview_service: PreviewService caching previews by revision
     """
+    scheduler = scheduler or RenderScheduler()
+
     # Create and register session routes
     sessions_router = create_sessions_router(
         sessions=sessions,
@@ -55,5 +65,11 @@ def register_api_routers(
         sessions=sessions,
         renderer=renderer,
         validator=validator,
+        scheduler=scheduler,
+        preview_service=preview_service,
+        websocket_handler=websocket_handler,
     )
     app.include_router(preview_router)
+
+    # Create and register render queue metrics routes
+    app.include_router(create_render_queue_router(scheduler))
@@ -4,8 +4,6 @@ WebSocket endpoint for the interactive diagram builder.
 This module provides the WebSocket endpoint for real-time updates.
 """
 
-import json
-
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 
 from ..websocket import WebSocketHandler
@@ -29,11 +27,16 @@ def setup_websocket_endpoint(
 
         try:
             while True:
-                data = await websocket.receive_text()
-                message = json.loads(data)
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000))
+                data = frame.get("text")
+                if data is None:
+                    data = frame.get("bytes", b"")
+                message = websocket_handler.decode_message(websocket, data)
 
                 # Handle different message types
-                await websocket_handler.handle_message(session_id, message)
+                await websocket_handler.handle_message(session_id, message, websocket)
 
         except WebSocketDisconnect:
             websocket_handler.disconnect(websocket, session_id)
@@ -5,6 +5,7 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
+from ..models.constants import EMPTY_STYLE
 from .builder import DiagramBuilder
 from .models import DiagramType, ElementType, Position, Size
 
@@ -55,7 +56,7 @@ class InteractiveTemplate:
                 position=position,
                 size=size,
                 properties=element_data.get("properties", {}),
-                style=element_data.get("style", {}),
+                style=element_data.get("style") or EMPTY_STYLE,
             )
 
         # Add connections
@@ -65,7 +66,7 @@ class InteractiveTemplate:
                 target_id=connection_data["target_id"],
                 label=connection_data.get("label", ""),
                 connection_type=connection_data.get("connection_type", "default"),
-                style=connection_data.get("style", {}),
+                style=connection_data.get("style") or EMPTY_STYLE,
                 properties=connection_data.get("properties", {}),
             )
 
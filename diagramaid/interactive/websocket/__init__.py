@@ -5,15 +5,39 @@ This package provides WebSocket management for real-time updates
 and collaborative editing capabilities.
 """
 
+from .backplane import Backplane, LocalBackplane, RedisBackplane
 from .broadcast_service import BroadcastService
+from .codec import MessageCodec, available_encodings, negotiate_codec
 from .message_dispatcher import MessageDispatcher
-from .session_manager import DiagramSession, SessionManager
+from .preview_service import PreviewService
+from .resp import RedisStandIn, RespClient
+from .session_manager import DiagramSession, SessionManager, SessionMapping
+from .session_store import (
+    MemorySessionStore,
+    RedisSessionStore,
+    SessionStore,
+    SQLiteSessionStore,
+)
 from .websocket_handler import WebSocketHandler
 
 __all__ = [
     "WebSocketHandler",
     "DiagramSession",
     "SessionManager",
+    "SessionMapping",
     "MessageDispatcher",
     "BroadcastService",
+    "PreviewService",
+    "MessageCodec",
+    "available_encodings",
+    "negotiate_codec",
+    "SessionStore",
+    "SQLiteSessionStore",
+    "MemorySessionStore",
+    "RedisSessionStore",
+    "Backplane",
+    "LocalBackplane",
+    "RedisBackplane",
+    "RespClient",
+    "RedisStandIn",
 ]
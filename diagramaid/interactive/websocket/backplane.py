@@ -0,0 +1,181 @@
+"""
+Publish/subscribe backplane for the interactive diagram builder.
+
+With several workers (processes or hosts) serving the same session, each
+worker applies the edits of its own clients and publishes them on the
+session's channel; the other workers apply them to their copy of the session
+and forward them to their clients. ``LocalBackplane`` connects handlers in one
+process, ``RedisBackplane`` connects workers through Redis pub/sub.
+"""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .resp import AsyncRespConnection
+
+MessageCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class Backplane(ABC):
+    """Base class for message backplanes between workers."""
+
+    @abstractmethod
+    async def publish(self, channel: str, message: dict[str, Any]) -> None:
+        """Publish a message to every subscriber of a channel."""
+        pass
+
+    @abstractmethod
+    async def subscribe(self, channel: str, callback: MessageCallback) -> None:
+        """Call ``callback`` with every message published to a channel."""
+        pass
+
+    @abstractmethod
+    async def unsubscribe(self, channel: str, callback: MessageCallback) -> None:
+        """Stop calling ``callback`` for a channel."""
+        pass
+
+    async def close(self) -> None:
+        """Release resources held by the backplane; a no-op unless overridden."""
+        return None
+
+
+class LocalBackplane(Backplane):
+    """
+    Backplane delivering messages within the current process.
+
+    The fallback for a single worker; several handlers sharing one instance
+    behave like workers sharing a Redis backplane.
+    """
+
+    def __init__(self) -> None:
+        """Initialize local backplane."""
+        self._subscribers: dict[str, list[MessageCallback]] = {}
+
+    async def publish(self, channel: str, message: dict[str, Any]) -> None:
+        # Round-trip through JSON so subscribers never share mutable state
+        data = json.dumps(message, default=str)
+        for callback in list(self._subscribers.get(channel, ())):
+            await callback(json.loads(data))
+
+    async def subscribe(self, channel: str, callback: MessageCallback) -> None:
+        self._subscribers.setdefault(channel, []).append(callback)
+
+    async def unsubscribe(self, channel: str, callback: MessageCallback) -> None:
+        callbacks = self._subscribers.get(channel, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            self._subscribers.pop(channel, None)
+
+
+class RedisBackplane(Backplane):
+    """
+    Backplane using Redis pub/sub (or a server speaking its protocol).
+
+    Uses one connection for publishing and one for the subscriptions, read by
+    a background task; both are opened on first use.
+    """
+
+    def __init__(
+        self, url: str = "redis://localhost:6379/0", prefix: str = "diagramaid:"
+    ) -> None:
+        """
+        Initialize Redis backplane.
+
+        Args:
+            url: Redis URL
+            prefix: Prefix of the Redis channel names
+        """
+        self.url = url
+        self.prefix = prefix
+        self.logger = logging.getLogger(__name__)
+        self._publisher: AsyncRespConnection | None = None
+        self._subscriber: AsyncRespConnection | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._subscribers: dict[str, list[MessageCallback]] = {}
+        self._confirmations: dict[str, asyncio.Future[None]] = {}
+        self._connect_lock = asyncio.Lock()
+
+    async def publish(self, channel: str, message: dict[str, Any]) -> None:
+        async with self._connect_lock:
+            if self._publisher is None or not self._publisher.connected:
+                self._publisher = AsyncRespConnection(self.url)
+                await self._publisher.connect()
+        await self._publisher.execute(
+            "PUBLISH", self.prefix + channel, json.dumps(message, default=str)
+        )
+
+    async def subscribe(self, channel: str, callback: MessageCallback) -> None:
+        callbacks = self._subscribers.setdefault(channel, [])
+        callbacks.append(callback)
+        if len(callbacks) > 1:
+            return
+        async with self._connect_lock:
+            if self._subscriber is None or not self._subscriber.connected:
+                self._subscriber = AsyncRespConnection(self.url)
+                await self._subscriber.connect()
+                self._reader_task = asyncio.ensure_future(self._read_messages())
+        # The reader task resolves the confirmation, after which no message
+        # published to the channel is missed
+        confirmed = asyncio.get_running_loop().create_future()
+        self._confirmations[channel] = confirmed
+        await self._subscriber.send("SUBSCRIBE", self.prefix + channel)
+        await confirmed
+
+    async def unsubscribe(self, channel: str, callback: MessageCallback) -> None:
+        callbacks = self._subscribers.get(channel, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if callbacks or channel not in self._subscribers:
+            return
+        del self._subscribers[channel]
+        if self._subscriber is not None and self._subscriber.connected:
+            await self._subscriber.send("UNSUBSCRIBE", self.prefix + channel)
+
+    async def _read_messages(self) -> None:
+        """Dispatch pushed messages until the subscriber connection closes."""
+        subscriber = self._subscriber
+        assert subscriber is not None
+        while True:
+            try:
+                reply = await subscriber.read_reply()
+            except (ConnectionError, OSError, asyncio.IncompleteReadError) as e:
+                for confirmed in self._confirmations.values():
+                    if not confirmed.done():
+                        confirmed.set_exception(ConnectionError(str(e)))
+                self._confirmations.clear()
+                return
+            if not isinstance(reply, list) or len(reply) != 3:
+                continue
+            channel = reply[1].decode()[len(self.prefix) :]
+            if reply[0] == b"subscribe":
+                confirmed = self._confirmations.pop(channel, None)
+                if confirmed is not None and not confirmed.done():
+                    confirmed.set_result(None)
+                continue
+            if reply[0] != b"message":
+                continue
+            try:
+                message = json.loads(reply[2])
+            except ValueError:
+                continue
+            for callback in list(self._subscribers.get(channel, ())):
+                try:
+                    await callback(message)
+                except Exception as e:
+                    self.logger.warning(f"Backplane callback failed: {e}")
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        for connection in (self._publisher, self._subscriber):
+            if connection is not None:
+                await connection.close()
+        self._publisher = None
+        self._subscriber = None
+        self._subscribers.clear()
@@ -5,12 +5,13 @@ This module provides message broadcasting functionality for WebSocket clients.
 """
 
 import asyncio
-import json
 import time
 from typing import Any
 
 from fastapi import WebSocket
 
+from .codec import JSON_CODEC, MessageCodec
+from .send_queue import ClientSendQueue, coalesce_key
 from .session_manager import DiagramSession
 
 
@@ -19,25 +20,60 @@ class BroadcastService:
     Handles message broadcasting to WebSocket clients.
 
     Provides methods for sending messages to individual clients,
-    sessions, and with debouncing support.
+    sessions, and with debouncing support. Every client has its own bounded
+    ``ClientSendQueue``: session broadcasts encode the message once and only
+    enqueue it, so a slow client never delays the others. Messages are
+    encoded with each client's negotiated ``MessageCodec`` (JSON by default).
     """
 
-    def __init__(self, debounce_delay: float = 0.1) -> None:
+    def __init__(self, debounce_delay: float = 0.1, max_queue_size: int = 256) -> None:
         """
         Initialize broadcast service.
 
         Args:
             debounce_delay: Delay in seconds for debounced broadcasts
+            max_queue_size: Maximum number of messages queued per client
+                before the client is disconnected
         """
         self.debounce_delay = debounce_delay
+        self.max_queue_size = max_queue_size
         self._pending_broadcasts: dict[str, dict[str, Any]] = {}
         self._last_broadcast_time: dict[str, float] = {}
+        self._queues: dict[WebSocket, ClientSendQueue] = {}
+        self._codecs: dict[WebSocket, MessageCodec] = {}
+        # Statistics of queues already dropped
+        self._queue_totals = {"sent": 0, "coalesced": 0, "overflows": 0, "failures": 0}
+
+    def set_codec(self, websocket: WebSocket, codec: MessageCodec) -> None:
+        """
+        Set the message encoding of a client.
+
+        Args:
+            websocket: WebSocket connection
+            codec: Codec negotiated with the client
+        """
+        self._codecs[websocket] = codec
+
+    def get_codec(self, websocket: WebSocket) -> MessageCodec:
+        """Get the message encoding of a client."""
+        return self._codecs.get(websocket, JSON_CODEC)
+
+    def _queue_for(self, websocket: WebSocket) -> ClientSendQueue:
+        """Get the send queue of a client, creating it on first use."""
+        queue = self._queues.get(websocket)
+        if queue is None:
+            queue = ClientSendQueue(websocket, self.max_queue_size)
+            self._queues[websocket] = queue
+        return queue
 
     async def send_to_client(
         self, websocket: WebSocket, message: dict[str, Any]
     ) -> bool:
         """
-        Send message to a single client.
+        Send message to a single client and wait until it was sent.
+
+        The message is sent through the client's queue, after any messages
+        already queued for it.
 
         Args:
             websocket: WebSocket connection
@@ -47,10 +83,10 @@ class BroadcastService:
             True if message was sent successfully
         """
         try:
-            await websocket.send_text(json.dumps(message))
-            return True
+            data = self.get_codec(websocket).encode(message)
         except Exception:
             return False
+        return await self._queue_for(websocket).send(data)
 
     async def send_to_session(
         self, session: DiagramSession, message: dict[str, Any]
@@ -65,19 +101,7 @@ class BroadcastService:
         Returns:
             Set of disconnected clients
         """
-        if not session.connected_clients:
-            return set()
-
-        message_text = json.dumps(message)
-        disconnected_clients: set[WebSocket] = set()
-
-        for client in session.connected_clients:
-            try:
-                await client.send_text(message_text)
-            except Exception:
-                disconnected_clients.add(client)
-
-        return disconnected_clients
+        return self._enqueue(session, message)
 
     async def broadcast_to_session(
         self,
@@ -96,22 +120,78 @@ class BroadcastService:
         Returns:
             Set of disconnected clients
         """
+        return self._enqueue(session, message, exclude)
+
+    def _enqueue(
+        self,
+        session: DiagramSession,
+        message: dict[str, Any],
+        exclude: WebSocket | None = None,
+    ) -> set[WebSocket]:
+        """Queue a message for the clients of a session."""
         if not session.connected_clients:
             return set()
 
-        message_text = json.dumps(message)
+        # Encode once per encoding in use, not once per client
+        encoded: dict[str, str | bytes] = {}
+        key = coalesce_key(message)
         disconnected_clients: set[WebSocket] = set()
 
         for client in session.connected_clients:
             if client == exclude:
                 continue
-            try:
-                await client.send_text(message_text)
-            except Exception:
+            codec = self._codecs.get(client, JSON_CODEC)
+            data = encoded.get(codec.name)
+            if data is None:
+                data = encoded[codec.name] = codec.encode(message)
+            if not self._queue_for(client).put(data, key):
+                # Failed earlier or overflowed now; the queue is closed
+                self.remove_client(client)
                 disconnected_clients.add(client)
 
         return disconnected_clients
 
+    async def flush(self, websocket: WebSocket | None = None) -> None:
+        """
+        Wait until queued messages were sent.
+
+        Args:
+            websocket: Client to wait for (all clients if not provided)
+        """
+        if websocket is None:
+            queues = list(self._queues.values())
+        else:
+            queues = [self._queues[websocket]] if websocket in self._queues else []
+        for queue in queues:
+            await queue.flush()
+
+    def remove_client(self, websocket: WebSocket) -> None:
+        """
+        Drop the send queue of a disconnected client.
+
+        Args:
+            websocket: WebSocket connection
+        """
+        self._codecs.pop(websocket, None)
+        queue = self._queues.pop(websocket, None)
+        if queue is not None:
+            queue.close()
+            for name, value in queue.stats.items():
+                self._queue_totals[name] += value
+
+    def get_queue_stats(self) -> dict[str, Any]:
+        """Get send queue statistics of all clients."""
+        totals = dict(self._queue_totals)
+        for queue in self._queues.values():
+            for name, value in queue.stats.items():
+                totals[name] += value
+        return {
+            **totals,
+            "clients": len(self._queues),
+            "queued": sum(len(queue) for queue in self._queues.values()),
+            "max_queue_size": self.max_queue_size,
+        }
+
     async def broadcast_debounced(
         self,
         session_id: str,
@@ -163,27 +243,59 @@ class BroadcastService:
                 session.remove_client(client)
 
     async def send_state_sync(
-        self, websocket: WebSocket, session: DiagramSession
+        self,
+        websocket: WebSocket,
+        session: DiagramSession,
+        since_revision: int | None = None,
+        history_id: str | None = None,
     ) -> bool:
         """
         Send current diagram state to a client.
 
+        A client that still has an earlier revision receives a
+        ``state_delta`` with the operations since that revision; otherwise,
+        or if the revision is too old or from another history, the full
+        state is sent.
+
         Args:
             websocket: WebSocket connection
             session: DiagramSession containing state
+            since_revision: Revision the client already has
+            history_id: History the client's revision belongs to
 
         Returns:
             True if state was sent successfully
         """
-        state_message = {
-            "type": "state_sync",
-            "session_id": session.session_id,
-            "diagram_type": session.builder.diagram_type.value,
-            "elements": session.builder.to_dict()["elements"],
-            "connections": session.builder.to_dict()["connections"],
-            "metadata": session.builder.metadata,
-            "client_count": session.get_client_count(),
-        }
+        builder = session.builder
+        ops = None
+        if since_revision is not None:
+            ops = builder.changes_since(since_revision, history_id)
+
+        state_message: dict[str, Any]
+        if ops is not None:
+            state_message = {
+                "type": "state_delta",
+                "session_id": session.session_id,
+                "history_id": builder.history_id,
+                "from_revision": since_revision,
+                "revision": builder.revision,
+                "ops": ops,
+                "client_count": session.get_client_count(),
+            }
+        else:
+            state = builder.to_dict()
+            state_message = {
+                "type": "state_sync",
+                "session_id": session.session_id,
+                "history_id": builder.history_id,
+                "revision": builder.revision,
+                "encoding": self.get_codec(websocket).name,
+                "diagram_type": builder.diagram_type.value,
+                "elements": state["elements"],
+                "connections": state["connections"],
+                "metadata": builder.metadata,
+                "client_count": session.get_client_count(),
+            }
         return await self.send_to_client(websocket, state_message)
 
     async def send_client_count_update(
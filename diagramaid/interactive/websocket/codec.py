@@ -0,0 +1,105 @@
+"""
+Message encodings for the interactive WebSocket protocol.
+
+Clients choose an encoding when connecting (``/ws/<session>?encoding=msgpack``).
+JSON text frames are always available; MessagePack (``msgpack``) and CBOR
+(``cbor2``) binary frames are used when the respective package is installed.
+"""
+
+import json
+from typing import Any
+
+try:
+    import msgpack
+
+    _MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    _MSGPACK_AVAILABLE = False
+
+try:
+    import cbor2
+
+    _CBOR_AVAILABLE = True
+except ImportError:
+    cbor2 = None
+    _CBOR_AVAILABLE = False
+
+
+class MessageCodec:
+    """JSON text encoding, understood by every client."""
+
+    name = "json"
+    binary = False
+
+    def encode(self, message: dict[str, Any]) -> str | bytes:
+        """Encode a message into a WebSocket frame payload."""
+        return json.dumps(message, separators=(",", ":"), default=str)
+
+    def decode(self, data: str | bytes) -> dict[str, Any]:
+        """Decode a WebSocket frame payload into a message."""
+        result: dict[str, Any] = json.loads(data)
+        return result
+
+
+class MsgpackCodec(MessageCodec):
+    """MessagePack binary encoding."""
+
+    name = "msgpack"
+    binary = True
+
+    def encode(self, message: dict[str, Any]) -> str | bytes:
+        data: bytes = msgpack.packb(message, use_bin_type=True, default=str)
+        return data
+
+    def decode(self, data: str | bytes) -> dict[str, Any]:
+        result: dict[str, Any] = msgpack.unpackb(data, raw=False)
+        return result
+
+
+class CborCodec(MessageCodec):
+    """CBOR binary encoding."""
+
+    name = "cbor"
+    binary = True
+
+    def encode(self, message: dict[str, Any]) -> str | bytes:
+        data: bytes = cbor2.dumps(
+            message, default=lambda encoder, value: encoder.encode(str(value))
+        )
+        return data
+
+    def decode(self, data: str | bytes) -> dict[str, Any]:
+        result: dict[str, Any] = cbor2.loads(data)
+        return result
+
+
+JSON_CODEC = MessageCodec()
+
+CODECS: dict[str, MessageCodec] = {"json": JSON_CODEC}
+if _MSGPACK_AVAILABLE:
+    CODECS["msgpack"] = MsgpackCodec()
+if _CBOR_AVAILABLE:
+    CODECS["cbor"] = CborCodec()
+
+
+def available_encodings() -> list[str]:
+    """Get the names of the encodings usable in this installation."""
+    return list(CODECS)
+
+
+def negotiate_codec(requested: str | None) -> MessageCodec:
+    """
+    Pick the encoding for a connection.
+
+    Args:
+        requested: Comma-separated encodings in order of client preference
+
+    Returns:
+        The first requested encoding that is available, JSON otherwise
+    """
+    for name in (requested or "").split(","):
+        codec = CODECS.get(name.strip().lower())
+        if codec is not None:
+            return codec
+    return JSON_CODEC
@@ -7,8 +7,10 @@ This module provides message routing and handling for WebSocket messages.
 from datetime import datetime
 from typing import Any
 
+from ..builder import TextEdit
 from ..models import Position, Size
 from .broadcast_service import BroadcastService
+from .preview_service import PreviewService
 from .session_manager import DiagramSession
 
 
@@ -19,19 +21,26 @@ class MessageDispatcher:
     Routes incoming messages to appropriate handlers based on message type.
     """
 
-    def __init__(self, broadcast_service: BroadcastService) -> None:
+    def __init__(
+        self,
+        broadcast_service: BroadcastService,
+        preview_service: PreviewService | None = None,
+    ) -> None:
         """
         Initialize message dispatcher.
 
         Args:
             broadcast_service: BroadcastService for sending responses
+            preview_service: PreviewService pushing previews after edits
         """
         self.broadcast_service = broadcast_service
+        self.preview_service = preview_service
 
         # Message type to handler mapping
         self._handlers: dict[str, Any] = {
             "element_update": self._handle_element_update,
             "connection_update": self._handle_connection_update,
+            "code_edit": self._handle_code_edit,
             "cursor_update": self._handle_cursor_update,
             "selection_update": self._handle_selection_update,
             "chat_message": self._handle_chat_message,
@@ -87,6 +96,7 @@ class MessageDispatcher:
                 "type": "element_updated",
                 "element_id": element_id,
                 "updates": updates,
+                "revision": session.builder.revision,
                 "timestamp": datetime.now().isoformat(),
             }
             disconnected = await self.broadcast_service.send_to_session(
@@ -97,6 +107,9 @@ class MessageDispatcher:
             for client in disconnected:
                 session.remove_client(client)
 
+            if self.preview_service is not None:
+                self.preview_service.schedule_push(session)
+
     async def _handle_connection_update(
         self, session: DiagramSession, message: dict[str, Any]
     ) -> None:
@@ -128,6 +141,7 @@ class MessageDispatcher:
                 "type": "connection_updated",
                 "connection_id": connection_id,
                 "updates": updates,
+                "revision": session.builder.revision,
                 "timestamp": datetime.now().isoformat(),
             }
             disconnected = await self.broadcast_service.send_to_session(
@@ -138,6 +152,48 @@ class MessageDispatcher:
             for client in disconnected:
                 session.remove_client(client)
 
+            if self.preview_service is not None:
+                self.preview_service.schedule_push(session)
+
+    async def _handle_code_edit(
+        self, session: DiagramSession, message: dict[str, Any]
+    ) -> None:
+        """Handle an edit of the diagram's Mermaid code."""
+        edit_data = message.get("edit")
+        if not isinstance(edit_data, dict):
+            return
+
+        try:
+            edit = TextEdit.from_dict(edit_data)
+            ops = session.builder.apply_code_edit(edit, message.get("base_code"))
+        except (KeyError, TypeError, ValueError):
+            return
+
+        if ops == []:
+            return
+
+        # None means the code was loaded as a whole; send the full diagram
+        broadcast_message: dict[str, Any] = {
+            "type": "code_edited",
+            "edit": edit.to_dict(),
+            "revision": session.builder.revision,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if ops is None:
+            broadcast_message["diagram"] = session.builder.to_dict()
+        else:
+            broadcast_message["ops"] = ops
+        disconnected = await self.broadcast_service.send_to_session(
+            session, broadcast_message
+        )
+
+        # Clean up disconnected clients
+        for client in disconnected:
+            session.remove_client(client)
+
+        if self.preview_service is not None:
+            self.preview_service.schedule_push(session)
+
     async def _handle_cursor_update(
         self, session: DiagramSession, message: dict[str, Any]
     ) -> None:
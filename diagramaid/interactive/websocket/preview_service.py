@@ -0,0 +1,222 @@
+"""
+Preview service for the interactive diagram builder.
+
+This module renders session previews keyed by the builder revision and pushes
+re-rendered previews to WebSocket clients after edits, so clients no longer
+need to poll the preview endpoint.
+"""
+
+import asyncio
+import base64
+import hashlib
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from ..scheduler import JobSupersededError, RenderPriority, RenderScheduler
+from .broadcast_service import BroadcastService
+from .session_manager import DiagramSession
+
+if TYPE_CHECKING:
+    from ...core import MermaidRenderer
+
+PreviewKey = tuple[str, str, int, str | None, str]
+
+
+class PreviewService:
+    """
+    Renders, caches and pushes session previews.
+
+    Previews are cached by ``(session, history, revision, theme, format)``,
+    so repeated requests for an unchanged diagram never re-render; the
+    builder's ``history_id`` keeps builders sharing a session ID apart. Edits
+    that do not change the generated Mermaid code (such as moving an element)
+    reuse the previous render. Pushed previews are debounced per session and only
+    sent when the rendered content changed.
+    """
+
+    def __init__(
+        self,
+        renderer: "MermaidRenderer",
+        scheduler: RenderScheduler | None = None,
+        broadcast_service: BroadcastService | None = None,
+        debounce_delay: float = 0.2,
+        cache_size: int = 128,
+        push_format: str = "svg",
+    ) -> None:
+        """
+        Initialize preview service.
+
+        Args:
+            renderer: MermaidRenderer used for previews
+            scheduler: RenderScheduler running the renders
+            broadcast_service: BroadcastService used to push previews
+            debounce_delay: Delay in seconds before an edit triggers a push
+            cache_size: Maximum number of cached previews
+            push_format: Output format of pushed previews
+        """
+        self.renderer = renderer
+        self.scheduler = scheduler or RenderScheduler()
+        self.broadcast_service = broadcast_service
+        self.debounce_delay = debounce_delay
+        self.cache_size = cache_size
+        self.push_format = push_format
+
+        self._cache: OrderedDict[PreviewKey, Any] = OrderedDict()
+        # (session, history, theme, format) -> (code, content) of the latest render
+        self._last_render: dict[tuple[str, str, str | None, str], tuple[str, Any]] = {}
+        self._last_pushed: dict[str, str] = {}
+        self._pending_pushes: dict[str, asyncio.Task[bool]] = {}
+        self._metrics = {
+            "renders": 0,
+            "cache_hits": 0,
+            "unchanged_code": 0,
+            "pushes": 0,
+            "skipped_pushes": 0,
+        }
+
+    async def render(
+        self,
+        session: DiagramSession,
+        theme: str | None = None,
+        format: str = "svg",
+    ) -> Any:
+        """
+        Get the preview of a session's current revision.
+
+        Args:
+            session: DiagramSession to render
+            theme: Optional theme name
+            format: Output format
+
+        Returns:
+            Rendered content (str for SVG, bytes for PNG/PDF)
+
+        Raises:
+            JobSupersededError: If a newer revision was rendered meanwhile
+            ServiceOverloadedError: If the render queue is full
+        """
+        builder = session.builder
+        revision = builder.revision
+        key = (session.session_id, builder.history_id, revision, theme, format)
+        if key in self._cache:
+            self._metrics["cache_hits"] += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        code = builder.generate_mermaid_code()
+        render_key = (session.session_id, builder.history_id, theme, format)
+        last = self._last_render.get(render_key)
+        if last is not None and last[0] == code:
+            self._metrics["unchanged_code"] += 1
+            content = last[1]
+        else:
+            options = {"theme": theme} if theme else {}
+            content = await self.scheduler.submit(
+                session.session_id,
+                partial(self.renderer.render_raw, code, format, **options),
+                RenderPriority.PREVIEW,
+                revision,
+            )
+            self._metrics["renders"] += 1
+            self._last_render[render_key] = (code, content)
+
+        self._cache[key] = content
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return content
+
+    def schedule_push(self, session: DiagramSession) -> None:
+        """
+        Push the session preview after the debounce delay.
+
+        A push already scheduled for the session is replaced, so a burst of
+        edits results in a single render.
+
+        Args:
+            session: DiagramSession that changed
+        """
+        pending = self._pending_pushes.get(session.session_id)
+        if pending is not None and not pending.done():
+            pending.cancel()
+        self._pending_pushes[session.session_id] = asyncio.ensure_future(
+            self._push_later(session)
+        )
+
+    async def _push_later(self, session: DiagramSession) -> bool:
+        await asyncio.sleep(self.debounce_delay)
+        try:
+            return await self.push(session)
+        except JobSupersededError:
+            return False
+        except Exception:
+            # A failed preview must not break the editing session
+            return False
+        finally:
+            if self._pending_pushes.get(session.session_id) is asyncio.current_task():
+                del self._pending_pushes[session.session_id]
+
+    async def push(self, session: DiagramSession) -> bool:
+        """
+        Render the session preview and send it to the session's clients.
+
+        Args:
+            session: DiagramSession to push
+
+        Returns:
+            True if a changed preview was sent
+        """
+        if self.broadcast_service is None or not session.connected_clients:
+            return False
+
+        revision = session.builder.revision
+        content = await self.render(session, format=self.push_format)
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        digest = hashlib.sha256(data).hexdigest()
+        if self._last_pushed.get(session.session_id) == digest:
+            self._metrics["skipped_pushes"] += 1
+            return False
+
+        self._last_pushed[session.session_id] = digest
+        self._metrics["pushes"] += 1
+        message = {
+            "type": "preview_updated",
+            "revision": revision,
+            "format": self.push_format,
+            "content": content,
+            "hash": digest,
+        }
+        if isinstance(content, bytes):
+            message["content"] = base64.b64encode(content).decode("ascii")
+            message["encoding"] = "base64"
+        disconnected = await self.broadcast_service.send_to_session(
+            session, message
+        )
+        for client in disconnected:
+            session.remove_client(client)
+        return True
+
+    def forget(self, session_id: str) -> None:
+        """
+        Drop cached previews, pending pushes and render revisions of a session.
+
+        Args:
+            session_id: Session ID to forget
+        """
+        pending = self._pending_pushes.pop(session_id, None)
+        if pending is not None and not pending.done():
+            pending.cancel()
+        self._last_pushed.pop(session_id, None)
+        for key in [key for key in self._cache if key[0] == session_id]:
+            del self._cache[key]
+        for render_key in [key for key in self._last_render if key[0] == session_id]:
+            del self._last_render[render_key]
+        self.scheduler.forget_session(session_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get render, cache and push statistics."""
+        return {
+            **self._metrics,
+            "cached_previews": len(self._cache),
+            "pending_pushes": len(self._pending_pushes),
+        }
@@ -0,0 +1,467 @@
+"""
+Minimal Redis protocol (RESP) clients for the interactive diagram builder.
+
+``RedisSessionStore``, ``RedisBackplane`` and shared rate limits talk to
+Redis, or any server speaking its protocol (Valkey, KeyDB, ...), through these
+clients, so running several workers needs no extra package. ``RedisStandIn`` is a small local
+server implementing the commands they use, for tests and single-host setups.
+"""
+
+import asyncio
+import fnmatch
+import socket
+import socketserver
+import threading
+import time
+from typing import Any, BinaryIO
+from urllib.parse import urlparse
+
+RespValue = Any
+
+
+class RespError(Exception):
+    """Error reply from a Redis-protocol server."""
+
+    pass
+
+
+def parse_redis_url(url: str) -> tuple[str, int, int, str | None]:
+    """
+    Split a ``redis://[:password@]host[:port][/db]`` URL.
+
+    Args:
+        url: Redis URL
+
+    Returns:
+        Tuple of host, port, database number and password
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("redis", ""):
+        raise ValueError(f"Unsupported Redis URL scheme: {parsed.scheme}")
+    db_path = parsed.path.lstrip("/")
+    return (
+        parsed.hostname or "localhost",
+        parsed.port or 6379,
+        int(db_path) if db_path else 0,
+        parsed.password,
+    )
+
+
+def encode_command(*args: str | bytes | int) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def _read_reply(stream: BinaryIO) -> RespValue:
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("Connection closed by server")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        return RespError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        return stream.read(length + 2)[:-2]
+    if kind == b"*":
+        count = int(payload)
+        if count < 0:
+            return None
+        return [_read_reply(stream) for _ in range(count)]
+    raise RespError(f"Unexpected reply: {line!r}")
+
+
+async def _read_reply_async(reader: asyncio.StreamReader) -> RespValue:
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Connection closed by server")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        return RespError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        count = int(payload)
+        if count < 0:
+            return None
+        return [await _read_reply_async(reader) for _ in range(count)]
+    raise RespError(f"Unexpected reply: {line!r}")
+
+
+class RespClient:
+    """
+    Blocking Redis-protocol client for request/reply commands.
+
+    Safe to share between threads; commands are serialized on one connection,
+    which is reopened after a connection error.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", timeout: float = 5.0):
+        """
+        Initialize client; it connects on the first command.
+
+        Args:
+            url: Redis URL
+            timeout: Socket timeout in seconds
+        """
+        self.host, self.port, self.db, self.password = parse_redis_url(url)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._sock: socket.socket | None = None
+        self._stream: BinaryIO | None = None
+
+    def execute(self, *args: str | bytes | int) -> RespValue:
+        """
+        Run a command and return its reply.
+
+        Raises:
+            RespError: If the server answered with an error
+            ConnectionError: If the server cannot be reached
+        """
+        with self._lock:
+            try:
+                stream = self._connect()
+                self._sock.sendall(encode_command(*args))  # type: ignore[union-attr]
+                reply = _read_reply(stream)
+            except OSError:
+                self._disconnect()
+                raise
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    def pipeline(self, *commands: tuple[str | bytes | int, ...]) -> list[RespValue]:
+        """
+        Run several commands in one round trip.
+
+        Args:
+            *commands: Commands as tuples of arguments
+
+        Returns:
+            Replies in command order
+
+        Raises:
+            RespError: If the server answered any command with an error
+        """
+        with self._lock:
+            try:
+                stream = self._connect()
+                self._sock.sendall(  # type: ignore[union-attr]
+                    b"".join(encode_command(*command) for command in commands)
+                )
+                replies = [_read_reply(stream) for _ in commands]
+            except OSError:
+                self._disconnect()
+                raise
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+    def _connect(self) -> BinaryIO:
+        if self._stream is None:
+            self._sock = socket.create_connection(
+                (self.host, self.port), timeout=self.timeout
+            )
+            self._stream = self._sock.makefile("rb")
+            for command in _setup_commands(self.db, self.password):
+                self._sock.sendall(encode_command(*command))
+                reply = _read_reply(self._stream)
+                if isinstance(reply, RespError):
+                    self._disconnect()
+                    raise reply
+        return self._stream
+
+    def _disconnect(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._stream = None
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._disconnect()
+
+
+class AsyncRespConnection:
+    """
+    Asyncio Redis-protocol connection.
+
+    Used for publishing and, once subscribed, for reading pushed messages.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0"):
+        """
+        Initialize connection; call ``connect()`` before use.
+
+        Args:
+            url: Redis URL
+        """
+        self.host, self.port, self.db, self.password = parse_redis_url(url)
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        """Whether the connection is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> None:
+        """Open the connection and select the database."""
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port
+        )
+        for command in _setup_commands(self.db, self.password):
+            await self.execute(*command)
+
+    async def send(self, *args: str | bytes | int) -> None:
+        """Send a command without reading its reply."""
+        if self._writer is None:
+            raise ConnectionError("Not connected")
+        self._writer.write(encode_command(*args))
+        await self._writer.drain()
+
+    async def read_reply(self) -> RespValue:
+        """Read the next reply or pushed message."""
+        if self._reader is None:
+            raise ConnectionError("Not connected")
+        return await _read_reply_async(self._reader)
+
+    async def execute(self, *args: str | bytes | int) -> RespValue:
+        """
+        Run a command and return its reply.
+
+        Raises:
+            RespError: If the server answered with an error
+        """
+        async with self._lock:
+            await self.send(*args)
+            reply = await self.read_reply()
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self._reader = None
+        self._writer = None
+
+
+def _setup_commands(db: int, password: str | None) -> list[tuple[str, ...]]:
+    commands: list[tuple[str, ...]] = []
+    if password:
+        commands.append(("AUTH", password))
+    if db:
+        commands.append(("SELECT", str(db)))
+    return commands
+
+
+class RedisStandIn:
+    """
+    Local stand-in for a Redis server.
+
+    Implements the commands used by ``RedisSessionStore``, ``RedisBackplane``
+    and shared ``RateLimiter`` counts (``PING``, ``GET``, ``SET``, ``DEL``,
+    ``EXISTS``, ``KEYS``, ``INCR``, ``EXPIRE``, ``PUBLISH``, ``SUBSCRIBE``,
+    ``UNSUBSCRIBE``) with in-memory data that is lost when it stops.
+
+    Example:
+        >>> with RedisStandIn() as server:
+        ...     store = RedisSessionStore(server.url)
+        ...     store.save("session1", {"revision": 1})
+    """
+
+    def __init__(self, host: str = "127.0.0.1") -> None:
+        """
+        Initialize the server; it listens once started.
+
+        Args:
+            host: Interface to bind (a free port is chosen)
+        """
+        self.host = host
+        self.data: dict[bytes, bytes] = {}
+        self.expiry: dict[bytes, float] = {}
+        self.commands: list[str] = []
+        self._channels: dict[bytes, set[_RespHandler]] = {}
+        self._lock = threading.Lock()
+        self._server: socketserver.ThreadingTCPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Redis URL of the running server."""
+        if self._server is None:
+            raise RuntimeError("Stand-in server is not running")
+        return f"redis://{self.host}:{self._server.server_address[1]}/0"
+
+    def start(self) -> "RedisStandIn":
+        """Start serving in a background thread."""
+        if self._server is None:
+            stand_in = self
+
+            class Handler(_RespHandler):
+                server_state = stand_in
+
+            socketserver.ThreadingTCPServer.allow_reuse_address = True
+            self._server = socketserver.ThreadingTCPServer((self.host, 0), Handler)
+            self._server.daemon_threads = True
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self) -> "RedisStandIn":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _execute(self, handler: "_RespHandler", args: list[bytes]) -> bytes:
+        name = args[0].decode().upper()
+        self.commands.append(name)
+        with self._lock:
+            now = time.monotonic()
+            for key in [k for k, deadline in self.expiry.items() if deadline <= now]:
+                self.data.pop(key, None)
+                del self.expiry[key]
+            if name == "PING":
+                return b"+PONG\r\n"
+            if name in ("SELECT", "AUTH"):
+                return b"+OK\r\n"
+            if name == "GET":
+                return _bulk(self.data.get(args[1]))
+            if name == "SET":
+                self.data[args[1]] = args[2]
+                self.expiry.pop(args[1], None)
+                return b"+OK\r\n"
+            if name == "INCR":
+                try:
+                    value = int(self.data.get(args[1], b"0")) + 1
+                except ValueError:
+                    return b"-ERR value is not an integer or out of range\r\n"
+                self.data[args[1]] = str(value).encode()
+                return b":%d\r\n" % value
+            if name == "EXPIRE":
+                if args[1] not in self.data:
+                    return b":0\r\n"
+                self.expiry[args[1]] = now + int(args[2])
+                return b":1\r\n"
+            if name == "DEL":
+                removed = [self.data.pop(key, None) for key in args[1:]]
+                return b":%d\r\n" % sum(value is not None for value in removed)
+            if name == "EXISTS":
+                return b":%d\r\n" % sum(key in self.data for key in args[1:])
+            if name == "KEYS":
+                pattern = args[1].decode()
+                keys = [
+                    key
+                    for key in self.data
+                    if fnmatch.fnmatchcase(key.decode(), pattern)
+                ]
+                return b"*%d\r\n" % len(keys) + b"".join(_bulk(k) for k in keys)
+            if name == "PUBLISH":
+                subscribers = list(self._channels.get(args[1], ()))
+                frame = _array([b"message", args[1], args[2]])
+                for subscriber in subscribers:
+                    subscriber.push(frame)
+                return b":%d\r\n" % len(subscribers)
+            if name in ("SUBSCRIBE", "UNSUBSCRIBE"):
+                channels = args[1:] or list(handler.channels)
+                replies = []
+                for channel in channels:
+                    if name == "SUBSCRIBE":
+                        handler.channels.add(channel)
+                        self._channels.setdefault(channel, set()).add(handler)
+                    else:
+                        handler.channels.discard(channel)
+                        self._channels.get(channel, set()).discard(handler)
+                    replies.append(
+                        b"*3\r\n"
+                        + _bulk(name.lower().encode())
+                        + _bulk(channel)
+                        + b":%d\r\n" % len(handler.channels)
+                    )
+                return b"".join(replies)
+        return b"-ERR unknown command '%s'\r\n" % name.encode()
+
+    def _disconnected(self, handler: "_RespHandler") -> None:
+        with self._lock:
+            for channel in handler.channels:
+                self._channels.get(channel, set()).discard(handler)
+
+
+def _bulk(value: bytes | None) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def _array(values: list[bytes]) -> bytes:
+    return b"*%d\r\n" % len(values) + b"".join(_bulk(v) for v in values)
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    server_state: RedisStandIn
+
+    def setup(self) -> None:
+        super().setup()
+        self.channels: set[bytes] = set()
+        self._write_lock = threading.Lock()
+
+    def push(self, frame: bytes) -> None:
+        try:
+            with self._write_lock:
+                self.wfile.write(frame)
+                self.wfile.flush()
+        except OSError:
+            pass
+
+    def handle(self) -> None:
+        try:
+            while True:
+                request = _read_reply(self.rfile)
+                if not isinstance(request, list) or not request:
+                    return
+                if request[0].upper() == b"QUIT":
+                    self.push(b"+OK\r\n")
+                    return
+                self.push(self.server_state._execute(self, request))
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            self.server_state._disconnected(self)
@@ -0,0 +1,192 @@
+"""
+Per-client outbound message queues for the interactive diagram builder.
+
+Each connection gets a bounded ``ClientSendQueue`` drained by its own writer
+task, so broadcasting only enqueues and a slow client delays nobody but
+itself. Messages describing the latest state of something (a cursor, a
+selection, the preview) replace their queued predecessor instead of piling
+up, and a client whose queue still overflows is disconnected.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import WebSocket
+
+#: Message types where only the latest queued message matters, mapped to the
+#: field telling whose state the message carries (None: one per session)
+COALESCED_MESSAGE_TYPES: dict[str, str | None] = {
+    "cursor_update": "client_id",
+    "selection_update": "client_id",
+    "client_update": None,
+    "preview_updated": None,
+}
+
+#: Close code sent to clients that cannot keep up ("Try Again Later")
+OVERFLOW_CLOSE_CODE = 1013
+
+
+def coalesce_key(message: dict[str, Any]) -> tuple[Any, ...] | None:
+    """
+    Get the key under which a message replaces its queued predecessor.
+
+    Args:
+        message: Outgoing message
+
+    Returns:
+        Coalescing key, or None if every message must be delivered
+    """
+    message_type = message.get("type")
+    if message_type not in COALESCED_MESSAGE_TYPES:
+        return None
+    owner_field = COALESCED_MESSAGE_TYPES[message_type]
+    return (message_type, message.get(owner_field) if owner_field else None)
+
+
+@dataclass(slots=True)
+class _Outbound:
+    data: str | bytes
+    key: tuple[Any, ...] | None = None
+    delivered: "asyncio.Future[bool] | None" = field(default=None)
+
+
+class ClientSendQueue:
+    """
+    Bounded outbound queue of one WebSocket client.
+
+    The writer task runs only while messages are queued, so idle connections
+    cost no task.
+    """
+
+    def __init__(self, websocket: WebSocket, max_size: int = 256) -> None:
+        """
+        Initialize send queue.
+
+        Args:
+            websocket: WebSocket connection the queue writes to
+            max_size: Maximum number of queued messages
+        """
+        self.websocket = websocket
+        self.max_size = max_size
+        self.closed = False
+        self._queue: deque[_Outbound] = deque()
+        self._keyed: dict[tuple[Any, ...], _Outbound] = {}
+        self._writer: asyncio.Task[None] | None = None
+        self.stats = {"sent": 0, "coalesced": 0, "overflows": 0, "failures": 0}
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def put(
+        self,
+        data: str | bytes,
+        key: tuple[Any, ...] | None = None,
+        delivered: "asyncio.Future[bool] | None" = None,
+    ) -> bool:
+        """
+        Queue a message without waiting for it to be sent.
+
+        Args:
+            data: Encoded message (bytes are sent as a binary frame)
+            key: Coalescing key (see ``coalesce_key``)
+            delivered: Optional future resolved once the message was sent
+
+        Returns:
+            False if the client is gone or was disconnected for overflowing
+        """
+        if self.closed:
+            return False
+
+        if key is not None and key in self._keyed:
+            # Latest state wins; the message keeps its predecessor's place
+            previous = self._keyed[key]
+            if previous.delivered is not None and not previous.delivered.done():
+                previous.delivered.set_result(True)
+            previous.data = data
+            previous.delivered = delivered
+            self.stats["coalesced"] += 1
+            return True
+
+        if len(self._queue) >= self.max_size:
+            self.stats["overflows"] += 1
+            self.close()
+            asyncio.ensure_future(self._close_websocket())
+            return False
+
+        entry = _Outbound(data, key, delivered)
+        self._queue.append(entry)
+        if key is not None:
+            self._keyed[key] = entry
+        if self._writer is None:
+            self._writer = asyncio.ensure_future(self._drain())
+        return True
+
+    async def send(self, data: str | bytes) -> bool:
+        """
+        Queue a message and wait until it was sent.
+
+        Args:
+            data: Encoded message
+
+        Returns:
+            True if the message was sent
+        """
+        delivered: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        if not self.put(data, delivered=delivered):
+            return False
+        return await delivered
+
+    async def _drain(self) -> None:
+        """Send queued messages in order until the queue is empty."""
+        try:
+            while self._queue and not self.closed:
+                entry = self._queue.popleft()
+                if entry.key is not None and self._keyed.get(entry.key) is entry:
+                    del self._keyed[entry.key]
+                try:
+                    if isinstance(entry.data, bytes):
+                        await self.websocket.send_bytes(entry.data)
+                    else:
+                        await self.websocket.send_text(entry.data)
+                except asyncio.CancelledError:
+                    _resolve(entry, False)
+                    raise
+                except Exception:
+                    self.stats["failures"] += 1
+                    _resolve(entry, False)
+                    self.close()
+                    return
+                self.stats["sent"] += 1
+                _resolve(entry, True)
+        finally:
+            self._writer = None
+
+    async def flush(self) -> None:
+        """Wait until every queued message was sent or the queue closed."""
+        while self._writer is not None:
+            await asyncio.wait({self._writer})
+
+    def close(self) -> None:
+        """Stop writing and fail the messages still queued."""
+        self.closed = True
+        for entry in self._queue:
+            _resolve(entry, False)
+        self._queue.clear()
+        self._keyed.clear()
+        if self._writer is not None and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+
+    async def _close_websocket(self) -> None:
+        try:
+            await self.websocket.close(
+                code=OVERFLOW_CLOSE_CODE, reason="Client too slow"
+            )
+        except Exception:
+            pass
+
+
+def _resolve(entry: _Outbound, sent: bool) -> None:
+    if entry.delivered is not None and not entry.delivered.done():
+        entry.delivered.set_result(sent)
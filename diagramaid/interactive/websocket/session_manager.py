@@ -1,15 +1,24 @@
 """
 Session management for the interactive diagram builder.
 
-This module provides session lifecycle management and client tracking.
+This module provides session lifecycle management and client tracking,
+including LRU eviction of idle sessions to a ``SessionStore``.
 """
 
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from fastapi import WebSocket
 
+from .session_store import SessionStore
+
 if TYPE_CHECKING:
     from ..builder import DiagramBuilder
 
@@ -53,23 +62,90 @@ class DiagramSession:
         """Update the session's last activity timestamp."""
         self.updated_at = datetime.now()
 
+    def to_snapshot(self) -> dict[str, Any]:
+        """Serialize the session's diagram for a session store."""
+        return {
+            "session_id": self.session_id,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "revision": self.builder.revision,
+            "builder": self.builder.to_dict(),
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any]) -> "DiagramSession":
+        """
+        Restore a session (without clients) from a snapshot.
+
+        Args:
+            snapshot: Data produced by ``to_snapshot``
+
+        Returns:
+            Restored DiagramSession
+        """
+        from ..builder import DiagramBuilder
+
+        builder = DiagramBuilder()
+        builder.from_dict(snapshot["builder"])
+        # Continue the revision sequence so caches keyed by revision stay valid
+        builder.revision = snapshot.get("revision", 0)
+        builder._record_changes(None)
+
+        session = cls(snapshot["session_id"], builder)
+        session.created_at = datetime.fromisoformat(snapshot["created_at"])
+        session.updated_at = datetime.fromisoformat(snapshot["updated_at"])
+        return session
+
 
 class SessionManager:
     """
     Manages diagram editing sessions.
 
-    Handles session creation, retrieval, and cleanup.
+    Handles session creation, retrieval, and cleanup. Sessions are kept in
+    least-recently-used order. Sessions without clients are unloaded when
+    idle for ``max_idle`` seconds or when ``max_sessions`` or ``max_memory``
+    would be exceeded; with a ``SessionStore`` they are snapshotted first and
+    rehydrated on the next access. ``checkpoint()`` saves every session
+    changed since its last snapshot, and ``start_maintenance()`` runs
+    checkpointing and idle eviction in the background.
     """
 
-    def __init__(self, max_sessions: int = 100) -> None:
+    def __init__(
+        self,
+        max_sessions: int = 100,
+        store: SessionStore | None = None,
+        max_idle: float | None = None,
+        max_memory: int | None = None,
+        checkpoint_interval: float = 30.0,
+    ) -> None:
         """
         Initialize session manager.
 
         Args:
-            max_sessions: Maximum number of concurrent sessions
+            max_sessions: Maximum number of sessions kept in memory
+            store: SessionStore receiving snapshots of unloaded sessions
+            max_idle: Seconds without access after which a session without
+                clients is unloaded (None keeps idle sessions)
+            max_memory: Approximate memory budget in bytes for loaded
+                sessions, measured by their serialized size
+            checkpoint_interval: Seconds between background checkpoints
         """
-        self.sessions: dict[str, DiagramSession] = {}
+        self.sessions: OrderedDict[str, DiagramSession] = OrderedDict()
         self.max_sessions = max_sessions
+        self.store = store
+        self.max_idle = max_idle
+        self.max_memory = max_memory
+        self.checkpoint_interval = checkpoint_interval
+
+        # Called with the session ID whenever a session leaves memory
+        self.unload_callbacks: list[Callable[[str], None]] = []
+
+        self._last_access: dict[str, float] = {}
+        self._saved_revisions: dict[str, int] = {}
+        self._sizes: dict[str, tuple[int, int]] = {}
+        self._maintenance_task: asyncio.Task[None] | None = None
+        self._metrics = {"evicted": 0, "rehydrated": 0, "checkpointed": 0}
+        self.logger = logging.getLogger(__name__)
 
     def create_session(
         self, session_id: str, builder: "DiagramBuilder"
@@ -85,20 +161,42 @@ class SessionManager:
             Created DiagramSession
         """
         session = DiagramSession(session_id, builder)
-        self.sessions[session_id] = session
+        self.add_session(session)
         return session
 
+    def add_session(self, session: DiagramSession) -> None:
+        """
+        Add a session created elsewhere, replacing one with the same ID.
+
+        Args:
+            session: Session to manage
+        """
+        if session.session_id not in self.sessions:
+            self._make_room(1)
+        self.sessions[session.session_id] = session
+        self._last_access[session.session_id] = time.monotonic()
+
     def get_session(self, session_id: str) -> DiagramSession | None:
-        """Get session by ID."""
-        return self.sessions.get(session_id)
+        """Get session by ID, rehydrating it from the store if unloaded."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = self._rehydrate(session_id)
+            if session is None:
+                return None
+        else:
+            self.sessions.move_to_end(session_id)
+        self._last_access[session_id] = time.monotonic()
+        return session
 
     def has_session(self, session_id: str) -> bool:
-        """Check if session exists."""
-        return session_id in self.sessions
+        """Check if session exists, in memory or in the store."""
+        if session_id in self.sessions:
+            return True
+        return self.store is not None and self.store.contains(session_id)
 
     def remove_session(self, session_id: str) -> bool:
         """
-        Remove a session.
+        Remove a session, including its snapshot.
 
         Args:
             session_id: Session ID to remove
@@ -106,10 +204,204 @@ class SessionManager:
         Returns:
             True if session was removed
         """
-        if session_id in self.sessions:
-            del self.sessions[session_id]
-            return True
-        return False
+        removed = self._unload(session_id)
+        if self.store is not None and self.store.delete(session_id):
+            removed = True
+        return removed
+
+    def reload(self, session_id: str) -> DiagramSession | None:
+        """
+        Replace a loaded session's diagram with its stored snapshot.
+
+        Used when another worker changed the session; a session missing
+        from the store was removed there and is unloaded.
+
+        Args:
+            session_id: Session ID to reload
+
+        Returns:
+            The reloaded session, or None if it is not loaded or was removed
+        """
+        session = self.sessions.get(session_id)
+        if session is None or self.store is None:
+            return session
+        snapshot = self.store.load(session_id)
+        if snapshot is None:
+            self._unload(session_id)
+            return None
+        session.builder = DiagramSession.from_snapshot(snapshot).builder
+        self._saved_revisions[session_id] = session.builder.revision
+        self._sizes.pop(session_id, None)
+        return session
+
+    def evict(self, session_id: str) -> bool:
+        """
+        Snapshot a session to the store (if any) and unload it from memory.
+
+        Args:
+            session_id: Session ID to evict
+
+        Returns:
+            True if the session was loaded
+        """
+        session = self.sessions.get(session_id)
+        if session is None:
+            return False
+        if self.store is not None and self._is_dirty(session):
+            self.store.save(session_id, session.to_snapshot())
+            self._metrics["checkpointed"] += 1
+        self._unload(session_id)
+        self._metrics["evicted"] += 1
+        return True
+
+    def evict_idle(self, now: float | None = None) -> list[str]:
+        """
+        Evict idle sessions without clients, then trim to the memory budget.
+
+        Args:
+            now: Current ``time.monotonic()`` value (for tests)
+
+        Returns:
+            IDs of evicted sessions
+        """
+        evicted: list[str] = []
+        if self.max_idle is not None:
+            now = time.monotonic() if now is None else now
+            for session_id, session in list(self.sessions.items()):
+                idle = now - self._last_access.get(session_id, now)
+                if session.is_empty() and idle >= self.max_idle:
+                    self.evict(session_id)
+                    evicted.append(session_id)
+        return evicted + self._make_room(0)
+
+    def checkpoint(self) -> int:
+        """
+        Snapshot every loaded session changed since its last snapshot.
+
+        Returns:
+            Number of sessions written
+        """
+        if self.store is None:
+            return 0
+        snapshots = self._dirty_snapshots()
+        self.store.save_many(snapshots)
+        self._mark_saved(snapshots)
+        return len(snapshots)
+
+    async def checkpoint_async(self, session_ids: Iterable[str] | None = None) -> int:
+        """
+        Like ``checkpoint()``, writing to the store on a worker thread.
+
+        Args:
+            session_ids: Only consider these sessions (all loaded if None)
+
+        Returns:
+            Number of sessions written
+        """
+        if self.store is None:
+            return 0
+        snapshots = self._dirty_snapshots(session_ids)
+        if snapshots:
+            await asyncio.to_thread(self.store.save_many, snapshots)
+            self._mark_saved(snapshots)
+        return len(snapshots)
+
+    def start_maintenance(self) -> None:
+        """Start periodic checkpointing and idle eviction on the running loop."""
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self._maintenance_task = asyncio.ensure_future(self._maintain())
+
+    async def _maintain(self) -> None:
+        while True:
+            await asyncio.sleep(self.checkpoint_interval)
+            try:
+                await self.checkpoint_async()
+                self.evict_idle()
+            except Exception as e:
+                self.logger.warning(f"Session maintenance failed: {e}")
+
+    def close(self) -> None:
+        """Stop background maintenance and checkpoint all sessions."""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+        self.checkpoint()
+
+    def _rehydrate(self, session_id: str) -> DiagramSession | None:
+        if self.store is None:
+            return None
+        snapshot = self.store.load(session_id)
+        if snapshot is None:
+            return None
+        self._make_room(1)
+        session = DiagramSession.from_snapshot(snapshot)
+        self.sessions[session_id] = session
+        # The rehydrated content matches the stored snapshot
+        self._saved_revisions[session_id] = session.builder.revision
+        self._metrics["rehydrated"] += 1
+        return session
+
+    def _unload(self, session_id: str) -> bool:
+        session = self.sessions.pop(session_id, None)
+        self._last_access.pop(session_id, None)
+        self._saved_revisions.pop(session_id, None)
+        self._sizes.pop(session_id, None)
+        if session is None:
+            return False
+        for callback in self.unload_callbacks:
+            callback(session_id)
+        return True
+
+    def _make_room(self, needed: int) -> list[str]:
+        """Evict least recently used sessions without clients over the limits."""
+        evicted: list[str] = []
+        memory = self.estimate_memory() if self.max_memory is not None else 0
+        for session_id, session in list(self.sessions.items()):
+            over_count = len(self.sessions) + needed > self.max_sessions
+            over_memory = self.max_memory is not None and memory > self.max_memory
+            if not (over_count or over_memory):
+                break
+            if session.is_empty():
+                memory -= self._session_size(session)
+                self.evict(session_id)
+                evicted.append(session_id)
+        return evicted
+
+    def _is_dirty(self, session: DiagramSession) -> bool:
+        saved = self._saved_revisions.get(session.session_id)
+        return saved != session.builder.revision
+
+    def _dirty_snapshots(
+        self, session_ids: Iterable[str] | None = None
+    ) -> list[tuple[str, dict[str, Any]]]:
+        if session_ids is None:
+            session_ids = list(self.sessions)
+        sessions = (self.sessions.get(session_id) for session_id in session_ids)
+        return [
+            (session.session_id, session.to_snapshot())
+            for session in sessions
+            if session is not None and self._is_dirty(session)
+        ]
+
+    def _mark_saved(self, snapshots: list[tuple[str, dict[str, Any]]]) -> None:
+        for session_id, snapshot in snapshots:
+            if session_id in self.sessions:
+                self._saved_revisions[session_id] = snapshot["revision"]
+        self._metrics["checkpointed"] += len(snapshots)
+
+    def _session_size(self, session: DiagramSession) -> int:
+        """Approximate memory of a session: its serialized size, per revision."""
+        revision = session.builder.revision
+        cached = self._sizes.get(session.session_id)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        size = len(json.dumps(session.builder.to_dict(), default=str))
+        self._sizes[session.session_id] = (revision, size)
+        return size
+
+    def estimate_memory(self) -> int:
+        """Approximate memory in bytes used by the loaded sessions."""
+        return sum(self._session_size(session) for session in self.sessions.values())
 
     def add_client_to_session(
         self, session_id: str, websocket: WebSocket
@@ -151,7 +443,7 @@ class SessionManager:
 
     def cleanup_empty_sessions(self) -> list[str]:
         """
-        Remove all empty sessions.
+        Unload all empty sessions, snapshotting them if a store is set.
 
         Returns:
             List of removed session IDs
@@ -160,11 +452,11 @@ class SessionManager:
             sid for sid, session in self.sessions.items() if session.is_empty()
         ]
         for sid in empty_sessions:
-            del self.sessions[sid]
+            self.evict(sid)
         return empty_sessions
 
     def get_session_count(self) -> int:
-        """Get total number of active sessions."""
+        """Get number of sessions loaded in memory."""
         return len(self.sessions)
 
     def is_at_capacity(self) -> bool:
@@ -195,3 +487,60 @@ class SessionManager:
             if info:
                 sessions_info.append(info)
         return sessions_info
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get eviction, rehydration and checkpoint statistics."""
+        return {
+            **self._metrics,
+            "loaded_sessions": len(self.sessions),
+            "stored_sessions": (
+                len(self.store.list_sessions()) if self.store is not None else 0
+            ),
+            "estimated_memory": (
+                self.estimate_memory() if self.max_memory is not None else None
+            ),
+        }
+
+
+class SessionMapping(MutableMapping[str, DiagramSession]):
+    """
+    Dictionary view of a SessionManager's sessions, by ID.
+
+    Lets code written against a plain dict of sessions (such as the REST
+    routers) share the sessions of a WebSocketHandler: lookups rehydrate
+    sessions from the store, deleting removes the stored snapshot too, and
+    the length and iteration cover the sessions loaded in memory.
+    """
+
+    def __init__(self, manager: SessionManager) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            manager: SessionManager holding the sessions
+        """
+        self.manager = manager
+
+    def __getitem__(self, session_id: str) -> DiagramSession:
+        session = self.manager.get_session(session_id)
+        if session is None:
+            raise KeyError(session_id)
+        return session
+
+    def __setitem__(self, session_id: str, session: DiagramSession) -> None:
+        if session.session_id != session_id:
+            raise ValueError(f"Session {session.session_id} stored as {session_id}")
+        self.manager.add_session(session)
+
+    def __delitem__(self, session_id: str) -> None:
+        if not self.manager.remove_session(session_id):
+            raise KeyError(session_id)
+
+    def __contains__(self, session_id: object) -> bool:
+        return isinstance(session_id, str) and self.manager.has_session(session_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.manager.sessions)
+
+    def __len__(self) -> int:
+        return len(self.manager.sessions)
@@ -0,0 +1,225 @@
+"""
+Session snapshot storage for the interactive diagram builder.
+
+``SessionManager`` writes snapshots of idle, evicted and changed sessions to a
+``SessionStore`` and rehydrates them on the next access, so sessions survive
+eviction and server restarts. Workers sharing a ``RedisSessionStore`` (see
+``backplane`` for exchanging live edits) can serve the same sessions.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .resp import RespClient
+
+
+class SessionStore(ABC):
+    """Base class for session snapshot stores."""
+
+    @abstractmethod
+    def save(self, session_id: str, snapshot: dict[str, Any]) -> None:
+        """Store the snapshot of a session, replacing an earlier one."""
+        pass
+
+    @abstractmethod
+    def load(self, session_id: str) -> dict[str, Any] | None:
+        """Load the snapshot of a session, or None if there is none."""
+        pass
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """Delete the snapshot of a session; True if one existed."""
+        pass
+
+    @abstractmethod
+    def list_sessions(self) -> list[str]:
+        """List the IDs of stored sessions."""
+        pass
+
+    def contains(self, session_id: str) -> bool:
+        """Check if a snapshot of the session is stored."""
+        return self.load(session_id) is not None
+
+    def save_many(self, snapshots: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Store several snapshots."""
+        for session_id, snapshot in snapshots:
+            self.save(session_id, snapshot)
+
+    def close(self) -> None:
+        """Release resources held by the store; a no-op unless overridden."""
+        return None
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Session store keeping snapshots in process memory.
+
+    Snapshots survive eviction but not restarts and are not shared between
+    workers; useful as a local fallback and in tests.
+    """
+
+    def __init__(self) -> None:
+        """Initialize memory session store."""
+        self._snapshots: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def save(self, session_id: str, snapshot: dict[str, Any]) -> None:
+        data = json.dumps(snapshot, default=str)
+        with self._lock:
+            self._snapshots[session_id] = data
+
+    def load(self, session_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            data = self._snapshots.get(session_id)
+        if data is None:
+            return None
+        snapshot: dict[str, Any] = json.loads(data)
+        return snapshot
+
+    def contains(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._snapshots
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._snapshots.pop(session_id, None) is not None
+
+    def list_sessions(self) -> list[str]:
+        with self._lock:
+            return list(self._snapshots)
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Session store backed by a SQLite database file.
+
+    Safe to use from several threads; snapshots are stored as JSON.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """
+        Initialize SQLite session store.
+
+        Args:
+            path: Database file (":memory:" for a non-persistent store)
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, data TEXT NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+
+    def save(self, session_id: str, snapshot: dict[str, Any]) -> None:
+        self.save_many([(session_id, snapshot)])
+
+    def save_many(self, snapshots: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        rows = [
+            (session_id, json.dumps(snapshot, default=str), time.time())
+            for session_id, snapshot in snapshots
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sessions (session_id, data, updated_at) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def load(self, session_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        snapshot: dict[str, Any] = json.loads(row[0])
+        return snapshot
+
+    def contains(self, session_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row is not None
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+        return cursor.rowcount > 0
+
+    def list_sessions(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT session_id FROM sessions ORDER BY updated_at"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Session store backed by Redis (or a server speaking its protocol).
+
+    Snapshots are stored as JSON strings under ``<prefix><session_id>``, so
+    workers on several hosts share sessions.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "diagramaid:session:",
+        client: RespClient | None = None,
+    ) -> None:
+        """
+        Initialize Redis session store.
+
+        Args:
+            url: Redis URL
+            prefix: Key prefix of the snapshots
+            client: RespClient to use instead of connecting to ``url``
+        """
+        self.prefix = prefix
+        self._client = client or RespClient(url)
+
+    def save(self, session_id: str, snapshot: dict[str, Any]) -> None:
+        self._client.execute(
+            "SET", self.prefix + session_id, json.dumps(snapshot, default=str)
+        )
+
+    def load(self, session_id: str) -> dict[str, Any] | None:
+        data = self._client.execute("GET", self.prefix + session_id)
+        if data is None:
+            return None
+        snapshot: dict[str, Any] = json.loads(data)
+        return snapshot
+
+    def contains(self, session_id: str) -> bool:
+        return bool(self._client.execute("EXISTS", self.prefix + session_id))
+
+    def delete(self, session_id: str) -> bool:
+        return bool(self._client.execute("DEL", self.prefix + session_id))
+
+    def list_sessions(self) -> list[str]:
+        keys = self._client.execute("KEYS", self.prefix + "*")
+        return [key.decode()[len(self.prefix) :] for key in keys]
+
+    def close(self) -> None:
+        self._client.close()
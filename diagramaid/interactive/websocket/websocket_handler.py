@@ -5,14 +5,20 @@ This module provides the main WebSocket handler that orchestrates
 session management, message dispatching, and broadcasting.
 """
 
+import asyncio
+import logging
+import uuid
 from typing import Any
 
 from fastapi import WebSocket
 
 from ..models import DiagramType
 from ..security import InputSanitizer, SecurityValidator, websocket_rate_limiter
+from .backplane import Backplane
 from .broadcast_service import BroadcastService
+from .codec import JSON_CODEC, negotiate_codec
 from .message_dispatcher import MessageDispatcher
+from .preview_service import PreviewService
 from .session_manager import DiagramSession, SessionManager
 
 
@@ -24,29 +30,68 @@ class WebSocketHandler:
     broadcasting for collaborative diagram editing.
     """
 
-    def __init__(self, max_sessions: int = 100) -> None:
+    def __init__(
+        self,
+        max_sessions: int = 100,
+        preview_service: PreviewService | None = None,
+        session_manager: SessionManager | None = None,
+        backplane: Backplane | None = None,
+    ) -> None:
         """
         Initialize WebSocket handler.
 
         Args:
             max_sessions: Maximum number of concurrent sessions
+            preview_service: PreviewService pushing previews after edits; its
+                broadcast service is set to this handler's if missing
+            session_manager: SessionManager to use instead of a purely
+                in-memory one (e.g. with a SessionStore for eviction)
+            backplane: Backplane exchanging client messages with other
+                workers serving the same sessions; edits are then written
+                through to the session store, which should be shared
         """
-        self._session_manager = SessionManager(max_sessions=max_sessions)
+        self._session_manager = session_manager or SessionManager(
+            max_sessions=max_sessions
+        )
         self._broadcast_service = BroadcastService()
-        self._message_dispatcher = MessageDispatcher(self._broadcast_service)
+        self.preview_service = preview_service
+        if preview_service is not None:
+            if preview_service.broadcast_service is None:
+                preview_service.broadcast_service = self._broadcast_service
+            self._session_manager.unload_callbacks.append(preview_service.forget)
+        self._message_dispatcher = MessageDispatcher(
+            self._broadcast_service, preview_service
+        )
 
         # Client to session mapping
         self._client_sessions: dict[WebSocket, str] = {}
 
+        self.backplane = backplane
+        self.worker_id = uuid.uuid4().hex
+        self._remote_callbacks: dict[str, Any] = {}
+        if backplane is not None:
+            self._session_manager.unload_callbacks.append(self._leave_backplane)
+        self.logger = logging.getLogger(__name__)
+
     @property
     def sessions(self) -> dict[str, DiagramSession]:
         """Get all active sessions."""
         return self._session_manager.sessions
 
+    @property
+    def session_manager(self) -> SessionManager:
+        """Get the session manager."""
+        return self._session_manager
+
     async def connect(self, websocket: WebSocket, session_id: str) -> None:
         """
         Connect client to session.
 
+        The query parameters ``encoding`` (comma-separated preference list,
+        see ``codec``) and ``revision``/``history_id`` (last revision the
+        client has, to resume with a delta instead of the full state) are
+        honoured.
+
         Args:
             websocket: WebSocket connection
             session_id: Session ID to join
@@ -57,7 +102,7 @@ class WebSocketHandler:
 
             # Check rate limit
             client_ip = websocket.client.host if websocket.client else "unknown"
-            if not websocket_rate_limiter.is_allowed(client_ip):
+            if not await websocket_rate_limiter.is_allowed_async(client_ip):
                 await websocket.close(code=1008, reason="Rate limit exceeded")
                 return
 
@@ -69,6 +114,8 @@ class WebSocketHandler:
 
             await websocket.accept()
 
+            await self.follow_session(session_id)
+
             # Create session if it doesn't exist
             if not self._session_manager.has_session(session_id):
                 from ..builder import DiagramBuilder
@@ -82,8 +129,19 @@ class WebSocketHandler:
                 session.add_client(websocket)
                 self._client_sessions[websocket] = session_id
 
-                # Send current state to new client
-                await self._broadcast_service.send_state_sync(websocket, session)
+                params = websocket.query_params
+                self._broadcast_service.set_codec(
+                    websocket, negotiate_codec(params.get("encoding"))
+                )
+
+                # Send current state (or the changes since the client's
+                # revision) to new client
+                await self._broadcast_service.send_state_sync(
+                    websocket,
+                    session,
+                    _parse_revision(params.get("revision")),
+                    params.get("history_id"),
+                )
 
                 # Notify other clients about new connection
                 await self._broadcast_service.send_client_count_update(session)
@@ -104,32 +162,71 @@ class WebSocketHandler:
             session_id: Session ID to leave
         """
         self._session_manager.remove_client_from_session(session_id, websocket)
+        self._broadcast_service.remove_client(websocket)
 
-        # Clean up empty sessions
-        session = self._session_manager.get_session(session_id)
-        if session and session.is_empty():
+        # Clean up empty sessions; with a store they stay until evicted
+        session = self._session_manager.sessions.get(session_id)
+        if session and session.is_empty() and self._session_manager.store is None:
             self._session_manager.remove_session(session_id)
 
         # Remove client mapping
         if websocket in self._client_sessions:
             del self._client_sessions[websocket]
 
+    def decode_message(self, websocket: WebSocket, data: str | bytes) -> dict[str, Any]:
+        """
+        Decode an incoming frame with the client's negotiated encoding.
+
+        Args:
+            websocket: WebSocket connection the frame came from
+            data: Text or binary frame payload
+
+        Returns:
+            Decoded message
+        """
+        if isinstance(data, str):
+            # Text frames are always JSON, whatever the client negotiated
+            return JSON_CODEC.decode(data)
+        return self._broadcast_service.get_codec(websocket).decode(data)
+
     async def handle_message(
-        self, session_id: str, message: dict[str, Any]
+        self,
+        session_id: str,
+        message: dict[str, Any],
+        websocket: WebSocket | None = None,
     ) -> None:
         """
         Handle incoming WebSocket message.
 
+        A ``sync_request`` message (``{"type": "sync_request", "revision",
+        "history_id"}``) is answered to the requesting client with a delta or
+        full state sync.
+
         Args:
             session_id: Session ID
             message: Message data
+            websocket: Client the message came from
         """
         session = self._session_manager.get_session(session_id)
         if not session:
             return
 
+        if message.get("type") == "sync_request" and websocket is not None:
+            await self._broadcast_service.send_state_sync(
+                websocket,
+                session,
+                _parse_revision(message.get("revision")),
+                message.get("history_id"),
+            )
+            return
+
+        revision = session.builder.revision
         try:
             await self._message_dispatcher.dispatch(session, message)
+            if self.backplane is not None and message.get("type") != "ping":
+                await self._publish(
+                    session_id, message, checkpoint=session.builder.revision != revision
+                )
         except Exception as e:
             # Send error back to clients
             error_message = {
@@ -139,12 +236,118 @@ class WebSocketHandler:
             }
             await self._broadcast_service.send_to_session(session, error_message)
 
+    async def _publish(
+        self,
+        session_id: str,
+        message: dict[str, Any],
+        checkpoint: bool,
+        reload: bool = False,
+    ) -> None:
+        """
+        Pass a message on to the other workers.
+
+        Args:
+            session_id: Session the message belongs to
+            message: Client message, or a message for clients if ``reload``
+            checkpoint: Whether the session changed and must be written through
+            reload: Whether workers reload the session from the store and
+                forward the message to their clients, instead of handling it
+                like a client message
+        """
+        assert self.backplane is not None
+        payload = {"origin": self.worker_id, "message": message}
+        if reload:
+            payload["reload"] = True
+        try:
+            if checkpoint:
+                # Workers loading the session later start from this snapshot
+                await self._session_manager.checkpoint_async([session_id])
+            await self.backplane.publish(_channel(session_id), payload)
+        except Exception as e:
+            self.logger.warning(f"Publishing to backplane failed: {e}")
+
+    async def follow_session(self, session_id: str) -> None:
+        """
+        Receive other workers' changes to a session before loading it.
+
+        Called before a session is looked up, so none made after its stored
+        snapshot is missed. A copy loaded without following the session is
+        reloaded from the store. Does nothing without a backplane.
+
+        Args:
+            session_id: Session ID
+        """
+        if self.backplane is None or session_id in self._remote_callbacks:
+            return
+        await self._join_backplane(session_id)
+        self._session_manager.reload(session_id)
+
+    async def announce_removal(self, session_id: str) -> None:
+        """
+        Tell other workers that a session was removed, so they unload it.
+
+        Args:
+            session_id: ID of the removed session
+        """
+        if self.backplane is not None:
+            message = {"type": "session_removed", "session_id": session_id}
+            await self._publish(session_id, message, checkpoint=False, reload=True)
+
+    async def _join_backplane(self, session_id: str) -> None:
+        """Subscribe to a session's channel unless already subscribed."""
+        if self.backplane is None or session_id in self._remote_callbacks:
+            return
+
+        async def on_message(payload: dict[str, Any]) -> None:
+            await self._handle_remote_message(session_id, payload)
+
+        self._remote_callbacks[session_id] = on_message
+        await self.backplane.subscribe(_channel(session_id), on_message)
+
+    def _leave_backplane(self, session_id: str) -> None:
+        """Unsubscribe from the channel of an unloaded session."""
+        callback = self._remote_callbacks.pop(session_id, None)
+        if callback is None or self.backplane is None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        asyncio.ensure_future(
+            self.backplane.unsubscribe(_channel(session_id), callback)
+        )
+
+    async def _handle_remote_message(
+        self, session_id: str, payload: dict[str, Any]
+    ) -> None:
+        """Apply a message handled by another worker to the local session."""
+        if payload.get("origin") == self.worker_id:
+            return
+        session = self._session_manager.sessions.get(session_id)
+        message = payload.get("message")
+        if session is None or not isinstance(message, dict):
+            return
+        if payload.get("reload"):
+            # Changes made outside client messages travel through the store
+            self._session_manager.reload(session_id)
+            await self._broadcast_service.send_to_session(session, message)
+            return
+        try:
+            await self._message_dispatcher.dispatch(session, message)
+        except Exception as e:
+            self.logger.warning(f"Applying backplane message failed: {e}")
+
     async def broadcast_to_session(
         self, session_id: str, message: dict[str, Any]
     ) -> None:
         """
         Broadcast message to all clients in session.
 
+        With a backplane, the session is written through to the store and
+        the other workers reload it before forwarding the message to their
+        clients, so changes made outside client messages (e.g. through the
+        REST API) reach every worker.
+
         Args:
             session_id: Session ID
             message: Message to broadcast
@@ -161,6 +364,9 @@ class WebSocketHandler:
                 if client in self._client_sessions:
                     del self._client_sessions[client]
 
+            if self.backplane is not None:
+                await self._publish(session_id, message, checkpoint=True, reload=True)
+
     async def broadcast_debounced(
         self,
         session_id: str,
@@ -192,3 +398,15 @@ class WebSocketHandler:
     def get_client_session(self, websocket: WebSocket) -> str | None:
         """Get session ID for a client."""
         return self._client_sessions.get(websocket)
+
+
+def _channel(session_id: str) -> str:
+    return f"session:{session_id}"
+
+
+def _parse_revision(value: Any) -> int | None:
+    """Parse a client-supplied revision, ignoring invalid values."""
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -21,9 +21,9 @@ async def get_templates_resource(ctx: Context) -> str:
     """
     try:
         try:
-            from ...templates import TemplateManager
+            from ...templates import get_shared_manager
 
-            template_manager = TemplateManager()
+            template_manager = get_shared_manager()
             templates = template_manager.list_templates()
 
             templates_data = {
@@ -82,9 +82,9 @@ async def get_template_details(ctx: Context, template_name: str) -> str:
     """
     try:
         try:
-            from ...templates import TemplateManager
+            from ...templates import get_shared_manager
 
-            template_manager = TemplateManager()
+            template_manager = get_shared_manager()
             template = template_manager.get_template_by_name(template_name)
 
             if not template:
@@ -216,6 +216,15 @@ if _FASTMCP_AVAILABLE:
         include_custom: bool = Field(
             default=True, description="Include custom templates"
         )
+        query: str | None = Field(
+            default=None,
+            description="Words to search for in names, tags and descriptions",
+            max_length=200,
+        )
+        offset: int = Field(default=0, description="Results to skip", ge=0)
+        limit: int | None = Field(
+            default=None, description="Maximum number of results", ge=1, le=1000
+        )
 
     class DiagramTypeParams(BaseModel):  # type: ignore[misc]
         """Parameters for diagram type information tools."""
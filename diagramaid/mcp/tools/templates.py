@@ -63,7 +63,7 @@ async def create_from_template(
 
         # Check if templates module is available
         try:
-            from ...templates import TemplateManager
+            from ...templates import get_shared_manager
         except ImportError:
             if ctx:
                 await ctx.error("Template functionality not available")
@@ -75,7 +75,7 @@ async def create_from_template(
             }
 
         # Create template manager and generate diagram
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
         diagram_code = template_manager.generate(
             params.template_name,
             params.parameters,
@@ -120,6 +120,9 @@ async def list_available_templates(
     category: Annotated[str | None, "Filter by template category"] = None,
     include_builtin: Annotated[bool, "Include built-in templates"] = True,
     include_custom: Annotated[bool, "Include custom templates"] = True,
+    query: Annotated[str | None, "Search names, tags and descriptions"] = None,
+    offset: Annotated[int, "Number of results to skip"] = 0,
+    limit: Annotated[int | None, "Maximum number of results"] = None,
     ctx: Context | None = None,
 ) -> dict[str, Any]:
     """
@@ -127,13 +130,18 @@ async def list_available_templates(
 
     This tool provides comprehensive information about all available templates,
     including built-in and custom templates, with filtering capabilities and
-    detailed metadata about each template.
+    detailed metadata about each template. Lookups go through the template
+    search index, so the cost depends on the number of results rather than
+    the size of the catalogue.
 
     Args:
-        template_name: Filter by specific template name
+        template_name: Filter by words in the template name
         category: Filter by template category
         include_builtin: Include built-in templates in results
         include_custom: Include custom templates in results
+        query: Search names, tags and descriptions, best matches first
+        offset: Number of results to skip
+        limit: Maximum number of results
 
     Returns:
         Dictionary containing template list and metadata
@@ -151,11 +159,14 @@ async def list_available_templates(
             category=category,
             include_builtin=include_builtin,
             include_custom=include_custom,
+            query=query,
+            offset=offset,
+            limit=limit,
         )
 
         # Check if templates module is available
         try:
-            from ...templates import TemplateManager
+            from ...templates import get_shared_manager
         except ImportError:
             return create_error_response(
                 ImportError("Template functionality not available"),
@@ -165,105 +176,79 @@ async def list_available_templates(
                 ],
             )
 
-        # Get templates
-        template_manager = TemplateManager()
-        all_templates = []
-
-        # Get built-in templates
+        template_manager = get_shared_manager()
+        sources = []
         if params.include_builtin:
-            try:
-                from ...templates.library import BuiltInTemplates
-
-                builtin_lib = BuiltInTemplates()
-                builtin_templates = builtin_lib.get_all_templates()
-                for template in builtin_templates:
-                    template["source"] = "builtin"
-                    all_templates.append(template)
-            except Exception as e:
-                logger.warning(f"Could not load built-in templates: {e}")
-
-        # Get custom templates
+            sources.append("builtin")
         if params.include_custom:
-            try:
-                custom_templates = template_manager.list_templates()
-                for template in custom_templates:  # type: ignore[assignment]
-                    if hasattr(template, "to_dict"):
-                        template_dict = template.to_dict()
-                        template_dict["source"] = "custom"
-                        all_templates.append(template_dict)
-                    elif isinstance(template, dict):
-                        template_dict = template.copy()
-                        template_dict["source"] = "custom"
-                        all_templates.append(template_dict)
-                    else:
-                        # Skip non-dict, non-template objects
-                        pass
-            except Exception as e:
-                logger.warning(f"Could not load custom templates: {e}")
-
-        # Apply filters
-        filtered_templates = all_templates
-
-        if params.template_name:
-            filtered_templates = [
-                t
-                for t in filtered_templates
-                if params.template_name.lower() in t.get("name", "").lower()
-            ]
-
-        if params.category:
-            filtered_templates = [
-                t
-                for t in filtered_templates
-                if t.get("diagram_type") == params.category
-            ]
+            sources.extend(["custom", "community"])
+
+        if params.template_name and params.query:
+            search_query = f"{params.query} {params.template_name}"
+        else:
+            search_query = params.query or params.template_name
+        page = template_manager.search_templates(
+            search_query,
+            fields=None if params.query else ["name"],
+            diagram_type=params.category,
+            source=sources,
+            offset=params.offset,
+            limit=params.limit,
+        )
+
+        filtered_templates = []
+        for template in page.items:
+            template_dict = template.to_dict()
+            template_dict["source"] = template_manager.get_template_source(
+                template.id
+            )
+            if template.id in page.scores:
+                template_dict["relevance_score"] = page.scores[template.id]
+            filtered_templates.append(template_dict)
+
+        builtin_count = template_manager.count_templates("builtin")
+        custom_count = sum(
+            template_manager.count_templates(source)
+            for source in ("custom", "community")
+        )
 
         # Enhanced metadata
         metadata = {
-            "total_templates": len(all_templates),
-            "filtered_count": len(filtered_templates),
-            "builtin_count": len(
-                [t for t in all_templates if t.get("source") == "builtin"]
-            ),
-            "custom_count": len(
-                [t for t in all_templates if t.get("source") == "custom"]
-            ),
-            "categories": list(
-                {t.get("diagram_type", "unknown") for t in all_templates}
-            ),
+            "total_templates": (builtin_count if params.include_builtin else 0)
+            + (custom_count if params.include_custom else 0),
+            "filtered_count": page.total,
+            "builtin_count": builtin_count,
+            "custom_count": custom_count,
+            "categories": template_manager.get_diagram_types(),
             "filters_applied": {
                 "template_name": params.template_name,
                 "category": params.category,
                 "include_builtin": params.include_builtin,
                 "include_custom": params.include_custom,
+                "query": params.query,
+            },
+            "pagination": {
+                "offset": page.offset,
+                "limit": page.limit,
+                "returned": len(filtered_templates),
             },
         }
 
+        by_category: dict[str, int] = {}
+        by_source: dict[str, int] = {}
+        for template_dict in filtered_templates:
+            category_name = template_dict.get("diagram_type", "unknown")
+            by_category[category_name] = by_category.get(category_name, 0) + 1
+            source_name = template_dict.get("source") or "unknown"
+            by_source[source_name] = by_source.get(source_name, 0) + 1
+
         return create_success_response(
             data={
                 "templates": filtered_templates,
                 "summary": {
-                    "total": len(filtered_templates),
-                    "by_category": {
-                        cat: len(
-                            [
-                                t
-                                for t in filtered_templates
-                                if t.get("diagram_type") == cat
-                            ]
-                        )
-                        for cat in {
-                            t.get("diagram_type", "unknown") for t in filtered_templates
-                        }
-                    },
-                    "by_source": {
-                        src: len(
-                            [t for t in filtered_templates if t.get("source") == src]
-                        )
-                        for src in {
-                            t.get("source", "unknown") for t in filtered_templates
-                        }
-                    },
+                    "total": page.total,
+                    "by_category": by_category,
+                    "by_source": by_source,
                 },
             },
             metadata=metadata,
@@ -309,7 +294,7 @@ async def get_template_details(
 
         # Check if templates module is available
         try:
-            from ...templates import TemplateManager
+            from ...templates import get_shared_manager
         except ImportError:
             if ctx:
                 await ctx.error("Template functionality not available")
@@ -322,7 +307,7 @@ async def get_template_details(
             )
 
         # Get template details
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
         template = template_manager.get_template_by_name(template_name)
 
         if not template:
@@ -441,7 +426,7 @@ async def create_custom_template(
 
         # Check if templates module is available
         try:
-            from ...templates import TemplateManager
+            from ...templates import get_shared_manager
         except ImportError:
             if ctx:
                 await ctx.error("Template functionality not available")
@@ -464,7 +449,7 @@ async def create_custom_template(
             )
 
         # Create template
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
         template = template_manager.create_template(
             name=name,
             diagram_type=diagram_type,
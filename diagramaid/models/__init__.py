@@ -18,10 +18,12 @@ Available diagram types:
 - TimelineDiagram: Timeline diagrams for chronological events
 """
 
+from .adjacency import AdjacencyIndex
 from .class_diagram import ClassDiagram
 from .constants import (
     ARROW_TYPES,
     DIAGRAM_TYPES,
+    EMPTY_STYLE,
     FLOWCHART_SHAPES,
     THEMES,
     VISIBILITY_SYMBOLS,
@@ -31,6 +33,7 @@ from .flowchart import FlowchartDiagram
 from .gantt import GanttDiagram
 from .git_graph import GitGraphDiagram
 from .mindmap import MindmapDiagram
+from .partition import DiagramTile, partition_diagram
 from .pie_chart import PieChartDiagram
 from .sequence import SequenceDiagram
 from .state import StateDiagram
@@ -49,10 +52,16 @@ __all__ = [
     "GitGraphDiagram",
     "MindmapDiagram",
     "TimelineDiagram",
+    # Graph indexes
+    "AdjacencyIndex",
+    # Partitioning
+    "DiagramTile",
+    "partition_diagram",
     # Constants
     "VISIBILITY_SYMBOLS",
     "DIAGRAM_TYPES",
     "FLOWCHART_SHAPES",
     "ARROW_TYPES",
     "THEMES",
+    "EMPTY_STYLE",
 ]
@@ -0,0 +1,216 @@
+"""
+Adjacency indexes for diagram connection graphs.
+
+Flowchart edges and interactive builder connections are stored in insertion
+order, which makes "which edges touch this node?" a scan over every edge.
+``AdjacencyIndex`` keeps outgoing and incoming edge keys per node next to that
+storage so neighbour queries and removals cost O(degree) instead of O(E).
+
+Edge keys are whatever the owning container uses to identify an edge: the
+edge object for object-mode flowcharts, the row index for columnar edge
+tables and the connection id for the interactive builder.
+
+Example:
+    >>> index = AdjacencyIndex()
+    >>> index.add("e1", "A", "B")
+    >>> index.add("e2", "B", "C")
+    >>> index.successors("A")
+    ['B']
+    >>> sorted(index.reachable("A"))
+    ['A', 'B', 'C']
+    >>> index.has_cycle()
+    False
+"""
+
+from collections import deque
+from collections.abc import Hashable, Iterable, Iterator
+
+
+class AdjacencyIndex:
+    """
+    Incoming/outgoing edge index keyed by node id.
+
+    Each node maps to an insertion-ordered ``dict`` of edge keys, so adding,
+    discarding and listing the edges of a node never touches unrelated edges
+    and neighbour queries return edges in the order they were added.
+    """
+
+    __slots__ = ("_edges", "_out", "_in")
+
+    def __init__(
+        self, edges: Iterable[tuple[Hashable, Hashable, Hashable]] = ()
+    ) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            edges: Optional ``(key, source, target)`` triples to index
+        """
+        self._edges: dict[Hashable, tuple[Hashable, Hashable]] = {}
+        self._out: dict[Hashable, dict[Hashable, None]] = {}
+        self._in: dict[Hashable, dict[Hashable, None]] = {}
+        for key, source, target in edges:
+            self.add(key, source, target)
+
+    def add(self, key: Hashable, source: Hashable, target: Hashable) -> None:
+        """
+        Index an edge, replacing any edge already stored under ``key``.
+
+        Args:
+            key: Edge key
+            source: Source node id
+            target: Target node id
+        """
+        if key in self._edges:
+            self.discard(key)
+        self._edges[key] = (source, target)
+        self._out.setdefault(source, {})[key] = None
+        self._in.setdefault(target, {})[key] = None
+
+    def discard(self, key: Hashable) -> bool:
+        """
+        Remove an edge from the index.
+
+        Returns:
+            True if the edge was indexed
+        """
+        endpoints = self._edges.pop(key, None)
+        if endpoints is None:
+            return False
+        source, target = endpoints
+        outgoing = self._out[source]
+        del outgoing[key]
+        if not outgoing:
+            del self._out[source]
+        incoming = self._in[target]
+        del incoming[key]
+        if not incoming:
+            del self._in[target]
+        return True
+
+    def discard_many(self, keys: Iterable[Hashable]) -> int:
+        """
+        Remove several edges from the index.
+
+        Returns:
+            Number of edges that were indexed and removed
+        """
+        return sum(self.discard(key) for key in keys)
+
+    def clear(self) -> None:
+        """Remove every edge from the index."""
+        self._edges.clear()
+        self._out.clear()
+        self._in.clear()
+
+    def endpoints(self, key: Hashable) -> tuple[Hashable, Hashable]:
+        """Return ``(source, target)`` of an indexed edge."""
+        return self._edges[key]
+
+    # Neighbour queries
+
+    def outgoing(self, node: Hashable) -> list[Hashable]:
+        """Return the keys of edges leaving ``node``."""
+        return list(self._out.get(node, ()))
+
+    def incoming(self, node: Hashable) -> list[Hashable]:
+        """Return the keys of edges entering ``node``."""
+        return list(self._in.get(node, ()))
+
+    def touching(self, node: Hashable) -> list[Hashable]:
+        """Return the keys of edges leaving or entering ``node`` (self-loops once)."""
+        keys = dict.fromkeys(self._out.get(node, ()))
+        keys.update(dict.fromkeys(self._in.get(node, ())))
+        return list(keys)
+
+    def successors(self, node: Hashable) -> list[Hashable]:
+        """Return the distinct targets of edges leaving ``node``."""
+        return list(
+            dict.fromkeys(self._edges[key][1] for key in self._out.get(node, ()))
+        )
+
+    def predecessors(self, node: Hashable) -> list[Hashable]:
+        """Return the distinct sources of edges entering ``node``."""
+        return list(
+            dict.fromkeys(self._edges[key][0] for key in self._in.get(node, ()))
+        )
+
+    def out_degree(self, node: Hashable) -> int:
+        """Return the number of edges leaving ``node``."""
+        return len(self._out.get(node, ()))
+
+    def in_degree(self, node: Hashable) -> int:
+        """Return the number of edges entering ``node``."""
+        return len(self._in.get(node, ()))
+
+    def degree(self, node: Hashable) -> int:
+        """Return the number of edge endpoints at ``node``."""
+        return self.out_degree(node) + self.in_degree(node)
+
+    def nodes(self) -> list[Hashable]:
+        """Return every node that is the endpoint of at least one edge."""
+        return list(dict.fromkeys([*self._out, *self._in]))
+
+    # Graph checks
+
+    def reachable(self, start: Hashable) -> set[Hashable]:
+        """Return the nodes reachable from ``start``, including ``start``."""
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            for target in self.successors(queue.popleft()):
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def has_path(self, source: Hashable, target: Hashable) -> bool:
+        """Return True if ``target`` is reachable from ``source``."""
+        return target in self.reachable(source)
+
+    def find_cycle(self) -> list[Hashable] | None:
+        """
+        Find a directed cycle.
+
+        Uses an iterative depth-first search so deep graphs do not hit the
+        recursion limit.
+
+        Returns:
+            Nodes of one cycle in edge order (the first node is not repeated),
+            or None if the graph is acyclic
+        """
+        # 0 = unvisited, 1 = on the current path, 2 = finished
+        state: dict[Hashable, int] = {}
+        for root in self._out:
+            if root in state:
+                continue
+            state[root] = 1
+            path = [root]
+            stack: list[Iterator[Hashable]] = [iter(self.successors(root))]
+            while stack:
+                for target in stack[-1]:
+                    seen = state.get(target, 0)
+                    if seen == 1:
+                        return path[path.index(target) :]
+                    if seen == 0:
+                        state[target] = 1
+                        path.append(target)
+                        stack.append(iter(self.successors(target)))
+                        break
+                else:
+                    state[path.pop()] = 2
+                    stack.pop()
+        return None
+
+    def has_cycle(self) -> bool:
+        """Return True if the graph contains a directed cycle."""
+        return self.find_cycle() is not None
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._edges
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def __repr__(self) -> str:
+        return f"AdjacencyIndex({len(self)} edges, {len(self.nodes())} nodes)"
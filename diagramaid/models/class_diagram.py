@@ -5,12 +5,14 @@ This module provides an object-oriented interface for creating UML class diagram
 with support for classes, interfaces, relationships, and methods.
 """
 
-from ..core import MermaidDiagram
+from collections.abc import Collection, Hashable
+
+from ..core import MermaidDiagram, TrackedElement
 from ..exceptions import DiagramError
 from .constants import VISIBILITY_SYMBOLS
 
 
-class ClassMethod:
+class ClassMethod(TrackedElement):
     """Represents a method belonging to a class in a class diagram.
 
     Attributes:
@@ -22,6 +24,15 @@ class ClassMethod:
         is_abstract: Whether the method is abstract.
     """
 
+    __slots__ = (
+        "name",
+        "visibility",
+        "return_type",
+        "parameters",
+        "is_static",
+        "is_abstract",
+    )
+
     def __init__(
         self,
         name: str,
@@ -57,7 +68,7 @@ class ClassMethod:
         return method_str
 
 
-class ClassAttribute:
+class ClassAttribute(TrackedElement):
     """Represents a class attribute (field) in a class diagram.
 
     Attributes:
@@ -67,6 +78,8 @@ class ClassAttribute:
         is_static: Whether the attribute is static.
     """
 
+    __slots__ = ("name", "type", "visibility", "is_static")
+
     def __init__(
         self,
         name: str,
@@ -93,7 +106,7 @@ class ClassAttribute:
         return attr_str
 
 
-class ClassDefinition:
+class ClassDefinition(TrackedElement):
     """Represents a class/interface definition in a class diagram.
 
     Attributes:
@@ -105,6 +118,15 @@ class ClassDefinition:
         methods: Collected methods defined on this class.
     """
 
+    __slots__ = (
+        "name",
+        "is_abstract",
+        "is_interface",
+        "stereotype",
+        "attributes",
+        "methods",
+    )
+
     def __init__(
         self,
         name: str,
@@ -123,10 +145,14 @@ class ClassDefinition:
     def add_attribute(self, attribute: ClassAttribute) -> None:
         """Append an attribute to this class definition."""
         self.attributes.append(attribute)
+        attribute._bind(self)
+        self._touch()
 
     def add_method(self, method: ClassMethod) -> None:
         """Append a method to this class definition."""
         self.methods.append(method)
+        method._bind(self)
+        self._touch()
 
     def to_mermaid(self) -> list[str]:
         """Build and return the Mermaid class block as a list of lines."""
@@ -158,7 +184,7 @@ class ClassDefinition:
         return lines
 
 
-class ClassRelationship:
+class ClassRelationship(TrackedElement):
     """Represents a relationship (edge) between two classes.
 
     Supported relationship types map to Mermaid arrows:
@@ -187,6 +213,15 @@ class ClassRelationship:
         "realization": "..|>",
     }
 
+    __slots__ = (
+        "from_class",
+        "to_class",
+        "relationship_type",
+        "label",
+        "from_cardinality",
+        "to_cardinality",
+    )
+
     def __init__(
         self,
         from_class: str,
@@ -243,6 +278,8 @@ class ClassDiagram(MermaidDiagram):
         self.classes: dict[str, ClassDefinition] = {}
         self.relationships: list[ClassRelationship] = []
 
+    _FRAGMENT_SECTIONS = ("classes", "relationships")
+
     def get_diagram_type(self) -> str:
         """Return the Mermaid diagram header keyword ('classDiagram')."""
         return "classDiagram"
@@ -260,6 +297,8 @@ class ClassDiagram(MermaidDiagram):
 
         class_def = ClassDefinition(name, is_abstract, is_interface, stereotype)
         self.classes[name] = class_def
+        class_def._bind(self, "classes", name)
+        self._mark_fragment_dirty("classes", name)
         return class_def
 
     def add_relationship(
@@ -286,24 +325,33 @@ class ClassDiagram(MermaidDiagram):
             to_cardinality,
         )
         self.relationships.append(relationship)
+        relationship._bind(self, "relationships", relationship)
+        self._mark_fragment_dirty("relationships", relationship)
         return relationship
 
-    def _generate_mermaid(self) -> str:
-        """Generate and return the full Mermaid text for the diagram."""
+    def _generate_header_lines(self) -> list[str]:
+        """Return the declaration and optional title lines."""
         lines = ["classDiagram"]
 
         # Add title if present
         if self.title:
             lines.append(f"    title: {self.title}")
 
-        # Add classes
-        for class_def in self.classes.values():
-            class_lines = class_def.to_mermaid()
-            for line in class_lines:
-                lines.append(f"    {line}")
+        return lines
+
+    def _fragment_source(self, section: str) -> Collection[Hashable]:
+        """Return the element container backing a fragment section."""
+        if section == "classes":
+            return self.classes
+        return self.relationships
 
-        # Add relationships
-        for relationship in self.relationships:
-            lines.append(f"    {relationship.to_mermaid()}")
+    def _render_fragment(self, section: str, key: Hashable) -> str:
+        """Return the Mermaid text for a single class block or relationship."""
+        if section == "classes":
+            class_lines = self.classes[key].to_mermaid()  # type: ignore[index]
+            return "\n".join(f"    {line}" for line in class_lines)
+        return f"    {key.to_mermaid()}"  # type: ignore[attr-defined]
 
-        return "\n".join(lines)
+    def _generate_mermaid(self) -> str:
+        """Generate and return the full Mermaid text for the diagram."""
+        return "\n".join(self._generate_fragment_lines())
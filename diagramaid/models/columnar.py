@@ -0,0 +1,622 @@
+"""
+Columnar element storage for very large diagram models.
+
+Object-per-element storage costs a Python object, its attribute slots and a
+dictionary entry for every node and edge. When a diagram is generated from
+inventory data with hundreds of thousands of elements, that overhead dominates
+memory. The tables in this module store the same data as parallel arrays:
+
+- ``NodeTable`` keeps interned ids and labels in lists and shape codes in a
+  byte array, behaving like ``dict[str, FlowchartNode]``.
+- ``EdgeTable`` keeps interned endpoint ids and labels in lists and arrow
+  codes in a byte array, behaving like ``list[FlowchartEdge]``. An
+  ``AdjacencyIndex`` over its rows is built on the first per-node query and
+  maintained from then on.
+
+Element objects are materialized on access and stay bound to their table, so
+assigning to their attributes writes the change back into the row and marks
+the matching output fragment of the owning diagram as dirty.
+
+``read_columns`` normalizes bulk input (rows, dict-of-lists, NumPy structured
+arrays or pyarrow tables) into plain column lists for the ``add_nodes`` /
+``add_edges`` bulk loaders.
+
+Example:
+    >>> diagram = FlowchartDiagram(storage="columnar")
+    >>> diagram.add_node("A", "Start")
+    >>> diagram.nodes["A"].label = "Begin"  # Written back into the table
+"""
+
+import sys
+from array import array
+from collections.abc import (
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+)
+from typing import Any, overload
+
+from ..exceptions import DiagramError
+from .adjacency import AdjacencyIndex
+
+# Compact when more than this share of rows are deleted
+_COMPACT_RATIO = 0.5
+# ...but never bother for small tables
+_COMPACT_MIN_ROWS = 1024
+
+
+def _intern(value: str) -> str:
+    """Intern a string so repeated ids and labels share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _column_list(column: Any) -> list[Any]:
+    """Convert a list, NumPy array or pyarrow array into a Python list."""
+    if isinstance(column, list):
+        return column
+    if hasattr(column, "to_pylist"):  # pyarrow Array / ChunkedArray
+        return column.to_pylist()  # type: ignore[no-any-return]
+    if hasattr(column, "tolist"):  # NumPy array, pandas Series
+        return column.tolist()  # type: ignore[no-any-return]
+    return list(column)
+
+
+def read_columns(data: Any, names: Sequence[str]) -> dict[str, list[Any] | None]:
+    """
+    Normalize bulk element input into one Python list per column.
+
+    Accepted inputs:
+
+    - a mapping of column name to list, NumPy array or pyarrow array
+    - a pyarrow ``Table`` / ``RecordBatch`` or a NumPy structured array
+    - an iterable of rows, each a mapping or a tuple ordered like ``names``
+
+    Array inputs are converted column-at-a-time in C, so no Python code runs
+    per row until the values are stored. NumPy and pyarrow are never imported
+    here; they are recognized by their conversion methods.
+
+    Args:
+        data: Bulk input
+        names: Column names in positional (tuple row) order
+
+    Returns:
+        Mapping of every name to its column, or None for absent columns
+
+    Raises:
+        DiagramError: If the columns have different lengths
+    """
+    columns: dict[str, list[Any] | None]
+    if hasattr(data, "column_names") and hasattr(data, "column"):
+        # pyarrow Table / RecordBatch
+        present = set(data.column_names)
+        columns = {
+            name: _column_list(data.column(name)) if name in present else None
+            for name in names
+        }
+    elif getattr(getattr(data, "dtype", None), "names", None):
+        # NumPy structured array
+        present = set(data.dtype.names)
+        columns = {
+            name: data[name].tolist() if name in present else None for name in names
+        }
+    elif isinstance(data, Mapping):
+        columns = {
+            name: _column_list(data[name]) if name in data else None for name in names
+        }
+    else:
+        rows = data if isinstance(data, list) else list(data)
+        if rows and isinstance(rows[0], Mapping):
+            present = set().union(*(row.keys() for row in rows))
+            columns = {
+                name: [row.get(name) for row in rows] if name in present else None
+                for name in names
+            }
+        else:
+            transposed = list(zip(*rows, strict=False)) if rows else []
+            # Short tuples leave trailing columns absent
+            width = min(map(len, rows), default=0)
+            columns = {
+                name: list(transposed[i]) if i < width else None
+                for i, name in enumerate(names)
+            }
+
+    lengths = {len(column) for column in columns.values() if column is not None}
+    if len(lengths) > 1:
+        raise DiagramError("Bulk input columns must all have the same length")
+    return columns
+
+
+class NodeTable(MutableMapping[str, Any]):
+    """
+    Mapping of node id to node stored as parallel columns.
+
+    Rows are appended in insertion order. Deleted rows are tombstoned and
+    reclaimed by ``compact()`` once they make up a large share of the table,
+    so deletion is O(1) and iteration order matches a ``dict``.
+
+    Args:
+        element_type: Node class used to materialize rows (``FlowchartNode``)
+        owner: Diagram notified about row changes, if any
+    """
+
+    __slots__ = (
+        "_element_type",
+        "_shapes",
+        "_shape_codes",
+        "_ids",
+        "_labels",
+        "_codes",
+        "_rows",
+        "_styles",
+        "_tombstones",
+        "_owner",
+    )
+
+    def __init__(self, element_type: type, owner: Any = None) -> None:
+        self._element_type = element_type
+        self._shapes: tuple[str, ...] = tuple(element_type.SHAPES)
+        self._shape_codes = {shape: code for code, shape in enumerate(self._shapes)}
+        self._ids: list[str | None] = []
+        self._labels: list[str] = []
+        self._codes = array("B")
+        self._rows: dict[str, int] = {}
+        # Styles are rare; keep them in a sparse side table
+        self._styles: dict[str, Mapping[str, str]] = {}
+        self._tombstones = 0
+        self._owner = owner
+
+    def _shape_code(self, shape: str) -> int:
+        try:
+            return self._shape_codes[shape]
+        except KeyError:
+            raise DiagramError(f"Unknown node shape: {shape}")
+
+    def append_row(
+        self,
+        id: str,
+        label: str,
+        shape: str = "rectangle",
+        style: Mapping[str, str] | None = None,
+    ) -> None:
+        """
+        Store a node without materializing an element object.
+
+        Args:
+            id: Unique node identifier
+            label: Display text
+            shape: Node shape name
+            style: Optional node style
+
+        Raises:
+            DiagramError: If the id already exists or the shape is unknown
+        """
+        if id in self._rows:
+            raise DiagramError(f"Node with ID '{id}' already exists")
+        code = self._shape_code(shape)
+        id = _intern(id)
+        self._rows[id] = len(self._ids)
+        self._ids.append(id)
+        self._labels.append(_intern(label))
+        self._codes.append(code)
+        if style:
+            self._styles[id] = style
+        if self._owner is not None:
+            self._owner._mark_fragment_dirty("nodes", id)
+
+    def extend_rows(
+        self,
+        ids: list[str],
+        labels: list[str],
+        shapes: list[str] | None = None,
+        styles: list[Mapping[str, str] | None] | None = None,
+    ) -> None:
+        """
+        Store many nodes at once, writing the columns directly.
+
+        The caller is responsible for validating ids and shapes first (see
+        ``FlowchartDiagram.add_nodes``).
+        """
+        start = len(self._ids)
+        ids = list(map(_intern, ids))
+        self._ids.extend(ids)
+        self._labels.extend(map(_intern, labels))
+        if shapes is None:
+            self._codes.extend(bytes(len(ids)))
+        else:
+            self._codes.extend(map(self._shape_codes.__getitem__, shapes))
+        self._rows.update(zip(ids, range(start, start + len(ids)), strict=True))
+        if styles is not None:
+            self._styles.update(
+                (id, style) for id, style in zip(ids, styles, strict=False) if style
+            )
+        if self._owner is not None:
+            self._owner._mark_fragments_dirty("nodes", ids)
+
+    def render(self, id: str) -> str:
+        """Return the Mermaid definition of a node without materializing it."""
+        row = self._rows[id]
+        return self._element_type.format_mermaid(  # type: ignore[no-any-return]
+            id, self._labels[row], self._shapes[self._codes[row]]
+        )
+
+    def compact(self) -> None:
+        """Reclaim the rows of deleted nodes."""
+        if not self._tombstones:
+            return
+        live = [row for row, id in enumerate(self._ids) if id is not None]
+        self._ids = [self._ids[row] for row in live]
+        self._labels = [self._labels[row] for row in live]
+        self._codes = array("B", (self._codes[row] for row in live))
+        self._rows = {id: row for row, id in enumerate(self._ids)}  # type: ignore[misc]
+        self._tombstones = 0
+
+    def _element_changed(self, node: Any) -> None:
+        """Write a mutated materialized node back into its row."""
+        key = node._fragment[1]
+        row = self._rows.get(key)
+        if row is None:
+            return
+        if node.id != key:
+            raise DiagramError("Node IDs cannot be changed in columnar storage")
+        self._labels[row] = _intern(node.label)
+        self._codes[row] = self._shape_code(node.shape)
+        if node.style:
+            self._styles[key] = node.style
+        else:
+            self._styles.pop(key, None)
+        if self._owner is not None:
+            self._owner._mark_fragment_dirty("nodes", key)
+
+    def __getitem__(self, id: str) -> Any:
+        row = self._rows[id]
+        node = self._element_type(
+            id,
+            self._labels[row],
+            self._shapes[self._codes[row]],
+            self._styles.get(id),
+        )
+        node._bind(self, "nodes", id)
+        return node
+
+    def __setitem__(self, id: str, node: Any) -> None:
+        row = self._rows.get(id)
+        if row is None:
+            self.append_row(id, node.label, node.shape, node.style)
+        else:
+            self._labels[row] = _intern(node.label)
+            self._codes[row] = self._shape_code(node.shape)
+            if node.style:
+                self._styles[id] = node.style
+            else:
+                self._styles.pop(id, None)
+            if self._owner is not None:
+                self._owner._mark_fragment_dirty("nodes", id)
+        node._bind(self, "nodes", id)
+
+    def __delitem__(self, id: str) -> None:
+        row = self._rows.pop(id)
+        self._ids[row] = None
+        self._labels[row] = ""
+        self._styles.pop(id, None)
+        self._tombstones += 1
+        if self._owner is not None:
+            self._owner._drop_fragment("nodes", id)
+        if (
+            len(self._ids) >= _COMPACT_MIN_ROWS
+            and self._tombstones > len(self._ids) * _COMPACT_RATIO
+        ):
+            self.compact()
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        if not self._tombstones:
+            return iter(self._ids)  # type: ignore[arg-type]
+        return (id for id in self._ids if id is not None)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"NodeTable({len(self)} nodes)"
+
+
+class EdgeTable(MutableSequence[Any]):
+    """
+    Sequence of edges stored as parallel columns.
+
+    Each edge lives in a row whose index doubles as its output fragment key.
+    Deleted rows are tombstoned so the keys of the remaining rows stay
+    stable; positional access compacts the table first so positions and rows
+    coincide. Rows are also indexed by endpoint (see ``adjacency``).
+
+    Args:
+        element_type: Edge class used to materialize rows (``FlowchartEdge``)
+        owner: Diagram notified about row changes, if any
+    """
+
+    __slots__ = (
+        "_element_type",
+        "_arrows",
+        "_arrow_codes",
+        "_from",
+        "_to",
+        "_labels",
+        "_codes",
+        "_styles",
+        "_live",
+        "_index",
+        "_owner",
+    )
+
+    def __init__(self, element_type: type, owner: Any = None) -> None:
+        self._element_type = element_type
+        self._arrows: tuple[str, ...] = tuple(element_type.ARROW_TYPES)
+        self._arrow_codes = {arrow: code for code, arrow in enumerate(self._arrows)}
+        self._from: list[str | None] = []
+        self._to: list[str | None] = []
+        self._labels: list[str | None] = []
+        self._codes = array("B")
+        self._styles: dict[int, Mapping[str, str]] = {}
+        self._live = 0
+        # Built on first use so tables that are never queried stay compact
+        self._index: AdjacencyIndex | None = None
+        self._owner = owner
+
+    @property
+    def adjacency(self) -> AdjacencyIndex:
+        """Index of live rows by source and target node id."""
+        if self._index is None:
+            self._index = AdjacencyIndex(
+                (row, source, self._to[row])
+                for row, source in enumerate(self._from)
+                if source is not None
+            )
+        return self._index
+
+    def _arrow_code(self, arrow_type: str) -> int:
+        try:
+            return self._arrow_codes[arrow_type]
+        except KeyError:
+            raise DiagramError(f"Invalid edge type: {arrow_type}")
+
+    @property
+    def _tombstones(self) -> int:
+        return len(self._from) - self._live
+
+    def append_row(
+        self,
+        from_node: str,
+        to_node: str,
+        label: str | None = None,
+        arrow_type: str = "arrow",
+        style: Mapping[str, str] | None = None,
+    ) -> int:
+        """
+        Store an edge without materializing an element object.
+
+        Returns:
+            Row index of the new edge
+        """
+        code = self._arrow_code(arrow_type)
+        row = len(self._from)
+        from_node, to_node = _intern(from_node), _intern(to_node)
+        self._from.append(from_node)
+        self._to.append(to_node)
+        self._labels.append(_intern(label) if label else label)
+        self._codes.append(code)
+        if style:
+            self._styles[row] = style
+        self._live += 1
+        if self._index is not None:
+            self._index.add(row, from_node, to_node)
+        if self._owner is not None:
+            self._owner._mark_fragment_dirty("edges", row)
+        return row
+
+    def extend_rows(
+        self,
+        from_nodes: list[str],
+        to_nodes: list[str],
+        labels: list[str | None] | None = None,
+        arrow_types: list[str] | None = None,
+        styles: list[Mapping[str, str] | None] | None = None,
+    ) -> range:
+        """
+        Store many edges at once, writing the columns directly.
+
+        The caller is responsible for validating endpoints and arrow types
+        first (see ``FlowchartDiagram.add_edges``).
+
+        Returns:
+            Row indices of the new edges
+        """
+        start = len(self._from)
+        rows = range(start, start + len(from_nodes))
+        self._from.extend(map(_intern, from_nodes))
+        self._to.extend(map(_intern, to_nodes))
+        if labels is None:
+            self._labels.extend([None] * len(rows))
+        else:
+            self._labels.extend(_intern(label) if label else label for label in labels)
+        if arrow_types is None:
+            self._codes.extend(bytes(len(rows)))
+        else:
+            self._codes.extend(map(self._arrow_codes.__getitem__, arrow_types))
+        if styles is not None:
+            self._styles.update(
+                (row, style) for row, style in zip(rows, styles, strict=False) if style
+            )
+        self._live += len(rows)
+        if self._index is not None:
+            for row in rows:
+                self._index.add(row, self._from[row], self._to[row])
+        if self._owner is not None:
+            self._owner._mark_fragments_dirty("edges", rows)
+        return rows
+
+    def render(self, row: int) -> str:
+        """Return the Mermaid definition of the edge in ``row``."""
+        return self._element_type.format_mermaid(  # type: ignore[no-any-return]
+            self._from[row],
+            self._to[row],
+            self._labels[row],
+            self._arrows[self._codes[row]],
+        )
+
+    def edge_at(self, row: int) -> Any:
+        """Return the edge stored in ``row``, bound to the table."""
+        if self._from[row] is None:
+            raise IndexError(f"Edge row {row} has been deleted")
+        return self._materialize(row)
+
+    def keys(self) -> Collection[int]:
+        """Return the live row indices in order (the fragment keys)."""
+        if not self._tombstones:
+            return range(len(self._from))
+        return [row for row, source in enumerate(self._from) if source is not None]
+
+    def rows_touching(self, node_id: str) -> list[int]:
+        """Return the live rows whose source or target is ``node_id``."""
+        return self.adjacency.touching(node_id)  # type: ignore[return-value]
+
+    def remove_rows(self, rows: Iterable[int]) -> None:
+        """Delete edges by row index, keeping the keys of other rows stable."""
+        for row in rows:
+            if self._from[row] is None:
+                continue
+            self._from[row] = None
+            self._to[row] = None
+            self._labels[row] = None
+            self._styles.pop(row, None)
+            self._live -= 1
+            if self._index is not None:
+                self._index.discard(row)
+            if self._owner is not None:
+                self._owner._drop_fragment("edges", row)
+        if (
+            len(self._from) >= _COMPACT_MIN_ROWS
+            and self._tombstones > len(self._from) * _COMPACT_RATIO
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Reclaim deleted rows; renumbers rows, so cached fragments are dropped."""
+        if not self._tombstones:
+            return
+        live = [row for row, source in enumerate(self._from) if source is not None]
+        self._from = [self._from[row] for row in live]
+        self._to = [self._to[row] for row in live]
+        self._labels = [self._labels[row] for row in live]
+        self._codes = array("B", (self._codes[row] for row in live))
+        new_rows = {old: new for new, old in enumerate(live)}
+        self._styles = {new_rows[row]: s for row, s in self._styles.items()}
+        self._index = None
+        if self._owner is not None:
+            self._owner._drop_section("edges")
+
+    def _element_changed(self, edge: Any) -> None:
+        """Write a mutated materialized edge back into its row."""
+        row = edge._fragment[1]
+        if row >= len(self._from) or self._from[row] is None:
+            return
+        self._write(row, edge)
+        if self._owner is not None:
+            self._owner._mark_fragment_dirty("edges", row)
+
+    def _write(self, row: int, edge: Any) -> None:
+        self._codes[row] = self._arrow_code(edge.arrow_type)
+        self._from[row] = _intern(edge.from_node)
+        self._to[row] = _intern(edge.to_node)
+        if self._index is not None:
+            self._index.add(row, self._from[row], self._to[row])
+        self._labels[row] = _intern(edge.label) if edge.label else edge.label
+        if edge.style:
+            self._styles[row] = edge.style
+        else:
+            self._styles.pop(row, None)
+
+    def _materialize(self, row: int) -> Any:
+        edge = self._element_type(
+            self._from[row],
+            self._to[row],
+            self._labels[row],
+            self._arrows[self._codes[row]],
+            style=self._styles.get(row),
+        )
+        edge._bind(self, "edges", row)
+        return edge
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        self.compact()
+        if isinstance(index, slice):
+            return [self._materialize(row) for row in range(len(self._from))[index]]
+        return self._materialize(range(len(self._from))[index])
+
+    def __setitem__(self, index: Any, edge: Any) -> None:
+        if isinstance(index, slice):
+            # Slice assignment may change the length; rebuild from materialized
+            # edges and let the owner rebuild the section.
+            edges = list(self)
+            edges[index] = edge
+            self._reset(edges)
+            return
+        self.compact()
+        row = range(len(self._from))[index]
+        self._write(row, edge)
+        edge._bind(self, "edges", row)
+        if self._owner is not None:
+            self._owner._mark_fragment_dirty("edges", row)
+
+    def __delitem__(self, index: int | slice) -> None:
+        self.compact()
+        rows = range(len(self._from))[index]
+        self.remove_rows(rows if isinstance(rows, range) else [rows])
+
+    def insert(self, index: int, edge: Any) -> None:
+        if index >= self._live:
+            self.append(edge)
+            return
+        edges = list(self)
+        edges.insert(index, edge)
+        self._reset(edges)
+
+    def append(self, edge: Any) -> None:
+        row = self.append_row(
+            edge.from_node, edge.to_node, edge.label, edge.arrow_type, edge.style
+        )
+        edge._bind(self, "edges", row)
+
+    def _reset(self, edges: list[Any]) -> None:
+        self._from, self._to, self._labels = [], [], []
+        self._codes = array("B")
+        self._styles = {}
+        self._live = 0
+        self._index = None
+        owner, self._owner = self._owner, None
+        for edge in edges:
+            self.append(edge)
+        self._owner = owner
+        if owner is not None:
+            owner._drop_section("edges")
+
+    def __iter__(self) -> Iterator[Any]:
+        for row in self.keys():
+            yield self._materialize(row)
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __repr__(self) -> str:
+        return f"EdgeTable({len(self)} edges)"
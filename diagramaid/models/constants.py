@@ -5,6 +5,8 @@ This module provides commonly used constants and mappings that are shared
 across multiple diagram types to avoid duplication.
 """
 
+from collections.abc import Iterator, Mapping
+from typing import Any
 
 # Visibility mapping for UML elements (class diagrams, etc.)
 VISIBILITY_SYMBOLS: dict[str, str] = {
@@ -73,6 +75,39 @@ ARROW_TYPES: dict[str, str] = {
     "cross": "--x",  # Cross endpoint
 }
 
+
+class _EmptyStyle(Mapping[str, str]):
+    """Immutable empty style mapping; copies and pickles resolve to the singleton."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> str:
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __copy__(self) -> "_EmptyStyle":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "_EmptyStyle":
+        return self
+
+    def __reduce__(self) -> str:
+        return "EMPTY_STYLE"
+
+    def __repr__(self) -> str:
+        return "EMPTY_STYLE"
+
+
+# Shared read-only style for elements without custom styling. Elements keep a
+# reference to this sentinel instead of allocating an empty dict each, and
+# replace it with a fresh dict on their first style update.
+EMPTY_STYLE: Mapping[str, str] = _EmptyStyle()
+
 # Common themes
 THEMES: list[str] = [
     "default",
@@ -36,6 +36,7 @@ class ERDiagram(MermaidDiagram):
             attributes: Mapping of attribute name to type (e.g., {"id": "INT"}).
         """
         self.entities[name] = attributes or {}
+        self._mark_dirty()
 
     def add_relationship(self, entity1: str, entity2: str, relationship: str) -> None:
         """Add a relationship between two entities.
@@ -46,6 +47,7 @@ class ERDiagram(MermaidDiagram):
             relationship: Mermaid ER relationship operator (e.g., "||--o{").
         """
         self.relationships.append((entity1, entity2, relationship))
+        self._mark_dirty()
 
     def _generate_mermaid(self) -> str:
         """Generate Mermaid syntax for the ER diagram.
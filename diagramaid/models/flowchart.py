@@ -5,14 +5,28 @@ This module provides an object-oriented interface for creating flowchart diagram
 with support for nodes, edges, subgraphs, and styling.
 """
 
-from ..core import MermaidDiagram
+from collections.abc import (
+    Collection,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+)
+from itertools import repeat
+from typing import Any, SupportsIndex
+
+from ..core import MermaidDiagram, TrackedElement
 from ..exceptions import DiagramError
 from ..utils import escape_html
+from .adjacency import AdjacencyIndex
+from .columnar import EdgeTable, NodeTable, read_columns
 from .constants import ARROW_TYPES as _SHARED_ARROW_TYPES
-from .constants import FLOWCHART_SHAPES
+from .constants import EMPTY_STYLE, FLOWCHART_SHAPES
 
 
-class FlowchartNode:
+class FlowchartNode(TrackedElement):
     """
     Represents a node in a flowchart diagram.
 
@@ -50,12 +64,14 @@ class FlowchartNode:
     # Use shared shapes from constants module
     SHAPES = FLOWCHART_SHAPES
 
+    __slots__ = ("id", "label", "shape", "style")
+
     def __init__(
         self,
         id: str,
         label: str,
         shape: str = "rectangle",
-        style: dict[str, str] | None = None,
+        style: Mapping[str, str] | None = None,
     ) -> None:
         """
         Initialize a flowchart node.
@@ -91,11 +107,30 @@ class FlowchartNode:
         self.id = id
         self.label = label
         self.shape = shape
-        self.style = style or {}
+        self.style = style or EMPTY_STYLE
 
         if shape not in self.SHAPES:
             raise DiagramError(f"Unknown node shape: {shape}")
 
+    @classmethod
+    def format_mermaid(cls, id: str, label: str, shape: str) -> str:
+        """
+        Format a node definition without instantiating a node.
+
+        Shared by ``to_mermaid`` and columnar node storage.
+
+        Args:
+            id: Node identifier
+            label: Display text (HTML-escaped on output)
+            shape: Key of ``SHAPES``
+
+        Returns:
+            Mermaid syntax string for the node
+        """
+        start, end = cls.SHAPES[shape]
+        # Escape HTML entities in label for proper Mermaid rendering
+        return f"{id}{start}{escape_html(label)}{end}"
+
     def to_mermaid(self) -> str:
         """
         Generate Mermaid syntax for this node.
@@ -112,19 +147,19 @@ class FlowchartNode:
             >>> print(process.to_mermaid())
             B[Process Data]
         """
-        start, end = self.SHAPES[self.shape]
-        # Escape HTML entities in label for proper Mermaid rendering
-        escaped_label = escape_html(self.label)
-        return f"{self.id}{start}{escaped_label}{end}"
+        return self.format_mermaid(self.id, self.label, self.shape)
 
     def update_style(self, style_updates: dict[str, str]) -> None:
         """
         Update the node's style properties.
 
+        The style mapping is replaced rather than mutated, so nodes sharing
+        the ``EMPTY_STYLE`` sentinel are never affected.
+
         Args:
             style_updates: Dictionary of style properties to update
         """
-        self.style.update(style_updates)
+        self.style = {**self.style, **style_updates}
 
     def clone(self, new_id: str) -> "FlowchartNode":
         """
@@ -137,11 +172,11 @@ class FlowchartNode:
             A new FlowchartNode instance with the same properties but different ID
         """
         return FlowchartNode(
-            id=new_id, label=self.label, shape=self.shape, style=self.style.copy()
+            id=new_id, label=self.label, shape=self.shape, style=dict(self.style)
         )
 
 
-class FlowchartEdge:
+class FlowchartEdge(TrackedElement):
     """
     Represents an edge (connection) between nodes in a flowchart.
 
@@ -184,6 +219,8 @@ class FlowchartEdge:
     # Alias for backward compatibility with tests
     EDGE_TYPES = ARROW_TYPES
 
+    __slots__ = ("from_node", "to_node", "label", "arrow_type", "edge_type", "style")
+
     def __init__(
         self,
         from_node: str,
@@ -191,7 +228,7 @@ class FlowchartEdge:
         label: str | None = None,
         arrow_type: str = "arrow",
         edge_type: str | None = None,  # Backward compatibility
-        style: dict[str, str] | None = None,
+        style: Mapping[str, str] | None = None,
     ) -> None:
         """
         Initialize a flowchart edge.
@@ -239,25 +276,37 @@ class FlowchartEdge:
         self.label = label
         self.arrow_type = arrow_type
         self.edge_type = arrow_type  # Backward compatibility property
-        self.style = style or {}
+        self.style = style or EMPTY_STYLE
 
         if arrow_type not in self.ARROW_TYPES:
             raise DiagramError(f"Invalid edge type: {arrow_type}")
 
-    def to_mermaid(self) -> str:
-        """Generate Mermaid syntax for this edge."""
-        arrow = self.ARROW_TYPES[self.arrow_type]
+    @classmethod
+    def format_mermaid(
+        cls, from_node: str, to_node: str, label: str | None, arrow_type: str
+    ) -> str:
+        """
+        Format an edge definition without instantiating an edge.
 
-        if self.label:
+        Shared by ``to_mermaid`` and columnar edge storage.
+        """
+        if label:
             # Insert label in the middle of the arrow
-            return f"{self.from_node} -->|{self.label}| {self.to_node}"
-        else:
-            return f"{self.from_node} {arrow} {self.to_node}"
+            return f"{from_node} -->|{label}| {to_node}"
+        return f"{from_node} {cls.ARROW_TYPES[arrow_type]} {to_node}"
 
+    def to_mermaid(self) -> str:
+        """Generate Mermaid syntax for this edge."""
+        return self.format_mermaid(
+            self.from_node, self.to_node, self.label, self.arrow_type
+        )
 
-class FlowchartSubgraph:
+
+class FlowchartSubgraph(TrackedElement):
     """Represents a subgraph (grouped nodes) in a flowchart."""
 
+    __slots__ = ("id", "title", "direction", "nodes", "edges")
+
     def __init__(
         self,
         id: str,
@@ -287,10 +336,12 @@ class FlowchartSubgraph:
         """Add a node to this subgraph."""
         if node_id not in self.nodes:
             self.nodes.append(node_id)
+            self._touch()
 
     def add_edge(self, edge: FlowchartEdge) -> None:
         """Add an edge to this subgraph."""
         self.edges.append(edge)
+        self._touch()
 
     def to_mermaid(self) -> list[str]:
         """Generate Mermaid syntax for this subgraph."""
@@ -316,6 +367,127 @@ class FlowchartSubgraph:
         return lines
 
 
+class _EdgeList(MutableSequence[FlowchartEdge]):
+    """
+    Edge list of an object-mode flowchart.
+
+    Edges are the keys of an insertion-ordered dict, so removing the edges
+    of a node costs O(degree) instead of a scan of the list; positional
+    access goes through a list view rebuilt after removals. Each edge
+    object appears at most once. Appends and removals keep the owner's
+    adjacency index current; reordering edits discard it so it is rebuilt
+    on next use.
+    """
+
+    __slots__ = ("_owner", "_edges", "_view")
+
+    def __init__(self, owner: "FlowchartDiagram", edges: Iterable[Any] = ()) -> None:
+        self._owner = owner
+        self._edges: dict[FlowchartEdge, None] = dict.fromkeys(edges)
+        self._view: list[FlowchartEdge] | None = None
+
+    def _list(self) -> list[FlowchartEdge]:
+        """The edges in order; treated as read-only by callers."""
+        if self._view is None:
+            self._view = list(self._edges)
+        return self._view
+
+    def _reset(self, edges: Iterable[FlowchartEdge]) -> None:
+        """Replace the edges, discarding the owner's adjacency index."""
+        self._edges = dict.fromkeys(edges)
+        self._view = None
+        self._owner._adjacency = None
+
+    def _retain(self, removed: Collection[FlowchartEdge]) -> None:
+        """Drop ``removed`` edges whose index entries the owner already discarded."""
+        for edge in removed:
+            self._edges.pop(edge, None)
+        self._view = None
+
+    def _discard(self, edge: FlowchartEdge) -> None:
+        del self._edges[edge]
+        self._view = None
+        if self._owner._adjacency is not None:
+            self._owner._adjacency.discard(edge)
+
+    def _extend_indexed(self, edges: list[FlowchartEdge]) -> None:
+        """Append many edges, keeping an existing adjacency index current."""
+        for edge in edges:
+            self.append(edge)
+
+    def append(self, edge: FlowchartEdge) -> None:
+        if edge in self._edges:
+            return
+        self._edges[edge] = None
+        if self._view is not None:
+            self._view.append(edge)
+        index = self._owner._adjacency
+        if index is not None:
+            index.add(edge, edge.from_node, edge.to_node)
+
+    def extend(self, edges: Iterable[FlowchartEdge]) -> None:
+        self._extend_indexed(list(edges))
+
+    def insert(self, index: SupportsIndex, edge: FlowchartEdge) -> None:
+        edges = self._list().copy()
+        edges.insert(index, edge)
+        self._reset(edges)
+
+    def pop(self, index: SupportsIndex = -1) -> FlowchartEdge:
+        edge = self._list()[index]
+        self._discard(edge)
+        return edge
+
+    def remove(self, edge: FlowchartEdge) -> None:
+        if edge not in self._edges:
+            raise ValueError("Edge is not in the list")
+        self._discard(edge)
+
+    def clear(self) -> None:
+        self._reset(())
+
+    def reverse(self) -> None:
+        self._reset(reversed(self._list()))
+
+    def sort(self, *, key: Any = None, reverse: bool = False) -> None:
+        self._reset(sorted(self._list(), key=key, reverse=reverse))
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._list()[index]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        edges = self._list().copy()
+        edges[index] = value
+        self._reset(edges)
+
+    def __delitem__(self, index: Any) -> None:
+        if isinstance(index, slice):
+            edges = self._list().copy()
+            del edges[index]
+            self._reset(edges)
+        else:
+            self._discard(self._list()[index])
+
+    def __contains__(self, edge: object) -> bool:
+        return edge in self._edges
+
+    def __iter__(self) -> Iterator[FlowchartEdge]:
+        return iter(self._list())
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _EdgeList):
+            other = other._list()
+        if isinstance(other, list):
+            return self._list() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._list())
+
+
 class FlowchartDiagram(MermaidDiagram):
     """
     Flowchart diagram model with support for nodes, edges, and subgraphs.
@@ -326,14 +498,29 @@ class FlowchartDiagram(MermaidDiagram):
         >>> flowchart.add_node("B", "Process", shape="rectangle")
         >>> flowchart.add_edge("A", "B", label="Begin")
         >>> print(flowchart.to_mermaid())
+
+        For diagrams with very many nodes and edges, columnar storage keeps
+        nodes and edges in parallel arrays instead of one object each:
+
+        >>> large = FlowchartDiagram(storage="columnar")
+
+        Edges are indexed by source and target node, so neighbour queries and
+        node removal only visit the edges of the nodes involved:
+
+        >>> flowchart.get_edges_from("A")
+        >>> flowchart.adjacency.has_cycle()
     """
 
     DIRECTIONS = ["TD", "TB", "BT", "RL", "LR"]
+    STORAGE_MODES = ["object", "columnar"]
+
+    _FRAGMENT_SECTIONS = ("nodes", "edges", "subgraphs", "styles")
 
     def __init__(
         self,
         direction: str = "TB",  # Changed default to TB to match tests
         title: str | None = None,
+        storage: str = "object",
     ) -> None:
         """
         Initialize flowchart diagram.
@@ -341,22 +528,60 @@ class FlowchartDiagram(MermaidDiagram):
         Args:
             direction: Flow direction (TD, LR, etc.)
             title: Optional diagram title
+            storage: Element storage mode. "object" keeps one FlowchartNode /
+                FlowchartEdge per element; "columnar" keeps ids, labels and
+                shape/arrow codes in parallel arrays and materializes element
+                objects on access (see ``diagramaid.models.columnar``)
         """
         super().__init__(title)
 
         if direction not in self.DIRECTIONS:
             raise DiagramError(f"Invalid direction: {direction}")
+        if storage not in self.STORAGE_MODES:
+            raise DiagramError(f"Invalid storage mode: {storage}")
 
         self.direction = direction
-        self.nodes: dict[str, FlowchartNode] = {}
-        self.edges: list[FlowchartEdge] = []
+        self.storage = storage
+        self._columnar = storage == "columnar"
+        # Object-mode edge index; None until first use or after a direct edit
+        self._adjacency: AdjacencyIndex | None = None
+        self.nodes: MutableMapping[str, FlowchartNode]
+        self.edges: MutableSequence[FlowchartEdge]
+        if self._columnar:
+            self.nodes = NodeTable(FlowchartNode, owner=self)
+            self.edges = EdgeTable(FlowchartEdge, owner=self)
+        else:
+            self.nodes = {}
+            self.edges = []
         self.subgraphs: dict[str, FlowchartSubgraph] = {}
         self.styles: dict[str, dict[str, str]] = {}
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "edges" and type(value) is list:
+            value = _EdgeList(self, value)
+            object.__setattr__(self, "_adjacency", None)
+        super().__setattr__(name, value)
+
     def get_diagram_type(self) -> str:
         """Return the Mermaid diagram type identifier."""
         return "flowchart"
 
+    @property
+    def adjacency(self) -> AdjacencyIndex:
+        """
+        Index of edges by source and target node id.
+
+        Edge keys are the edge objects in object storage and row indices in
+        columnar storage. Use it for degree, reachability and cycle checks.
+        """
+        if isinstance(self.edges, EdgeTable):
+            return self.edges.adjacency
+        if self._adjacency is None:
+            self._adjacency = AdjacencyIndex(
+                (edge, edge.from_node, edge.to_node) for edge in self.edges
+            )
+        return self._adjacency
+
     def add_node(
         self,
         id: str,
@@ -430,6 +655,9 @@ class FlowchartDiagram(MermaidDiagram):
 
         node = FlowchartNode(id, label, shape, style)
         self.nodes[id] = node
+        if not self._columnar:
+            node._bind(self, "nodes", id)
+            self._mark_fragment_dirty("nodes", id)
         return node
 
     def add_edge(
@@ -520,8 +748,157 @@ class FlowchartDiagram(MermaidDiagram):
 
         edge = FlowchartEdge(from_node, to_node, label, arrow_type, style=style)
         self.edges.append(edge)
+        if not self._columnar:
+            edge._bind(self, "edges", edge)
+            self._mark_fragment_dirty("edges", edge)
         return edge
 
+    def add_nodes(self, nodes: Any) -> int:
+        """
+        Add many nodes in one call.
+
+        All ids and shapes are validated in one pass before anything is
+        stored, and columnar storage receives the columns directly, so the
+        cost per node is far below that of repeated ``add_node`` calls.
+
+        Args:
+            nodes: Node data with an ``id`` column and optional ``label``
+                (defaults to the id), ``shape`` and ``style`` columns. Accepts
+                rows (mappings or ``(id, label, shape, style)`` tuples), a
+                dict of lists or NumPy/pyarrow arrays, a NumPy structured
+                array or a pyarrow table.
+
+        Returns:
+            Number of nodes added
+
+        Raises:
+            DiagramError: If an id is missing, repeated or already present,
+                or a shape is unknown. Nothing is added in that case.
+
+        Example:
+            >>> flowchart.add_nodes({"id": ["A", "B"], "label": ["Start", "End"]})
+            2
+        """
+        columns = read_columns(nodes, ("id", "label", "shape", "style"))
+        if columns["id"] is None:
+            if any(column is not None for column in columns.values()):
+                raise DiagramError("Bulk node input requires an 'id' column")
+            return 0
+        ids = list(map(str, columns["id"]))
+        labels = columns["label"]
+        shapes = columns["shape"]
+        styles = columns["style"]
+
+        if len(set(ids)) != len(ids) or any(map(self.nodes.__contains__, ids)):
+            seen: set[str] = set()
+            for id in ids:
+                if id in seen or id in self.nodes:
+                    raise DiagramError(f"Node with ID '{id}' already exists")
+                seen.add(id)
+        if labels is None:
+            labels = ids
+        else:
+            if None in labels:
+                labels = [
+                    id if label is None else label
+                    for id, label in zip(ids, labels, strict=False)
+                ]
+            labels = list(map(str, labels))
+        if shapes is not None:
+            if None in shapes:
+                shapes = ["rectangle" if shape is None else shape for shape in shapes]
+            unknown = set(shapes).difference(FlowchartNode.SHAPES)
+            if unknown:
+                raise DiagramError(f"Unknown node shape: {sorted(unknown)[0]}")
+
+        if isinstance(self.nodes, NodeTable):
+            self.nodes.extend_rows(ids, labels, shapes, styles)
+            return len(ids)
+
+        for id, label, shape, style in zip(
+            ids,
+            labels,
+            shapes if shapes is not None else repeat("rectangle"),
+            styles if styles is not None else repeat(None),
+            strict=False,
+        ):
+            node = FlowchartNode(id, label, shape, style)
+            node._bind(self, "nodes", id)
+            self.nodes[id] = node
+        self._mark_fragments_dirty("nodes", ids)
+        return len(ids)
+
+    def add_edges(self, edges: Any) -> int:
+        """
+        Add many edges in one call.
+
+        Endpoint references are checked once against the set of distinct
+        endpoints rather than per edge, and nothing is stored unless every
+        edge is valid.
+
+        Args:
+            edges: Edge data with ``from_node`` and ``to_node`` columns and
+                optional ``label``, ``arrow_type`` (defaults to "arrow") and
+                ``style`` columns, in any of the forms accepted by
+                ``add_nodes``
+
+        Returns:
+            Number of edges added
+
+        Raises:
+            DiagramError: If an endpoint does not exist or an arrow type is
+                unknown. Nothing is added in that case.
+
+        Example:
+            >>> flowchart.add_edges([("A", "B"), ("B", "C", "next")])
+            2
+        """
+        columns = read_columns(
+            edges, ("from_node", "to_node", "label", "arrow_type", "style")
+        )
+        if columns["from_node"] is None or columns["to_node"] is None:
+            if any(column is not None for column in columns.values()):
+                raise DiagramError(
+                    "Bulk edge input requires 'from_node' and 'to_node' columns"
+                )
+            return 0
+        from_nodes = list(map(str, columns["from_node"]))
+        to_nodes = list(map(str, columns["to_node"]))
+        labels = columns["label"]
+        arrow_types = columns["arrow_type"]
+        styles = columns["style"]
+
+        for endpoint in set(from_nodes).union(to_nodes):
+            if endpoint not in self.nodes:
+                role = "Source" if endpoint in from_nodes else "Target"
+                raise DiagramError(f"{role} node '{endpoint}' does not exist")
+        if arrow_types is not None:
+            if None in arrow_types:
+                arrow_types = ["arrow" if a is None else a for a in arrow_types]
+            unknown = set(arrow_types).difference(FlowchartEdge.ARROW_TYPES)
+            if unknown:
+                raise DiagramError(f"Invalid edge type: {sorted(unknown)[0]}")
+
+        if isinstance(self.edges, EdgeTable):
+            self.edges.extend_rows(from_nodes, to_nodes, labels, arrow_types, styles)
+            return len(from_nodes)
+
+        new_edges = []
+        for from_node, to_node, label, arrow_type, style in zip(
+            from_nodes,
+            to_nodes,
+            labels if labels is not None else repeat(None),
+            arrow_types if arrow_types is not None else repeat("arrow"),
+            styles if styles is not None else repeat(None),
+            strict=False,
+        ):
+            edge = FlowchartEdge(from_node, to_node, label, arrow_type, style=style)
+            edge._bind(self, "edges", edge)
+            new_edges.append(edge)
+        self.edges._extend_indexed(new_edges)  # type: ignore[attr-defined]
+        self._mark_fragments_dirty("edges", new_edges)
+        return len(new_edges)
+
     def add_subgraph(
         self,
         id: str,
@@ -544,6 +921,8 @@ class FlowchartDiagram(MermaidDiagram):
 
         subgraph = FlowchartSubgraph(id, title, direction)
         self.subgraphs[id] = subgraph
+        subgraph._bind(self, "subgraphs", id)
+        self._mark_fragment_dirty("subgraphs", id)
         return subgraph
 
     def add_node_to_subgraph(self, node_id: str, subgraph_id: str) -> None:
@@ -559,24 +938,69 @@ class FlowchartDiagram(MermaidDiagram):
         """Get a node by its ID."""
         return self.nodes.get(node_id)
 
+    def get_edges_from(self, node_id: str) -> list[FlowchartEdge]:
+        """Get all edges leaving a node."""
+        return self._edges_for_keys(self.adjacency.outgoing(node_id))
+
+    def get_edges_to(self, node_id: str) -> list[FlowchartEdge]:
+        """Get all edges entering a node."""
+        return self._edges_for_keys(self.adjacency.incoming(node_id))
+
+    def _edges_for_keys(self, keys: list[Hashable]) -> list[FlowchartEdge]:
+        if isinstance(self.edges, EdgeTable):
+            return [self.edges.edge_at(row) for row in keys]  # type: ignore[arg-type]
+        return keys  # type: ignore[return-value]
+
     def remove_node(self, node_id: str) -> None:
         """Remove a node and all edges connected to it."""
-        if node_id not in self.nodes:
-            raise DiagramError(f"Node '{node_id}' does not exist")
+        self.remove_nodes([node_id])
 
-        # Remove the node
-        del self.nodes[node_id]
+    def remove_nodes(self, node_ids: Iterable[str]) -> None:
+        """
+        Remove several nodes and all edges connected to them.
+
+        Connected edges are found through the adjacency index and removed in
+        a single pass over the edge storage.
 
-        # Remove all edges connected to this node
-        self.edges = [
-            edge
-            for edge in self.edges
-            if edge.from_node != node_id and edge.to_node != node_id
-        ]
+        Args:
+            node_ids: IDs of the nodes to remove
+
+        Raises:
+            DiagramError: If any node does not exist (nothing is removed)
+        """
+        node_ids = list(dict.fromkeys(node_ids))
+        for node_id in node_ids:
+            if node_id not in self.nodes:
+                raise DiagramError(f"Node '{node_id}' does not exist")
+
+        index = self.adjacency
+        edge_keys: dict[Hashable, None] = {}
+        for node_id in node_ids:
+            edge_keys.update(dict.fromkeys(index.touching(node_id)))
+
+        if isinstance(self.edges, EdgeTable):
+            # Tables drop the cached fragments of deleted rows themselves
+            for node_id in node_ids:
+                del self.nodes[node_id]
+            self.edges.remove_rows(edge_keys)  # type: ignore[arg-type]
+            return
+
+        for node_id in node_ids:
+            self.nodes.pop(node_id)._unbind()
+            self._drop_fragment("nodes", node_id)
+
+        if not edge_keys:
+            return
+        for edge in edge_keys:
+            edge._unbind()  # type: ignore[attr-defined]
+            self._drop_fragment("edges", edge)
+        index.discard_many(edge_keys)
+        self.edges._retain(edge_keys)  # type: ignore[attr-defined,arg-type]
 
     def add_style(self, element_id: str, style: dict[str, str]) -> None:
         """Add styling to a node or edge."""
         self.styles[element_id] = style
+        self._mark_fragment_dirty("styles", element_id)
 
     def validate_diagram(self) -> None:
         """
@@ -599,34 +1023,55 @@ class FlowchartDiagram(MermaidDiagram):
                     f"Edge references non-existent target node: {edge.to_node}"
                 )
 
-    def _generate_mermaid(self) -> str:
-        """Generate complete Mermaid syntax for the flowchart."""
-        lines = []
+    def _element_changed(self, element: TrackedElement) -> None:
+        """Re-index a bound edge whose endpoints may have changed."""
+        if (
+            self._adjacency is not None
+            and isinstance(element, FlowchartEdge)
+            and element in self._adjacency
+        ):
+            self._adjacency.add(element, element.from_node, element.to_node)
+        super()._element_changed(element)
 
-        # Start with diagram type and direction
-        lines.append(f"flowchart {self.direction}")
+    def _generate_header_lines(self) -> list[str]:
+        """Generate the flowchart declaration and title lines."""
+        lines = [f"flowchart {self.direction}"]
 
         # Add title if present
         if self.title:
             lines.append(f"    title: {self.title}")
 
-        # Add nodes
-        for node in self.nodes.values():
-            lines.append(f"    {node.to_mermaid()}")
-
-        # Add edges
-        for edge in self.edges:
-            lines.append(f"    {edge.to_mermaid()}")
-
-        # Add subgraphs
-        for subgraph in self.subgraphs.values():
-            subgraph_lines = subgraph.to_mermaid()
-            for line in subgraph_lines:
-                lines.append(f"    {line}")
+        return lines
 
-        # Add styles
-        for element_id, style in self.styles.items():
-            style_str = ",".join([f"{k}:{v}" for k, v in style.items()])
-            lines.append(f"    style {element_id} {style_str}")
+    def _fragment_source(self, section: str) -> Collection[Hashable]:
+        """Return the element container backing a fragment section."""
+        if section == "nodes":
+            return self.nodes
+        if section == "edges":
+            if isinstance(self.edges, EdgeTable):
+                return self.edges.keys()
+            return self.edges
+        if section == "subgraphs":
+            return self.subgraphs
+        return self.styles
+
+    def _render_fragment(self, section: str, key: Hashable) -> str:
+        """Emit the Mermaid text for a single node, edge, subgraph or style."""
+        if section == "nodes":
+            if isinstance(self.nodes, NodeTable):
+                return f"    {self.nodes.render(key)}"  # type: ignore[arg-type]
+            return f"    {self.nodes[key].to_mermaid()}"  # type: ignore[index]
+        if section == "edges":
+            if isinstance(self.edges, EdgeTable):
+                return f"    {self.edges.render(key)}"  # type: ignore[arg-type]
+            return f"    {key.to_mermaid()}"  # type: ignore[attr-defined]
+        if section == "subgraphs":
+            subgraph_lines = self.subgraphs[key].to_mermaid()  # type: ignore[index]
+            return "\n".join(f"    {line}" for line in subgraph_lines)
+        style = self.styles[key]  # type: ignore[index]
+        style_str = ",".join([f"{k}:{v}" for k, v in style.items()])
+        return f"    style {key} {style_str}"
 
-        return "\n".join(lines)
+    def _generate_mermaid(self) -> str:
+        """Generate complete Mermaid syntax for the flowchart."""
+        return "\n".join(self._generate_fragment_lines())
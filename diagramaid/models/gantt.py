@@ -32,6 +32,7 @@ class GanttDiagram(MermaidDiagram):
             title: Section title shown in the diagram.
         """
         self.sections.append(title)
+        self._mark_dirty()
 
     def add_task(
         self,
@@ -49,6 +50,7 @@ class GanttDiagram(MermaidDiagram):
             status: Mermaid task status/marker (e.g., 'active', 'done', 'crit').
         """
         self.tasks.append((name, start_date, duration, status))
+        self._mark_dirty()
 
     def _generate_mermaid(self) -> str:
         """Generate Mermaid syntax for the Gantt diagram.
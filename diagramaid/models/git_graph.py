@@ -32,6 +32,7 @@ class GitGraphDiagram(MermaidDiagram):
             branch: Target branch name (defaults to 'main').
         """
         self.commits.append(("commit", message, branch))
+        self._mark_dirty()
 
     def add_branch(self, name: str) -> None:
         """Add a new branch.
@@ -40,6 +41,7 @@ class GitGraphDiagram(MermaidDiagram):
             name: Branch name to create.
         """
         self.branches.append(name)
+        self._mark_dirty()
 
     def add_merge(self, from_branch: str, to_branch: str) -> None:
         """Add a merge between branches.
@@ -49,6 +51,7 @@ class GitGraphDiagram(MermaidDiagram):
             to_branch: Destination branch receiving the merge.
         """
         self.merges.append((from_branch, to_branch))
+        self._mark_dirty()
 
     def _generate_mermaid(self) -> str:
         """Generate Mermaid syntax for the git graph.
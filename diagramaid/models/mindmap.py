@@ -1,6 +1,18 @@
 """Mindmap diagram model for the Mermaid Render library."""
 
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
 from ..core import MermaidDiagram
+from ..exceptions import DiagramError
+
+# Mermaid delimiters around the node text, by shape
+_SHAPE_FORMATS = {
+    "circle": "(({}))",
+    "bang": ")){}((",
+    "cloud": "))){}(((",
+    "hexagon": ")){}((",
+}
 
 
 class MindmapNode:
@@ -9,6 +21,8 @@ class MindmapNode:
     Each node has an ID, display text, an optional shape, and a list of child nodes.
     """
 
+    __slots__ = ("id", "text", "shape", "children", "_owner")
+
     def __init__(self, id: str, text: str, shape: str = "default") -> None:
         """Initialize a mindmap node.
 
@@ -21,6 +35,8 @@ class MindmapNode:
         self.text = text
         self.shape = shape
         self.children: list[MindmapNode] = []
+        # Diagram whose tree holds this node, told about add_child calls
+        self._owner: MindmapDiagram | None = None
 
     def add_child(self, child: "MindmapNode") -> None:
         """Add a child node.
@@ -29,6 +45,20 @@ class MindmapNode:
             child: The MindmapNode to attach as a child.
         """
         self.children.append(child)
+        if self._owner is not None:
+            self._owner._adopt(self, child)
+
+    def iter_subtree(self) -> Iterable[tuple["MindmapNode", int]]:
+        """Yield this node and its descendants in pre-order with their depth.
+
+        Uses an explicit stack, so arbitrarily deep trees do not hit the
+        recursion limit.
+        """
+        stack = [(self, 0)]
+        while stack:
+            node, depth = stack.pop()
+            yield node, depth
+            stack.extend((child, depth + 1) for child in reversed(node.children))
 
     def to_mermaid(self, level: int = 0) -> list[str]:
         """Generate Mermaid syntax lines for this node and its subtree.
@@ -39,30 +69,31 @@ class MindmapNode:
         Returns:
             A list of Mermaid lines representing this node and descendants.
         """
-        lines = []
-        indent = "  " * level
-
-        if self.shape == "circle":
-            lines.append(f"{indent}(({self.text}))")
-        elif self.shape == "bang":
-            lines.append(f"{indent})){self.text}((")
-        elif self.shape == "cloud":
-            lines.append(f"{indent}))){self.text}(((")
-        elif self.shape == "hexagon":
-            lines.append(f"{indent})){self.text}((")
-        else:
-            lines.append(f"{indent}{self.text}")
+        return [
+            f"{'  ' * (level + depth)}{node._format_text()}"
+            for node, depth in self.iter_subtree()
+        ]
 
-        for child in self.children:
-            lines.extend(child.to_mermaid(level + 1))
-
-        return lines
+    def _format_text(self) -> str:
+        """Return the node text wrapped in the delimiters of its shape."""
+        shape_format = _SHAPE_FORMATS.get(self.shape)
+        return shape_format.format(self.text) if shape_format else self.text
 
 
 class MindmapDiagram(MermaidDiagram):
     """Mindmap diagram model for hierarchical information.
 
     Manages a root node and provides helpers to add/find nodes and render Mermaid text.
+    Nodes are indexed by ID, so adding under or looking up any node is O(1).
+    Nodes attached directly with ``MindmapNode.add_child`` are indexed as
+    they are added; direct edits to a node's ``children`` list are not
+    tracked.
+
+    Example:
+        >>> mindmap = MindmapDiagram(root_text="Project")
+        >>> mindmap.add_node("root", "docs", "Docs")
+        >>> mindmap.add_tree("docs", {"id": "api", "text": "API", "children": []})
+        >>> mindmap.add_rows([("guide", "docs", "Guide")])
     """
 
     def __init__(self, title: str | None = None, root_text: str = "Root") -> None:
@@ -74,6 +105,9 @@ class MindmapDiagram(MermaidDiagram):
         """
         super().__init__(title)
         self.root = MindmapNode("root", root_text)
+        self.root._owner = self
+        self._nodes: dict[str, MindmapNode] = {"root": self.root}
+        self._parents: dict[str, str] = {}
 
     def get_diagram_type(self) -> str:
         """Return the Mermaid diagram type identifier."""
@@ -92,38 +126,188 @@ class MindmapDiagram(MermaidDiagram):
 
         Returns:
             The created MindmapNode instance.
+
+        Raises:
+            DiagramError: If the parent does not exist or the ID is taken.
+        """
+        parent = self._require_node(parent_id)
+        if node_id in self._nodes:
+            raise DiagramError(f"Mindmap node with ID '{node_id}' already exists")
+
+        node = self._attach(parent, node_id, text, shape)
+        self._mark_dirty()
+        return node
+
+    def get_node(self, node_id: str) -> MindmapNode | None:
+        """Get a node by its ID."""
+        return self._lookup(node_id)
+
+    def remove_node(self, node_id: str) -> None:
+        """Remove a node and its whole subtree.
+
+        Args:
+            node_id: ID of the node to remove.
+
+        Raises:
+            DiagramError: If the node does not exist or is the root.
+        """
+        if node_id == "root":
+            raise DiagramError("The mindmap root cannot be removed")
+        node = self._require_node(node_id)
+
+        parent = self._nodes[self._parents[node_id]]
+        parent.children = [child for child in parent.children if child is not node]
+        for descendant, _ in node.iter_subtree():
+            descendant._owner = None
+            self._nodes.pop(descendant.id, None)
+            self._parents.pop(descendant.id, None)
+        self._mark_dirty()
+
+    def add_tree(self, parent_id: str, tree: Mapping[str, Any]) -> MindmapNode:
+        """Attach a nested dictionary as a subtree in linear time.
+
+        Each mapping has an ``id``, a ``text``, and optional ``shape`` and
+        ``children`` (a list of mappings of the same form).
+
+        Args:
+            parent_id: ID of the node to attach the subtree to.
+            tree: Nested mapping describing the subtree.
+
+        Returns:
+            The MindmapNode created for the top of ``tree``.
+
+        Raises:
+            DiagramError: If the parent does not exist or an ID is repeated.
+                Nothing is added in that case.
         """
-        node = MindmapNode(node_id, text, shape)
+        parent = self._require_node(parent_id)
+
+        # Validate first so a bad subtree leaves the diagram untouched
+        seen: set[str] = set()
+        pending = [tree]
+        while pending:
+            item = pending.pop()
+            item_id = item["id"]
+            if item_id in seen or item_id in self._nodes:
+                raise DiagramError(f"Mindmap node with ID '{item_id}' already exists")
+            seen.add(item_id)
+            pending.extend(item.get("children") or ())
+
+        top = self._attach(parent, tree["id"], tree["text"], tree.get("shape"))
+        stack = [(top, tree)]
+        while stack:
+            node, item = stack.pop()
+            for child in item.get("children") or ():
+                child_node = self._attach(
+                    node, child["id"], child["text"], child.get("shape")
+                )
+                stack.append((child_node, child))
+
+        self._mark_dirty()
+        return top
+
+    def add_rows(
+        self, rows: Iterable[Mapping[str, Any] | Sequence[Any]]
+    ) -> list[MindmapNode]:
+        """Add nodes from a parent-pointer table in linear time.
+
+        Rows are ``(id, parent_id, text[, shape])`` sequences or mappings
+        with ``id``, ``parent_id``, ``text`` and optional ``shape`` keys. A
+        ``parent_id`` of None means the root. Rows may appear in any order;
+        siblings keep their relative order.
+
+        Args:
+            rows: Table of nodes to add.
 
-        if parent_id == "root":
-            self.root.add_child(node)
-        else:
-            # Find parent node (simple DFS)
-            parent = self._find_node(self.root, parent_id)
-            if parent:
-                parent.add_child(node)
+        Returns:
+            The created nodes in table order.
 
+        Raises:
+            DiagramError: If an ID is repeated or a parent cannot be resolved.
+                Nothing is added in that case.
+        """
+        table: dict[str, tuple[str, str, str | None]] = {}
+        children: dict[str, list[str]] = {}
+        for row in rows:
+            if isinstance(row, Mapping):
+                node_id = row["id"]
+                parent_id = row.get("parent_id")
+                text, shape = row["text"], row.get("shape")
+            else:
+                node_id, parent_id, text, *rest = row
+                shape = rest[0] if rest else None
+            parent_id = parent_id if parent_id is not None else "root"
+            if node_id in table or node_id in self._nodes:
+                raise DiagramError(f"Mindmap node with ID '{node_id}' already exists")
+            table[node_id] = (parent_id, text, shape)
+            children.setdefault(parent_id, []).append(node_id)
+
+        # Every parent must be an existing node or resolve within the table
+        for parent_id in children:
+            if parent_id not in table and self._lookup(parent_id) is None:
+                raise DiagramError(f"Parent node '{parent_id}' does not exist")
+
+        # Order rows parent-first, starting from the existing nodes
+        order: list[str] = []
+        pending = [parent_id for parent_id in children if parent_id not in table]
+        while pending:
+            for node_id in children.get(pending.pop(), ()):
+                order.append(node_id)
+                pending.append(node_id)
+        if len(order) != len(table):
+            # Rows that were never reached form a cycle of parents
+            raise DiagramError("Mindmap rows contain a parent cycle")
+
+        created: dict[str, MindmapNode] = {}
+        for node_id in order:
+            parent_id, text, shape = table[node_id]
+            parent = created.get(parent_id) or self._nodes[parent_id]
+            created[node_id] = self._attach(parent, node_id, text, shape)
+
+        self._mark_dirty()
+        return [created[node_id] for node_id in table]
+
+    def _attach(
+        self, parent: MindmapNode, node_id: str, text: str, shape: str | None
+    ) -> MindmapNode:
+        """Create a node under ``parent`` and index it."""
+        node = MindmapNode(node_id, text, shape or "default")
+        node._owner = self
+        parent.children.append(node)
+        self._nodes[node_id] = node
+        self._parents[node_id] = parent.id
         return node
 
-    def _find_node(self, current: MindmapNode, node_id: str) -> MindmapNode | None:
-        """Find a node by ID in the tree."""
-        if current.id == node_id:
-            return current
+    def _lookup(self, node_id: str) -> MindmapNode | None:
+        """Find a node by ID."""
+        return self._nodes.get(node_id)
 
-        for child in current.children:
-            result = self._find_node(child, node_id)
-            if result:
-                return result
+    def _require_node(self, node_id: str) -> MindmapNode:
+        node = self._lookup(node_id)
+        if node is None:
+            raise DiagramError(f"Mindmap node '{node_id}' does not exist")
+        return node
 
-        return None
+    def _adopt(self, parent: MindmapNode, child: MindmapNode) -> None:
+        """Index a subtree attached with ``MindmapNode.add_child``."""
+        self._parents.setdefault(child.id, parent.id)
+        for node, _ in child.iter_subtree():
+            node._owner = self
+            self._nodes.setdefault(node.id, node)
+            for grandchild in node.children:
+                self._parents.setdefault(grandchild.id, node.id)
+        self._mark_dirty()
 
-    def _generate_mermaid(self) -> str:
-        """Generate Mermaid syntax for the mindmap."""
-        lines = ["mindmap"]
+    def _iter_mermaid_lines(self) -> Iterator[str]:
+        """Yield the mindmap declaration, title and one line per node."""
+        yield "mindmap"
 
         if self.title:
-            lines.append(f"  title: {self.title}")
+            yield f"  title: {self.title}"
 
-        lines.extend(self.root.to_mermaid())
+        for node, depth in self.root.iter_subtree():
+            yield f"{'  ' * depth}{node._format_text()}"
 
-        return "\n".join(lines)
+    def _generate_mermaid(self) -> str:
+        """Generate Mermaid syntax for the mindmap."""
+        return "\n".join(self._iter_mermaid_lines())
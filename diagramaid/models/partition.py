@@ -0,0 +1,300 @@
+"""
+Partitioning of large flowcharts and state diagrams into tiles.
+
+Mermaid layout time grows faster than linearly with the number of nodes, and
+remote renderers reject very long inputs. ``partition_diagram`` splits a
+diagram into tiles of at most ``max_nodes`` nodes that can be rendered
+independently (and in parallel) and stitched back together.
+
+Tiles are filled with whole connected components first, so unrelated parts
+of a diagram never share a tile with half of another part. Flowchart
+subgraphs that fit into a tile are kept together. Components larger than a
+tile are cut into clusters in breadth-first order; every edge crossing a cut
+is kept in both tiles and points at a stub node that names the tile holding
+the real node.
+
+Example:
+    >>> tiles = partition_diagram(large_flowchart, max_nodes=200)
+    >>> [tile.to_mermaid() for tile in tiles]
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..core import MermaidDiagram
+from ..exceptions import DiagramError
+from .flowchart import FlowchartDiagram
+from .state import StateDiagram
+
+#: Default upper bound on the number of real nodes per tile
+DEFAULT_TILE_NODES = 300
+
+# Start/end pseudo-state; it is local to every tile instead of a shared node
+_STATE_TERMINAL = "[*]"
+
+
+@dataclass
+class DiagramTile:
+    """One independently renderable part of a partitioned diagram."""
+
+    index: int
+    diagram: MermaidDiagram
+    node_ids: list[str] = field(default_factory=list)
+    stub_ids: list[str] = field(default_factory=list)
+
+    def to_mermaid(self) -> str:
+        """Return the Mermaid syntax of the tile."""
+        return self.diagram.to_mermaid()
+
+
+def partition_diagram(
+    diagram: MermaidDiagram, max_nodes: int = DEFAULT_TILE_NODES
+) -> list[DiagramTile]:
+    """
+    Split a flowchart or state diagram into tiles of bounded size.
+
+    Runs in time linear in the number of nodes and edges.
+
+    Args:
+        diagram: FlowchartDiagram or StateDiagram to split
+        max_nodes: Maximum number of real (non-stub) nodes per tile
+
+    Returns:
+        Tiles in order; a diagram that already fits yields a single tile
+        holding a copy of the diagram
+
+    Raises:
+        DiagramError: If the diagram type cannot be partitioned or
+            ``max_nodes`` is not positive
+    """
+    if max_nodes < 1:
+        raise DiagramError("max_nodes must be at least 1")
+    if isinstance(diagram, FlowchartDiagram):
+        return _partition_flowchart(diagram, max_nodes)
+    if isinstance(diagram, StateDiagram):
+        return _partition_state(diagram, max_nodes)
+    raise DiagramError(
+        f"Cannot partition diagrams of type '{diagram.get_diagram_type()}'"
+    )
+
+
+def assign_tiles(
+    node_ids: list[str],
+    edges: list[tuple[str, str]],
+    groups: list[list[str]] | None = None,
+    max_nodes: int = DEFAULT_TILE_NODES,
+) -> dict[str, int]:
+    """
+    Assign every node to a tile.
+
+    Groups (e.g. subgraphs) that fit into a tile are placed as one unit.
+    Units are visited component by component in breadth-first order and
+    packed greedily, so small components share tiles and large components
+    are cut into clusters of neighbouring nodes.
+
+    Args:
+        node_ids: All node ids in diagram order
+        edges: ``(source, target)`` pairs between ids of ``node_ids``
+        groups: Node id lists that should stay together where possible
+        max_nodes: Maximum number of nodes per tile
+
+    Returns:
+        Mapping of node id to tile index (tiles numbered from 0)
+    """
+    unit_of: dict[str, int] = {}
+    units: list[list[str]] = []
+    for group in groups or ():
+        members = [
+            node_id for node_id in dict.fromkeys(group) if node_id not in unit_of
+        ]
+        if 1 < len(members) <= max_nodes:
+            for node_id in members:
+                unit_of[node_id] = len(units)
+            units.append(members)
+    for node_id in node_ids:
+        if node_id not in unit_of:
+            unit_of[node_id] = len(units)
+            units.append([node_id])
+
+    neighbours: list[list[int]] = [[] for _ in units]
+    for source, target in edges:
+        a, b = unit_of[source], unit_of[target]
+        if a != b:
+            neighbours[a].append(b)
+            neighbours[b].append(a)
+
+    tiles: dict[str, int] = {}
+    visited = [False] * len(units)
+    tile = 0
+    size = 0
+    for start in range(len(units)):
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = deque([start])
+        while queue:
+            unit = queue.popleft()
+            members = units[unit]
+            if size and size + len(members) > max_nodes:
+                tile += 1
+                size = 0
+            for node_id in members:
+                tiles[node_id] = tile
+            size += len(members)
+            for neighbour in neighbours[unit]:
+                if not visited[neighbour]:
+                    visited[neighbour] = True
+                    queue.append(neighbour)
+    return tiles
+
+
+def _stub_label(label: str, tile: int) -> str:
+    return f"{label} (part {tile + 1})"
+
+
+def _tile_title(title: str | None, index: int, count: int) -> str | None:
+    if not title or count == 1:
+        return title
+    return f"{title} ({index + 1}/{count})"
+
+
+def _partition_flowchart(
+    diagram: FlowchartDiagram, max_nodes: int
+) -> list[DiagramTile]:
+    nodes = {
+        node.id: (node.label, node.shape, node.style or None)
+        for node in diagram.nodes.values()
+    }
+    edges = list(diagram.edges)
+    for edge in edges:
+        # Endpoints may be referenced without a node declaration
+        for node_id in (edge.from_node, edge.to_node):
+            if node_id not in nodes:
+                nodes[node_id] = (node_id, "rectangle", None)
+
+    tiles = assign_tiles(
+        list(nodes),
+        [(edge.from_node, edge.to_node) for edge in edges],
+        [subgraph.nodes for subgraph in diagram.subgraphs.values()],
+        max_nodes,
+    )
+    count = max(tiles.values(), default=0) + 1
+
+    node_rows: list[list[tuple[Any, ...]]] = [[] for _ in range(count)]
+    for node_id, (label, shape, style) in nodes.items():
+        node_rows[tiles[node_id]].append((node_id, label, shape, style))
+
+    stubs: list[dict[str, tuple[Any, ...]]] = [{} for _ in range(count)]
+    edge_rows: list[list[tuple[Any, ...]]] = [[] for _ in range(count)]
+    for edge in edges:
+        row = (
+            edge.from_node,
+            edge.to_node,
+            edge.label,
+            edge.arrow_type,
+            edge.style or None,
+        )
+        source_tile = tiles[edge.from_node]
+        target_tile = tiles[edge.to_node]
+        edge_rows[source_tile].append(row)
+        if source_tile != target_tile:
+            edge_rows[target_tile].append(row)
+            for here, there, node_id in (
+                (source_tile, target_tile, edge.to_node),
+                (target_tile, source_tile, edge.from_node),
+            ):
+                if node_id not in stubs[here]:
+                    label = _stub_label(nodes[node_id][0], there)
+                    stubs[here][node_id] = (node_id, label, "asymmetric", None)
+
+    parts = [
+        FlowchartDiagram(
+            direction=diagram.direction,
+            title=_tile_title(diagram.title, index, count),
+            storage=diagram.storage,
+        )
+        for index in range(count)
+    ]
+    for index, part in enumerate(parts):
+        part.add_nodes(node_rows[index] + list(stubs[index].values()))
+        part.add_edges(edge_rows[index])
+
+    for subgraph in diagram.subgraphs.values():
+        members: dict[int, list[str]] = {}
+        for node_id in subgraph.nodes:
+            if node_id in tiles:
+                members.setdefault(tiles[node_id], []).append(node_id)
+        for index, node_ids in members.items():
+            copy = parts[index].add_subgraph(
+                subgraph.id, subgraph.title, subgraph.direction
+            )
+            for node_id in node_ids:
+                copy.add_node(node_id)
+
+    for element_id, style in diagram.styles.items():
+        for part in parts:
+            if element_id in part.subgraphs or (
+                element_id in tiles and part is parts[tiles[element_id]]
+            ):
+                part.add_style(element_id, dict(style))
+
+    return [
+        DiagramTile(
+            index=index,
+            diagram=part,
+            node_ids=[row[0] for row in node_rows[index]],
+            stub_ids=list(stubs[index]),
+        )
+        for index, part in enumerate(parts)
+    ]
+
+
+def _partition_state(diagram: StateDiagram, max_nodes: int) -> list[DiagramTile]:
+    states = dict(diagram.states)
+    for from_state, to_state, _ in diagram.transitions:
+        for state_id in (from_state, to_state):
+            if state_id != _STATE_TERMINAL:
+                states.setdefault(state_id, state_id)
+    states.pop(_STATE_TERMINAL, None)
+
+    tiles = assign_tiles(
+        list(states),
+        [
+            (from_state, to_state)
+            for from_state, to_state, _ in diagram.transitions
+            if _STATE_TERMINAL not in (from_state, to_state)
+        ],
+        max_nodes=max_nodes,
+    )
+    count = max(tiles.values(), default=0) + 1
+
+    parts = [
+        StateDiagram(title=_tile_title(diagram.title, index, count))
+        for index in range(count)
+    ]
+    result = [
+        DiagramTile(index=index, diagram=part) for index, part in enumerate(parts)
+    ]
+    for state_id, label in states.items():
+        tile = tiles[state_id]
+        parts[tile].add_state(state_id, label)
+        result[tile].node_ids.append(state_id)
+
+    for from_state, to_state, label in diagram.transitions:
+        # Transitions from or to [*] belong to the tile of the real state
+        source_tile = tiles.get(from_state, tiles.get(to_state, 0))
+        target_tile = tiles.get(to_state, source_tile)
+        parts[source_tile].add_transition(from_state, to_state, label)
+        if source_tile == target_tile:
+            continue
+        parts[target_tile].add_transition(from_state, to_state, label)
+        for here, there, state_id in (
+            (source_tile, target_tile, to_state),
+            (target_tile, source_tile, from_state),
+        ):
+            if state_id not in parts[here].states:
+                parts[here].add_state(state_id, _stub_label(states[state_id], there))
+                result[here].stub_ids.append(state_id)
+
+    return result
@@ -32,6 +32,7 @@ class PieChartDiagram(MermaidDiagram):
             value: Numeric value determining the slice size.
         """
         self.data[label] = value
+        self._mark_dirty()
 
     def _generate_mermaid(self) -> str:
         """Generate Mermaid syntax for the pie chart.
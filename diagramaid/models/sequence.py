@@ -5,11 +5,13 @@ This module provides an object-oriented interface for creating sequence diagrams
 with support for participants, messages, activations, notes, and loops.
 """
 
-from ..core import MermaidDiagram
+from collections.abc import Collection, Hashable
+
+from ..core import MermaidDiagram, TrackedElement
 from ..exceptions import DiagramError
 
 
-class SequenceParticipant:
+class SequenceParticipant(TrackedElement):
     """
     Represents a participant in a sequence diagram.
 
@@ -38,6 +40,8 @@ class SequenceParticipant:
         >>> db = SequenceParticipant("database")
     """
 
+    __slots__ = ("id", "name")
+
     def __init__(self, id: str, name: str | None = None) -> None:
         """
         Initialize a sequence participant.
@@ -80,7 +84,7 @@ class SequenceParticipant:
         return f"participant {self.id}"
 
 
-class SequenceMessage:
+class SequenceMessage(TrackedElement):
     """
     Represents a message between participants in a sequence diagram.
 
@@ -131,6 +135,15 @@ class SequenceMessage:
         "destroy": "-x",  # Destroy message
     }
 
+    __slots__ = (
+        "from_participant",
+        "to_participant",
+        "message",
+        "message_type",
+        "activate",
+        "deactivate",
+    )
+
     def __init__(
         self,
         from_participant: str,
@@ -197,11 +210,13 @@ class SequenceMessage:
         return lines
 
 
-class SequenceNote:
+class SequenceNote(TrackedElement):
     """Represents a note in a sequence diagram."""
 
     POSITIONS = ["left of", "right of", "over"]
 
+    __slots__ = ("text", "participant", "position", "participants")
+
     def __init__(
         self,
         text: str,
@@ -235,9 +250,11 @@ class SequenceNote:
             return f"note {self.position} {self.participant}: {self.text}"
 
 
-class SequenceLoop:
+class SequenceLoop(TrackedElement):
     """Represents a loop block in a sequence diagram."""
 
+    __slots__ = ("condition", "messages", "notes")
+
     def __init__(self, condition: str) -> None:
         """
         Initialize a sequence loop.
@@ -252,10 +269,14 @@ class SequenceLoop:
     def add_message(self, message: SequenceMessage) -> None:
         """Add a message to this loop."""
         self.messages.append(message)
+        message._bind(self)
+        self._touch()
 
     def add_note(self, note: SequenceNote) -> None:
         """Add a note to this loop."""
         self.notes.append(note)
+        note._bind(self)
+        self._touch()
 
     def to_mermaid(self) -> list[str]:
         """Generate Mermaid syntax for this loop."""
@@ -302,6 +323,8 @@ class SequenceDiagram(MermaidDiagram):
         self.loops: list[SequenceLoop] = []
         self.activations: dict[str, bool] = {}
 
+    _FRAGMENT_SECTIONS = ("participants", "messages", "notes", "loops")
+
     def get_diagram_type(self) -> str:
         """Return the Mermaid diagram type identifier."""
         return "sequenceDiagram"
@@ -322,6 +345,8 @@ class SequenceDiagram(MermaidDiagram):
 
         participant = SequenceParticipant(id, name)
         self.participants[id] = participant
+        participant._bind(self, "participants", id)
+        self._mark_fragment_dirty("participants", id)
         return participant
 
     def add_message(
@@ -411,6 +436,8 @@ class SequenceDiagram(MermaidDiagram):
             deactivate,
         )
         self.messages.append(msg)
+        msg._bind(self, "messages", msg)
+        self._mark_fragment_dirty("messages", msg)
         return msg
 
     def add_note(
@@ -437,6 +464,8 @@ class SequenceDiagram(MermaidDiagram):
 
         note = SequenceNote(text, participant, position, participants)
         self.notes.append(note)
+        note._bind(self, "notes", note)
+        self._mark_fragment_dirty("notes", note)
         return note
 
     def add_loop(self, condition: str) -> SequenceLoop:
@@ -451,6 +480,8 @@ class SequenceDiagram(MermaidDiagram):
         """
         loop = SequenceLoop(condition)
         self.loops.append(loop)
+        loop._bind(self, "loops", loop)
+        self._mark_fragment_dirty("loops", loop)
         return loop
 
     def activate_participant(self, participant_id: str) -> None:
@@ -465,8 +496,8 @@ class SequenceDiagram(MermaidDiagram):
             raise DiagramError(f"Participant '{participant_id}' does not exist")
         self.activations[participant_id] = False
 
-    def _generate_mermaid(self) -> str:
-        """Generate complete Mermaid syntax for the sequence diagram."""
+    def _generate_header_lines(self) -> list[str]:
+        """Generate the declaration, title and autonumber lines."""
         lines = ["sequenceDiagram"]
 
         # Add title if present
@@ -477,22 +508,29 @@ class SequenceDiagram(MermaidDiagram):
         if self.autonumber:
             lines.append("    autonumber")
 
-        # Add participants
-        for participant in self.participants.values():
-            lines.append(f"    {participant.to_mermaid()}")
-
-        # Add messages
-        for message in self.messages:
-            for line in message.to_mermaid():
-                lines.append(f"    {line}")
-
-        # Add notes
-        for note in self.notes:
-            lines.append(f"    {note.to_mermaid()}")
+        return lines
 
-        # Add loops
-        for loop in self.loops:
-            for line in loop.to_mermaid():
-                lines.append(f"    {line}")
+    def _fragment_source(self, section: str) -> Collection[Hashable]:
+        """Return the element container backing a fragment section."""
+        if section == "participants":
+            return self.participants
+        if section == "messages":
+            return self.messages
+        if section == "notes":
+            return self.notes
+        return self.loops
+
+    def _render_fragment(self, section: str, key: Hashable) -> str:
+        """Emit the Mermaid text for a single participant, message, note or loop."""
+        if section == "participants":
+            return f"    {self.participants[key].to_mermaid()}"  # type: ignore[index]
+        if section == "notes":
+            return f"    {key.to_mermaid()}"  # type: ignore[attr-defined]
+        # Messages and loops may span several lines
+        return "\n".join(
+            f"    {line}" for line in key.to_mermaid()  # type: ignore[attr-defined]
+        )
 
-        return "\n".join(lines)
+    def _generate_mermaid(self) -> str:
+        """Generate complete Mermaid syntax for the sequence diagram."""
+        return "\n".join(self._generate_fragment_lines())
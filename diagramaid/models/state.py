@@ -31,6 +31,7 @@ class StateDiagram(MermaidDiagram):
             label: Optional display label (defaults to id if not provided).
         """
         self.states[id] = label or id
+        self._mark_dirty()
 
     def add_transition(
         self, from_state: str, to_state: str, label: str | None = None
@@ -43,6 +44,7 @@ class StateDiagram(MermaidDiagram):
             label: Optional transition label.
         """
         self.transitions.append((from_state, to_state, label))
+        self._mark_dirty()
 
     def _generate_mermaid(self) -> str:
         """Generate Mermaid syntax for the state diagram.
@@ -5,10 +5,12 @@ This module provides an object-oriented interface for creating timeline diagrams
 with support for time periods, events, sections, and styling.
 """
 
-from ..core import MermaidDiagram
+from collections.abc import Collection, Hashable
 
+from ..core import MermaidDiagram, TrackedElement
 
-class TimelineEvent:
+
+class TimelineEvent(TrackedElement):
     """
     Represents an event in a timeline.
 
@@ -16,6 +18,8 @@ class TimelineEvent:
     descriptive text about what happened.
     """
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str) -> None:
         """
         Initialize timeline event.
@@ -35,7 +39,7 @@ class TimelineEvent:
         return f": {self.text}"
 
 
-class TimelinePeriod:
+class TimelinePeriod(TrackedElement):
     """
     Represents a time period in a timeline.
 
@@ -43,6 +47,8 @@ class TimelinePeriod:
     a specific point or duration in time.
     """
 
+    __slots__ = ("period", "events")
+
     def __init__(self, period: str) -> None:
         """
         Initialize timeline period.
@@ -65,6 +71,8 @@ class TimelinePeriod:
         """
         event = TimelineEvent(text)
         self.events.append(event)
+        event._bind(self)
+        self._touch()
         return event
 
     def to_mermaid(self) -> list[str]:
@@ -91,7 +99,7 @@ class TimelinePeriod:
         return lines
 
 
-class TimelineSection:
+class TimelineSection(TrackedElement):
     """
     Represents a section in a timeline.
 
@@ -99,6 +107,8 @@ class TimelineSection:
     visual organization and color coding.
     """
 
+    __slots__ = ("name", "periods")
+
     def __init__(self, name: str) -> None:
         """
         Initialize timeline section.
@@ -121,6 +131,8 @@ class TimelineSection:
         """
         timeline_period = TimelinePeriod(period)
         self.periods.append(timeline_period)
+        timeline_period._bind(self)
+        self._touch()
         return timeline_period
 
     def to_mermaid(self) -> list[str]:
@@ -176,6 +188,8 @@ class TimelineDiagram(MermaidDiagram):
         self.sections: list[TimelineSection] = []
         self.periods: list[TimelinePeriod] = []  # Periods not in sections
 
+    _FRAGMENT_SECTIONS = ("sections", "periods")
+
     def get_diagram_type(self) -> str:
         """Return the Mermaid diagram type identifier."""
         return "timeline"
@@ -193,7 +207,8 @@ class TimelineDiagram(MermaidDiagram):
         self._check_disposed()
         section = TimelineSection(name)
         self.sections.append(section)
-        self.clear_cache()
+        section._bind(self, "sections", section)
+        self._mark_fragment_dirty("sections", section)
         return section
 
     def add_period(self, period: str) -> TimelinePeriod:
@@ -209,7 +224,8 @@ class TimelineDiagram(MermaidDiagram):
         self._check_disposed()
         timeline_period = TimelinePeriod(period)
         self.periods.append(timeline_period)
-        self.clear_cache()
+        timeline_period._bind(self, "periods", timeline_period)
+        self._mark_fragment_dirty("periods", timeline_period)
         return timeline_period
 
     def add_event(self, period: str, event_text: str) -> TimelineEvent:
@@ -232,20 +248,18 @@ class TimelineDiagram(MermaidDiagram):
         # Look for existing period in standalone periods only
         for timeline_period in self.periods:
             if timeline_period.period == period:
-                event = timeline_period.add_event(event_text)
-                self.clear_cache()
-                return event
+                return timeline_period.add_event(event_text)
 
         # Create new standalone period if not found
         new_period = self.add_period(period)
         return new_period.add_event(event_text)
 
-    def _generate_mermaid(self) -> str:
+    def _generate_header_lines(self) -> list[str]:
         """
-        Generate complete Mermaid syntax for the timeline diagram.
+        Generate the declaration and title lines of the timeline diagram.
 
         Returns:
-            Mermaid timeline text including title, sections, and periods.
+            Lines preceding the sections and standalone periods.
         """
         lines = ["timeline"]
 
@@ -253,16 +267,24 @@ class TimelineDiagram(MermaidDiagram):
         if self.title:
             lines.append(f"    title {self.title}")
 
-        # Add sections
-        for section in self.sections:
-            section_lines = section.to_mermaid()
-            for line in section_lines:
-                lines.append(f"    {line}")
+        return lines
+
+    def _fragment_source(self, section: str) -> Collection[Hashable]:
+        """Return the element container backing a fragment section."""
+        if section == "sections":
+            return self.sections
+        return self.periods
 
-        # Add standalone periods (not in sections)
-        for period in self.periods:
-            period_lines = period.to_mermaid()
-            for line in period_lines:
-                lines.append(f"    {line}")
+    def _render_fragment(self, section: str, key: Hashable) -> str:
+        """Emit the Mermaid text for a single section or standalone period."""
+        element_lines = key.to_mermaid()  # type: ignore[attr-defined]
+        return "\n".join(f"    {line}" for line in element_lines)
 
-        return "\n".join(lines)
+    def _generate_mermaid(self) -> str:
+        """
+        Generate complete Mermaid syntax for the timeline diagram.
+
+        Returns:
+            Mermaid timeline text including title, sections, and periods.
+        """
+        return "\n".join(self._generate_fragment_lines())
@@ -31,6 +31,7 @@ class UserJourneyDiagram(MermaidDiagram):
             title: Section title displayed in the diagram.
         """
         self.sections.append(("section", title))
+        self._mark_dirty()
 
     def add_task(self, task: str, actors: list[str], score: int) -> None:
         """Add a task with actors and satisfaction score.
@@ -41,6 +42,7 @@ class UserJourneyDiagram(MermaidDiagram):
             score: Satisfaction score (typically 1–5).
         """
         self.tasks.append((task, actors, score))
+        self._mark_dirty()
 
     def _generate_mermaid(self) -> str:
         """Generate Mermaid syntax for the user journey.
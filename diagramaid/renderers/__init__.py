@@ -36,13 +36,22 @@ from .pdf_renderer import PDFRenderer
 from .playwright_renderer import PlaywrightRenderer
 from .png_renderer import PNGRenderer
 from .registry import RendererRegistry, get_global_registry, register_renderer
+from .remote import StandInServer, TransferStats, decode_payload, encode_payload
 from .svg_renderer import SVGRenderer
+from .tiling import TiledRenderer, stitch_svgs
 
 __all__ = [
     # Original renderers
     "SVGRenderer",
     "PNGRenderer",
     "PDFRenderer",
+    "TiledRenderer",
+    "stitch_svgs",
+    # Remote rendering services
+    "encode_payload",
+    "decode_payload",
+    "TransferStats",
+    "StandInServer",
     # Plugin architecture
     "BaseRenderer",
     "RendererCapability",
@@ -7,6 +7,7 @@ must implement to be part of the plugin-based rendering system.
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -127,6 +128,34 @@ class BaseRenderer(ABC):
         """
         pass
 
+    def render_chunks(
+        self,
+        chunks: Iterable[str],
+        format: str,
+        theme: str | None = None,
+        config: dict[str, Any] | None = None,
+        **options: Any,
+    ) -> RenderResult:
+        """
+        Render Mermaid code supplied as a stream of text chunks.
+
+        Accepts the output of ``MermaidDiagram.iter_mermaid()``. The default
+        implementation joins the chunks and calls ``render()``; renderers that
+        can hand the source to their backend piece by piece (for example by
+        writing it to a file) override this to avoid building the full string.
+
+        Args:
+            chunks: Consecutive pieces of the Mermaid diagram syntax
+            format: Output format (svg, png, pdf, etc.)
+            theme: Optional theme name
+            config: Optional configuration dictionary
+            **options: Additional rendering options
+
+        Returns:
+            RenderResult containing the rendered content and metadata
+        """
+        return self.render("".join(chunks), format, theme, config, **options)
+
     def supports_format(self, format: str) -> bool:
         """
         Check if renderer supports the specified format.
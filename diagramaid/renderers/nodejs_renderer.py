@@ -9,6 +9,7 @@ import json
 import subprocess
 import tempfile
 import time
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
@@ -102,6 +103,55 @@ class NodeJSRenderer(BaseRenderer):
         Returns:
             RenderResult containing the rendered content and metadata
         """
+        return self._render_input(
+            lambda path: path.write_text(mermaid_code, encoding="utf-8"),
+            format,
+            theme,
+            config,
+            options,
+        )
+
+    def render_chunks(
+        self,
+        chunks: Iterable[str],
+        format: str,
+        theme: str | None = None,
+        config: dict[str, Any] | None = None,
+        **options: Any,
+    ) -> RenderResult:
+        """
+        Render streamed Mermaid code using Node.js CLI.
+
+        The chunks are written straight to the mmdc input file, so the full
+        diagram source is never held in memory.
+
+        Args:
+            chunks: Consecutive pieces of the Mermaid diagram syntax
+            format: Output format (svg, png, pdf)
+            theme: Optional theme name
+            config: Optional configuration dictionary
+            **options: Additional rendering options
+
+        Returns:
+            RenderResult containing the rendered content and metadata
+        """
+
+        def write_input(path: Path) -> None:
+            with path.open("w", encoding="utf-8") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+
+        return self._render_input(write_input, format, theme, config, options)
+
+    def _render_input(
+        self,
+        write_input: Callable[[Path], object],
+        format: str,
+        theme: str | None,
+        config: dict[str, Any] | None,
+        options: dict[str, Any],
+    ) -> RenderResult:
+        """Run mmdc on an input file populated by ``write_input``."""
         from ..exceptions import RenderingError, UnsupportedFormatError
 
         if format.lower() not in {"svg", "png", "pdf"}:
@@ -120,7 +170,7 @@ class NodeJSRenderer(BaseRenderer):
                 config_file = temp_path / "config.json"
 
                 # Write Mermaid code to input file
-                input_file.write_text(mermaid_code, encoding="utf-8")
+                write_input(input_file)
 
                 # Create configuration file if needed
                 mermaid_config = self._create_mermaid_config(theme, config, options)
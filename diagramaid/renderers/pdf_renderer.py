@@ -91,6 +91,97 @@ class PDFRenderer:
         except Exception as e:
             raise RenderingError(f"PDF rendering from SVG failed: {str(e)}") from e
 
+    def render_pages(self, svg_pages: list[str]) -> bytes:
+        """
+        Render several SVG documents into one PDF with a page per SVG.
+
+        Used for diagrams that were split into tiles. Requires weasyprint or
+        reportlab+svglib; cairosvg only produces single-page documents.
+
+        Args:
+            svg_pages: SVG content of each page in order
+
+        Returns:
+            PDF data as bytes
+
+        Raises:
+            UnsupportedFormatError: If no multi-page PDF backend is available
+            RenderingError: If rendering fails
+        """
+        try:
+            return self._svg_pages_to_pdf(
+                [self._clean_svg_content(svg) for svg in svg_pages]
+            )
+        except UnsupportedFormatError:
+            raise
+        except Exception as e:
+            raise RenderingError(f"Multi-page PDF rendering failed: {str(e)}") from e
+
+    def _svg_pages_to_pdf(self, svg_pages: list[str]) -> bytes:
+        """Convert cleaned SVG pages to a multi-page PDF."""
+        from io import BytesIO
+
+        # Backend 1: weasyprint, one page-sized section per SVG
+        try:
+            import weasyprint
+
+            sections = "\n".join(
+                f'<section class="page">{self._strip_xml_declaration(svg)}</section>'
+                for svg in svg_pages
+            )
+            html_content = f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        @page {{ size: {self.page_size} {self.orientation}; margin: 20px; }}
+        html, body {{ margin: 0; padding: 0; }}
+        .page {{ page-break-after: always; }}
+        .page:last-child {{ page-break-after: auto; }}
+        svg {{ max-width: 100%; max-height: 100%; height: auto; }}
+    </style>
+</head>
+<body>
+{sections}
+</body>
+</html>"""
+
+            pdf_buffer = BytesIO()
+            weasyprint.HTML(string=html_content).write_pdf(target=pdf_buffer)
+            return pdf_buffer.getvalue()
+        except ImportError:
+            pass
+
+        # Backend 2: reportlab + svglib, one canvas page per drawing
+        try:
+            from reportlab.graphics import renderPDF
+            from reportlab.pdfgen import canvas
+            from svglib.svglib import svg2rlg
+
+            pdf_buffer = BytesIO()
+            pdf_canvas = canvas.Canvas(pdf_buffer)
+            for svg in svg_pages:
+                drawing = svg2rlg(BytesIO(svg.encode("utf-8")))
+                if drawing is None:
+                    raise RenderingError(
+                        "Failed to parse SVG content for PDF conversion."
+                    )
+                pdf_canvas.setPageSize((drawing.width, drawing.height))
+                renderPDF.draw(drawing, pdf_canvas, 0, 0)
+                pdf_canvas.showPage()
+            pdf_canvas.save()
+            return pdf_buffer.getvalue()
+        except ImportError:
+            raise UnsupportedFormatError(
+                "Multi-page PDF rendering requires weasyprint or reportlab+svglib. "
+                "Install with: pip install weasyprint"
+            )
+
+    @staticmethod
+    def _strip_xml_declaration(svg_content: str) -> str:
+        """Remove the XML declaration so the SVG can be embedded in HTML."""
+        return re.sub(r"^\s*<\?xml[^>]*\?>\s*", "", svg_content)
+
     def _clean_svg_content(self, svg_content: str) -> str:
         """
         Clean SVG content to ensure it's well-formed XML without corrupting entities.
@@ -4,13 +4,12 @@ PNG renderer for the Mermaid Render library.
 This module provides PNG rendering functionality using the mermaid.ink service.
 """
 
-import base64
-import json
 from typing import Any
 
 import requests
 
 from ..exceptions import NetworkError, RenderingError
+from .remote import DEFAULT_POST_THRESHOLD, TransferStats, build_remote_request
 
 
 class PNGRenderer:
@@ -27,6 +26,9 @@ class PNGRenderer:
         timeout: float = 30.0,
         width: int = 800,
         height: int = 600,
+        encoding: str = "pako",
+        post_url: str | None = None,
+        post_threshold: int = DEFAULT_POST_THRESHOLD,
     ) -> None:
         """
         Initialize PNG renderer.
@@ -36,8 +38,16 @@ class PNGRenderer:
             timeout: Request timeout in seconds
             width: Default image width
             height: Default image height
+            encoding: Remote payload encoding, "pako" (compressed) or "base64"
+            post_url: POST-capable service (e.g. ``diagramaid serve``) used
+                when the request URL would exceed ``post_threshold``
+            post_threshold: URL length above which requests are sent by POST
         """
         self.server_url = server_url.rstrip("/")
+        self.encoding = encoding
+        self.post_url = post_url
+        self.post_threshold = post_threshold
+        self.transfer_stats = TransferStats()
         self.timeout = timeout
         self.default_width = width
         self.default_height = height
@@ -80,16 +90,17 @@ class PNGRenderer:
             img_width = width or self.default_width
             img_height = height or self.default_height
 
-            # Create the request payload
-            if mermaid_config:
-                payload = {"code": mermaid_code, "mermaid": mermaid_config}
-                json_str = json.dumps(payload)
-                encoded = base64.b64encode(json_str.encode()).decode()
-            else:
-                encoded = base64.b64encode(mermaid_code.encode()).decode()
-
-            # Build URL with image parameters
-            url = f"{self.server_url}/img/{encoded}"
+            # Encode the request; oversized payloads go to the POST endpoint
+            request = build_remote_request(
+                self.server_url,
+                "img",
+                mermaid_code,
+                mermaid_config,
+                self.encoding,
+                self.post_url,
+                self.post_threshold,
+            )
+            url = request.url
             params = {
                 "type": "png",
                 "width": str(img_width),
@@ -97,8 +108,18 @@ class PNGRenderer:
             }
 
             # Make the request
-            response = requests.get(url, params=params, timeout=self.timeout)
+            if request.method == "POST":
+                response = requests.post(
+                    url,
+                    params=params,
+                    data=request.body,
+                    headers={"Content-Type": "text/plain"},
+                    timeout=self.timeout,
+                )
+            else:
+                response = requests.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
+            self.transfer_stats.record(request, response)
 
             # Verify we got PNG data
             if not response.content.startswith(b"\x89PNG"):
@@ -140,6 +161,10 @@ class PNGRenderer:
         with open(output_path, "wb") as f:
             f.write(png_data)
 
+    def get_transfer_metrics(self) -> dict[str, Any]:
+        """Get request counts and bytes exchanged with the rendering service."""
+        return self.transfer_stats.to_dict()
+
     def get_supported_themes(self) -> list[str]:
         """Get list of supported themes."""
         return ["default", "dark", "forest", "neutral", "base"]
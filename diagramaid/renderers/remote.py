@@ -0,0 +1,372 @@
+"""
+Request encoding for remote mermaid.ink-compatible rendering services.
+
+mermaid.ink reads the diagram from the URL path. Plain base64 makes the URL
+grow with the diagram, so large diagrams hit URL length limits and every
+request ships uncompressed text. This module builds requests with the
+deflate-compressed ``pako:`` encoding used by the Mermaid Live Editor and
+switches to a POST request when the URL would exceed a threshold and a
+POST-capable endpoint (such as ``diagramaid serve``) is configured.
+
+POST requests send the same encoded payload as the request body, so servers
+decode GET and POST requests with ``decode_payload``. ``StandInServer`` is a
+local server speaking both forms, for tests and offline development.
+
+Example:
+    >>> request = build_remote_request(
+    ...     "https://mermaid.ink", "svg", "flowchart TD\\n    A --> B"
+    ... )
+    >>> request.method, request.url.startswith("https://mermaid.ink/svg/pako:")
+    ('GET', True)
+"""
+
+import base64
+import html
+import json
+import threading
+import zlib
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlsplit
+
+#: Supported payload encodings
+PAYLOAD_ENCODINGS = ("pako", "base64")
+
+#: URL length above which requests are sent by POST (when an endpoint exists)
+DEFAULT_POST_THRESHOLD = 4096
+
+_PAKO_PREFIX = "pako:"
+
+
+def encode_payload(
+    mermaid_code: str,
+    config: dict[str, Any] | None = None,
+    encoding: str = "pako",
+) -> str:
+    """
+    Encode Mermaid code and configuration as a mermaid.ink path segment.
+
+    Args:
+        mermaid_code: Raw Mermaid diagram syntax
+        config: Optional Mermaid configuration
+        encoding: "pako" (deflate + URL-safe base64) or "base64" (plain)
+
+    Returns:
+        Encoded payload, prefixed with ``pako:`` for the pako encoding
+
+    Raises:
+        ValueError: If the encoding is not supported
+    """
+    if encoding == "pako":
+        # Same state layout as Mermaid Live Editor links
+        state = {"code": mermaid_code, "mermaid": json.dumps(config or {})}
+        compressed = zlib.compress(json.dumps(state).encode("utf-8"), 9)
+        encoded = base64.urlsafe_b64encode(compressed).decode("ascii")
+        return _PAKO_PREFIX + encoded.rstrip("=")
+    if encoding == "base64":
+        if config:
+            data = json.dumps({"code": mermaid_code, "mermaid": config})
+        else:
+            data = mermaid_code
+        return base64.b64encode(data.encode("utf-8")).decode("ascii")
+    raise ValueError(
+        f"Unsupported payload encoding '{encoding}'. "
+        f"Available: {', '.join(PAYLOAD_ENCODINGS)}"
+    )
+
+
+def decode_payload(payload: str) -> tuple[str, dict[str, Any]]:
+    """
+    Decode a payload produced by ``encode_payload`` (or a mermaid.ink link).
+
+    Args:
+        payload: Encoded path segment or POST body
+
+    Returns:
+        Tuple of Mermaid code and configuration
+
+    Raises:
+        ValueError: If the payload cannot be decoded
+    """
+    payload = payload.strip()
+    try:
+        if payload.startswith(_PAKO_PREFIX):
+            data = payload[len(_PAKO_PREFIX) :]
+            raw = zlib.decompress(
+                base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+            )
+        else:
+            data = payload.replace("-", "+").replace("_", "/")
+            raw = base64.b64decode(data + "=" * (-len(data) % 4))
+        text = raw.decode("utf-8")
+    except (ValueError, zlib.error) as e:
+        raise ValueError(f"Invalid diagram payload: {e}") from e
+
+    try:
+        state = json.loads(text)
+    except json.JSONDecodeError:
+        return text, {}
+    if not isinstance(state, dict) or "code" not in state:
+        return text, {}
+
+    config = state.get("mermaid") or {}
+    if isinstance(config, str):
+        config = json.loads(config) if config.strip() else {}
+    return str(state["code"]), config
+
+
+@dataclass
+class RemoteRequest:
+    """An HTTP request for a remote rendering service."""
+
+    method: str
+    url: str
+    body: bytes | None = None
+
+    @property
+    def size(self) -> int:
+        """Approximate bytes sent: URL plus body."""
+        return len(self.url) + len(self.body or b"")
+
+
+def build_remote_request(
+    server_url: str,
+    endpoint: str,
+    mermaid_code: str,
+    config: dict[str, Any] | None = None,
+    encoding: str = "pako",
+    post_url: str | None = None,
+    post_threshold: int = DEFAULT_POST_THRESHOLD,
+) -> RemoteRequest:
+    """
+    Build a GET request, or a POST request for oversized payloads.
+
+    Args:
+        server_url: Base URL of the GET service (e.g. https://mermaid.ink)
+        endpoint: Service endpoint ("svg", "img", "pdf")
+        mermaid_code: Raw Mermaid diagram syntax
+        config: Optional Mermaid configuration
+        encoding: Payload encoding ("pako" or "base64")
+        post_url: Base URL of a service accepting POST requests; without it
+            every request is sent by GET
+        post_threshold: URL length above which POST is used
+
+    Returns:
+        The request to send
+    """
+    payload = encode_payload(mermaid_code, config, encoding)
+    url = f"{server_url.rstrip('/')}/{endpoint}/{payload}"
+    if post_url and len(url) > post_threshold:
+        return RemoteRequest(
+            "POST", f"{post_url.rstrip('/')}/{endpoint}", payload.encode("ascii")
+        )
+    return RemoteRequest("GET", url)
+
+
+class TransferStats:
+    """Thread-safe counters of requests and bytes exchanged with a service."""
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self._lock = threading.Lock()
+        self.get_requests = 0
+        self.post_requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def record(self, request: RemoteRequest, response: Any) -> None:
+        """
+        Record one completed request.
+
+        Args:
+            request: The request that was sent
+            response: ``requests`` response; the received size is taken from
+                its Content-Length (the compressed size on the wire) or body
+        """
+        received = response_size(response)
+        with self._lock:
+            if request.method == "POST":
+                self.post_requests += 1
+            else:
+                self.get_requests += 1
+            self.bytes_sent += request.size
+            self.bytes_received += received
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self.get_requests = 0
+            self.post_requests = 0
+            self.bytes_sent = 0
+            self.bytes_received = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the counters and the average bytes sent per request."""
+        with self._lock:
+            requests = self.get_requests + self.post_requests
+            return {
+                "requests": requests,
+                "get_requests": self.get_requests,
+                "post_requests": self.post_requests,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "average_bytes_sent": self.bytes_sent / requests if requests else 0.0,
+            }
+
+
+def response_size(response: Any) -> int:
+    """Return the size of a response body as transferred, if known."""
+    headers = getattr(response, "headers", None)
+    length = headers.get("content-length") if hasattr(headers, "get") else None
+    if isinstance(length, str) and length.isdigit():
+        return int(length)
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    text = getattr(response, "text", None)
+    if isinstance(text, str):
+        return len(text.encode("utf-8"))
+    return 0
+
+
+# Smallest valid PNG: a 1x1 transparent pixel
+_STAND_IN_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA"
+    "60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+@dataclass
+class StandInRequest:
+    """A request received by ``StandInServer``."""
+
+    method: str
+    endpoint: str
+    url_length: int
+    body_length: int
+    mermaid_code: str
+    config: dict[str, Any]
+
+
+class StandInServer:
+    """
+    Local stand-in for a mermaid.ink-compatible rendering service.
+
+    Serves ``GET /<endpoint>/<payload>`` like mermaid.ink and
+    ``POST /<endpoint>`` with the payload as the body, for the ``svg`` and
+    ``img`` endpoints. Instead of rendering, it answers with a small SVG
+    echoing the decoded code, or a 1x1 PNG, and records every request.
+
+    Example:
+        >>> with StandInServer(max_url_length=2048) as server:
+        ...     renderer = SVGRenderer(
+        ...         server_url=server.url, post_url=server.url, use_local=False
+        ...     )
+        ...     svg = renderer.render("flowchart TD\\n    A --> B")
+    """
+
+    def __init__(self, host: str = "127.0.0.1", max_url_length: int | None = None):
+        """
+        Initialize the server; it listens once started.
+
+        Args:
+            host: Interface to bind (a free port is chosen)
+            max_url_length: Answer longer request lines with 414, like
+                servers and proxies in front of mermaid.ink
+        """
+        self.host = host
+        self.max_url_length = max_url_length
+        self.requests: list[StandInRequest] = []
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._server is None:
+            raise RuntimeError("Stand-in server is not running")
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    def start(self) -> "StandInServer":
+        """Start serving in a background thread."""
+        if self._server is None:
+            self._server = ThreadingHTTPServer((self.host, 0), _stand_in_handler(self))
+            self._server.daemon_threads = True
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def _stand_in_handler(server: StandInServer) -> type[BaseHTTPRequestHandler]:
+    """Create a request handler class bound to a stand-in server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if (
+                server.max_url_length is not None
+                and len(self.path) > server.max_url_length
+            ):
+                self._reply(414, "text/plain", b"URI Too Long")
+                return
+            endpoint, _, payload = urlsplit(self.path).path.strip("/").partition("/")
+            self._handle("GET", endpoint, payload, 0)
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = self.rfile.read(length).decode("ascii", "replace")
+            endpoint = urlsplit(self.path).path.strip("/")
+            self._handle("POST", endpoint, payload, length)
+
+        def _handle(
+            self, method: str, endpoint: str, payload: str, body_length: int
+        ) -> None:
+            if endpoint not in ("svg", "img") or not payload:
+                self._reply(404, "text/plain", b"Not Found")
+                return
+            try:
+                code, config = decode_payload(payload)
+            except ValueError as e:
+                self._reply(400, "text/plain", str(e).encode("utf-8"))
+                return
+            server.requests.append(
+                StandInRequest(
+                    method, endpoint, len(self.path), body_length, code, config
+                )
+            )
+            if endpoint == "img":
+                self._reply(200, "image/png", _STAND_IN_PNG)
+                return
+            svg = (
+                '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 200 100">'
+                f"<desc>{html.escape(code)}</desc></svg>"
+            )
+            self._reply(200, "image/svg+xml", svg.encode("utf-8"))
+
+        def _reply(self, status: int, content_type: str, body: bytes) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass  # Keep test output quiet
+
+    return Handler
@@ -25,6 +25,7 @@ import requests
 
 from ..exceptions import NetworkError, RenderingError
 from ..validators import MermaidValidator
+from .remote import DEFAULT_POST_THRESHOLD, TransferStats, build_remote_request
 
 
 class SVGRenderer:
@@ -45,6 +46,9 @@ class SVGRenderer:
         cache_enabled: bool = True,
         cache_dir: str | None = None,
         cache_ttl: int = 3600,  # 1 hour default
+        encoding: str = "pako",
+        post_url: str | None = None,
+        post_threshold: int = DEFAULT_POST_THRESHOLD,
     ) -> None:
         """
         Initialize SVG renderer.
@@ -58,8 +62,16 @@ class SVGRenderer:
             cache_enabled: Whether to enable caching
             cache_dir: Cache directory path (default: ~/.diagramaid_cache)
             cache_ttl: Cache time-to-live in seconds
+            encoding: Remote payload encoding, "pako" (compressed) or "base64"
+            post_url: POST-capable service (e.g. ``diagramaid serve``) used
+                when the request URL would exceed ``post_threshold``
+            post_threshold: URL length above which requests are sent by POST
         """
         self.server_url = server_url.rstrip("/")
+        self.encoding = encoding
+        self.post_url = post_url
+        self.post_threshold = post_threshold
+        self.transfer_stats = TransferStats()
         self.timeout = timeout
         self.use_local = use_local
         self.max_retries = max_retries
@@ -266,6 +278,7 @@ class SVGRenderer:
             "min_render_time": 0.0,
             "max_render_time": 0.0,
             "total_render_time": 0.0,
+            "transfer": self.transfer_stats.to_dict(),
         }
 
         if self._metrics["total_requests"] > 0:
@@ -314,6 +327,8 @@ class SVGRenderer:
             analysis["suggestions"].extend(
                 [
                     "Consider breaking the diagram into smaller parts",
+                    "Render flowcharts and state diagrams in parallel tiles "
+                    "with TiledRenderer",
                     "Use subgraphs to organize complex diagrams",
                     "Enable caching to avoid re-rendering",
                     "Consider using a higher timeout value",
@@ -760,10 +775,6 @@ class SVGRenderer:
         Returns:
             SVG content as string
         """
-        import base64
-        import json as _json
-
-        url: str | None = None
         try:
             # Validate input
             if not mermaid_code or not mermaid_code.strip():
@@ -784,21 +795,29 @@ class SVGRenderer:
             if theme:
                 mermaid_config = self.apply_theme_to_config(mermaid_config, theme)
 
-            # Create the request payload
-            if mermaid_config:
-                # Include config in the request
-                payload = {"code": mermaid_code, "mermaid": mermaid_config}
-                json_str = _json.dumps(payload)
-                encoded = base64.b64encode(json_str.encode("utf-8")).decode("ascii")
-                url = f"{self.server_url}/svg/{encoded}"
-            else:
-                # Simple encoding without config
-                encoded = base64.b64encode(mermaid_code.encode("utf-8")).decode("ascii")
-                url = f"{self.server_url}/svg/{encoded}"
+            # Encode the request; oversized payloads go to the POST endpoint
+            request = build_remote_request(
+                self.server_url,
+                "svg",
+                mermaid_code,
+                mermaid_config,
+                self.encoding,
+                self.post_url,
+                self.post_threshold,
+            )
 
             # Make the request using the configured session
-            response = self._session.get(url, timeout=self.timeout)
+            if request.method == "POST":
+                response = self._session.post(
+                    request.url,
+                    data=request.body,
+                    headers={"Content-Type": "text/plain"},
+                    timeout=self.timeout,
+                )
+            else:
+                response = self._session.get(request.url, timeout=self.timeout)
             response.raise_for_status()
+            self.transfer_stats.record(request, response)
 
             # Validate response content
             svg_content = response.text
@@ -823,7 +842,9 @@ class SVGRenderer:
         except requests.exceptions.Timeout as e:
             raise NetworkError(f"Request timeout after {self.timeout}s") from e
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code if e.response else "unknown"
+            status_code = (
+                e.response.status_code if e.response is not None else "unknown"
+            )
             raise NetworkError(
                 f"Network request failed with status {status_code}"
             ) from e
@@ -0,0 +1,269 @@
+"""
+Tiled rendering of oversized diagrams.
+
+Large flowcharts and state diagrams are split into tiles with
+``partition_diagram``; the tiles are rendered concurrently and either
+stitched into a single SVG or written as one PDF page per tile. Every tile
+stays small enough to lay out quickly and to fit remote URL limits, so the
+total time grows with the number of tiles instead of superlinearly with the
+number of nodes.
+
+Example:
+    >>> renderer = TiledRenderer(max_nodes=300, max_workers=8)
+    >>> svg = renderer.render_svg(large_flowchart)
+    >>> pdf = renderer.render_pdf(large_flowchart)
+"""
+
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from ..exceptions import RenderingError
+from .pdf_renderer import PDFRenderer
+from .svg_renderer import SVGRenderer
+
+if TYPE_CHECKING:
+    from ..core import MermaidDiagram
+    from ..models.partition import DiagramTile
+
+_SVG_OPEN_TAG = re.compile(r"<svg\b[^>]*>", re.IGNORECASE)
+_SVG_PROLOG = re.compile(r"^\s*(?:<\?xml[^>]*\?>\s*)?(?:<!DOCTYPE[^>]*>\s*)?")
+_ID_ATTRIBUTE = re.compile(r'\bid="([^"]+)"')
+_ID_REFERENCE = re.compile(r"#([\w-]+)")
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def svg_size(svg_content: str) -> tuple[float, float]:
+    """
+    Return the width and height of an SVG document.
+
+    Uses the ``viewBox`` when present (Mermaid output sets ``width="100%"``),
+    otherwise numeric ``width``/``height`` attributes.
+
+    Args:
+        svg_content: SVG document
+
+    Returns:
+        ``(width, height)`` in user units
+
+    Raises:
+        RenderingError: If the document has no ``<svg>`` element or size
+    """
+    match = _SVG_OPEN_TAG.search(svg_content)
+    if match is None:
+        raise RenderingError("Tile output is not an SVG document")
+    tag = match.group(0)
+
+    view_box = re.search(r'viewBox="([^"]+)"', tag)
+    if view_box:
+        numbers = _NUMBER.findall(view_box.group(1))
+        if len(numbers) == 4:
+            return float(numbers[2]), float(numbers[3])
+
+    size = []
+    for name in ("width", "height"):
+        value = re.search(rf'\b{name}="([^"%]+)"', tag)
+        number = _NUMBER.match(value.group(1).strip()) if value else None
+        if number is None:
+            raise RenderingError(f"Cannot determine SVG {name}")
+        size.append(float(number.group(0)))
+    return size[0], size[1]
+
+
+def stitch_svgs(
+    svg_documents: list[str], columns: int | None = None, gap: float = 40
+) -> str:
+    """
+    Combine SVG documents into one SVG laid out on a grid.
+
+    Each document is nested as an ``<svg>`` element at its grid position.
+    Element ids are prefixed per document so identical Mermaid ids (markers,
+    CSS scopes) in different tiles do not collide.
+
+    Args:
+        svg_documents: SVG documents in reading order
+        columns: Grid columns (defaults to a near-square grid)
+        gap: Space between documents in user units
+
+    Returns:
+        A single SVG document
+    """
+    if len(svg_documents) == 1:
+        return svg_documents[0]
+    columns = columns or math.ceil(math.sqrt(len(svg_documents)))
+
+    parts = []
+    total_width = 0.0
+    y = 0.0
+    for row_start in range(0, len(svg_documents), columns):
+        x = 0.0
+        row_height = 0.0
+        row_end = min(row_start + columns, len(svg_documents))
+        for index in range(row_start, row_end):
+            svg = _SVG_PROLOG.sub("", svg_documents[index])
+            svg = _prefix_ids(svg, f"t{index}-")
+            width, height = svg_size(svg)
+            parts.append(_place_svg(svg, x, y, width, height))
+            x += width + gap
+            row_height = max(row_height, height)
+        total_width = max(total_width, x - gap)
+        y += row_height + gap
+    total_height = max(y - gap, 0.0)
+
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        'xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{total_width:g}" height="{total_height:g}" '
+        f'viewBox="0 0 {total_width:g} {total_height:g}">'
+        + "".join(parts)
+        + "</svg>"
+    )
+
+
+def _place_svg(svg: str, x: float, y: float, width: float, height: float) -> str:
+    """Rewrite the root ``<svg>`` tag of a document to sit at ``(x, y)``."""
+    match = _SVG_OPEN_TAG.search(svg)
+    assert match is not None  # Checked by svg_size
+    tag = re.sub(r'\s(?:x|y|width|height|style)="[^"]*"', "", match.group(0))
+    tag = (
+        f'<svg x="{x:g}" y="{y:g}" width="{width:g}" height="{height:g}"'
+        + tag[len("<svg") :]
+    )
+    return svg[: match.start()] + tag + svg[match.end() :]
+
+
+def _prefix_ids(svg: str, prefix: str) -> str:
+    """Prefix every element id of a document and the references to it."""
+    ids = set(_ID_ATTRIBUTE.findall(svg))
+    if not ids:
+        return svg
+
+    def rename_reference(match: re.Match[str]) -> str:
+        name = match.group(1)
+        return f"#{prefix}{name}" if name in ids else match.group(0)
+
+    svg = _ID_ATTRIBUTE.sub(lambda match: f'id="{prefix}{match.group(1)}"', svg)
+    return _ID_REFERENCE.sub(rename_reference, svg)
+
+
+class TiledRenderer:
+    """
+    Renderer that partitions large diagrams and renders the tiles in parallel.
+
+    Diagrams that fit into a single tile are rendered unchanged, so the
+    renderer can be used for every flowchart or state diagram regardless of
+    size.
+    """
+
+    def __init__(
+        self,
+        svg_renderer: SVGRenderer | None = None,
+        pdf_renderer: PDFRenderer | None = None,
+        max_nodes: int | None = None,
+        max_workers: int = 4,
+        columns: int | None = None,
+    ) -> None:
+        """
+        Initialize the tiled renderer.
+
+        Args:
+            svg_renderer: Renderer used for each tile (shared by all workers)
+            pdf_renderer: Renderer used to assemble multi-page PDFs
+            max_nodes: Maximum number of nodes per tile
+            max_workers: Number of tiles rendered concurrently
+            columns: Grid columns of the stitched SVG (near-square if None)
+        """
+        from ..models.partition import DEFAULT_TILE_NODES
+
+        self.svg_renderer = svg_renderer or SVGRenderer()
+        self.pdf_renderer = pdf_renderer or PDFRenderer(self.svg_renderer)
+        self.max_nodes = max_nodes or DEFAULT_TILE_NODES
+        self.max_workers = max_workers
+        self.columns = columns
+
+    def partition(self, diagram: "MermaidDiagram") -> list["DiagramTile"]:
+        """Split a diagram into tiles of at most ``max_nodes`` nodes."""
+        from ..models.partition import partition_diagram
+
+        return partition_diagram(diagram, self.max_nodes)
+
+    def render_tiles(
+        self,
+        diagram: "MermaidDiagram",
+        theme: str | None = None,
+        config: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """
+        Render every tile of a diagram to SVG.
+
+        Args:
+            diagram: FlowchartDiagram or StateDiagram to render
+            theme: Optional theme name
+            config: Optional configuration dictionary
+
+        Returns:
+            SVG content of each tile in tile order
+
+        Raises:
+            RenderingError: If a tile fails to render
+        """
+        tiles = self.partition(diagram)
+
+        def render_tile(tile: "DiagramTile") -> str:
+            try:
+                return self.svg_renderer.render(tile.to_mermaid(), theme, config)
+            except Exception as e:
+                raise RenderingError(
+                    f"Tile {tile.index + 1} of {len(tiles)} failed: {str(e)}"
+                ) from e
+
+        if len(tiles) == 1 or self.max_workers <= 1:
+            return [render_tile(tile) for tile in tiles]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(tiles))
+        ) as executor:
+            return list(executor.map(render_tile, tiles))
+
+    def render_svg(
+        self,
+        diagram: "MermaidDiagram",
+        theme: str | None = None,
+        config: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Render a diagram to a single SVG stitched together from its tiles.
+
+        Args:
+            diagram: FlowchartDiagram or StateDiagram to render
+            theme: Optional theme name
+            config: Optional configuration dictionary
+
+        Returns:
+            SVG content
+        """
+        return stitch_svgs(
+            self.render_tiles(diagram, theme, config), columns=self.columns
+        )
+
+    def render_pdf(
+        self,
+        diagram: "MermaidDiagram",
+        theme: str | None = None,
+        config: dict[str, Any] | None = None,
+    ) -> bytes:
+        """
+        Render a diagram to a PDF with one page per tile.
+
+        Args:
+            diagram: FlowchartDiagram or StateDiagram to render
+            theme: Optional theme name
+            config: Optional configuration dictionary
+
+        Returns:
+            PDF data as bytes
+        """
+        svg_pages = self.render_tiles(diagram, theme, config)
+        if len(svg_pages) == 1:
+            return self.pdf_renderer.render_from_svg(svg_pages[0])
+        return self.pdf_renderer.render_pages(svg_pages)
@@ -31,6 +31,7 @@ Example:
     ... })
 """
 
+from .columnar_source import ColumnarDataSource
 from .data_sources import (
     APIDataSource,
     CSVDataSource,
@@ -51,7 +52,7 @@ from .schema import (
     validate_template,
     validate_template_parameters,
 )
-from .template_manager import Template, TemplateManager
+from .template_manager import Template, TemplateManager, get_shared_manager
 
 # Convenience functions
 from .utils import (
@@ -68,6 +69,7 @@ __all__ = [
     "Template",
     "TemplateSchema",
     "ParameterSchema",
+    "get_shared_manager",
     # Generators
     "FlowchartGenerator",
     "SequenceGenerator",
@@ -82,6 +84,7 @@ __all__ = [
     "CSVDataSource",
     "DatabaseDataSource",
     "APIDataSource",
+    "ColumnarDataSource",
     # Utilities
     "generate_from_template",
     "list_available_templates",
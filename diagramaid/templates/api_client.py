@@ -0,0 +1,417 @@
+"""
+HTTP plumbing for API data sources.
+
+``APIDataSource`` sends its requests through a pooled ``requests.Session``
+per base URL and set of default headers, so repeated loads reuse open
+connections. Shared sessions never store cookies. GET responses that
+carry an ``ETag`` or ``Last-Modified`` header are kept in a
+``ResponseCache``; the next request for the same URL is sent as a
+conditional request, and a ``304 Not Modified`` answer is served from the
+cache without transferring the body again. The cache can be persisted to a
+directory so that separate builds share it.
+
+``StandInAPIServer`` is a local JSON API speaking conditional requests and
+``Link`` header pagination, for tests and offline development.
+
+Example:
+    >>> with StandInAPIServer({"/services": [{"name": "api"}]}) as server:
+    ...     source = APIDataSource(server.url)
+    ...     source.load_data("/services")
+    {'data': [{'name': 'api'}]}
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from email.utils import formatdate
+from http.cookiejar import DefaultCookiePolicy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept open per host by a pooled session
+DEFAULT_POOL_SIZE = 16
+
+# Maximum number of responses kept in memory by a ResponseCache
+DEFAULT_RESPONSE_CACHE_SIZE = 256
+
+# Prefix of the files a ResponseCache writes to its directory
+_CACHE_FILE_PREFIX = "response-"
+
+# Request headers that do not change the response and are left out of keys
+_CONDITIONAL_HEADERS = {"if-none-match", "if-modified-since"}
+
+
+@dataclass
+class CachedResponse:
+    """A validated response kept by ``ResponseCache``."""
+
+    url: str
+    content: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    next_url: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers asking the server whether the response changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    LRU cache of validated GET responses, optionally persisted to disk.
+
+    Responses are keyed on the URL, query parameters and request headers.
+    With a directory, each response is also written to a JSON file there
+    and read back on a memory miss.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_RESPONSE_CACHE_SIZE,
+        directory: str | Path | None = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept in memory
+            directory: Directory to persist responses in (memory only if None)
+        """
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> str:
+        """
+        Build the cache key of a GET request.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Request headers (conditional headers are ignored)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        request = [
+            url,
+            sorted((str(k), str(v)) for k, v in (params or {}).items()),
+            sorted(
+                (k.lower(), v)
+                for k, v in (headers or {}).items()
+                if k.lower() not in _CONDITIONAL_HEADERS
+            ),
+        ]
+        encoded = json.dumps(request, separators=(",", ":")).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Look up a response.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            The cached response, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None and self.directory is not None:
+            entry = self._read(key)
+            if entry is not None:
+                self._remember(key, entry)
+        with self._lock:
+            self._stats["hits" if entry is not None else "misses"] += 1
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from ``make_key``
+            entry: Response to keep
+        """
+        self._remember(key, entry)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            temporary = path.with_suffix(f".{threading.get_ident()}.tmp")
+            temporary.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+            temporary.replace(path)
+
+    def record_revalidation(self) -> None:
+        """Count a response confirmed unchanged by the server."""
+        with self._lock:
+            self._stats["revalidated"] += 1
+
+    def clear(self) -> None:
+        """Drop all responses, including persisted ones."""
+        with self._lock:
+            self._entries.clear()
+        if self.directory is not None and self.directory.is_dir():
+            for path in self.directory.glob(f"{_CACHE_FILE_PREFIX}*.json"):
+                path.unlink(missing_ok=True)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Number of entries and counts of hits, misses and responses
+            revalidated with a 304 answer
+        """
+        return {"entries": len(self._entries), **self._stats}
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{_CACHE_FILE_PREFIX}{key}.json"
+
+    def _read(self, key: str) -> CachedResponse | None:
+        try:
+            raw = json.loads(self._path(key).read_text("utf-8"))
+            return CachedResponse(**raw)
+        except (OSError, ValueError, TypeError):
+            return None
+
+
+_sessions: dict[tuple[str, str], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+# Responses shared by all APIDataSource instances
+response_cache = ResponseCache()
+
+
+def get_session(
+    base_url: str,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    credentials: Mapping[str, str] | None = None,
+) -> requests.Session:
+    """
+    Get the process-wide session for a base URL, creating it on first use.
+
+    Callers with different credentials get different sessions, and sessions
+    refuse cookies, so no caller's requests carry state set by another's.
+
+    Args:
+        base_url: Base URL (or any URL of the service; only the scheme and
+            host are used)
+        pool_size: Connections kept open per host (used when the session is
+            created)
+        credentials: Default headers of the caller, such as ``Authorization``
+
+    Returns:
+        Shared session with pooled connections
+    """
+    parts = urlsplit(base_url)
+    key = (f"{parts.scheme}://{parts.netloc}", _credentials_digest(credentials))
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _sessions[key] = session
+    return session
+
+
+def _credentials_digest(credentials: Mapping[str, str] | None) -> str:
+    """Digest of request headers, so session keys do not hold secrets."""
+    if not credentials:
+        return ""
+    items = sorted((name.lower(), value) for name, value in credentials.items())
+    return hashlib.sha256(json.dumps(items).encode("utf-8")).hexdigest()
+
+
+def close_sessions() -> None:
+    """Close every shared session and forget them."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+@dataclass
+class StandInAPIRequest:
+    """A request received by ``StandInAPIServer``."""
+
+    path: str
+    query: dict[str, str]
+    status: int
+
+
+class StandInAPIServer:
+    """
+    Local stand-in for a JSON inventory API.
+
+    Serves each route's document as JSON with an ``ETag`` and a
+    ``Last-Modified`` header, answers matching conditional requests with
+    ``304 Not Modified`` and records every request. With ``page_size``,
+    list documents are served in pages selected by a ``page`` query
+    parameter, linked with ``Link: <...>; rel="next"`` headers.
+
+    Example:
+        >>> with StandInAPIServer({"/hosts": hosts}, page_size=100) as server:
+        ...     records = list(APIDataSource(server.url).stream("/hosts"))
+    """
+
+    def __init__(
+        self,
+        routes: dict[str, Any] | None = None,
+        page_size: int | None = None,
+        host: str = "127.0.0.1",
+    ) -> None:
+        """
+        Initialize the server; it listens once started.
+
+        Args:
+            routes: Path -> JSON document
+            page_size: Items per page of list documents (no paging if None)
+            host: Interface to bind (a free port is chosen)
+        """
+        self.routes: dict[str, Any] = {}
+        self.page_size = page_size
+        self.host = host
+        self.requests: list[StandInAPIRequest] = []
+        self._modified: dict[str, str] = {}
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        for path, document in (routes or {}).items():
+            self.set_route(path, document)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._server is None:
+            raise RuntimeError("Stand-in server is not running")
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    def set_route(self, path: str, document: Any) -> None:
+        """
+        Serve a document, replacing the previous one at the path.
+
+        Args:
+            path: Request path
+            document: JSON-serializable document
+        """
+        self.routes[path] = document
+        self._modified[path] = formatdate(usegmt=True)
+
+    def start(self) -> "StandInAPIServer":
+        """Start serving in a background thread."""
+        if self._server is None:
+            self._server = ThreadingHTTPServer((self.host, 0), _api_handler(self))
+            self._server.daemon_threads = True
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self) -> "StandInAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def _api_handler(server: StandInAPIServer) -> type[BaseHTTPRequestHandler]:
+    """Create a request handler class bound to a stand-in API server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            parts = urlsplit(self.path)
+            query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+            if parts.path not in server.routes:
+                self._reply(parts.path, query, 404, b'{"error": "Not Found"}')
+                return
+
+            document = server.routes[parts.path]
+            headers = {"Last-Modified": server._modified[parts.path]}
+            if server.page_size and isinstance(document, list):
+                page = int(query.get("page", "1"))
+                start = (page - 1) * server.page_size
+                document = document[start : start + server.page_size]
+                if start + server.page_size < len(server.routes[parts.path]):
+                    next_query = urlencode({**query, "page": page + 1})
+                    headers["Link"] = f'<{parts.path}?{next_query}>; rel="next"'
+
+            body = json.dumps(document).encode("utf-8")
+            headers["ETag"] = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == headers["ETag"] or (
+                self.headers.get("If-None-Match") is None
+                and self.headers.get("If-Modified-Since") == headers["Last-Modified"]
+            ):
+                self._reply(parts.path, query, 304, b"", headers)
+                return
+            self._reply(parts.path, query, 200, body, headers)
+
+        def _reply(
+            self,
+            path: str,
+            query: dict[str, str],
+            status: int,
+            body: bytes,
+            headers: dict[str, str] | None = None,
+        ) -> None:
+            server.requests.append(StandInAPIRequest(path, query, status))
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass  # Keep test output quiet
+
+    return Handler
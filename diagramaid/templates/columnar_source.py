@@ -0,0 +1,680 @@
+"""
+Columnar data source with vectorized mapping, filters and group-bys.
+
+The record-based data sources run Python code per row and per field. For
+inputs with millions of rows, ``ColumnarDataSource`` keeps data as columns
+instead and applies operations a whole column at a time:
+
+- With ``pyarrow`` installed, Parquet, Arrow IPC (Feather) and CSV files are
+  read into a ``pyarrow.Table``; filters and aggregations run in Arrow
+  compute kernels, and Parquet filters are pushed down to the reader.
+- NumPy structured arrays (in memory or ``.npy`` files) become a dict of
+  column views; filters use boolean masks and group-bys ``numpy.unique``.
+- Without either package, CSV files are read into a dict of column lists
+  and the same operations run as column-wise Python loops.
+
+Tables are accepted as they are by ``FlowchartDiagram.add_nodes`` /
+``add_edges``, so ``columns_to_flowchart`` builds diagrams without creating
+a record per row.
+
+Example:
+    >>> source = ColumnarDataSource()
+    >>> edges = source.load_columns(
+    ...     "links.parquet",
+    ...     mapping={"from_node": "src", "to_node": "dst"},
+    ...     filters={"kind": ["http", "grpc"]},
+    ... )
+    >>> diagram = columns_to_flowchart(edges=edges, direction="LR")
+"""
+
+import csv
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import chain, compress
+from pathlib import Path
+from typing import Any, cast
+
+from ..exceptions import DataSourceError
+from ..models.flowchart import FlowchartDiagram
+from .data_sources import DEFAULT_CHUNK_SIZE, DataSource
+
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    _NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    pa = pc = pa_csv = pq = None
+    _PYARROW_AVAILABLE = False
+
+# File suffix -> format
+FORMATS: dict[str, str] = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".arrows": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".npy": "numpy",
+}
+
+AGGREGATIONS = ("count", "sum", "mean", "min", "max")
+
+# A table: a pyarrow Table, or column name -> list or NumPy array
+Table = Any
+
+
+def as_table(data: Any) -> Table:
+    """
+    Normalize columnar input into a table.
+
+    Args:
+        data: pyarrow Table or RecordBatch, NumPy structured array, or a
+            mapping of column name to list or array
+
+    Returns:
+        A pyarrow Table, or a dict of columns (NumPy structured arrays
+        become dicts of zero-copy field views)
+
+    Raises:
+        DataSourceError: If the input is not columnar
+    """
+    if _PYARROW_AVAILABLE and isinstance(data, pa.RecordBatch):
+        return pa.Table.from_batches([data])
+    if _PYARROW_AVAILABLE and isinstance(data, pa.Table):
+        return data
+    names = getattr(getattr(data, "dtype", None), "names", None)
+    if names:
+        return {name: data[name] for name in names}
+    if isinstance(data, Mapping):
+        return dict(data)
+    raise DataSourceError(f"Unsupported columnar input: {type(data).__name__}")
+
+
+def column_names(table: Table) -> list[str]:
+    """
+    Get the column names of a table.
+
+    Args:
+        table: Table from ``as_table``
+
+    Returns:
+        Column names in order
+    """
+    return list(table.column_names) if _is_arrow(table) else list(table)
+
+
+def num_rows(table: Table) -> int:
+    """
+    Get the number of rows of a table.
+
+    Args:
+        table: Table from ``as_table``
+
+    Returns:
+        Number of rows
+    """
+    if _is_arrow(table):
+        return int(table.num_rows)
+    return len(next(iter(table.values()))) if table else 0
+
+
+def map_columns(table: Table, mapping: Mapping[str, str]) -> Table:
+    """
+    Select and rename columns without copying them.
+
+    Args:
+        table: Table from ``as_table``
+        mapping: Target column -> source column
+
+    Returns:
+        Table with only the target columns
+
+    Raises:
+        DataSourceError: If a source column does not exist
+    """
+    _require_columns(table, mapping.values())
+    if _is_arrow(table):
+        return table.select(list(mapping.values())).rename_columns(list(mapping))
+    return {target: table[source] for target, source in mapping.items()}
+
+
+def filter_columns(table: Table, criteria: Mapping[str, Any]) -> Table:
+    """
+    Keep the rows matching criteria, evaluated a column at a time.
+
+    Args:
+        table: Table from ``as_table``
+        criteria: Column -> required value, collection of allowed values
+            (list, tuple, set), or a function of the column returning a
+            boolean mask (for example ``lambda c: c > 10`` on NumPy columns)
+
+    Returns:
+        Table with the matching rows
+
+    Raises:
+        DataSourceError: If a criteria column does not exist
+    """
+    if not criteria:
+        return table
+    _require_columns(table, criteria)
+
+    if _is_arrow(table):
+        mask = None
+        for name, expected in criteria.items():
+            column = table.column(name)
+            if callable(expected):
+                matches = expected(column)
+            elif _is_collection(expected):
+                matches = pc.is_in(
+                    column, value_set=pa.array(list(expected), type=column.type)
+                )
+            else:
+                matches = pc.equal(column, expected)
+            mask = matches if mask is None else pc.and_(mask, matches)
+        # Nulls never match
+        return table.filter(pc.fill_null(mask, False))
+
+    masks = []
+    for name, expected in criteria.items():
+        column = table[name]
+        if callable(expected):
+            masks.append(expected(column))
+        elif _is_array(column):
+            if _is_collection(expected):
+                masks.append(np.isin(column, list(expected)))
+            else:
+                masks.append(column == expected)
+        elif _is_collection(expected):
+            allowed = set(expected)
+            masks.append([value in allowed for value in column])
+        else:
+            masks.append([value == expected for value in column])
+
+    if _NUMPY_AVAILABLE and any(_is_array(m) for m in masks):
+        mask = np.logical_and.reduce([np.asarray(m, dtype=bool) for m in masks])
+        return {
+            name: column[mask] if _is_array(column) else list(compress(column, mask))
+            for name, column in table.items()
+        }
+    keep = (
+        [all(flags) for flags in zip(*masks, strict=False)]
+        if len(masks) > 1
+        else masks[0]
+    )
+    return {name: list(compress(column, keep)) for name, column in table.items()}
+
+
+def group_columns(
+    table: Table, by: str, aggregations: Mapping[str, tuple[str, str]]
+) -> Table:
+    """
+    Aggregate columns per distinct key, vectorized where possible.
+
+    Args:
+        table: Table from ``as_table``
+        by: Column to group by
+        aggregations: Output column -> (source column, function), where the
+            function is one of count, sum, mean, min and max (nulls are
+            skipped)
+
+    Returns:
+        Table with the ``by`` column and one column per aggregation, one row
+        per key, sorted by key
+
+    Raises:
+        DataSourceError: If a column does not exist or a function is unknown
+    """
+    _require_columns(table, [by, *(source for source, _ in aggregations.values())])
+    for _, function in aggregations.values():
+        if function not in AGGREGATIONS:
+            raise DataSourceError(f"Unknown aggregation: {function}")
+
+    if _is_arrow(table):
+        grouped = table.group_by(by).aggregate(
+            [(source, function) for source, function in aggregations.values()]
+        )
+        outputs = [f"{source}_{function}" for source, function in aggregations.values()]
+        result = grouped.select([by, *outputs]).rename_columns([by, *aggregations])
+        return result.sort_by(by)
+
+    keys = table[by]
+    if _is_array(keys) and all(
+        function == "count" or _is_numeric_array(table[source])
+        for source, function in aggregations.values()
+    ):
+        return _group_numpy(table, by, aggregations)
+
+    # Assign each row its group number in one pass over the key column
+    group_of: dict[Any, int] = {}
+    inverse = [group_of.setdefault(key, len(group_of)) for key in keys]
+    group_keys = list(group_of)
+    # Null keys sort last, as in pyarrow
+    order = sorted(
+        range(len(group_keys)),
+        key=lambda group: (group_keys[group] is None, group_keys[group]),
+    )
+    result = {by: [group_keys[group] for group in order]}
+    for output, (source, function) in aggregations.items():
+        values: list[list[Any]] = [[] for _ in group_of]
+        for group, value in zip(inverse, table[source], strict=False):
+            if value is not None:
+                values[group].append(value)
+        result[output] = [_aggregate(values[group], function) for group in order]
+    return result
+
+
+def columns_to_flowchart(
+    nodes: Any = None,
+    edges: Any = None,
+    direction: str = "TD",
+    declare_endpoints: bool = True,
+) -> FlowchartDiagram:
+    """
+    Build a columnar flowchart directly from tables.
+
+    Args:
+        nodes: Node table with an ``id`` column and optional ``label``,
+            ``shape`` and ``style`` columns
+        edges: Edge table with ``from_node`` and ``to_node`` columns and
+            optional ``label``, ``arrow_type`` and ``style`` columns
+        direction: Flow direction
+        declare_endpoints: Declare edge endpoints missing from ``nodes`` as
+            plain nodes, the way Mermaid creates them implicitly
+
+    Returns:
+        The populated FlowchartDiagram
+
+    Raises:
+        DiagramError: If the tables do not describe a valid flowchart
+    """
+    diagram = FlowchartDiagram(direction=direction, storage="columnar")
+    nodes = None if nodes is None else as_table(nodes)
+    if nodes is not None:
+        diagram.add_nodes(nodes)
+    if edges is not None:
+        edges = as_table(edges)
+        if declare_endpoints:
+            missing = _missing_endpoints(nodes, edges)
+            if missing:
+                diagram.add_nodes({"id": missing})
+        diagram.add_edges(edges)
+    return diagram
+
+
+class ColumnarDataSource(DataSource):
+    """
+    Columnar file and array data source.
+
+    Reads Parquet and Arrow IPC files (requires ``pyarrow``), CSV files
+    (with ``pyarrow`` if installed) and NumPy structured arrays or ``.npy``
+    files (requires ``numpy``) into tables, then applies filters, column
+    mapping and grouping as vectorized column operations.
+    """
+
+    def load_columns(self, source: Any, **options: Any) -> Table:
+        """
+        Load a table, filtered, mapped and grouped.
+
+        Filters refer to source columns and run before the mapping; the
+        group-by refers to mapped columns.
+
+        Args:
+            source: File path, or a pyarrow Table, NumPy structured array or
+                dict of columns
+            **options: ``format`` (parquet, arrow, csv or numpy; inferred
+                from the suffix), ``columns`` (columns to read), ``filters``
+                (see ``filter_columns``), ``mapping`` (target -> source
+                column), ``group_by`` and ``aggregations`` (see
+                ``group_columns``), ``delimiter`` and ``encoding`` for CSV
+
+        Returns:
+            A pyarrow Table or a dict of columns
+
+        Raises:
+            DataSourceError: If reading fails or a required package is
+                missing
+        """
+        filters = cast(dict[str, Any], options.get("filters") or {})
+        mapping = cast(dict[str, str] | None, options.get("mapping"))
+        columns = cast(list[str] | None, options.get("columns"))
+        if columns is None and mapping:
+            # Read only what the filters and the mapping need
+            columns = list(dict.fromkeys(chain(filters, mapping.values())))
+
+        try:
+            if isinstance(source, (str, Path)):
+                table = self._read(Path(source), columns, filters, options)
+            else:
+                table = as_table(source)
+                if columns is not None:
+                    table = map_columns(table, {name: name for name in columns})
+
+            table = filter_columns(table, filters)
+            if mapping:
+                table = map_columns(table, mapping)
+            group_by = cast(str | None, options.get("group_by"))
+            if group_by:
+                aggregations = cast(
+                    dict[str, tuple[str, str]],
+                    options.get("aggregations") or {"count": (group_by, "count")},
+                )
+                table = group_columns(table, group_by, aggregations)
+            return table
+        except DataSourceError:
+            raise
+        except Exception as e:
+            raise DataSourceError(f"Failed to load columnar data: {str(e)}") from e
+
+    def load_data(self, source: Any, **options: Any) -> dict[str, Any]:
+        """
+        Load data as Python values.
+
+        Args:
+            source: As accepted by ``load_columns``
+            **options: Options of ``load_columns``, plus ``structure``
+                ("columns" for column name -> list, or "rows" for
+                ``{"data": [records]}``)
+
+        Returns:
+            Dictionary with loaded data
+
+        Raises:
+            DataSourceError: If loading fails
+        """
+        table = self.load_columns(source, **options)
+        if options.get("structure", "columns") == "rows":
+            return {"data": list(chain.from_iterable(_row_chunks(table, None)))}
+        if _is_arrow(table):
+            return cast(dict[str, Any], table.to_pydict())
+        return {name: _to_list(column) for name, column in table.items()}
+
+    def iter_records(
+        self, source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE, **options: Any
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream the rows of a loaded table as records.
+
+        Args:
+            source: As accepted by ``load_columns``
+            chunk_size: Maximum number of records per chunk
+            **options: Options of ``load_columns``
+
+        Yields:
+            Lists of at most ``chunk_size`` records
+
+        Raises:
+            DataSourceError: If loading fails
+        """
+        yield from _row_chunks(self.load_columns(source, **options), chunk_size)
+
+    def validate_source(self, source: str) -> bool:
+        """Validate the file exists and its format can be read here."""
+        path = Path(source)
+        file_format = FORMATS.get(path.suffix.lower())
+        if not path.is_file() or file_format is None:
+            return False
+        if file_format in ("parquet", "arrow"):
+            return _PYARROW_AVAILABLE
+        if file_format == "numpy":
+            return _NUMPY_AVAILABLE
+        return True
+
+    def _read(
+        self,
+        path: Path,
+        columns: list[str] | None,
+        filters: Mapping[str, Any],
+        options: Mapping[str, Any],
+    ) -> Table:
+        """Read a file into a table."""
+        if not path.exists():
+            raise DataSourceError(f"Columnar file not found: {path}")
+        file_format = cast(str | None, options.get("format")) or FORMATS.get(
+            path.suffix.lower()
+        )
+        delimiter = cast(
+            str, options.get("delimiter", "\t" if path.suffix == ".tsv" else ",")
+        )
+        encoding = cast(str, options.get("encoding", "utf-8"))
+
+        if file_format in ("parquet", "arrow"):
+            if not _PYARROW_AVAILABLE:
+                raise DataSourceError(
+                    f"Reading {file_format} files requires pyarrow "
+                    "(pip install diagramaid[columnar])"
+                )
+            if file_format == "parquet":
+                # Plain equality and membership filters skip row groups
+                # while reading
+                pushdown = [
+                    (name, "in", list(value))
+                    if _is_collection(value)
+                    else (name, "=", value)
+                    for name, value in filters.items()
+                    if not callable(value)
+                ]
+                return pq.read_table(path, columns=columns, filters=pushdown or None)
+            return _read_ipc(path, columns)
+
+        if file_format == "numpy":
+            if not _NUMPY_AVAILABLE:
+                raise DataSourceError(
+                    "Reading .npy files requires numpy "
+                    "(pip install diagramaid[columnar])"
+                )
+            table = as_table(np.load(path, allow_pickle=False))
+            if columns is not None:
+                table = map_columns(table, {name: name for name in columns})
+            return table
+
+        if file_format == "csv":
+            if _PYARROW_AVAILABLE:
+                return pa_csv.read_csv(
+                    path,
+                    read_options=pa_csv.ReadOptions(encoding=encoding),
+                    parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+                    convert_options=pa_csv.ConvertOptions(include_columns=columns),
+                )
+            return _read_csv(path, columns, delimiter, encoding)
+
+        raise DataSourceError(f"Unsupported columnar format: {file_format or path}")
+
+
+def _read_ipc(path: Path, columns: list[str] | None) -> Table:
+    """Read an Arrow IPC file (or stream) through a memory map."""
+    with pa.memory_map(str(path), "r") as source:
+        try:
+            table = pa.ipc.open_file(source).read_all()
+        except pa.ArrowInvalid:
+            source.seek(0)
+            table = pa.ipc.open_stream(source).read_all()
+    return table.select(columns) if columns is not None else table
+
+
+def _read_csv(
+    path: Path, columns: list[str] | None, delimiter: str, encoding: str
+) -> Table:
+    """Read CSV columns without pyarrow."""
+    with open(path, encoding=encoding, newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, [])
+        names = header if columns is None else columns
+        missing = [name for name in names if name not in header]
+        if missing:
+            raise DataSourceError(f"Unknown columns: {', '.join(missing)}")
+        positions = [header.index(name) for name in names]
+        values: list[list[str]] = [[] for _ in names]
+        appenders = list(
+            zip(positions, (column.append for column in values), strict=True)
+        )
+        width = len(header)
+        for row in reader:
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            for position, append in appenders:
+                append(row[position])
+
+    table: dict[str, Any] = {}
+    for name, column in zip(names, values, strict=True):
+        parsed = _parse_numbers(column)
+        if _NUMPY_AVAILABLE and None not in parsed:
+            # Typed arrays make the filters and group-bys below vectorized
+            table[name] = np.asarray(parsed)
+        else:
+            table[name] = parsed
+    return table
+
+
+def _parse_numbers(column: list[str]) -> list[Any]:
+    """
+    Convert a CSV column of numbers to int or float, like pyarrow's reader.
+
+    Empty values of a numeric column become None. Columns with any other
+    value, or with no values at all, are returned unchanged.
+    """
+    if not any(column):
+        return column
+    for kind in (int, float):
+        try:
+            return [kind(value) if value != "" else None for value in column]
+        except ValueError:
+            continue
+    return column
+
+
+def _group_numpy(
+    table: dict[str, Any], by: str, aggregations: Mapping[str, tuple[str, str]]
+) -> dict[str, Any]:
+    """Group NumPy columns with ``numpy.unique`` and ``bincount``."""
+    keys, inverse, counts = np.unique(
+        table[by], return_inverse=True, return_counts=True
+    )
+    inverse = inverse.reshape(-1)
+    result: dict[str, Any] = {by: keys}
+    # Row order sorted by group, and where each group starts in it
+    order = np.argsort(inverse, kind="stable")
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    for output, (source, function) in aggregations.items():
+        values = np.asarray(table[source])
+        if function == "count":
+            result[output] = counts
+        elif function in ("sum", "mean"):
+            sums = np.bincount(inverse, weights=values, minlength=len(keys))
+            result[output] = sums if function == "sum" else sums / counts
+        elif function == "min":
+            result[output] = np.minimum.reduceat(values[order], starts)
+        else:
+            result[output] = np.maximum.reduceat(values[order], starts)
+    return result
+
+
+def _is_numeric_array(column: Any) -> bool:
+    return _is_array(column) and column.dtype.kind in "biuf"
+
+
+def _aggregate(values: list[Any], function: str) -> Any:
+    """Aggregate the non-null values of one group."""
+    if function == "count":
+        return len(values)
+    if not values:
+        return None
+    if function == "sum":
+        return sum(values)
+    if function == "mean":
+        return sum(values) / len(values)
+    return min(values) if function == "min" else max(values)
+
+
+def _missing_endpoints(nodes: Table | None, edges: Table) -> list[Any]:
+    """Get the edge endpoints that are not node ids, vectorized if possible."""
+    sources = _column(edges, "from_node")
+    targets = _column(edges, "to_node")
+    ids = None
+    if nodes is not None and "id" in column_names(nodes):
+        ids = _column(nodes, "id")
+
+    if _PYARROW_AVAILABLE and isinstance(sources, pa.ChunkedArray):
+        ends = pc.unique(
+            pa.chunked_array(
+                sources.chunks + targets.cast(sources.type).chunks, type=sources.type
+            )
+        )
+        if ids is not None:
+            known = pa.array(_to_list(ids)).cast(ends.type)
+            ends = ends.filter(pc.invert(pc.is_in(ends, value_set=known)))
+        return cast(list[Any], ends.to_pylist())
+
+    if _is_array(sources):
+        ends = np.unique(np.concatenate([sources, np.asarray(targets)]))
+        if ids is not None:
+            ends = ends[~np.isin(ends, np.asarray(_to_list(ids)))]
+        return cast(list[Any], ends.tolist())
+
+    declared = set(_to_list(ids)) if ids is not None else set()
+    return [
+        node_id
+        for node_id in dict.fromkeys(chain(sources, targets))
+        if node_id not in declared
+    ]
+
+
+def _row_chunks(table: Table, chunk_size: int | None) -> Iterator[list[dict[str, Any]]]:
+    """Convert a table into records, a chunk at a time."""
+    if _is_arrow(table):
+        for batch in table.to_batches(max_chunksize=chunk_size):
+            yield batch.to_pylist()
+        return
+    names = list(table)
+    total = num_rows(table)
+    size = chunk_size or max(total, 1)
+    for start in range(0, total, size):
+        columns = [_to_list(table[name][start : start + size]) for name in names]
+        yield [
+            dict(zip(names, values, strict=True))
+            for values in zip(*columns, strict=False)
+        ]
+
+
+def _require_columns(table: Table, names: Any) -> None:
+    present = set(column_names(table))
+    missing = [name for name in names if name not in present]
+    if missing:
+        raise DataSourceError(f"Unknown columns: {', '.join(missing)}")
+
+
+def _column(table: Table, name: str) -> Any:
+    return table.column(name) if _is_arrow(table) else table[name]
+
+
+def _is_arrow(table: Table) -> bool:
+    return _PYARROW_AVAILABLE and isinstance(table, pa.Table)
+
+
+def _is_array(column: Any) -> bool:
+    return _NUMPY_AVAILABLE and isinstance(column, np.ndarray)
+
+
+def _is_collection(value: Any) -> bool:
+    return isinstance(value, (list, tuple, set, frozenset))
+
+
+def _to_list(column: Sequence[Any] | Any) -> list[Any]:
+    if isinstance(column, list):
+        return column
+    if hasattr(column, "to_pylist"):
+        return cast(list[Any], column.to_pylist())
+    if hasattr(column, "tolist"):
+        return cast(list[Any], column.tolist())
+    return list(column)
@@ -0,0 +1,283 @@
+"""
+Connection pooling and query result caching for database data sources.
+
+Opening a SQLite connection and planning a query cost more than running
+a small query, so ``DatabaseDataSource`` reuses connections from a pool per
+connection string. Each thread gets its own connection (SQLite connections
+must not be shared between concurrent threads), and each connection keeps
+its compiled statements in SQLite's statement cache so repeated queries skip
+planning. Query results can additionally be cached for a time.
+"""
+
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from typing import Any
+
+# Compiled statements kept per connection (sqlite3's own default is 128)
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+# Maximum number of query results kept by a QueryResultCache
+DEFAULT_RESULT_CACHE_SIZE = 256
+
+
+class ConnectionPool:
+    """
+    Pool of SQLite connections to one database with thread affinity.
+
+    A thread asking for a connection always gets the same one back, so no
+    locking is needed around queries. Connections of threads that have
+    ended are closed when the next connection is opened.
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            connection_string: SQLite database path or ``file:`` URI
+            statement_cache_size: Compiled statements kept per connection
+        """
+        self.connection_string = connection_string
+        self.statement_cache_size = statement_cache_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[
+            tuple[weakref.ref[threading.Thread], sqlite3.Connection]
+        ] = []
+        # Bumped by close() so that threads drop their closed connections
+        self._generation = 0
+        self._stats = {"opened": 0, "reused": 0, "closed": 0}
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection, opening it on first use.
+
+        Returns:
+            Connection with rows accessible by column name
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        cached = getattr(self._local, "connection", None)
+        if cached is not None and cached[0] == self._generation:
+            self._stats["reused"] += 1
+            return cached[1]
+
+        conn = sqlite3.connect(
+            self.connection_string,
+            check_same_thread=False,
+            cached_statements=self.statement_cache_size,
+            uri=self.connection_string.startswith("file:"),
+        )
+        conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._close_orphans()
+            self._connections.append((weakref.ref(threading.current_thread()), conn))
+            self._stats["opened"] += 1
+            self._local.connection = (self._generation, conn)
+        return conn
+
+    def close(self) -> None:
+        """Close all connections; threads open new ones on next use."""
+        with self._lock:
+            self._generation += 1
+            for _, conn in self._connections:
+                conn.close()
+            self._stats["closed"] += len(self._connections)
+            self._connections.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Open connections and counts of opened, reused and closed ones
+        """
+        return {"connections": len(self._connections), **self._stats}
+
+    def _close_orphans(self) -> None:
+        """Close the connections of threads that have ended."""
+        alive = []
+        for thread_ref, conn in self._connections:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                alive.append((thread_ref, conn))
+            else:
+                conn.close()
+                self._stats["closed"] += 1
+        self._connections = alive
+
+
+class QueryResultCache:
+    """
+    LRU cache of query results with a time to live per entry.
+
+    Entries are keyed on the connection string, the query text and its
+    parameters, and can be invalidated by connection or query.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_RESULT_CACHE_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[
+            tuple[str, str, Hashable], tuple[float, list[dict[str, Any]]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        connection_string: str, query: str, parameters: Any = ()
+    ) -> tuple[str, str, Hashable]:
+        """
+        Build the cache key of a query.
+
+        Args:
+            connection_string: Database the query runs against
+            query: Query text
+            parameters: Positional (sequence) or named (mapping) parameters
+
+        Returns:
+            Hashable key
+        """
+        if isinstance(parameters, Mapping):
+            params: Hashable = tuple(sorted(parameters.items()))
+        else:
+            params = tuple(parameters)
+        return connection_string, query, params
+
+    def get(self, key: tuple[str, str, Hashable]) -> list[dict[str, Any]] | None:
+        """
+        Look up a result.
+
+        Args:
+            key: Key from ``make_key``
+
+        Returns:
+            Copy of the cached rows, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            expires_at, rows = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+        # Copies keep callers from changing the cached rows
+        return [dict(row) for row in rows]
+
+    def put(
+        self, key: tuple[str, str, Hashable], rows: list[dict[str, Any]], ttl: float
+    ) -> None:
+        """
+        Store a result.
+
+        Args:
+            key: Key from ``make_key``
+            rows: Query result
+            ttl: Seconds the result stays valid
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, [dict(r) for r in rows])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, connection_string: str | None = None, query: str | None = None
+    ) -> int:
+        """
+        Drop cached results.
+
+        Args:
+            connection_string: Only results from this database
+            query: Only results of this query (with any parameters)
+
+        Returns:
+            Number of results dropped
+        """
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if (connection_string is None or key[0] == connection_string)
+                and (query is None or key[1] == query)
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Number of entries and counts of hits, misses and expired entries
+        """
+        return {"entries": len(self._entries), **self._stats}
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+# Results shared by all DatabaseDataSource instances
+result_cache = QueryResultCache()
+
+
+def get_connection_pool(
+    connection_string: str,
+    statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+) -> ConnectionPool:
+    """
+    Get the process-wide pool for a database, creating it on first use.
+
+    Args:
+        connection_string: SQLite database path or ``file:`` URI
+        statement_cache_size: Compiled statements kept per connection (used
+            when the pool is created)
+
+    Returns:
+        The shared ConnectionPool
+    """
+    pool = _pools.get(connection_string)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(connection_string)
+            if pool is None:
+                pool = ConnectionPool(connection_string, statement_cache_size)
+                _pools[connection_string] = pool
+    return pool
+
+
+def close_connection_pools() -> None:
+    """Close every shared pool's connections and forget the pools."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -2,20 +2,46 @@
 Data source integrations for template parameter generation.
 
 This module provides integrations with various data sources to automatically
-populate template parameters from external data.
+populate template parameters from external data. Besides loading a whole
+source with ``load_data``, every source can stream its records in chunks
+with ``iter_records``; together with the streaming operators at the end of
+this module, large files and tables are processed in bounded memory.
 """
 
+import asyncio
+import copy
 import csv
 import json
+import re
 import sqlite3
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain, groupby, islice
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TextIO, TypeVar, cast
 from urllib.parse import urljoin
 
 import requests
 
 from ..exceptions import DataSourceError
+from .api_client import CachedResponse, ResponseCache, get_session, response_cache
+from .connection_pool import (
+    DEFAULT_STATEMENT_CACHE_SIZE,
+    get_connection_pool,
+    result_cache,
+)
+
+T = TypeVar("T")
+
+# Number of records per chunk yielded by ``iter_records``
+DEFAULT_CHUNK_SIZE = 1000
+
+# Characters read from a JSON file at a time when streaming an array
+_JSON_BLOCK_SIZE = 1 << 16
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
 class DataSource(ABC):
@@ -31,6 +57,46 @@ class DataSource(ABC):
         """Validate if source is accessible and valid."""
         pass
 
+    def iter_records(
+        self, source: str, chunk_size: int = DEFAULT_CHUNK_SIZE, **options: Any
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream the records of a source in chunks.
+
+        The default implementation loads the whole source with ``load_data``
+        and splits its ``data`` list; sources that can read incrementally
+        override it.
+
+        Args:
+            source: Data source location/query
+            chunk_size: Maximum number of records per chunk
+            **options: Options as accepted by ``load_data``
+
+        Yields:
+            Lists of at most ``chunk_size`` records
+
+        Raises:
+            DataSourceError: If loading fails
+        """
+        data = self.load_data(source, **options)
+        records: Any = data["data"] if set(data) == {"data"} else data
+        if not isinstance(records, list):
+            records = [records]
+        yield from chunked(records, chunk_size)
+
+    def stream(self, source: str, **options: Any) -> Iterator[dict[str, Any]]:
+        """
+        Stream the records of a source one by one.
+
+        Args:
+            source: Data source location/query
+            **options: Options as accepted by ``iter_records``
+
+        Returns:
+            Iterator over the records
+        """
+        return chain.from_iterable(self.iter_records(source, **options))
+
 
 class JSONDataSource(DataSource):
     """
@@ -100,6 +166,78 @@ class JSONDataSource(DataSource):
         except (OSError, json.JSONDecodeError):
             return False
 
+    def iter_records(
+        self, source: str, chunk_size: int = DEFAULT_CHUNK_SIZE, **options: Any
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream records from a JSON or JSON Lines file.
+
+        JSON Lines files (``.jsonl``/``.ndjson`` or ``lines=True``) and
+        documents whose top level is an array are decoded one record at a
+        time. For other documents, the list at ``path`` (dot notation, or
+        ``data``) is streamed after the document has been loaded.
+
+        Args:
+            source: Path to JSON file
+            chunk_size: Maximum number of records per chunk
+            **options: ``lines``, ``path``, ``filters`` (criteria each record
+                must match) and ``mapping`` (target field -> source field)
+
+        Yields:
+            Lists of at most ``chunk_size`` records
+
+        Raises:
+            DataSourceError: If the file is missing or invalid
+        """
+        source_path = Path(source)
+        if not source_path.exists():
+            raise DataSourceError(f"JSON file not found: {source}")
+
+        lines = options.get("lines")
+        if lines is None:
+            lines = source_path.suffix.lower() in (".jsonl", ".ndjson")
+
+        records: Iterator[Any]
+        try:
+            with open(source_path, encoding="utf-8") as f:
+                if lines:
+                    records = (json.loads(line) for line in f if line.strip())
+                else:
+                    records = self._iter_document(f, options.get("path"))
+
+                filters = cast(dict[str, Any] | None, options.get("filters"))
+                if filters:
+                    records = (r for r in records if self._matches_filter(r, filters))
+                mapping = cast(dict[str, str] | None, options.get("mapping"))
+                if mapping:
+                    records = (
+                        self._apply_mapping(r, mapping) if isinstance(r, dict) else r
+                        for r in records
+                    )
+                yield from chunked(records, chunk_size)
+        except (OSError, ValueError) as e:
+            raise DataSourceError(f"Failed to load JSON data: {str(e)}") from e
+
+    def _iter_document(self, f: TextIO, path: str | None) -> Iterator[Any]:
+        """Iterate the records of a JSON document."""
+        if path is None:
+            first = f.read(_JSON_BLOCK_SIZE)
+            if first.lstrip().startswith("["):
+                return _iter_json_array(f, first)
+            raw = json.loads(first + f.read())
+        else:
+            raw = json.load(f)
+
+        if path is not None:
+            value = self._get_nested_value(raw, path) if isinstance(raw, dict) else None
+        elif isinstance(raw, dict) and set(raw) == {"data"}:
+            value = raw["data"]
+        else:
+            value = raw
+        if value is None:
+            return iter(())
+        return iter(value if isinstance(value, list) else [value])
+
     def _apply_mapping(
         self, data: dict[str, Any], mapping: dict[str, str]
     ) -> dict[str, Any]:
@@ -190,32 +328,21 @@ class CSVDataSource(DataSource):
             if not source_path.exists():
                 raise DataSourceError(f"CSV file not found: {source}")
 
-            delimiter = cast(str, options.get("delimiter", ","))
-            encoding = cast(str, options.get("encoding", "utf-8"))
-
-            rows: list[dict[str, str]]
-            with open(source_path, encoding=encoding) as f:
-                reader = csv.DictReader(f, delimiter=delimiter)
-                rows = list(reader)
-
-            # Apply column mapping if provided
-            mapping = cast(dict[str, str] | None, options.get("mapping"))
-            if mapping:
-                rows = [self._apply_row_mapping(row, mapping) for row in rows]
+            # Rows are read lazily so that the structures below are built
+            # in a single pass without an intermediate list
+            rows = self._read_rows(source_path, **options)
 
             # Structure data based on options
             structure = cast(str, options.get("structure", "rows"))
 
-            if structure == "rows":
-                return {"data": rows}
-            elif structure == "columns":
-                return self._rows_to_columns(rows)
+            if structure == "columns":
+                return records_to_columns(rows, missing="")
             elif structure == "grouped":
                 group_by = cast(str | None, options.get("group_by"))
                 if group_by:
                     return self._group_rows(rows, group_by)
 
-            return {"data": rows}
+            return {"data": list(rows)}
 
         except (OSError, csv.Error) as e:
             raise DataSourceError(f"Failed to load CSV data: {str(e)}") from e
@@ -234,6 +361,51 @@ class CSVDataSource(DataSource):
         except (OSError, csv.Error):
             return False
 
+    def iter_records(
+        self, source: str, chunk_size: int = DEFAULT_CHUNK_SIZE, **options: Any
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream rows from a CSV file.
+
+        Only one chunk of rows is held in memory at a time.
+
+        Args:
+            source: Path to CSV file
+            chunk_size: Maximum number of rows per chunk
+            **options: ``delimiter``, ``encoding``, ``filters`` (column values
+                each row must match) and ``mapping`` (target column -> source
+                column)
+
+        Yields:
+            Lists of at most ``chunk_size`` rows
+
+        Raises:
+            DataSourceError: If the file is missing or cannot be parsed
+        """
+        source_path = Path(source)
+        if not source_path.exists():
+            raise DataSourceError(f"CSV file not found: {source}")
+
+        try:
+            yield from chunked(self._read_rows(source_path, **options), chunk_size)
+        except (OSError, csv.Error) as e:
+            raise DataSourceError(f"Failed to load CSV data: {str(e)}") from e
+
+    def _read_rows(self, source_path: Path, **options: Any) -> Iterator[dict[str, str]]:
+        """Lazily read, filter and map the rows of a CSV file."""
+        delimiter = cast(str, options.get("delimiter", ","))
+        encoding = cast(str, options.get("encoding", "utf-8"))
+        filters = cast(dict[str, Any] | None, options.get("filters"))
+        mapping = cast(dict[str, str] | None, options.get("mapping"))
+
+        with open(source_path, encoding=encoding, newline="") as f:
+            rows: Iterator[dict[str, str]] = csv.DictReader(f, delimiter=delimiter)
+            if filters:
+                rows = filter_records(rows, filters)
+            if mapping:
+                rows = (self._apply_row_mapping(row, mapping) for row in rows)
+            yield from rows
+
     def _apply_row_mapping(
         self, row: dict[str, str], mapping: dict[str, str]
     ) -> dict[str, str]:
@@ -248,17 +420,10 @@ class CSVDataSource(DataSource):
 
     def _rows_to_columns(self, rows: list[dict[str, str]]) -> dict[str, list[str]]:
         """Convert row-based data to column-based data."""
-        if not rows:
-            return {}
-
-        columns: dict[str, list[str]] = {}
-        for column_name in rows[0].keys():
-            columns[column_name] = [row.get(column_name, "") for row in rows]
-
-        return columns
+        return records_to_columns(rows, missing="")
 
     def _group_rows(
-        self, rows: list[dict[str, str]], group_by: str
+        self, rows: Iterable[dict[str, str]], group_by: str
     ) -> dict[str, list[dict[str, str]]]:
         """Group rows by a specific column."""
         groups: dict[str, list[dict[str, str]]] = {}
@@ -277,17 +442,33 @@ class DatabaseDataSource(DataSource):
     Database data source.
 
     Loads template parameters from SQL databases with support for
-    custom queries and result transformation.
+    custom queries and result transformation. Connections come from a
+    shared per-database pool (one connection per thread, with compiled
+    statements cached), and results can be cached for ``cache_ttl`` seconds.
     """
 
-    def __init__(self, connection_string: str | None = None) -> None:
+    def __init__(
+        self,
+        connection_string: str | None = None,
+        pooled: bool = True,
+        cache_ttl: float | None = None,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ) -> None:
         """
         Initialize database data source.
 
         Args:
             connection_string: Database connection string
+            pooled: Reuse connections from the shared pool instead of
+                opening one per query
+            cache_ttl: Seconds query results are cached (no caching if None)
+            statement_cache_size: Compiled statements kept per pooled
+                connection
         """
         self.connection_string = connection_string
+        self.pooled = pooled
+        self.cache_ttl = cache_ttl
+        self.statement_cache_size = statement_cache_size
 
     def load_data(self, source: str, **options: Any) -> dict[str, Any]:
         """
@@ -295,7 +476,8 @@ class DatabaseDataSource(DataSource):
 
         Args:
             source: SQL query or table name
-            **options: Additional options (connection, parameters, etc.)
+            **options: Additional options (connection, parameters,
+                transform, cache_ttl to override the instance setting)
 
         Returns:
             Dictionary with loaded data
@@ -311,30 +493,27 @@ class DatabaseDataSource(DataSource):
             if not connection_string:
                 raise DataSourceError("Database connection string required")
 
-            # For simplicity, this implementation uses SQLite
-            conn = sqlite3.connect(connection_string)
-            conn.row_factory = sqlite3.Row  # Enable column access by name
-
-            cursor = conn.cursor()
-
-            # Determine if source is a query or table name
-            if source.strip().upper().startswith("SELECT"):
-                query = source
-            else:
-                # Treat as table name
-                query = f"SELECT * FROM {source}"
-
-            # Execute query with parameters if provided
+            query = self._build_query(source)
             parameters = cast(
                 tuple[Any, ...] | list[Any], options.get("parameters", ())
             )
-            cursor.execute(query, parameters)
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            # Convert to list of dictionaries
-            data_list: list[dict[str, Any]] = [dict(row) for row in rows]
+            cache_ttl = cast(float | None, options.get("cache_ttl", self.cache_ttl))
+
+            # Results are cached before transformation, so differently
+            # transformed loads of the same query share an entry
+            data_list: list[dict[str, Any]] | None = None
+            if cache_ttl:
+                key = result_cache.make_key(connection_string, query, parameters)
+                data_list = result_cache.get(key)
+            if data_list is None:
+                with self._connect(connection_string) as conn:
+                    cursor = conn.execute(query, parameters)
+                    try:
+                        data_list = [dict(row) for row in cursor.fetchall()]
+                    finally:
+                        cursor.close()
+                if cache_ttl:
+                    result_cache.put(key, data_list, cache_ttl)
 
             # Apply transformations if provided
             transform = cast(dict[str, Any] | None, options.get("transform"))
@@ -346,26 +525,150 @@ class DatabaseDataSource(DataSource):
         except (sqlite3.Error, Exception) as e:
             raise DataSourceError(f"Failed to load database data: {str(e)}") from e
 
+    async def load_data_async(self, source: str, **options: Any) -> dict[str, Any]:
+        """
+        Load data from a database query without blocking the event loop.
+
+        The query runs in a worker thread with that thread's pooled
+        connection, so concurrent loads do not wait for each other.
+
+        Args:
+            source: SQL query or table name
+            **options: Options as accepted by ``load_data``
+
+        Returns:
+            Dictionary with loaded data
+
+        Raises:
+            DataSourceError: If loading fails
+        """
+        return await asyncio.to_thread(self.load_data, source, **options)
+
+    async def load_many_async(
+        self,
+        sources: Iterable[str | tuple[str, dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Load several queries concurrently.
+
+        Args:
+            sources: Queries or table names, or (source, options) pairs
+            return_exceptions: Return per-query exceptions instead of raising
+                the first one
+
+        Returns:
+            Loaded data (or exceptions) in the order of ``sources``
+
+        Raises:
+            DataSourceError: If a load fails and return_exceptions is False
+        """
+        loads = []
+        for item in sources:
+            source, options = (item, {}) if isinstance(item, str) else item
+            loads.append(self.load_data_async(source, **options))
+        return list(await asyncio.gather(*loads, return_exceptions=return_exceptions))
+
+    def invalidate(self, source: str | None = None) -> int:
+        """
+        Drop cached results of this database.
+
+        Args:
+            source: Only results of this query or table (with any parameters)
+
+        Returns:
+            Number of cached results dropped
+        """
+        if not self.connection_string:
+            return 0
+        query = None if source is None else self._build_query(source)
+        return result_cache.invalidate(self.connection_string, query)
+
     def validate_source(self, source: str) -> bool:
         """Validate database connection and query/table."""
         try:
             if not self.connection_string:
                 return False
 
-            conn = sqlite3.connect(self.connection_string)
-            cursor = conn.cursor()
-
-            # Test query
-            if source.strip().upper().startswith("SELECT"):
-                cursor.execute(f"EXPLAIN QUERY PLAN {source}")
-            else:
-                cursor.execute(f"SELECT 1 FROM {source} LIMIT 1")
+            with self._connect(self.connection_string) as conn:
+                # Test query
+                if source.strip().upper().startswith("SELECT"):
+                    conn.execute(f"EXPLAIN QUERY PLAN {source}").close()
+                else:
+                    conn.execute(f"SELECT 1 FROM {source} LIMIT 1").close()
 
-            conn.close()
             return True
         except sqlite3.Error:
             return False
 
+    def iter_records(
+        self, source: str, chunk_size: int = DEFAULT_CHUNK_SIZE, **options: Any
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream query results in chunks fetched with ``fetchmany``.
+
+        Results are not cached. An unpooled connection stays open until the
+        iterator is exhausted or closed.
+
+        Args:
+            source: SQL query or table name
+            chunk_size: Maximum number of rows per chunk
+            **options: Options as accepted by ``load_data``
+
+        Yields:
+            Lists of at most ``chunk_size`` rows
+
+        Raises:
+            DataSourceError: If the query fails
+        """
+        connection_string = cast(
+            str | None, options.get("connection", self.connection_string)
+        )
+        if not connection_string:
+            raise DataSourceError("Database connection string required")
+        transform = cast(dict[str, Any] | None, options.get("transform"))
+        parameters = cast(tuple[Any, ...] | list[Any], options.get("parameters", ()))
+
+        try:
+            with self._connect(connection_string) as conn:
+                cursor = conn.execute(self._build_query(source), parameters)
+                try:
+                    while rows := cursor.fetchmany(chunk_size):
+                        chunk: list[dict[str, Any]] = [dict(row) for row in rows]
+                        if transform:
+                            # Transformations are per row, so chunks can be
+                            # handled independently
+                            chunk = self._apply_transform(chunk, transform)
+                        if chunk:
+                            yield chunk
+                finally:
+                    cursor.close()
+        except sqlite3.Error as e:
+            raise DataSourceError(f"Failed to load database data: {str(e)}") from e
+
+    @contextmanager
+    def _connect(self, connection_string: str) -> Iterator[sqlite3.Connection]:
+        """Get a pooled connection, or open one that is closed afterwards."""
+        if self.pooled:
+            pool = get_connection_pool(connection_string, self.statement_cache_size)
+            yield pool.connection()
+            return
+
+        # For simplicity, this implementation uses SQLite
+        conn = sqlite3.connect(connection_string)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _build_query(source: str) -> str:
+        """Turn a table name into a query; queries are used as given."""
+        if source.strip().upper().startswith("SELECT"):
+            return source
+        return f"SELECT * FROM {source}"
+
     def _apply_transform(
         self, data: list[dict[str, Any]], transform: dict[str, Any]
     ) -> list[dict[str, Any]]:
@@ -393,11 +696,18 @@ class APIDataSource(DataSource):
     REST API data source.
 
     Loads template parameters from REST APIs with support for
-    authentication, pagination, and response transformation.
+    authentication, pagination, and response transformation. Requests go
+    through a pooled session per base URL, and GET responses with an ETag
+    or Last-Modified header are cached and revalidated with conditional
+    requests.
     """
 
     def __init__(
-        self, base_url: str | None = None, headers: dict[str, str] | None = None
+        self,
+        base_url: str | None = None,
+        headers: dict[str, str] | None = None,
+        cache: ResponseCache | bool = True,
+        max_workers: int = 8,
     ) -> None:
         """
         Initialize API data source.
@@ -405,9 +715,19 @@ class APIDataSource(DataSource):
         Args:
             base_url: Base URL for API requests
             headers: Default headers for requests
+            cache: Response cache for conditional requests (True for the
+                shared cache, False to disable caching)
+            max_workers: Maximum number of concurrent requests in
+                ``load_many``
         """
         self.base_url = base_url
         self.default_headers = headers or {}
+        self.cache: ResponseCache | None
+        if isinstance(cache, ResponseCache):
+            self.cache = cache
+        else:
+            self.cache = response_cache if cache else None
+        self.max_workers = max_workers
 
     def load_data(self, source: str, **options: Any) -> dict[str, Any]:
         """
@@ -424,44 +744,7 @@ class APIDataSource(DataSource):
             DataSourceError: If loading fails
         """
         try:
-            # Build URL
-            if source.startswith("http"):
-                url = source
-            elif self.base_url:
-                url = urljoin(self.base_url, source)
-            else:
-                raise DataSourceError("Base URL required for relative endpoints")
-
-            # Prepare request
-            method = cast(str, options.get("method", "GET")).upper()
-            params = cast(dict[str, Any], options.get("params", {}))
-            headers = {
-                **self.default_headers,
-                **cast(dict[str, str], options.get("headers", {})),
-            }
-            timeout = cast(int, options.get("timeout", 30))
-
-            # Make request
-            response = requests.request(
-                method=method,
-                url=url,
-                params=params,
-                headers=headers,
-                timeout=timeout,
-                json=options.get("json"),
-                data=options.get("data"),
-            )
-
-            response.raise_for_status()
-
-            # Parse response
-            content_type = response.headers.get("content-type", "") or ""
-
-            parsed: Any
-            if "application/json" in content_type:
-                parsed = response.json()
-            else:
-                parsed = {"content": response.text}
+            parsed, _ = self._request(self._build_url(source), **options)
 
             # Apply data extraction if provided
             extract_path = cast(str | None, options.get("extract_path"))
@@ -483,6 +766,78 @@ class APIDataSource(DataSource):
         except (requests.RequestException, ValueError) as e:
             raise DataSourceError(f"Failed to load API data: {str(e)}") from e
 
+    def load_many(
+        self,
+        sources: Iterable[str | tuple[str, dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Load several endpoints concurrently.
+
+        Args:
+            sources: Endpoint paths or URLs, or (source, options) pairs
+            return_exceptions: Return per-endpoint exceptions instead of
+                raising the first one
+
+        Returns:
+            Loaded data (or exceptions) in the order of ``sources``
+
+        Raises:
+            DataSourceError: If a load fails and return_exceptions is False
+        """
+        items = [(item, {}) if isinstance(item, str) else item for item in sources]
+        if not items:
+            return []
+
+        results: list[Any] = []
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items)),
+            thread_name_prefix="api-data-source",
+        ) as executor:
+            futures = [
+                executor.submit(self.load_data, source, **options)
+                for source, options in items
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except DataSourceError as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        return results
+
+    def iter_records(
+        self, source: str, chunk_size: int = DEFAULT_CHUNK_SIZE, **options: Any
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream the records of a paginated endpoint in chunks.
+
+        Pages are requested as the records are consumed. The next page is
+        taken from the response field at ``next_path``, or, with
+        ``page_param``, by incrementing that query parameter until a page has
+        no records, or otherwise from a ``Link: <...>; rel="next"`` header.
+
+        Args:
+            source: API endpoint path or full URL
+            chunk_size: Maximum number of records per chunk
+            **options: Options as accepted by ``load_data`` (``extract_path``
+                locates the records of each page), plus ``next_path``,
+                ``page_param``, ``first_page`` (default 1) and ``max_pages``
+
+        Yields:
+            Lists of at most ``chunk_size`` records
+
+        Raises:
+            DataSourceError: If a page cannot be loaded
+        """
+        try:
+            yield from chunked(
+                chain.from_iterable(self._iter_pages(source, **options)), chunk_size
+            )
+        except (requests.RequestException, ValueError) as e:
+            raise DataSourceError(f"Failed to load API data: {str(e)}") from e
+
     def validate_source(self, source: str) -> bool:
         """Validate API endpoint is accessible."""
         try:
@@ -495,12 +850,134 @@ class APIDataSource(DataSource):
                 return False
 
             # Test with HEAD request
-            response = requests.head(url, headers=self.default_headers, timeout=10)
+            session = get_session(
+                self.base_url or url, credentials=self.default_headers
+            )
+            response = session.head(url, headers=self.default_headers, timeout=10)
             return bool(response.status_code < 400)
 
         except requests.RequestException:
             return False
 
+    def _build_url(self, source: str) -> str:
+        """Resolve an endpoint path against the base URL."""
+        if source.startswith("http"):
+            return source
+        elif self.base_url:
+            return urljoin(self.base_url, source)
+        raise DataSourceError("Base URL required for relative endpoints")
+
+    def _request(self, url: str, **options: Any) -> tuple[Any, str | None]:
+        """
+        Send a request, revalidating a cached response if there is one.
+
+        Returns:
+            Parsed response and the URL of the next page from a Link header
+        """
+        method = cast(str, options.get("method", "GET")).upper()
+        params = cast(dict[str, Any], options.get("params", {}))
+        headers = {
+            **self.default_headers,
+            **cast(dict[str, str], options.get("headers", {})),
+        }
+        timeout = cast(int, options.get("timeout", 30))
+
+        cache = self.cache if method == "GET" else None
+        cached = None
+        if cache is not None:
+            key = cache.make_key(url, params, headers)
+            cached = cache.get(key)
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+
+        session = get_session(self.base_url or url, credentials=self.default_headers)
+        response = session.request(
+            method=method,
+            url=url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            json=options.get("json"),
+            data=options.get("data"),
+        )
+        if cached is not None and response.status_code == 304:
+            cast(ResponseCache, cache).record_revalidation()
+            return copy.deepcopy(cached.content), cached.next_url
+
+        response.raise_for_status()
+
+        # Parse response
+        content_type = response.headers.get("content-type", "") or ""
+
+        parsed: Any
+        if "application/json" in content_type:
+            parsed = response.json()
+        else:
+            parsed = {"content": response.text}
+
+        next_url = None
+        link = response.headers.get("Link")
+        if link:
+            for link_value in requests.utils.parse_header_links(link):
+                if link_value.get("rel") == "next":
+                    next_url = urljoin(url, link_value["url"])
+
+        if cache is not None:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                cache.put(
+                    key,
+                    CachedResponse(
+                        url, copy.deepcopy(parsed), etag, last_modified, next_url
+                    ),
+                )
+        return parsed, next_url
+
+    def _iter_pages(self, source: str, **options: Any) -> Iterator[list[Any]]:
+        """Request pages one at a time and yield the records of each."""
+        extract_path = cast(str | None, options.get("extract_path"))
+        next_path = cast(str | None, options.get("next_path"))
+        page_param = cast(str | None, options.get("page_param"))
+        max_pages = cast(int | None, options.get("max_pages"))
+        transform = cast(dict[str, Any] | None, options.get("transform"))
+
+        url: str | None = self._build_url(source)
+        params = dict(cast(dict[str, Any], options.get("params", {})))
+        page = cast(int, options.get("first_page", 1))
+        if page_param:
+            params[page_param] = page
+
+        pages = 0
+        while url is not None and (max_pages is None or pages < max_pages):
+            parsed, link = self._request(url, **{**options, "params": params})
+            pages += 1
+
+            records = parsed
+            if extract_path:
+                records = self._extract_data(parsed, extract_path)
+            if records is None:
+                records = []
+            elif not isinstance(records, list):
+                records = [records]
+            if transform:
+                records = self._apply_api_transform(records, transform)
+            yield records
+
+            # Next links carry their own query string
+            if next_path:
+                target = self._extract_data(parsed, next_path)
+                url = urljoin(url, target) if isinstance(target, str) else None
+                params = {}
+            elif page_param:
+                page += 1
+                params[page_param] = page
+                url = url if records else None
+            elif link:
+                url, params = link, {}
+            else:
+                url = None
+
     def _extract_data(self, data: Any, extract_path: str) -> Any | None:
         """Extract data from nested response using dot notation."""
         keys = extract_path.split(".")
@@ -543,7 +1020,8 @@ def create_data_source(source_type: str, **config: Any) -> DataSource:
     Factory function to create data source instances.
 
     Args:
-        source_type: Type of data source (json, csv, database, api)
+        source_type: Type of data source (json, csv, database, api,
+            columnar)
         **config: Configuration for the data source
 
     Returns:
@@ -556,11 +1034,15 @@ def create_data_source(source_type: str, **config: Any) -> DataSource:
         >>> json_source = create_data_source('json')
         >>> api_source = create_data_source('api', base_url='https://api.example.com')
     """
+    # Imported here because the columnar module builds on this one
+    from .columnar_source import ColumnarDataSource
+
     source_map: dict[str, type[DataSource]] = {
         "json": JSONDataSource,
         "csv": CSVDataSource,
         "database": DatabaseDataSource,
         "api": APIDataSource,
+        "columnar": ColumnarDataSource,
     }
 
     if source_type not in source_map:
@@ -570,11 +1052,16 @@ def create_data_source(source_type: str, **config: Any) -> DataSource:
 
     # Pass relevant config to constructor
     if source_type == "database":
-        return DatabaseDataSource(cast(str | None, config.get("connection_string")))
+        return DatabaseDataSource(
+            cast(str | None, config.get("connection_string")),
+            pooled=cast(bool, config.get("pooled", True)),
+            cache_ttl=cast(float | None, config.get("cache_ttl")),
+        )
     elif source_type == "api":
         return APIDataSource(
             cast(str | None, config.get("base_url")),
             cast(dict[str, str] | None, config.get("headers")),
+            cache=cast(ResponseCache | bool, config.get("cache", True)),
         )
     else:
         return source_class()
@@ -617,3 +1104,245 @@ def load_template_data(
         return mapped_data
 
     return data
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Split an iterable into lists of a fixed size.
+
+    Args:
+        items: Items to split
+        size: Maximum number of items per list
+
+    Yields:
+        Lists of at most ``size`` items; only the last one may be shorter
+
+    Raises:
+        ValueError: If size is not positive
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be positive")
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def filter_records(
+    records: Iterable[dict[str, Any]],
+    criteria: Mapping[str, Any] | Callable[[dict[str, Any]], bool],
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily keep the records matching criteria.
+
+    Args:
+        records: Records to filter
+        criteria: Field values a record must have, or a predicate
+
+    Returns:
+        Iterator over the matching records
+    """
+    if callable(criteria):
+        return filter(criteria, records)
+    expected = list(criteria.items())
+    missing = object()
+    return (
+        record
+        for record in records
+        if all(record.get(key, missing) == value for key, value in expected)
+    )
+
+
+def map_records(
+    records: Iterable[dict[str, Any]],
+    mapping: Mapping[str, str] | Callable[[dict[str, Any]], dict[str, Any]],
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily reshape records.
+
+    Args:
+        records: Records to reshape
+        mapping: Target field -> source field (dot notation for nested
+            fields), or a function returning the new record
+
+    Returns:
+        Iterator over the reshaped records; fields missing from a record
+        are left out
+    """
+    if callable(mapping):
+        return map(mapping, records)
+    paths = [(target, source.split(".")) for target, source in mapping.items()]
+
+    def reshape(record: dict[str, Any]) -> dict[str, Any]:
+        mapped: dict[str, Any] = {}
+        for target, keys in paths:
+            value: Any = record
+            for key in keys:
+                if not isinstance(value, dict) or key not in value:
+                    break
+                value = value[key]
+            else:
+                mapped[target] = value
+        return mapped
+
+    return map(reshape, records)
+
+
+def group_records(
+    records: Iterable[dict[str, Any]], group_by: str, default: Any = "unknown"
+) -> Iterator[tuple[Any, list[dict[str, Any]]]]:
+    """
+    Group consecutive records sharing a field value.
+
+    Only one group is held in memory at a time, so the input should be
+    ordered by the field (for example with ``ORDER BY``); otherwise a value
+    is reported once per run. Use ``aggregate_records`` for unordered input.
+
+    Args:
+        records: Records ordered by the field
+        group_by: Field to group by
+        default: Group of records without the field
+
+    Yields:
+        (value, records) pairs
+    """
+    for value, group in groupby(records, key=lambda r: r.get(group_by, default)):
+        yield value, list(group)
+
+
+def aggregate_records(
+    records: Iterable[dict[str, Any]],
+    group_by: str,
+    reducer: Callable[[Any, dict[str, Any]], Any],
+    initial: Any = 0,
+    default: Any = "unknown",
+) -> dict[Any, Any]:
+    """
+    Fold records per group in a single pass, keeping one value per group.
+
+    Args:
+        records: Records in any order
+        group_by: Field to group by
+        reducer: Function of (accumulated value, record) returning the new
+            accumulated value
+        initial: Accumulated value of a new group
+        default: Group of records without the field
+
+    Returns:
+        Accumulated value per group, in order of first appearance
+
+    Example:
+        >>> aggregate_records(rows, "type", lambda count, _: count + 1)
+        {'start': 1, 'process': 2}
+    """
+    totals: dict[Any, Any] = {}
+    for record in records:
+        key = record.get(group_by, default)
+        totals[key] = reducer(totals.get(key, initial), record)
+    return totals
+
+
+def records_to_columns(
+    records: Iterable[dict[str, Any]],
+    columns: Iterable[str] | None = None,
+    missing: Any = None,
+) -> dict[str, list[Any]]:
+    """
+    Build columns from records in a single pass.
+
+    Args:
+        records: Records to convert
+        columns: Columns to build (the fields of the first record if None)
+        missing: Value for fields a record lacks
+
+    Returns:
+        Column name -> values
+    """
+    iterator = iter(records)
+    if columns is None:
+        first = next(iterator, None)
+        if first is None:
+            return {}
+        names = list(first)
+        iterator = chain([first], iterator)
+    else:
+        names = list(columns)
+
+    result: dict[str, list[Any]] = {name: [] for name in names}
+    appenders = [(name, result[name].append) for name in names]
+    for record in iterator:
+        for name, append in appenders:
+            append(record.get(name, missing))
+    return result
+
+
+def _iter_json_array(f: TextIO, buffer: str = "") -> Iterator[Any]:
+    """
+    Decode the items of a top-level JSON array one at a time.
+
+    Args:
+        f: File positioned after ``buffer``
+        buffer: Text already read from the start of the file
+
+    Yields:
+        Array items
+
+    Raises:
+        ValueError: If the document is not a valid array
+    """
+    decoder = json.JSONDecoder()
+    position = 0
+    eof = False
+    # "open" before "[", "item" before an item (or "]" if none were read
+    # yet), "separator" after an item
+    state = "open"
+    has_items = False
+
+    while True:
+        whitespace = _JSON_WHITESPACE.match(buffer, position)
+        position = whitespace.end() if whitespace else position
+        if position == len(buffer):
+            if eof:
+                raise ValueError("Unexpected end of JSON array")
+            buffer, position, eof = _read_more(f, buffer, position)
+            continue
+
+        char = buffer[position]
+        if state == "open":
+            if char != "[":
+                raise ValueError("JSON document is not an array")
+            position += 1
+            state = "item"
+        elif state == "item":
+            if char == "]" and not has_items:
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                buffer, position, eof = _read_more(f, buffer, position)
+                continue
+            if end == len(buffer) and not eof:
+                # A number may continue in the next block
+                buffer, position, eof = _read_more(f, buffer, position)
+                continue
+            yield item
+            has_items = True
+            position = end
+            state = "separator"
+        elif char == ",":
+            position += 1
+            state = "item"
+        elif char == "]":
+            return
+        else:
+            raise ValueError(f"Expected ',' or ']' in JSON array, found {char!r}")
+
+
+def _read_more(f: TextIO, buffer: str, position: int) -> tuple[str, int, bool]:
+    """Drop consumed text and append the next block of a file."""
+    rest = buffer[position:]
+    # Grow reads with the pending text so that large items decode in
+    # amortized linear time
+    block = f.read(max(_JSON_BLOCK_SIZE, len(rest)))
+    return rest + block, 0, not block
@@ -2,7 +2,9 @@
 Specialized diagram generators for common patterns.
 
 This module provides high-level generators that create diagrams
-from structured data without requiring template knowledge.
+from structured data without requiring template knowledge. Their list inputs
+may be any iterables, such as ``DataSource.stream`` results: each is consumed
+in a single pass and formatted straight into output lines.
 """
 
 from abc import ABC, abstractmethod
@@ -31,12 +33,33 @@ class FlowchartGenerator(DiagramGenerator):
     automatic styling and layout optimization.
     """
 
+    # Node syntax by shape, formatted with the node id and label
+    SHAPE_FORMATS: dict[str, str] = {
+        "rectangle": "{0}[{1}]",
+        "rounded": "{0}({1})",
+        "circle": "{0}(({1}))",
+        "diamond": "{0}{{{1}}}",
+        "hexagon": "{0}{{{{{1}}}}}",
+        "stadium": "{0}([{1}])",
+        "subroutine": "{0}[[{1}]]",
+        "cylinder": "{0}[({1})]",
+    }
+
+    # Arrow syntax by edge style
+    EDGE_STYLES: dict[str, str] = {
+        "solid": "-->",
+        "dotted": "-.-",
+        "thick": "==>",
+        "invisible": "~~~",
+    }
+
     def generate(self, data: dict[str, Any], **options: Any) -> str:
         """
         Generate flowchart from structured data.
 
         Args:
-            data: Flowchart data with nodes and edges
+            data: Flowchart data with nodes and edges (lists or iterables of
+                node and edge records)
             **options: Additional generation options
 
         Returns:
@@ -56,25 +79,12 @@ class FlowchartGenerator(DiagramGenerator):
             lines.append("")
 
         # Add nodes
+        rectangle = self.SHAPE_FORMATS["rectangle"]
         for node in nodes:
             node_id = node["id"]
             label = node.get("label", node_id)
-            shape = node.get("shape", "rectangle")
-
-            # Map shape to Mermaid syntax
-            shape_map = {
-                "rectangle": f"{node_id}[{label}]",
-                "rounded": f"{node_id}({label})",
-                "circle": f"{node_id}(({label}))",
-                "diamond": f"{node_id}{{{label}}}",
-                "hexagon": f"{node_id}{{{{{label}}}}}",
-                "stadium": f"{node_id}([{label}])",
-                "subroutine": f"{node_id}[[{label}]]",
-                "cylinder": f"{node_id}[({label})]",
-            }
-
-            node_syntax = shape_map.get(shape, f"{node_id}[{label}]")
-            lines.append(f"    {node_syntax}")
+            shape_format = self.SHAPE_FORMATS.get(node.get("shape"), rectangle)
+            lines.append(f"    {shape_format.format(node_id, label)}")
 
         lines.append("")
 
@@ -83,17 +93,7 @@ class FlowchartGenerator(DiagramGenerator):
             from_node = edge["from"]
             to_node = edge["to"]
             label = edge.get("label", "")
-            style = edge.get("style", "solid")
-
-            # Map style to Mermaid syntax
-            style_map = {
-                "solid": "-->",
-                "dotted": "-.-",
-                "thick": "==>",
-                "invisible": "~~~",
-            }
-
-            arrow = style_map.get(style, "-->")
+            arrow = self.EDGE_STYLES.get(edge.get("style", "solid"), "-->")
 
             if label:
                 lines.append(f"    {from_node} {arrow}|{label}| {to_node}")
@@ -612,30 +612,26 @@ class ArchitectureGenerator(DiagramGenerator):
             flowchart_data["nodes"].append(node)
             flowchart_data["styling"]["node_classes"][comp_id] = comp_type
 
-        # Process connections
-        for connection in data.get("connections", []):
-            from_name = connection["from"]
-            to_name = connection["to"]
-
-            # Convert names to IDs (replace spaces with underscores)
-            from_id = from_name.replace(" ", "_")
-            to_id = to_name.replace(" ", "_")
-
-            protocol = connection.get("protocol", "")
-            label = protocol if protocol else ""
-
-            edge = {
-                "from": from_id,
-                "to": to_id,
-                "label": label,
-                "arrow": "-->",
-            }
-
-            flowchart_data["edges"].append(edge)
+        # Process connections lazily, so they can be streamed
+        flowchart_data["edges"] = (
+            self._connection_edge(connection)
+            for connection in data.get("connections", [])
+        )
 
         generator = FlowchartGenerator()
         return generator.generate(flowchart_data)
 
+    @staticmethod
+    def _connection_edge(connection: dict[str, Any]) -> dict[str, Any]:
+        """Convert a connection between named components into an edge."""
+        # Convert names to IDs (replace spaces with underscores)
+        return {
+            "from": connection["from"].replace(" ", "_"),
+            "to": connection["to"].replace(" ", "_"),
+            "label": connection.get("protocol", "") or "",
+            "arrow": "-->",
+        }
+
     def get_schema(self) -> dict[str, Any]:
         """Get data schema for architecture generation."""
         return {
@@ -692,6 +688,14 @@ class ProcessFlowGenerator(DiagramGenerator):
     parallel processes, and standard business symbols.
     """
 
+    # Node syntax by process type, formatted with the node id and label
+    PROCESS_FORMATS: dict[str, str] = {
+        "process": "{0}[{1}]",
+        "decision": "{0}{{{1}}}",
+        "subprocess": "{0}[[{1}]]",
+        "data": "{0}[/{1}/]",
+    }
+
     def generate(self, data: dict[str, Any], **options: Any) -> str:
         """Generate process flow diagram from structured data."""
         # Implementation similar to FlowchartGenerator but with
@@ -713,19 +717,12 @@ class ProcessFlowGenerator(DiagramGenerator):
         lines.append("")
 
         # Add process nodes
+        process_format = self.PROCESS_FORMATS["process"]
         for process in processes:
-            proc_id = process["id"]
-            label = process["label"]
-            proc_type = process.get("type", "process")
-
-            if proc_type == "decision":
-                lines.append(f"    {proc_id}{{{label}}}")
-            elif proc_type == "subprocess":
-                lines.append(f"    {proc_id}[[{label}]]")
-            elif proc_type == "data":
-                lines.append(f"    {proc_id}[/{label}/]")
-            else:
-                lines.append(f"    {proc_id}[{label}]")
+            node_format = self.PROCESS_FORMATS.get(
+                process.get("type", "process"), process_format
+            )
+            lines.append(f"    {node_format.format(process['id'], process['label'])}")
 
         lines.append("")
 
@@ -13,6 +13,8 @@ from typing import Any
 from urllib.error import URLError
 from urllib.request import Request, urlopen
 
+from .search_index import TemplateIndex
+
 logger = logging.getLogger(__name__)
 
 class BuiltInTemplates:
@@ -385,6 +387,7 @@ class CommunityTemplates:
         """
         self.enable_online = enable_online
         self._templates: dict[str, dict[str, Any]] = {}
+        self._index = TemplateIndex()
 
         if enable_online:
             self._load_online_templates()
@@ -415,10 +418,24 @@ class CommunityTemplates:
         # For now, just add to local collection
         template_name = template_data.get("name")
         if template_name:
-            self._templates[template_name] = template_data
+            self._add_template(template_data)
             return True
         return False
 
+    def _add_template(self, template: dict[str, Any]) -> None:
+        """Add a template to the collection and the search index."""
+        template_name = template["name"]
+        self._templates[template_name] = template
+        self._index.add(
+            template_name,
+            name=str(template_name),
+            description=str(template.get("description") or ""),
+            diagram_type=template.get("diagram_type"),
+            tags=template.get("tags") or [],
+            author=template.get("author"),
+            source=template.get("source"),
+        )
+
     def _load_online_templates(self) -> None:
         """
         Load templates from online community repository.
@@ -442,7 +459,7 @@ class CommunityTemplates:
                         # Add metadata
                         template["source"] = "community"
                         template["fetched_at"] = datetime.now().isoformat()
-                        self._templates[template_name] = template
+                        self._add_template(template)
 
                 # Cache the templates for offline use
                 self._cache_templates(templates, cache_file)
@@ -593,7 +610,7 @@ class CommunityTemplates:
                 template_name = template.get("name")
                 if template_name:
                     template["source"] = "cache"
-                    self._templates[template_name] = template
+                    self._add_template(template)
 
             logger.info(f"Loaded {len(templates)} templates from cache")
 
@@ -608,6 +625,7 @@ class CommunityTemplates:
             Number of templates loaded
         """
         self._templates.clear()
+        self._index.clear()
         self._load_online_templates()
         return len(self._templates)
 
@@ -616,39 +634,29 @@ class CommunityTemplates:
         query: str | None = None,
         diagram_type: str | None = None,
         tags: list[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         Search community templates.
 
         Args:
-            query: Search query string
+            query: Words to look for in names and descriptions; all must
+                occur, the last one may be a prefix
             diagram_type: Filter by diagram type
             tags: Filter by tags
+            offset: Number of results to skip
+            limit: Maximum number of results (all if None)
 
         Returns:
-            List of matching templates
+            List of matching templates, most relevant first
         """
-        results = []
-
-        for template in self._templates.values():
-            # Filter by diagram type
-            if diagram_type and template.get("diagram_type") != diagram_type:
-                continue
-
-            # Filter by tags
-            if tags:
-                template_tags = template.get("tags", [])
-                if not any(tag in template_tags for tag in tags):
-                    continue
-
-            # Filter by query
-            if query:
-                query_lower = query.lower()
-                name = template.get("name", "").lower()
-                description = template.get("description", "").lower()
-                if query_lower not in name and query_lower not in description:
-                    continue
-
-            results.append(template)
-
-        return results
+        page = self._index.search(
+            query,
+            fields=["name", "description"],
+            diagram_type=diagram_type,
+            tags=tags or None,
+            offset=offset,
+            limit=limit,
+        )
+        return [self._templates[name] for name in page.items]
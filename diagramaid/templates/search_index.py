@@ -0,0 +1,346 @@
+"""
+Search index for diagram templates.
+
+This module provides an in-memory inverted index over template metadata.
+It is updated as templates are added and removed, so filtered listing and
+ranked full-text search only touch the templates that match instead of
+scanning the whole catalogue.
+"""
+
+import bisect
+import heapq
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Score of a query token matching a word in each text field; tokens that
+# only match a word prefix score half
+FIELD_WEIGHTS: dict[str, float] = {"name": 3.0, "tags": 2.0, "description": 1.0}
+
+FACETS = ("diagram_type", "tags", "author", "source")
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lower-case search tokens.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Alphanumeric words of the text
+    """
+    return _WORD.findall(text.lower())
+
+
+@dataclass
+class SearchPage:
+    """One page of search results, best matches first."""
+
+    items: list[Any]
+    total: int
+    offset: int = 0
+    limit: int | None = None
+    scores: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class _Entry:
+    """What the index holds for one template, for removing it again."""
+
+    sort_key: tuple[str, str]
+    facets: dict[str, set[str]]
+    words: dict[str, set[str]]
+
+
+class TemplateIndex:
+    """
+    Inverted index of templates by metadata.
+
+    Templates are indexed under a key (an ID or name) by their diagram type,
+    tags, author and source, and by the words of their name, tags and
+    description. Listing without a query returns templates ordered by name;
+    a query ranks templates containing all of its words by where they occur.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entries: dict[str, _Entry] = {}
+        # Facet -> value -> keys
+        self._facets: dict[str, dict[str, set[str]]] = {f: {} for f in FACETS}
+        # Text field -> word -> keys
+        self._postings: dict[str, dict[str, set[str]]] = {
+            f: {} for f in FIELD_WEIGHTS
+        }
+        # All indexed words, sorted for prefix lookups
+        self._vocabulary: list[str] = []
+        # (name, key) of every entry, sorted
+        self._order: list[tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def add(
+        self,
+        key: str,
+        name: str,
+        description: str = "",
+        diagram_type: str | None = None,
+        tags: Iterable[str] | None = None,
+        author: str | None = None,
+        source: str | None = None,
+    ) -> None:
+        """
+        Add a template to the index, replacing an entry with the same key.
+
+        Args:
+            key: Key the template is returned under
+            name: Template name
+            description: Template description
+            diagram_type: Diagram type
+            tags: Template tags
+            author: Template author
+            source: Where the template comes from (builtin, custom, ...)
+        """
+        if key in self._entries:
+            self.remove(key)
+
+        tags = [str(tag) for tag in tags or ()]
+        facet_values = {
+            "diagram_type": {diagram_type} if diagram_type else set(),
+            "tags": set(tags),
+            "author": {author} if author else set(),
+            "source": {source} if source else set(),
+        }
+        words = {
+            "name": set(tokenize(name)),
+            "tags": {word for tag in tags for word in tokenize(tag)},
+            "description": set(tokenize(description or "")),
+        }
+        entry = _Entry((name, key), facet_values, words)
+        self._entries[key] = entry
+
+        for facet, values in facet_values.items():
+            for value in values:
+                self._facets[facet].setdefault(value, set()).add(key)
+        for field_name, field_words in words.items():
+            postings = self._postings[field_name]
+            for word in field_words:
+                if word not in postings:
+                    postings[word] = set()
+                    if not self._in_vocabulary(word):
+                        bisect.insort(self._vocabulary, word)
+                postings[word].add(key)
+        bisect.insort(self._order, entry.sort_key)
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove a template from the index.
+
+        Args:
+            key: Key the template was added under
+
+        Returns:
+            True if the template was indexed
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+
+        for facet, values in entry.facets.items():
+            for value in values:
+                _discard(self._facets[facet], value, key)
+        for field_name, field_words in entry.words.items():
+            for word in field_words:
+                _discard(self._postings[field_name], word, key)
+                if not any(word in postings for postings in self._postings.values()):
+                    del self._vocabulary[bisect.bisect_left(self._vocabulary, word)]
+        del self._order[bisect.bisect_left(self._order, entry.sort_key)]
+        return True
+
+    def clear(self) -> None:
+        """Remove all templates from the index."""
+        self._entries.clear()
+        for index in (*self._facets.values(), *self._postings.values()):
+            index.clear()
+        self._vocabulary.clear()
+        self._order.clear()
+
+    def count(self, facet: str, value: str) -> int:
+        """
+        Count templates with a facet value.
+
+        Args:
+            facet: One of diagram_type, tags, author, source
+            value: Facet value
+
+        Returns:
+            Number of indexed templates with the value
+        """
+        return len(self._facets[facet].get(value, ()))
+
+    def values(self, facet: str) -> list[str]:
+        """
+        Get the values of a facet present in the index.
+
+        Args:
+            facet: One of diagram_type, tags, author, source
+
+        Returns:
+            Sorted facet values
+        """
+        return sorted(self._facets[facet])
+
+    def search(
+        self,
+        query: str | None = None,
+        fields: Iterable[str] | None = None,
+        diagram_type: str | None = None,
+        tags: Iterable[str] | None = None,
+        author: str | None = None,
+        source: str | Iterable[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> SearchPage:
+        """
+        Find templates matching a query and filters.
+
+        Args:
+            query: Words that must all occur in a searched field (the last
+                word may be a prefix)
+            fields: Text fields to search (name, tags, description; all if
+                None)
+            diagram_type: Only templates of this diagram type
+            tags: Only templates with any of these tags
+            author: Only templates by this author
+            source: Only templates from this source or any of these sources
+            offset: Number of results to skip
+            limit: Maximum number of results (all if None)
+
+        Returns:
+            Page of keys, ranked by score if there is a query and by name
+            otherwise
+        """
+        if isinstance(source, str):
+            source = [source]
+        candidates: set[str] | None = None
+        for facet, values in (
+            ("diagram_type", [diagram_type] if diagram_type else None),
+            ("tags", tags),
+            ("author", [author] if author else None),
+            ("source", source),
+        ):
+            if values is None:
+                continue
+            matches = self._union(self._facets[facet], values)
+            candidates = matches if candidates is None else candidates & matches
+
+        words = tokenize(query) if query else []
+        if not words:
+            return self._by_name(candidates, offset, limit)
+
+        scores = self._score(words, list(fields or FIELD_WEIGHTS), candidates)
+        ranked: Iterable[tuple[float, tuple[str, str]]] = (
+            (-score, self._entries[key].sort_key) for key, score in scores.items()
+        )
+        if limit is None:
+            ordered = sorted(ranked)[offset:]
+        else:
+            ordered = heapq.nsmallest(offset + limit, ranked)[offset:]
+        keys = [sort_key[1] for _, sort_key in ordered]
+        return SearchPage(
+            items=keys,
+            total=len(scores),
+            offset=offset,
+            limit=limit,
+            scores={key: scores[key] for key in keys},
+        )
+
+    def _score(
+        self, words: list[str], fields: list[str], candidates: set[str] | None
+    ) -> dict[str, float]:
+        """Score the templates containing every query word."""
+        scores: dict[str, float] | None = None
+        for position, word in enumerate(words):
+            # Search-as-you-type: the last word may be incomplete
+            prefix = position == len(words) - 1
+            word_scores: dict[str, float] = {}
+            for expansion in self._expand(word) if prefix else [word]:
+                factor = 1.0 if expansion == word else 0.5
+                for field_name in fields:
+                    keys = self._postings[field_name].get(expansion, ())
+                    weight = FIELD_WEIGHTS[field_name] * factor
+                    for key in keys:
+                        if candidates is None or key in candidates:
+                            word_scores[key] = max(word_scores.get(key, 0.0), weight)
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {
+                    key: score + word_scores[key]
+                    for key, score in scores.items()
+                    if key in word_scores
+                }
+            if not scores:
+                break
+        return scores or {}
+
+    def _expand(self, prefix: str) -> list[str]:
+        """Get the indexed words starting with a prefix."""
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\U0010ffff")
+        return self._vocabulary[start:end]
+
+    def _by_name(
+        self, candidates: set[str] | None, offset: int, limit: int | None
+    ) -> SearchPage:
+        """Page through templates in name order."""
+        stop = None if limit is None else offset + limit
+        if candidates is None:
+            keys = [key for _, key in self._order[offset:stop]]
+            total = len(self._order)
+        elif len(candidates) * 8 < len(self._order):
+            ordered = sorted(self._entries[key].sort_key for key in candidates)
+            keys = [key for _, key in ordered[offset:stop]]
+            total = len(candidates)
+        else:
+            # Most templates match; walk the name order instead of sorting
+            keys = []
+            skipped = 0
+            for _, key in self._order:
+                if key not in candidates:
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                if stop is not None and len(keys) == stop - offset:
+                    break
+                keys.append(key)
+            total = len(candidates)
+        return SearchPage(items=keys, total=total, offset=offset, limit=limit)
+
+    def _in_vocabulary(self, word: str) -> bool:
+        position = bisect.bisect_left(self._vocabulary, word)
+        return position < len(self._vocabulary) and self._vocabulary[position] == word
+
+    @staticmethod
+    def _union(index: dict[str, set[str]], values: Iterable[str]) -> set[str]:
+        matches: set[str] = set()
+        for value in values:
+            matches |= index.get(value, set())
+        return matches
+
+
+def _discard(index: dict[str, set[str]], value: str, key: str) -> None:
+    keys = index.get(value)
+    if keys is None:
+        return
+    keys.discard(key)
+    if not keys:
+        del index[value]
@@ -5,10 +5,14 @@ This module provides the core template management functionality including
 template storage, validation, generation, and lifecycle management.
 """
 
+import hashlib
 import json
 import logging
+import os
+import threading
+import time
 import uuid
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -16,16 +20,27 @@ from typing import Any
 from jinja2 import (
     BaseLoader,
     Environment,
+    FileSystemBytecodeCache,
     TemplateError,
 )
+from jinja2 import Template as JinjaTemplate
 
 from ..exceptions import TemplateError as MermaidTemplateError
 from ..exceptions import ValidationError
 from .schema import validate_template
+from .search_index import SearchPage, TemplateIndex
 
 # Configure logger for template management
 logger = logging.getLogger(__name__)
 
+# Metadata of the custom templates directory, so templates are listed
+# without opening their files
+MANIFEST_FILE = ".manifest.json"
+MANIFEST_VERSION = 1
+
+# Template fields read from the template file on first use
+_BODY_FIELDS = ("template_content", "parameters")
+
 
 @dataclass
 class Template:
@@ -83,6 +98,47 @@ class Template:
             return False
 
 
+class _LazyTemplate(Template):
+    """
+    Template known from the manifest, with its body read on first use.
+
+    ``template_content`` and ``parameters`` are read from the template file
+    the first time either is accessed; all other fields come from the
+    manifest.
+    """
+
+    _path: str
+
+    @classmethod
+    def from_manifest(cls, path: str, data: dict[str, Any]) -> "_LazyTemplate":
+        """Create template from manifest metadata and its file path."""
+        template = cls.__new__(cls)
+        template.__dict__.update(
+            {key: value for key, value in data.items() if key not in _BODY_FIELDS}
+        )
+        template.created_at = datetime.fromisoformat(data["created_at"])
+        template.updated_at = datetime.fromisoformat(data["updated_at"])
+        template._path = path
+        template.__post_init__()
+        return template
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set yet
+        if name not in _BODY_FIELDS or "_path" not in self.__dict__:
+            raise AttributeError(name)
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+            body = {field_name: data[field_name] for field_name in _BODY_FIELDS}
+        except (OSError, json.JSONDecodeError, KeyError) as e:
+            raise MermaidTemplateError(
+                f"Failed to read template {self.__dict__.get('id')}: {e}"
+            ) from e
+        for field_name, value in body.items():
+            self.__dict__.setdefault(field_name, value)
+        return self.__dict__[name]
+
+
 class TemplateManager:
     """
     Manages Mermaid diagram templates including storage, validation, and generation.
@@ -93,6 +149,10 @@ class TemplateManager:
     - Generating diagrams from templates with parameters
     - Template validation and schema checking
     - Template sharing and export/import
+
+    Custom templates are loaded on first use from a manifest holding their
+    metadata; template files are only opened when a template's content is
+    needed or the file changed since the manifest was written.
     """
 
     def __init__(
@@ -100,6 +160,7 @@ class TemplateManager:
         templates_dir: Path | None = None,
         auto_load_builtin: bool = True,
         auto_load_community: bool = False,
+        bytecode_cache_dir: Path | None = None,
     ):
         """
         Initialize template manager.
@@ -108,16 +169,37 @@ class TemplateManager:
             templates_dir: Directory for storing custom templates
             auto_load_builtin: Whether to automatically load built-in templates
             auto_load_community: Whether to automatically load community templates
+            bytecode_cache_dir: Directory for caching compiled templates across
+                processes (no on-disk cache if None)
         """
         self.templates_dir = templates_dir or Path.home() / ".diagramaid_templates"
         self.templates_dir.mkdir(parents=True, exist_ok=True)
 
         self._templates: dict[str, Template] = {}
+        # Template name -> ID of the first template registered with that name
+        self._names: dict[str, str] = {}
+        # Template ID -> (content hash, compiled template)
+        self._compiled: dict[str, tuple[str, JinjaTemplate]] = {}
+        # Template ID -> "builtin", "community" or "custom"
+        self._sources: dict[str, str] = {}
+        self._index = TemplateIndex()
+        # Custom template file name -> (mtime_ns, size, template ID or None
+        # for unreadable files)
+        self._files: dict[str, tuple[int, int, str | None]] = {}
+        self._loaded = False
+        self._manifest_dirty = False
+        self._last_scan = 0.0
+
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
         self._jinja_env = Environment(
             loader=BaseLoader(),
             autoescape=False,
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=bytecode_cache,
         )
 
         if auto_load_builtin:
@@ -126,8 +208,7 @@ class TemplateManager:
         if auto_load_community:
             self._load_community_templates()
 
-        # Load custom templates from directory
-        self._load_custom_templates()
+        # Custom templates are loaded from the directory on first use
 
     def create_template(
         self,
@@ -159,6 +240,7 @@ class TemplateManager:
         Raises:
             MermaidTemplateError: If template creation fails
         """
+        self._ensure_loaded()
         template_id = str(uuid.uuid4())
         now = datetime.now()
 
@@ -180,21 +262,61 @@ class TemplateManager:
         if not template.validate():
             raise MermaidTemplateError(f"Invalid template: {name}")
 
-        self._templates[template_id] = template
+        self._register(template)
         self._save_template(template)
 
         return template
 
+    def update_template(self, template_id: str, **changes: Any) -> Template:
+        """
+        Update fields of a template.
+
+        Args:
+            template_id: Template ID
+            **changes: Template fields to change (name, template_content,
+                parameters, description, ...)
+
+        Returns:
+            Updated template
+
+        Raises:
+            MermaidTemplateError: If the template does not exist or the
+                changes make it invalid
+        """
+        template = self.get_template(template_id)
+        if not template:
+            raise MermaidTemplateError(f"Template not found: {template_id}")
+
+        invalid = (set(changes) - set(Template.__dataclass_fields__)) | (
+            {"id", "created_at"} & set(changes)
+        )
+        if invalid:
+            raise MermaidTemplateError(
+                f"Cannot update template fields: {', '.join(sorted(invalid))}"
+            )
+
+        current = {f.name: getattr(template, f.name) for f in fields(Template)}
+        updated = Template(**{**current, **changes})
+        updated.updated_at = datetime.now()
+        if not updated.validate():
+            raise MermaidTemplateError(f"Invalid template: {updated.name}")
+
+        source = self._sources[template_id]
+        self._unregister(template_id)
+        self._register(updated, source)
+        self._save_template(updated)
+        return updated
+
     def get_template(self, template_id: str) -> Template | None:
         """Get template by ID."""
+        self._ensure_loaded()
         return self._templates.get(template_id)
 
     def get_template_by_name(self, name: str) -> Template | None:
         """Get template by name."""
-        for template in self._templates.values():
-            if template.name == name:
-                return template
-        return None
+        self._ensure_loaded()
+        template_id = self._names.get(name)
+        return self._templates.get(template_id) if template_id else None
 
     def list_templates(
         self,
@@ -211,22 +333,87 @@ class TemplateManager:
             author: Filter by author
 
         Returns:
-            List of matching templates
+            List of matching templates sorted by name
         """
-        templates = list(self._templates.values())
+        return self.search_templates(
+            diagram_type=diagram_type, tags=tags or None, author=author
+        ).items
 
-        if diagram_type:
-            templates = [t for t in templates if t.diagram_type == diagram_type]
+    def search_templates(
+        self,
+        query: str | None = None,
+        fields: list[str] | None = None,
+        diagram_type: str | None = None,
+        tags: list[str] | None = None,
+        author: str | None = None,
+        source: str | list[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> SearchPage:
+        """
+        Search templates through the template index.
 
-        if tags:
-            templates = [
-                t for t in templates if t.tags and any(tag in t.tags for tag in tags)
-            ]
+        Args:
+            query: Words to look for; all must occur, the last one may be
+                a prefix
+            fields: Fields to search (name, tags, description; all if None)
+            diagram_type: Filter by diagram type
+            tags: Filter by tags (any match)
+            author: Filter by author
+            source: Filter by source ("builtin", "community", "custom")
+            offset: Number of results to skip
+            limit: Maximum number of results (all if None)
 
-        if author:
-            templates = [t for t in templates if t.author == author]
+        Returns:
+            Page of matching templates, ranked by relevance if there is a
+            query and sorted by name otherwise
+        """
+        self._ensure_loaded()
+        page = self._index.search(
+            query,
+            fields=fields,
+            diagram_type=diagram_type,
+            tags=tags,
+            author=author,
+            source=source,
+            offset=offset,
+            limit=limit,
+        )
+        page.items = [self._templates[template_id] for template_id in page.items]
+        return page
 
-        return sorted(templates, key=lambda t: t.name)
+    def get_template_source(self, template_id: str) -> str | None:
+        """
+        Get where a template comes from.
+
+        Args:
+            template_id: Template ID
+
+        Returns:
+            "builtin", "community", "custom", or None if not found
+        """
+        self._ensure_loaded()
+        return self._sources.get(template_id)
+
+    def count_templates(self, source: str | None = None) -> int:
+        """
+        Count templates without listing them.
+
+        Args:
+            source: Only count templates from this source
+
+        Returns:
+            Number of templates
+        """
+        self._ensure_loaded()
+        if source is None:
+            return len(self._templates)
+        return self._index.count("source", source)
+
+    def get_diagram_types(self) -> list[str]:
+        """Get the diagram types of all templates, sorted."""
+        self._ensure_loaded()
+        return self._index.values("diagram_type")
 
     def generate(
         self,
@@ -262,7 +449,7 @@ class TemplateManager:
 
         try:
             # Render template with parameters
-            jinja_template = self._jinja_env.from_string(template.template_content)
+            jinja_template = self._compile(template)
             diagram_code = jinja_template.render(**parameters)
 
             return str(diagram_code).strip()
@@ -283,12 +470,14 @@ class TemplateManager:
         Raises:
             MermaidTemplateError: If template deletion fails
         """
+        self._ensure_loaded()
         if template_id not in self._templates:
             logger.warning(f"Attempted to delete non-existent template: {template_id}")
             return False
 
         # Get template for logging and validation
         template = self._templates[template_id]
+        source = self._sources[template_id]
 
         # Log deletion attempt
         logger.info(
@@ -307,20 +496,22 @@ class TemplateManager:
 
         try:
             # Remove from memory
-            del self._templates[template_id]
+            self._unregister(template_id)
 
             # Remove file if it exists
             template_file = self.templates_dir / f"{template_id}.json"
             if template_file.exists():
                 template_file.unlink()
                 logger.debug(f"Deleted template file: {template_file}")
+            if self._files.pop(template_file.name, None) is not None:
+                self._manifest_dirty = True
 
             logger.info(f"Successfully deleted template: {template_id}")
             return True
 
         except Exception as e:
             # Restore template if deletion failed
-            self._templates[template_id] = template
+            self._register(template, source)
             error_msg = f"Failed to delete template {template_id}: {str(e)}"
             logger.error(error_msg)
             raise MermaidTemplateError(error_msg) from e
@@ -371,16 +562,78 @@ class TemplateManager:
             template_data = json.load(f)
 
         template = Template.from_dict(template_data)
+        self._ensure_loaded()
 
         # Generate new ID to avoid conflicts
         template.id = str(uuid.uuid4())
         template.updated_at = datetime.now()
 
-        self._templates[template.id] = template
+        self._register(template)
         self._save_template(template)
 
         return template
 
+    def _register(self, template: Template, source: str = "custom") -> None:
+        """Add a template to the manager, its name index and search index."""
+        if template.id in self._templates:
+            self._unregister(template.id)
+        self._templates[template.id] = template
+        self._sources[template.id] = source
+        self._names.setdefault(template.name, template.id)
+        self._index.add(
+            template.id,
+            name=template.name,
+            description=template.description,
+            diagram_type=template.diagram_type,
+            tags=template.tags,
+            author=template.author,
+            source=source,
+        )
+
+    def _unregister(self, template_id: str) -> None:
+        """Remove a template, its index entries and compiled form."""
+        template = self._templates.pop(template_id)
+        del self._sources[template_id]
+        self._index.remove(template_id)
+        self._compiled.pop(template_id, None)
+        if self._names.get(template.name) == template_id:
+            del self._names[template.name]
+            # Fall back to the next template registered with the same name
+            for other in self._templates.values():
+                if other.name == template.name:
+                    self._names[template.name] = other.id
+                    break
+
+    def _compile(self, template: Template) -> JinjaTemplate:
+        """
+        Get the compiled Jinja template, compiling it on first use.
+
+        Compiled templates are cached by template ID and content hash, so
+        edits to ``template_content`` are picked up. With a bytecode cache
+        configured, compiled code is also shared across processes.
+        """
+        source = template.template_content
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        cached = self._compiled.get(template.id)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+
+        env = self._jinja_env
+        bytecode_cache = env.bytecode_cache
+        code = None
+        if bytecode_cache is not None:
+            bucket = bytecode_cache.get_bucket(env, template.id, None, source)
+            code = bucket.code
+        if code is None:
+            code = env.compile(source, template.name)
+            if bytecode_cache is not None:
+                bucket.code = code
+                bytecode_cache.set_bucket(bucket)
+
+        compiled = env.template_class.from_code(env, code, env.globals, None)
+        self._compiled[template.id] = (digest, compiled)
+        return compiled
+
     def _validate_parameters(
         self, template: Template, parameters: dict[str, Any]
     ) -> None:
@@ -398,20 +651,130 @@ class TemplateManager:
         template_file = self.templates_dir / f"{template.id}.json"
         with open(template_file, "w", encoding="utf-8") as f:
             json.dump(template.to_dict(), f, indent=2)
+        # Our own write needs no re-read; the manifest catches up on reload
+        stat = template_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        self._files[template_file.name] = (*stamp, template.id)
+        self._manifest_dirty = True
 
-    def _load_custom_templates(self) -> None:
-        """Load custom templates from templates directory."""
-        for template_file in self.templates_dir.glob("*.json"):
-            try:
-                with open(template_file, encoding="utf-8") as f:
-                    template_data = json.load(f)
+    def reload(self) -> int:
+        """
+        Pick up changes to the custom templates directory.
 
-                template = Template.from_dict(template_data)
-                self._templates[template.id] = template
+        Files are only opened if they are new or their modification time or
+        size changed since they were last read; templates whose file was
+        removed are dropped. The manifest is rewritten if anything changed.
 
-            except (json.JSONDecodeError, KeyError, ValueError):
-                # Skip invalid template files
-                continue
+        Returns:
+            Number of template files read
+        """
+        first_load = not self._loaded
+        manifest = self._read_manifest() if first_load else {}
+        self._loaded = True
+        self._last_scan = time.monotonic()
+        seen: set[str] = set()
+        files_read = 0
+
+        with os.scandir(self.templates_dir) as entries:
+            for entry in entries:
+                if (
+                    not entry.name.endswith(".json")
+                    or entry.name == MANIFEST_FILE
+                    or not entry.is_file()
+                ):
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                known = self._files.get(entry.name)
+                if known is not None and known[:2] == stamp:
+                    continue
+
+                cached = manifest.get(entry.name)
+                template: Template | None = None
+                if cached is not None and (cached["mtime_ns"], cached["size"]) == stamp:
+                    if cached["template"] is not None:
+                        template = _LazyTemplate.from_manifest(
+                            entry.path, cached["template"]
+                        )
+                else:
+                    template = self._read_template_file(Path(entry.path))
+                    files_read += 1
+                    self._manifest_dirty = True
+
+                if known is not None and known[2] in self._templates:
+                    self._unregister(known[2])
+                if template is not None:
+                    self._register(template)
+                template_id = template.id if template is not None else None
+                self._files[entry.name] = (*stamp, template_id)
+
+        for name in set(self._files) - seen:
+            template_id = self._files.pop(name)[2]
+            if template_id in self._templates:
+                self._unregister(template_id)
+            self._manifest_dirty = True
+
+        if self._manifest_dirty or (first_load and set(manifest) != set(self._files)):
+            self._write_manifest()
+        return files_read
+
+    def reload_if_stale(self, max_age: float) -> None:
+        """
+        Reload if the directory was last scanned more than max_age ago.
+
+        Args:
+            max_age: Maximum age of the last scan in seconds
+        """
+        if self._loaded and time.monotonic() - self._last_scan > max_age:
+            self.reload()
+
+    def _ensure_loaded(self) -> None:
+        """Load custom templates on first use."""
+        if not self._loaded:
+            self.reload()
+
+    def _read_template_file(self, template_file: Path) -> Template | None:
+        """Read a custom template file, or None if it is not valid."""
+        try:
+            with open(template_file, encoding="utf-8") as f:
+                template_data = json.load(f)
+            return Template.from_dict(template_data)
+        except (OSError, json.JSONDecodeError, KeyError, ValueError):
+            # Skip invalid template files
+            return None
+
+    def _read_manifest(self) -> dict[str, dict[str, Any]]:
+        """Read the manifest, or an empty one if missing or outdated."""
+        try:
+            with open(self.templates_dir / MANIFEST_FILE, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        files: dict[str, dict[str, Any]] = data.get("files", {})
+        return files
+
+    def _write_manifest(self) -> None:
+        """Write the manifest atomically."""
+        files: dict[str, dict[str, Any]] = {}
+        for name, (mtime_ns, size, template_id) in self._files.items():
+            template = self._templates.get(template_id) if template_id else None
+            files[name] = {
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "template": _manifest_entry(template) if template else None,
+            }
+        manifest_file = self.templates_dir / MANIFEST_FILE
+        temporary = manifest_file.with_name(f"{MANIFEST_FILE}.{os.getpid()}.tmp")
+        try:
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "files": files}, f)
+            os.replace(temporary, manifest_file)
+            self._manifest_dirty = False
+        except OSError as e:
+            logger.debug(f"Could not write template manifest: {e}")
 
     def _load_builtin_templates(self) -> None:
         """Load built-in templates."""
@@ -420,7 +783,7 @@ class TemplateManager:
         builtin = BuiltInTemplates()
         for template_data in builtin.get_all_templates():
             template = Template.from_dict(template_data)
-            self._templates[template.id] = template
+            self._register(template, "builtin")
 
     def _load_community_templates(self) -> None:
         """Load community templates."""
@@ -430,7 +793,47 @@ class TemplateManager:
             community = CommunityTemplates()
             for template_data in community.get_all_templates():
                 template = Template.from_dict(template_data)
-                self._templates[template.id] = template
+                self._register(template, "community")
         except Exception:
             # Community templates are optional - don't fail if unavailable
             pass
+
+
+def _manifest_entry(template: Template) -> dict[str, Any]:
+    """Get the manifest metadata of a template, without its body."""
+    entry = {
+        f.name: getattr(template, f.name)
+        for f in fields(Template)
+        if f.name not in _BODY_FIELDS
+    }
+    entry["created_at"] = template.created_at.isoformat()
+    entry["updated_at"] = template.updated_at.isoformat()
+    return entry
+
+
+# Seconds between directory scans of the shared manager
+SHARED_RELOAD_INTERVAL = 2.0
+
+_shared_manager: TemplateManager | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_manager() -> TemplateManager:
+    """
+    Get the process-wide template manager.
+
+    The manager is created on first use with the default templates
+    directory. Each call rescans the directory for changes made by other
+    processes if the last scan is older than ``SHARED_RELOAD_INTERVAL``
+    seconds; the scan only re-reads changed files.
+
+    Returns:
+        Shared TemplateManager
+    """
+    global _shared_manager
+    with _shared_lock:
+        if _shared_manager is None:
+            _shared_manager = TemplateManager()
+        else:
+            _shared_manager.reload_if_stale(SHARED_RELOAD_INTERVAL)
+        return _shared_manager
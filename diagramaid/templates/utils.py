@@ -7,10 +7,10 @@ including generation, validation, and management utilities.
 
 import json
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 from ..exceptions import TemplateError as MermaidTemplateError
-from .template_manager import Template, TemplateManager
+from .template_manager import TemplateManager, get_shared_manager
 
 
 def generate_from_template(
@@ -25,7 +25,8 @@ def generate_from_template(
     Args:
         template_name: Name or ID of template to use
         parameters: Template parameters
-        template_manager: Optional template manager instance
+        template_manager: Optional template manager instance (the shared
+            manager if None)
         validate_params: Whether to validate parameters
 
     Returns:
@@ -43,7 +44,7 @@ def generate_from_template(
         ... })
     """
     if template_manager is None:
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
 
     return template_manager.generate(template_name, parameters, validate_params)
 
@@ -57,7 +58,8 @@ def list_available_templates(
     List available templates with metadata.
 
     Args:
-        template_manager: Optional template manager instance
+        template_manager: Optional template manager instance (the shared
+            manager if None)
         diagram_type: Filter by diagram type
         tags: Filter by tags
 
@@ -70,7 +72,7 @@ def list_available_templates(
         ...     print(f"{template['name']}: {template['description']}")
     """
     if template_manager is None:
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
 
     templates = template_manager.list_templates(diagram_type=diagram_type, tags=tags)
 
@@ -99,7 +101,8 @@ def get_template_info(
 
     Args:
         template_name: Name or ID of template
-        template_manager: Optional template manager instance
+        template_manager: Optional template manager instance (the shared
+            manager if None)
 
     Returns:
         Template information dictionary or None if not found
@@ -109,7 +112,7 @@ def get_template_info(
         >>> print(f"Parameters: {info['parameters']}")
     """
     if template_manager is None:
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
 
     template = template_manager.get_template(template_name)
     if not template:
@@ -145,7 +148,8 @@ def validate_template_params_by_name(
     Args:
         template_name: Name or ID of template
         parameters: Parameters to validate
-        template_manager: Optional template manager instance
+        template_manager: Optional template manager instance (the shared
+            manager if None)
 
     Returns:
         List of validation errors (empty if valid)
@@ -159,7 +163,7 @@ def validate_template_params_by_name(
         ...     print("Validation errors:", errors)
     """
     if template_manager is None:
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
 
     template = template_manager.get_template(template_name)
     if not template:
@@ -184,7 +188,8 @@ def export_template(
     Args:
         template_name: Name or ID of template to export
         output_path: Output file path
-        template_manager: Optional template manager instance
+        template_manager: Optional template manager instance (the shared
+            manager if None)
 
     Returns:
         True if export successful
@@ -193,7 +198,7 @@ def export_template(
         >>> success = export_template("my_template", "exported_template.json")
     """
     if template_manager is None:
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
 
     try:
         template_manager.export_template(template_name, Path(output_path))
@@ -211,7 +216,8 @@ def import_template(
 
     Args:
         template_file: Path to template file
-        template_manager: Optional template manager instance
+        template_manager: Optional template manager instance (the shared
+            manager if None)
 
     Returns:
         Template ID if import successful, None otherwise
@@ -222,7 +228,7 @@ def import_template(
         ...     print(f"Imported template: {template_id}")
     """
     if template_manager is None:
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
 
     try:
         template = template_manager.import_template(Path(template_file))
@@ -248,7 +254,8 @@ def create_template_from_diagram(
         parameters: Parameter definitions
         description: Template description
         diagram_type: Diagram type (auto-detected if not provided)
-        template_manager: Optional template manager instance
+        template_manager: Optional template manager instance (the shared
+            manager if None)
 
     Returns:
         Template ID if creation successful, None otherwise
@@ -262,7 +269,7 @@ def create_template_from_diagram(
         ... )
     """
     if template_manager is None:
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
 
     # Auto-detect diagram type if not provided
     if diagram_type is None:
@@ -294,7 +301,8 @@ def get_template_examples(
 
     Args:
         template_name: Name or ID of template
-        template_manager: Optional template manager instance
+        template_manager: Optional template manager instance (the shared
+            manager if None)
 
     Returns:
         List of example parameter dictionaries
@@ -306,7 +314,7 @@ def get_template_examples(
         ...     diagram = generate_from_template("software_architecture", example['parameters'])
     """
     if template_manager is None:
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
 
     template = template_manager.get_template(template_name)
     if not template:
@@ -376,7 +384,8 @@ def search_templates(
 
     Args:
         query: Search query
-        template_manager: Optional template manager instance
+        template_manager: Optional template manager instance (the shared
+            manager if None)
         search_fields: Fields to search in (name, description, tags)
 
     Returns:
@@ -388,78 +397,20 @@ def search_templates(
         ...     print(f"Found: {result['name']}")
     """
     if template_manager is None:
-        template_manager = TemplateManager()
+        template_manager = get_shared_manager()
 
     if search_fields is None:
         search_fields = ["name", "description", "tags"]
 
-    query_lower = query.lower()
-    all_templates = template_manager.list_templates()
-    matching_templates = []
-
-    for template in all_templates:
-        match = False
-
-        if "name" in search_fields and query_lower in template.name.lower():
-            match = True
-
-        if (
-            "description" in search_fields
-            and query_lower in template.description.lower()
-        ):
-            match = True
-
-        if "tags" in search_fields and template.tags:
-            for tag in template.tags:
-                if query_lower in tag.lower():
-                    match = True
-                    break
-
-        if match:
-            matching_templates.append(
-                {
-                    "id": template.id,
-                    "name": template.name,
-                    "description": template.description,
-                    "diagram_type": template.diagram_type,
-                    "tags": template.tags,
-                    "relevance_score": _calculate_relevance(
-                        template, query_lower, search_fields
-                    ),
-                }
-            )
-
-    # Sort by relevance score
-    matching_templates.sort(
-        key=lambda x: cast(float, x["relevance_score"]), reverse=True
-    )
-
-    return matching_templates
-
-
-def _calculate_relevance(
-    template: Template, query: str, search_fields: list[str]
-) -> float:
-    """Calculate relevance score for search results."""
-    score = 0.0
-
-    if "name" in search_fields:
-        if query in template.name.lower():
-            score += 3.0  # Name matches are most important
-        elif any(word in template.name.lower() for word in query.split()):
-            score += 1.5
-
-    if "description" in search_fields:
-        if query in template.description.lower():
-            score += 2.0
-        elif any(word in template.description.lower() for word in query.split()):
-            score += 1.0
-
-    if "tags" in search_fields and template.tags:
-        for tag in template.tags:
-            if query in tag.lower():
-                score += 2.5
-            elif any(word in tag.lower() for word in query.split()):
-                score += 1.2
-
-    return score
+    page = template_manager.search_templates(query, fields=search_fields)
+    return [
+        {
+            "id": template.id,
+            "name": template.name,
+            "description": template.description,
+            "diagram_type": template.diagram_type,
+            "tags": template.tags,
+            "relevance_score": page.scores[template.id],
+        }
+        for template in page.items
+    ]
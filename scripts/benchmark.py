@@ -260,6 +260,46 @@ class BenchmarkRunner:
                 "test_name": "caching_performance"
             }
     
+    def benchmark_model_memory(self, node_count: int = 100000) -> dict[str, Any]:
+        """Benchmark memory of large flowchart models per storage mode."""
+        self.log("Benchmarking model memory...")
+
+        try:
+            from diagramaid.models.flowchart import FlowchartDiagram
+
+            def build_diagram(storage: str):
+                diagram = FlowchartDiagram(storage=storage)
+                for i in range(node_count):
+                    diagram.add_node(f"n{i}", f"Service {i % 100}")
+                for i in range(1, node_count):
+                    diagram.add_edge(f"n{i - 1}", f"n{i}")
+                return diagram
+
+            results = {}
+            for storage in ("object", "columnar"):
+                results[storage] = self.memory_profile(build_diagram, storage)
+
+            if results["object"].get("success") and results["columnar"].get("success"):
+                reduction = 1 - (
+                    results["columnar"]["current_memory"]
+                    / results["object"]["current_memory"]
+                )
+            else:
+                reduction = 0.0
+
+            return {
+                "node_count": node_count,
+                "results": results,
+                "memory_reduction": reduction,
+                "test_name": "model_memory"
+            }
+
+        except ImportError as e:
+            return {
+                "error": f"Failed to import diagramaid: {e}",
+                "test_name": "model_memory"
+            }
+
     def run_cpu_profiling(self, func, *args, **kwargs) -> str:
         """Run CPU profiling on a function."""
         profile_file = self.project_root / "profile_results.prof"
@@ -298,11 +338,13 @@ class BenchmarkRunner:
             "basic": [self.benchmark_basic_operations],
             "rendering": [self.benchmark_diagram_rendering],
             "caching": [self.benchmark_caching_performance],
+            "memory": [self.benchmark_model_memory],
             "all": [
                 self.benchmark_import_time,
                 self.benchmark_basic_operations,
                 self.benchmark_diagram_rendering,
-                self.benchmark_caching_performance
+                self.benchmark_caching_performance,
+                self.benchmark_model_memory
             ]
         }
         
@@ -419,7 +461,7 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Performance benchmarking for Mermaid Render")
     
     parser.add_argument("--suite", "-s", default="all",
-                       choices=["import", "basic", "rendering", "caching", "all"],
+                       choices=["import", "basic", "rendering", "caching", "memory", "all"],
                        help="Benchmark suite to run")
     
     parser.add_argument("--output", "-o", default="json",
@@ -252,3 +252,32 @@ if __name__ == "__main__":
     test_session_warmup()
 
     print("\n🎉 All performance optimization tests passed!")
+
+
+def test_columnar_storage_memory() -> None:
+    """Test that columnar flowchart storage uses less memory than objects."""
+    import tracemalloc
+
+    from diagramaid.models.flowchart import FlowchartDiagram
+
+    print("\nTesting columnar storage memory...")
+
+    def build(storage: str) -> FlowchartDiagram:
+        diagram = FlowchartDiagram(storage=storage)
+        for i in range(5000):
+            diagram.add_node(f"n{i}", f"Service {i % 50}")
+        for i in range(1, 5000):
+            diagram.add_edge(f"n{i - 1}", f"n{i}")
+        return diagram
+
+    usage = {}
+    for storage in ("object", "columnar"):
+        tracemalloc.start()
+        diagram = build(storage)
+        usage[storage], _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del diagram
+
+    print(f"Memory usage: {usage}")
+    assert usage["columnar"] < usage["object"] * 0.6
+    print("✓ Columnar storage memory passed")
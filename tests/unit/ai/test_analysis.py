@@ -14,3 +14,35 @@ class TestAIAnalysis:
         assert True
         
     # TODO: Add comprehensive unit tests for ai/analysis.py
+
+
+@pytest.mark.unit
+class TestGraphAnalysis:
+    """Unit tests for DiagramAnalyzer.analyze_graph."""
+
+    def test_analyze_flowchart_graph(self):
+        """Test degree, reachability and cycle results for a flowchart."""
+        from diagramaid.ai.analysis import DiagramAnalyzer
+        from diagramaid.models import FlowchartDiagram
+
+        diagram = FlowchartDiagram()
+        for node_id in ["start", "a", "b", "loop", "orphan", "island"]:
+            diagram.add_node(node_id, node_id)
+        diagram.add_edge("start", "a")
+        diagram.add_edge("start", "b")
+        diagram.add_edge("loop", "island")
+        diagram.add_edge("island", "loop")
+
+        analysis = DiagramAnalyzer().analyze_graph(
+            diagram.adjacency, node_ids=diagram.nodes
+        )
+
+        assert analysis.node_count == 6
+        assert analysis.connection_count == 4
+        assert analysis.max_out_degree == 2
+        assert analysis.entry_nodes == ["start"]
+        assert analysis.exit_nodes == ["a", "b"]
+        assert analysis.isolated_nodes == ["orphan"]
+        assert analysis.unreachable_nodes == ["loop", "island"]
+        assert analysis.has_cycle
+        assert analysis.to_dict()["cycle"] == ["loop", "island"]
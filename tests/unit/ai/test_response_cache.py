@@ -0,0 +1,164 @@
+"""
+Unit tests for ai.response_cache module and cached provider generation.
+"""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from diagramaid.ai import (
+    AIResponseCache,
+    LocalModelProvider,
+    OpenRouterProvider,
+    ProviderConfig,
+    ProviderManager,
+    response_cache,
+)
+
+PROMPT = "Create a flowchart of a login process"
+
+
+def _completion(content: str) -> Mock:
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {
+        "choices": [{"message": {"content": content}, "finish_reason": "stop"}],
+        "model": "openai/gpt-4o",
+        "usage": {"prompt_tokens": 12, "completion_tokens": 30, "total_tokens": 42},
+    }
+    return response
+
+
+def _provider() -> OpenRouterProvider:
+    return OpenRouterProvider(ProviderConfig(api_key="key", model="openai/gpt-4o"))
+
+
+@pytest.mark.unit
+class TestAIResponseCache:
+    """Unit tests for AIResponseCache class."""
+
+    def test_keys(self) -> None:
+        """Test that keys normalize parameters and tell requests apart."""
+        messages = [{"role": "user", "content": PROMPT}]
+        key = AIResponseCache.make_key(
+            "openai", "gpt-4o", messages, {"temperature": 0.0, "max_tokens": 500}
+        )
+        assert key == AIResponseCache.make_key(
+            "openai",
+            "gpt-4o",
+            messages,
+            {"max_tokens": 500, "temperature": 0.0, "stop": None},
+        )
+        assert key != AIResponseCache.make_key(
+            "openai", "gpt-4o", messages, {"temperature": 0.2, "max_tokens": 500}
+        )
+        assert key != AIResponseCache.make_key(
+            "anthropic", "gpt-4o", messages, {"temperature": 0.0, "max_tokens": 500}
+        )
+
+    def test_ttl_lru_and_savings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test expiry, eviction and the savings counted by hits."""
+        now = [1000.0]
+        monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+        cache = AIResponseCache(max_entries=2, ttl=60)
+        response: dict[str, Any] = {"content": "x", "usage": {"total_tokens": 42}}
+
+        cache.put("a", response, latency=1.5)
+        cached = cache.get("a")
+        assert cached == response
+        cached["content"] = "changed"
+        assert cache.get("a") == response
+
+        cache.put("b", {"content": "y"}, latency=0.5)
+        cache.put("c", {"content": "z"}, latency=0.5)
+        assert cache.get("a") is None
+        now[0] += 61
+        assert cache.get("b") is None
+        assert cache.get_stats() == {
+            "entries": 1,
+            "hits": 2,
+            "misses": 2,
+            "expired": 1,
+            "saved_seconds": 3.0,
+            "saved_tokens": 84,
+        }
+        with pytest.raises(ValueError):
+            AIResponseCache(ttl=0)
+
+    def test_disk_tier(self, tmp_path: Path) -> None:
+        """Test sharing responses through a directory, bounded in size."""
+        AIResponseCache(directory=tmp_path).put("a", {"content": "x"}, latency=1.0)
+        assert AIResponseCache(directory=tmp_path).get("a") == {"content": "x"}
+
+        (tmp_path / "settings.json").write_text("{}")
+        cache = AIResponseCache(directory=tmp_path, max_disk_entries=10)
+        for key in range(10):
+            cache.put(str(key), {"content": key}, latency=1.0)
+        # Over the limit, the oldest files are pruned to 90% of it
+        assert len(list(tmp_path.glob("ai-response-*.json"))) == 9
+        cache.clear()
+        assert [path.name for path in tmp_path.iterdir()] == ["settings.json"]
+        assert cache.get("9") is None
+
+
+@pytest.mark.unit
+class TestCachedGeneration:
+    """Unit tests for provider and manager generation through a cache."""
+
+    @patch("requests.post")
+    def test_provider_cache(self, mock_post: Mock) -> None:
+        """Test that repeated requests are answered from the cache."""
+        mock_post.return_value = _completion("flowchart TD\n    A --> B")
+        provider = _provider()
+        cache = provider.enable_cache()
+
+        first = provider.generate_text(PROMPT, temperature=0.0)
+        second = provider.generate_text(PROMPT, temperature=0.0)
+        assert mock_post.call_count == 1
+        assert second.content == first.content
+        assert second.usage == first.usage
+        assert second.metadata is not None and second.metadata["cached"]
+        assert cache.get_stats()["saved_tokens"] == 42
+
+        provider.generate_text(PROMPT, temperature=0.5)
+        provider.generate_text(PROMPT, temperature=0.0, use_cache=False)
+        provider.generate_text(PROMPT, messages=[{"role": "user", "content": "x"}])
+        assert mock_post.call_count == 4
+
+        provider.disable_cache()
+        provider.generate_text(PROMPT, temperature=0.0)
+        assert mock_post.call_count == 5
+
+    @patch("requests.post")
+    def test_fallback_not_cached(self, mock_post: Mock) -> None:
+        """Test that failed requests answered by the fallback are retried."""
+        mock_post.return_value = Mock(status_code=200)
+        mock_post.return_value.json.side_effect = ValueError("not JSON")
+        provider = _provider()
+        provider.config.max_retries = 0
+        cache = provider.enable_cache()
+
+        assert provider.generate_text(PROMPT).provider == "fallback"
+        mock_post.return_value = _completion("flowchart TD")
+        assert provider.generate_text(PROMPT).provider == "openrouter"
+        assert len(cache) == 1
+
+    @patch("requests.post")
+    def test_manager_cache(self, mock_post: Mock) -> None:
+        """Test that a manager shares its cache with its providers."""
+        mock_post.return_value = _completion("flowchart TD")
+        cache = AIResponseCache()
+        own_cache = AIResponseCache()
+        local = LocalModelProvider()
+        local.enable_cache(own_cache)
+        manager = ProviderManager([_provider()], cache=cache)
+        manager.add_provider(local)
+
+        assert manager.providers[0].response_cache is cache
+        assert local.response_cache is own_cache
+        manager.generate_text(PROMPT)
+        manager.generate_text(PROMPT)
+        assert mock_post.call_count == 1
+        assert cache.get_stats()["hits"] == 1
@@ -96,3 +96,37 @@ class TestFlowchartGenerator:
         generator = FlowchartGenerator()
         result = generator.generate({}, {}, {"direction": "LR"})
         assert "LR" in result or "flowchart" in result.lower()
+
+    def test_iter_chunks_and_write_match_generate(self) -> None:
+        """Test that streamed output equals the generated string."""
+        import io
+
+        generator = FlowchartGenerator()
+        elements = {
+            f"n{i}": DiagramElement(
+                id=f"n{i}",
+                element_type=ElementType.NODE,
+                position=Position(0, 0),
+                size=Size(100, 50),
+                label=f"Node {i}",
+            )
+            for i in range(200)
+        }
+        connections = {
+            f"c{i}": DiagramConnection(
+                id=f"c{i}", source_id=f"n{i}", target_id=f"n{i + 1}", label="go"
+            )
+            for i in range(199)
+        }
+        metadata = {"title": "Flow"}
+        expected = generator.generate(elements, connections, metadata)
+
+        chunks = list(generator.iter_chunks(elements, connections, metadata, 500))
+        assert len(chunks) > 1
+        assert "".join(chunks) == expected
+
+        buffer = io.StringIO()
+        assert generator.write(buffer, elements, connections, metadata) == len(
+            expected
+        )
+        assert buffer.getvalue() == expected
@@ -0,0 +1,176 @@
+"""
+Unit tests for interactive.builder.parsers.incremental module.
+
+Tests incremental re-parsing of code edits and their application to a
+DiagramBuilder.
+"""
+
+import random
+
+import pytest
+
+from diagramaid.interactive.builder import DiagramBuilder
+from diagramaid.interactive.builder.parsers import (
+    FlowchartParser,
+    IncrementalParser,
+    StateDiagramParser,
+    TextEdit,
+)
+
+FLOWCHART = "flowchart TD\n    A[Start]\n    A --> B\n    B --> C\n    C{Check}"
+
+
+def _insert(code: str, line: int, text: str) -> TextEdit:
+    column = len(code.split("\n")[line])
+    return TextEdit(line, column, line, column, text)
+
+
+def _summary(builder: DiagramBuilder) -> tuple[dict, list]:
+    elements = {
+        element_id: (element.label, element.properties.get("shape"))
+        for element_id, element in builder.elements.items()
+    }
+    connections = sorted(
+        (c.source_id, c.target_id, c.label, c.connection_type)
+        for c in builder.connections.values()
+    )
+    return elements, connections
+
+
+@pytest.mark.unit
+class TestTextEdit:
+    """Unit tests for TextEdit class."""
+
+    def test_splice(self) -> None:
+        """Test replacing ranges within and across lines."""
+        lines = ["abc", "def", "ghi"]
+        assert TextEdit(1, 1, 1, 2, "X").splice(lines) == (1, 1, ["dXf"])
+        assert TextEdit(0, 2, 2, 1, "-\n-").splice(lines) == (0, 3, ["ab-", "-hi"])
+
+    def test_invalid_range(self) -> None:
+        """Test that ranges outside the document are rejected."""
+        with pytest.raises(ValueError):
+            TextEdit(3, 0, 3, 0).splice(["abc"])
+        with pytest.raises(ValueError):
+            TextEdit(0, 2, 0, 1).splice(["abc"])
+
+    def test_dict_round_trip(self) -> None:
+        """Test conversion to and from dictionaries."""
+        edit = TextEdit(1, 2, 3, 4, "x")
+        assert TextEdit.from_dict(edit.to_dict()) == edit
+
+
+@pytest.mark.unit
+class TestIncrementalParser:
+    """Unit tests for IncrementalParser class."""
+
+    def test_only_edited_lines_are_parsed(self) -> None:
+        """Test that an edit re-parses only the lines it touches."""
+        parser = IncrementalParser(FlowchartParser())
+        parser.load(FLOWCHART)
+        assert parser.lines_parsed == 4
+
+        affected = parser.apply(TextEdit(3, 10, 3, 11, "D"))
+        assert parser.lines_parsed == 5
+        assert affected == ({"B", "C", "D"}, {("B", "C"), ("B", "D")})
+        assert parser.element("C") is not None
+        assert parser.element("D").label == "D"
+
+    def test_declarations_take_precedence(self) -> None:
+        """Test merging declarations with elements implied by connections."""
+        parser = IncrementalParser(FlowchartParser())
+        parser.load(FLOWCHART)
+        assert parser.element("B").label == "B"
+        parser.apply(_insert(FLOWCHART, 1, "\n    B(Later)"))
+        assert parser.element("B").label == "Later"
+
+        states = IncrementalParser(StateDiagramParser())
+        states.load('stateDiagram-v2\n    A --> B\n    state "Busy" as B')
+        assert states.element("B").label == "B"
+
+    def test_header_edit(self) -> None:
+        """Test that editing the declaration re-parses the document."""
+        parser = IncrementalParser(FlowchartParser())
+        parser.load(FLOWCHART)
+        assert parser.apply(TextEdit(0, 10, 0, 12, "LR")) is None
+        assert parser.header == "flowchart LR"
+        assert parser.element("A").label == "Start"
+
+
+@pytest.mark.unit
+class TestApplyCodeEdit:
+    """Unit tests for DiagramBuilder.apply_code_edit."""
+
+    def test_minimal_changes_preserve_identity(self) -> None:
+        """Test that edits update elements in place and report only changes."""
+        builder = DiagramBuilder()
+        builder.load_from_mermaid_code(FLOWCHART)
+        objects = dict(builder.elements)
+        revision = builder.revision
+
+        ops = builder.apply_code_edit(_insert(FLOWCHART, 4, "\n    B[Middle]"))
+        assert ops is not None
+        assert [(op["op"], op["path"]) for op in ops] == [("replace", "/elements/B")]
+        assert ops[0]["value"]["label"] == "Middle"
+        assert all(builder.elements[k] is v for k, v in objects.items())
+        assert builder.changes_since(revision) == ops
+
+    def test_connections_matched_by_endpoints(self) -> None:
+        """Test adding, relabelling and removing connections."""
+        builder = DiagramBuilder()
+        builder.load_from_mermaid_code(FLOWCHART)
+        first = builder.connections["conn_A_B_0"]
+
+        ops = builder.apply_code_edit(TextEdit(2, 4, 2, 11, "A -->|go| B"))
+        assert [op["path"] for op in ops] == ["/connections/conn_A_B_0"]
+        assert builder.connections["conn_A_B_0"] is first
+        assert first.label == "go"
+
+        ops = builder.apply_code_edit(TextEdit(3, 0, 4, 0, ""))
+        # C is still declared on its own line, so only the connection goes
+        assert [(op["op"], op["path"]) for op in ops] == [
+            ("remove", "/connections/conn_B_C_1")
+        ]
+        ops = builder.apply_code_edit(TextEdit(3, 0, 3, 12, ""))
+        assert [(op["op"], op["path"]) for op in ops] == [("remove", "/elements/C")]
+
+    def test_diagram_type_change_reloads(self) -> None:
+        """Test that changing the diagram type loads the code as a whole."""
+        builder = DiagramBuilder()
+        builder.load_from_mermaid_code(FLOWCHART)
+        assert builder.apply_code_edit(TextEdit(0, 0, 0, 12, "stateDiagram")) is None
+        assert builder.diagram_type.value == "state"
+
+    def test_matches_full_parse(self) -> None:
+        """Test that a sequence of random edits ends where a full parse does."""
+        rng = random.Random(7)
+        statements = ["A --> B", "B --> C", "A[Start]", "C{Check}", "B -.- A", "D"]
+        builder = DiagramBuilder()
+        code = "flowchart TD\n    " + "\n    ".join(statements)
+        builder.load_from_mermaid_code(code)
+
+        for _ in range(60):
+            lines = code.split("\n")
+            line = rng.randrange(1, len(lines))
+            if rng.random() < 0.3 and len(lines) > 2:
+                edit = TextEdit(line - 1, len(lines[line - 1]), line, len(lines[line]))
+            else:
+                text = rng.choice(statements + ["X --> A", "A(Round)", "B -->|b| D"])
+                edit = TextEdit(line, 0, line, len(lines[line]), "    " + text)
+            builder.apply_code_edit(edit)
+            first, count, replacement = edit.splice(lines)
+            code = "\n".join(lines[:first] + replacement + lines[first + count :])
+
+        expected = DiagramBuilder()
+        expected.load_from_mermaid_code(code)
+        assert _summary(builder) == _summary(expected)
+
+    def test_stale_code_uses_generated_code(self) -> None:
+        """Test editing after the diagram was changed outside the code."""
+        builder = DiagramBuilder()
+        builder.load_from_mermaid_code(FLOWCHART)
+        builder.update_element("A", label="Begin")
+        code = builder.generate_mermaid_code()
+        ops = builder.apply_code_edit(_insert(code, len(code.split("\n")) - 1, ""))
+        assert ops == []
+        assert builder.elements["A"].label == "Begin"
@@ -123,3 +123,38 @@ class TestConnectionManager:
         
         assert manager.has_connection(conn.id)
         assert not manager.has_connection("nonexistent")
+
+    def test_adjacency_tracks_add_and_remove(self) -> None:
+        """Test that the adjacency index follows connection changes."""
+        manager = ConnectionManager()
+
+        first = manager.add_connection("a", "b")
+        second = manager.add_connection("b", "c")
+        manager.remove_connection(first.id)
+
+        assert manager.adjacency.outgoing("a") == []
+        assert manager.adjacency.incoming("c") == [second.id]
+        assert manager.get_connections_from("b") == [second]
+
+    def test_remove_connections_for_elements(self) -> None:
+        """Test bulk removal of connections for several elements."""
+        manager = ConnectionManager()
+        manager.add_connection("a", "b")
+        manager.add_connection("b", "c")
+        kept = manager.add_connection("c", "d")
+
+        removed = manager.remove_connections_for_elements(["a", "b"])
+
+        assert len(removed) == 2
+        assert list(manager.connections.values()) == [kept]
+
+    def test_assigned_connections_reindexed(self) -> None:
+        """Test that assigning the connections dict rebuilds the index."""
+        manager = ConnectionManager()
+        manager.add_connection("a", "b")
+        connection = DiagramConnection(id="c1", source_id="x", target_id="y")
+
+        manager.connections = {"c1": connection}
+
+        assert manager.get_connections_from("a") == []
+        assert manager.get_connections_to("y") == [connection]
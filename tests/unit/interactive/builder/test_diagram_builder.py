@@ -51,6 +51,29 @@ class TestDiagramBuilder:
         assert len(builder.elements) == 0
         assert builder.elements.get(element.id) is None
 
+    def test_remove_elements(self) -> None:
+        """Test removing several elements and their connections."""
+        builder = DiagramBuilder()
+        ids = [
+            builder.add_element(
+                element_type=ElementType.NODE,
+                label=label,
+                position=Position(0, 0),
+                size=Size(100, 50),
+            ).id
+            for label in "ABC"
+        ]
+        builder.add_connection(ids[0], ids[1])
+        kept = builder.add_connection(ids[2], ids[2])
+        builder.add_connection(ids[1], ids[2])
+
+        removed = builder.remove_elements(ids[:2] + ["missing"])
+
+        assert removed == ids[:2]
+        assert list(builder.elements) == [ids[2]]
+        assert list(builder.connections.values()) == [kept]
+        assert builder.adjacency.has_cycle()
+
     def test_add_connection(self) -> None:
         """Test adding connection between elements."""
         builder = DiagramBuilder()
@@ -154,3 +177,42 @@ class TestDiagramBuilder:
         builder.add_connection(source.id, target.id)
         code = builder.generate_mermaid_code()
         assert "flowchart" in code.lower() or "graph" in code.lower()
+
+    def test_changes_since(self) -> None:
+        """Test delta operations between revisions."""
+        builder = DiagramBuilder()
+        source = builder.add_element(ElementType.NODE, "A", Position(0, 0))
+        start = builder.revision
+        target = builder.add_element(ElementType.NODE, "B", Position(0, 0))
+        connection = builder.add_connection(source.id, target.id)
+        assert connection is not None
+        builder.update_element(source.id, label="A2")
+        temporary = builder.add_element(ElementType.NODE, "C", Position(0, 0))
+        builder.remove_element(temporary.id)
+
+        ops = builder.changes_since(start)
+        assert ops is not None
+        by_path = {op["path"]: op for op in ops}
+        assert by_path[f"/elements/{source.id}"]["op"] == "replace"
+        assert by_path[f"/elements/{source.id}"]["value"]["label"] == "A2"
+        assert by_path[f"/elements/{target.id}"]["op"] == "add"
+        assert by_path[f"/connections/{connection.id}"]["op"] == "add"
+        # Added and removed in between: nothing to send
+        assert f"/elements/{temporary.id}" not in by_path
+
+        builder.remove_element(target.id)
+        ops = builder.changes_since(start)
+        assert ops is not None
+        paths = {op["path"] for op in ops}
+        assert f"/connections/{connection.id}" not in paths
+        assert builder.changes_since(builder.revision) == []
+        assert builder.changes_since(builder.revision + 1) is None
+
+    def test_changes_since_requires_full_sync(self) -> None:
+        """Test that whole-state loads and old revisions need a full sync."""
+        builder = DiagramBuilder()
+        builder.add_element(ElementType.NODE, "A", Position(0, 0))
+        revision = builder.revision
+        builder.load_from_mermaid_code("flowchart TD\n    X --> Y")
+        assert builder.changes_since(revision) is None
+        assert builder.changes_since(builder.revision) == []
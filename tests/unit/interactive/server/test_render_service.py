@@ -0,0 +1,211 @@
+"""
+Unit tests for interactive.server.render_service module.
+
+Tests the render service queue, cache and mermaid.ink-compatible routes.
+"""
+
+import asyncio
+import base64
+import threading
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from diagramaid.exceptions import (
+    RenderingError,
+    ServiceOverloadedError,
+    UnsupportedFormatError,
+)
+from diagramaid.interactive.server.render_service import (
+    RenderService,
+    create_render_service_app,
+)
+from diagramaid.renderers.remote import encode_payload
+
+
+class FakeRenderer:
+    """Render function that records calls and can be held open."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, str | None, Any]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(
+        self, code: str, format: str, theme: str | None, config: Any
+    ) -> str | bytes:
+        self.calls.append((code, format, theme, config))
+        self.release.wait(5)
+        if "invalid" in code:
+            raise RenderingError("Invalid diagram")
+        if format == "svg":
+            return f'<svg viewBox="0 0 10 10"><desc>{code}</desc></svg>'
+        return b"\x89PNG-" + code.encode()
+
+
+@pytest.fixture
+def renderer() -> FakeRenderer:
+    return FakeRenderer()
+
+
+@pytest.mark.unit
+class TestRenderService:
+    """Unit tests for the render service."""
+
+    def test_cache_and_coalescing(self, renderer: FakeRenderer) -> None:
+        """Test that repeated and concurrent identical renders run once."""
+        service = RenderService(render_function=renderer)
+
+        async def run() -> list[Any]:
+            first = await asyncio.gather(
+                service.render("graph TD; A-->B"), service.render("graph TD; A-->B")
+            )
+            return [*first, await service.render("graph TD; A-->B")]
+
+        results = asyncio.run(run())
+        service.close()
+
+        assert len(set(results)) == 1
+        assert len(renderer.calls) == 1
+        stats = service.get_stats()
+        assert stats["coalesced"] == 1
+        assert stats["cache_hits"] == 1
+        assert stats["pending"] == 0
+
+    def test_cache_eviction(self, renderer: FakeRenderer) -> None:
+        """Test that the cache keeps the most recently used results."""
+        service = RenderService(render_function=renderer, cache_size=1)
+
+        async def run() -> None:
+            await service.render("graph TD; A")
+            await service.render("graph TD; B")
+            await service.render("graph TD; A")
+
+        asyncio.run(run())
+        service.close()
+        assert len(renderer.calls) == 3
+        assert service.get_stats()["cached_entries"] == 1
+
+    def test_rejects_when_saturated(self, renderer: FakeRenderer) -> None:
+        """Test that work beyond workers plus queue is rejected."""
+        service = RenderService(render_function=renderer, max_workers=1, max_queue=1)
+        renderer.release.clear()
+
+        async def run() -> None:
+            running = [
+                asyncio.ensure_future(service.render(f"graph TD; N{i}"))
+                for i in range(2)
+            ]
+            await asyncio.sleep(0)
+            with pytest.raises(ServiceOverloadedError) as exc_info:
+                await service.render("graph TD; N2")
+            assert exc_info.value.retry_after == 1.0
+            # A result in flight can still be joined without a slot
+            joined = asyncio.ensure_future(service.render("graph TD; N0"))
+            await asyncio.sleep(0)
+            renderer.release.set()
+            await asyncio.gather(*running, joined)
+
+        asyncio.run(run())
+        service.close()
+        assert service.get_stats()["rejected"] == 1
+        assert len(renderer.calls) == 2
+
+    def test_batch_admitted_as_a_whole(self, renderer: FakeRenderer) -> None:
+        """Test that a batch larger than the free capacity is rejected."""
+        service = RenderService(render_function=renderer, max_workers=1, max_queue=1)
+        requests = [(f"graph TD; N{i}", "svg", None, None) for i in range(3)]
+
+        with pytest.raises(ServiceOverloadedError):
+            asyncio.run(service.render_many(requests))
+        assert renderer.calls == []
+
+        results = asyncio.run(
+            service.render_many(
+                [("graph TD; ok", "svg", None, None), ("invalid", "svg", None, None)],
+                return_exceptions=True,
+            )
+        )
+        service.close()
+        assert isinstance(results[1], RenderingError)
+
+    def test_unsupported_format(self, renderer: FakeRenderer) -> None:
+        """Test that unknown formats are rejected before rendering."""
+        service = RenderService(render_function=renderer)
+        with pytest.raises(UnsupportedFormatError):
+            asyncio.run(service.render("graph TD; A", format="gif"))
+        service.close()
+
+
+@pytest.mark.unit
+class TestRenderRoutes:
+    """Unit tests for the mermaid.ink-compatible routes."""
+
+    @pytest.fixture
+    def client(self, renderer: FakeRenderer) -> TestClient:
+        app = create_render_service_app(RenderService(render_function=renderer))
+        with TestClient(app) as client:
+            yield client
+
+    @pytest.mark.parametrize("encoding", ["pako", "base64"])
+    def test_get_svg(
+        self, client: TestClient, renderer: FakeRenderer, encoding: str
+    ) -> None:
+        """Test the mermaid.ink SVG URL scheme with both encodings."""
+        payload = encode_payload("graph TD; A-->B", {"theme": "dark"}, encoding)
+        response = client.get(f"/svg/{payload}")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("image/svg+xml")
+        assert "<svg" in response.text
+        assert renderer.calls[-1][:3] == ("graph TD; A-->B", "svg", "dark")
+
+    def test_image_and_post(self, client: TestClient, renderer: FakeRenderer) -> None:
+        """Test PNG rendering over GET and POST with query parameters."""
+        payload = encode_payload("graph TD; A-->B")
+        response = client.get(f"/img/{payload}", params={"type": "png", "width": 300})
+        assert response.status_code == 200
+        assert response.content.startswith(b"\x89PNG")
+        assert renderer.calls[-1][3] == {"width": "300"}
+
+        response = client.post("/img?type=png", content=payload)
+        assert response.status_code == 200
+        assert client.get(f"/img/{payload}?type=webp").status_code == 400
+
+    def test_errors(self, client: TestClient) -> None:
+        """Test status codes for bad payloads and failed renders."""
+        assert client.get("/svg/pako:garbage").status_code == 400
+        assert client.get(f"/svg/{encode_payload('invalid')}").status_code == 400
+
+    def test_overloaded_returns_429(self, renderer: FakeRenderer) -> None:
+        """Test that a saturated queue answers 429 with Retry-After."""
+        service = RenderService(render_function=renderer, max_workers=1, max_queue=0)
+        app = create_render_service_app(service)
+        with TestClient(app) as client:
+            service._pending = service.capacity
+            response = client.get(f"/svg/{encode_payload('graph TD; A')}")
+            service._pending = 0
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+
+    def test_batch(self, client: TestClient) -> None:
+        """Test the JSON batch endpoint."""
+        response = client.post(
+            "/batch",
+            json={
+                "diagrams": [
+                    {"code": "graph TD; A"},
+                    {"code": "graph TD; B", "format": "png"},
+                    {"code": "invalid"},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert "<svg" in results[0]["content"]
+        assert base64.b64decode(results[1]["content"]).startswith(b"\x89PNG")
+        assert results[1]["encoding"] == "base64"
+        assert "error" in results[2]
+
+        assert client.post("/batch", json={"diagrams": []}).status_code == 400
+        assert client.get("/health").json()["renders"] == 2
@@ -0,0 +1,291 @@
+"""
+Unit tests for interactive.scheduler module.
+
+Tests the RenderScheduler priority, fairness, superseding and backpressure.
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from diagramaid.exceptions import ServiceOverloadedError
+from diagramaid.interactive.builder import DiagramBuilder
+from diagramaid.interactive.export import ExportFormat, ExportManager
+from diagramaid.interactive.routes.preview import (
+    create_preview_router,
+    create_render_queue_router,
+)
+from diagramaid.interactive.scheduler import (
+    JobSupersededError,
+    RenderPriority,
+    RenderScheduler,
+)
+from diagramaid.interactive.websocket import DiagramSession
+
+
+class Recorder:
+    """Creates jobs that record their start order; the first one blocks."""
+
+    def __init__(self) -> None:
+        self.order: list[str] = []
+        self.gate = threading.Event()
+
+    def blocker(self) -> str:
+        self.gate.wait(5)
+        return "blocker"
+
+    def job(self, name: str) -> Callable[[], str]:
+        def run() -> str:
+            self.order.append(name)
+            return name
+
+        return run
+
+
+async def _queue_behind_blocker(
+    scheduler: RenderScheduler,
+    recorder: Recorder,
+    jobs: list[tuple[str, str, RenderPriority]],
+) -> list[Any]:
+    """Submit jobs while one worker is blocked, then release it."""
+    blocked = asyncio.ensure_future(scheduler.submit("blocker", recorder.blocker))
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.ensure_future(scheduler.submit(session, recorder.job(name), priority))
+        for session, name, priority in jobs
+    ]
+    await asyncio.sleep(0)
+    recorder.gate.set()
+    return await asyncio.gather(blocked, *tasks, return_exceptions=True)
+
+
+@pytest.mark.unit
+class TestRenderScheduler:
+    """Unit tests for RenderScheduler."""
+
+    def test_previews_before_exports(self) -> None:
+        """Test that previews run before earlier queued exports."""
+        scheduler = RenderScheduler(max_concurrency=1)
+        recorder = Recorder()
+        asyncio.run(
+            _queue_behind_blocker(
+                scheduler,
+                recorder,
+                [
+                    ("a", "export", RenderPriority.EXPORT),
+                    ("b", "preview", RenderPriority.PREVIEW),
+                ],
+            )
+        )
+        scheduler.shutdown()
+        assert recorder.order == ["preview", "export"]
+
+    def test_sessions_take_turns(self) -> None:
+        """Test round-robin between sessions within a priority."""
+        scheduler = RenderScheduler(max_concurrency=1)
+        recorder = Recorder()
+        export = RenderPriority.EXPORT
+        asyncio.run(
+            _queue_behind_blocker(
+                scheduler,
+                recorder,
+                [("a", "a1", export), ("a", "a2", export), ("a", "a3", export)]
+                + [("b", "b1", export)],
+            )
+        )
+        scheduler.shutdown()
+        assert recorder.order == ["a1", "b1", "a2", "a3"]
+
+    def test_starving_export_is_promoted(self) -> None:
+        """Test that exports waiting too long run ahead of previews."""
+        scheduler = RenderScheduler(max_concurrency=1, starvation_timeout=0)
+        recorder = Recorder()
+        asyncio.run(
+            _queue_behind_blocker(
+                scheduler,
+                recorder,
+                [
+                    ("a", "export", RenderPriority.EXPORT),
+                    ("b", "preview", RenderPriority.PREVIEW),
+                ],
+            )
+        )
+        scheduler.shutdown()
+        assert recorder.order == ["export", "preview"]
+
+    def test_newer_preview_supersedes_queued(self) -> None:
+        """Test that queued previews of a session are replaced."""
+        scheduler = RenderScheduler(max_concurrency=1)
+        recorder = Recorder()
+        results = asyncio.run(
+            _queue_behind_blocker(
+                scheduler,
+                recorder,
+                [
+                    ("a", "rev1", RenderPriority.PREVIEW),
+                    ("a", "rev2", RenderPriority.PREVIEW),
+                    ("b", "other", RenderPriority.PREVIEW),
+                ],
+            )
+        )
+        scheduler.shutdown()
+        assert isinstance(results[1], JobSupersededError)
+        assert results[2:] == ["rev2", "other"]
+        assert recorder.order == ["rev2", "other"]
+        assert scheduler.get_metrics()["superseded"] == 1
+
+    def test_stale_revision_rejected(self) -> None:
+        """Test that previews of older revisions are rejected."""
+        scheduler = RenderScheduler()
+
+        async def run() -> None:
+            assert await scheduler.submit("a", lambda: "new", revision=5) == "new"
+            with pytest.raises(JobSupersededError):
+                await scheduler.submit("a", lambda: "old", revision=4)
+
+        asyncio.run(run())
+        scheduler.shutdown()
+
+    def test_full_queue_rejected(self) -> None:
+        """Test backpressure when the queue is full."""
+        scheduler = RenderScheduler(max_concurrency=1, max_queue=1)
+        recorder = Recorder()
+        results = asyncio.run(
+            _queue_behind_blocker(
+                scheduler,
+                recorder,
+                [
+                    ("a", "queued", RenderPriority.EXPORT),
+                    ("b", "rejected", RenderPriority.EXPORT),
+                ],
+            )
+        )
+        scheduler.shutdown()
+        assert results[1] == "queued"
+        assert isinstance(results[2], ServiceOverloadedError)
+
+    def test_rejected_preview_keeps_session_state(self) -> None:
+        """Test that a rejected preview neither supersedes nor records anything."""
+        scheduler = RenderScheduler(max_concurrency=1, max_queue=1)
+        recorder = Recorder()
+
+        async def run() -> list[Any]:
+            blocked = asyncio.ensure_future(
+                scheduler.submit("blocker", recorder.blocker)
+            )
+            await asyncio.sleep(0)
+            queued = asyncio.ensure_future(
+                scheduler.submit("x", recorder.job("export"), RenderPriority.EXPORT)
+            )
+            await asyncio.sleep(0)
+            with pytest.raises(ServiceOverloadedError):
+                await scheduler.submit("a", recorder.job("rev5"), revision=5)
+            recorder.gate.set()
+            await asyncio.gather(blocked, queued)
+            return [await scheduler.submit("a", recorder.job("rev4"), revision=4)]
+
+        assert asyncio.run(run()) == ["rev4"]
+        scheduler.shutdown()
+        assert recorder.order == ["export", "rev4"]
+
+    def test_forget_session(self) -> None:
+        """Test that a removed session's revision is no longer tracked."""
+        scheduler = RenderScheduler()
+
+        async def run() -> str:
+            await scheduler.submit("a", lambda: "new", revision=5)
+            scheduler.forget_session("a")
+            return await scheduler.submit("a", lambda: "restarted", revision=1)
+
+        assert asyncio.run(run()) == "restarted"
+        scheduler.shutdown()
+
+    def test_metrics(self) -> None:
+        """Test queue depth and wait-time metrics."""
+        scheduler = RenderScheduler(max_concurrency=1)
+        recorder = Recorder()
+
+        async def run() -> dict[str, Any]:
+            blocked = asyncio.ensure_future(
+                scheduler.submit("blocker", recorder.blocker)
+            )
+            await asyncio.sleep(0)
+            queued = asyncio.ensure_future(
+                scheduler.submit("a", recorder.job("a"), RenderPriority.EXPORT)
+            )
+            await asyncio.sleep(0)
+            metrics = scheduler.get_metrics()
+            recorder.gate.set()
+            await asyncio.gather(blocked, queued)
+            return metrics
+
+        during = asyncio.run(run())
+        after = scheduler.get_metrics()
+        scheduler.shutdown()
+        assert during["queue_depth"] == 1
+        assert during["queue_depth_by_priority"] == {"preview": 0, "export": 1}
+        assert during["running"] == 1
+        assert after["queue_depth"] == 0
+        assert after["completed"] == 2
+        assert after["max_wait_time"] > 0
+        assert after["average_wait_time"] > 0
+
+    def test_failed_job_raises(self) -> None:
+        """Test that job exceptions reach the caller."""
+        scheduler = RenderScheduler()
+
+        def fail() -> None:
+            raise RuntimeError("render failed")
+
+        with pytest.raises(RuntimeError, match="render failed"):
+            asyncio.run(scheduler.submit("a", fail))
+        scheduler.shutdown()
+        assert scheduler.get_metrics()["failed"] == 1
+
+
+@pytest.mark.unit
+class TestSchedulerIntegration:
+    """Tests for the preview route and exports using the scheduler."""
+
+    def test_preview_route(self) -> None:
+        """Test that previews render through the scheduler."""
+        scheduler = RenderScheduler()
+        renderer = Mock()
+        renderer.render_raw.return_value = "<svg></svg>"
+        session = DiagramSession("session1", DiagramBuilder())
+        app = FastAPI()
+        app.include_router(
+            create_preview_router({"session1": session}, renderer, Mock(), scheduler)
+        )
+        app.include_router(create_render_queue_router(scheduler))
+
+        with TestClient(app) as client:
+            response = client.get("/api/sessions/session1/preview")
+            metrics = client.get("/api/render-queue/metrics").json()
+        scheduler.shutdown()
+
+        assert response.status_code == 200
+        assert response.json()["content"] == "<svg></svg>"
+        assert metrics["completed"] == 1
+
+    def test_export_async(self) -> None:
+        """Test that rendered exports run with export priority."""
+        scheduler = RenderScheduler()
+        renderer = Mock()
+        renderer.render_raw.return_value = "<svg></svg>"
+        manager = ExportManager(renderer, scheduler)
+
+        builder = DiagramBuilder()
+        svg = asyncio.run(manager.export_diagram_async(builder, ExportFormat.SVG))
+        code = asyncio.run(manager.export_diagram_async(builder, ExportFormat.MERMAID))
+        scheduler.shutdown()
+
+        assert svg == "<svg></svg>"
+        assert isinstance(code, str)
+        assert scheduler.get_metrics()["submitted"] == 1
@@ -4,13 +4,17 @@ Unit tests for interactive.security module.
 Tests the security utilities and middleware.
 """
 
+import asyncio
+
 import pytest
 
+from diagramaid.interactive import security
 from diagramaid.interactive.security import (
     InputSanitizer,
     RateLimitConfig,
     RateLimiter,
 )
+from diagramaid.interactive.websocket import RedisStandIn
 
 
 @pytest.mark.unit
@@ -52,3 +56,51 @@ class TestSecurity:
         assert limiter.is_allowed("test_client")
         # Third should be blocked
         assert not limiter.is_allowed("test_client")
+
+    def test_rate_limiter_burst_and_refill(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the burst limit and token refill over time."""
+        clock = [1000.0]
+        monkeypatch.setattr(security.time, "monotonic", lambda: clock[0])
+        config = RateLimitConfig(max_requests=60, window_seconds=60, burst_limit=3)
+        limiter = RateLimiter(config)
+
+        assert [limiter.is_allowed("c") for _ in range(4)] == [True] * 3 + [False]
+        clock[0] += 1.0
+        assert limiter.is_allowed("c")
+        assert limiter.get_remaining_requests("c") == 57
+
+    def test_rate_limiter_forgets_idle_clients(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that idle clients are swept periodically."""
+        clock = [1000.0]
+        monkeypatch.setattr(security.time, "monotonic", lambda: clock[0])
+        config = RateLimitConfig(window_seconds=60, cleanup_interval=30)
+        limiter = RateLimiter(config)
+        for client_id in ("a", "b"):
+            limiter.is_allowed(client_id)
+
+        clock[0] += 45
+        limiter.is_allowed("b")
+        assert set(limiter.clients) == {"a", "b"}
+        clock[0] += 60
+        limiter.is_allowed("c")
+        assert set(limiter.clients) == {"c"}
+
+    def test_rate_limiter_shared_across_workers(self) -> None:
+        """Test that limits shared through Redis hold across limiters."""
+        config = RateLimitConfig(max_requests=3, window_seconds=60, burst_limit=10)
+        with RedisStandIn() as server:
+            workers = [RateLimiter(config), RateLimiter(config)]
+            for limiter in workers:
+                limiter.share(server.url)
+
+            assert workers[0].is_allowed("c")
+            assert asyncio.run(workers[1].is_allowed_async("c"))
+            assert workers[0].get_remaining_requests("c") == 1
+            assert workers[1].is_allowed("c")
+            assert not workers[0].is_allowed("c")
+            assert workers[1].is_allowed("other")
+            assert workers[0].clients == {}
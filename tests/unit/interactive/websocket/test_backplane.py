@@ -0,0 +1,266 @@
+"""
+Unit tests for interactive.websocket.backplane and Redis session storage.
+
+Tests cross-worker broadcasts and shared sessions against the local pub/sub
+fallback and a local Redis stand-in.
+"""
+
+import asyncio
+import json
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from diagramaid.interactive.models import ElementType, Position
+from diagramaid.interactive.server.interactive_server import InteractiveServer
+from diagramaid.interactive.websocket import (
+    Backplane,
+    LocalBackplane,
+    MemorySessionStore,
+    RedisBackplane,
+    RedisSessionStore,
+    RedisStandIn,
+    RespClient,
+    SessionManager,
+    SessionStore,
+    WebSocketHandler,
+)
+
+
+@pytest.fixture
+def redis_server() -> Iterator[RedisStandIn]:
+    with RedisStandIn() as server:
+        yield server
+
+
+def _websocket() -> AsyncMock:
+    websocket = AsyncMock()
+    websocket.client.host = "127.0.0.1"
+    websocket.headers = {"origin": "http://localhost:8080"}
+    websocket.query_params = {}
+    return websocket
+
+
+def _received(websocket: AsyncMock) -> list[dict[str, Any]]:
+    return [json.loads(call.args[0]) for call in websocket.send_text.call_args_list]
+
+
+def _stored_label(store: SessionStore, element_id: str) -> str:
+    snapshot = store.load("shared")
+    assert snapshot is not None
+    label: str = snapshot["builder"]["elements"][element_id]["label"]
+    return label
+
+
+def _worker(store: SessionStore, backplane: Backplane) -> WebSocketHandler:
+    return WebSocketHandler(
+        session_manager=SessionManager(store=store), backplane=backplane
+    )
+
+
+async def _edit_across_workers(store: SessionStore, backplane: Backplane) -> None:
+    first, second = _worker(store, backplane), _worker(store, backplane)
+    alice, bob = _websocket(), _websocket()
+    await first.connect(alice, "shared")
+    builder = first.sessions["shared"].builder
+    element = builder.add_element(ElementType.NODE, "Start", Position(0, 0))
+    await first.session_manager.checkpoint_async()
+
+    # The second worker loads the session from the shared store
+    await second.connect(bob, "shared")
+    assert element.id in second.sessions["shared"].builder.elements
+
+    await first.handle_message(
+        "shared",
+        {
+            "type": "element_update",
+            "element_id": element.id,
+            "updates": {"label": "Renamed"},
+        },
+        alice,
+    )
+    for _ in range(50):
+        await first._broadcast_service.flush()
+        await second._broadcast_service.flush()
+        if any(m["type"] == "element_updated" for m in _received(bob)):
+            break
+        await asyncio.sleep(0.01)
+
+    assert second.sessions["shared"].builder.elements[element.id].label == "Renamed"
+    updates = [m for m in _received(bob) if m["type"] == "element_updated"]
+    assert [m["updates"] for m in updates] == [{"label": "Renamed"}]
+    # Edits are written through, so workers joining later see them
+    assert _stored_label(store, element.id) == "Renamed"
+    # The originating worker does not apply its own edit twice
+    assert [m["type"] for m in _received(alice)].count("element_updated") == 1
+
+
+@pytest.mark.unit
+class TestRedisSessionStore:
+    """Unit tests for RedisSessionStore class."""
+
+    def test_round_trip(self, redis_server: RedisStandIn) -> None:
+        """Test saving, loading, listing and deleting snapshots."""
+        store = RedisSessionStore(redis_server.url)
+        store.save("a", {"value": 1})
+        store.save_many([("b", {"value": 2}), ("a", {"value": 3})])
+
+        assert store.load("a") == {"value": 3}
+        assert store.contains("b")
+        assert not store.contains("c")
+        assert sorted(store.list_sessions()) == ["a", "b"]
+        assert store.delete("a") is True
+        assert store.delete("a") is False
+        assert store.load("a") is None
+        store.close()
+
+    def test_memory_store(self) -> None:
+        """Test the in-process fallback store."""
+        store = MemorySessionStore()
+        store.save("a", {"value": 1})
+        assert store.load("a") == {"value": 1}
+        assert store.list_sessions() == ["a"]
+        assert store.delete("a") is True
+        assert not store.contains("a")
+
+    def test_client_reports_errors(self, redis_server: RedisStandIn) -> None:
+        """Test that error replies raise and the client stays usable."""
+        client = RespClient(redis_server.url)
+        with pytest.raises(Exception, match="unknown command"):
+            client.execute("FLUSHEVERYTHING")
+        assert client.execute("PING") == "PONG"
+        client.close()
+
+
+@pytest.mark.unit
+class TestBackplane:
+    """Unit tests for Backplane implementations."""
+
+    @pytest.mark.asyncio
+    async def test_redis_publish_subscribe(self, redis_server: RedisStandIn) -> None:
+        """Test that subscribers on other connections receive messages."""
+        publisher = RedisBackplane(redis_server.url)
+        subscriber = RedisBackplane(redis_server.url)
+        received: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+        async def on_message(message: dict[str, Any]) -> None:
+            await received.put(message)
+
+        await subscriber.subscribe("session:a", on_message)
+        await publisher.publish("session:b", {"n": 0})
+        await publisher.publish("session:a", {"n": 1})
+        assert await asyncio.wait_for(received.get(), 5) == {"n": 1}
+
+        await subscriber.unsubscribe("session:a", on_message)
+        await publisher.publish("session:a", {"n": 2})
+        await publisher.close()
+        await subscriber.close()
+        assert received.empty()
+
+    @pytest.mark.asyncio
+    async def test_local_backplane_across_workers(self) -> None:
+        """Test two workers sharing the local fallback backplane."""
+        await _edit_across_workers(MemorySessionStore(), LocalBackplane())
+
+    @pytest.mark.asyncio
+    async def test_redis_backplane_across_workers(
+        self, redis_server: RedisStandIn
+    ) -> None:
+        """Test two workers sharing sessions and edits through Redis."""
+        backplanes = [RedisBackplane(redis_server.url) for _ in range(2)]
+        first, second = (
+            _worker(RedisSessionStore(redis_server.url), backplane)
+            for backplane in backplanes
+        )
+        store = RedisSessionStore(redis_server.url)
+        alice, bob = _websocket(), _websocket()
+
+        await first.connect(alice, "shared")
+        element = first.sessions["shared"].builder.add_element(
+            ElementType.NODE, "Start", Position(0, 0)
+        )
+        await first.session_manager.checkpoint_async()
+        await second.connect(bob, "shared")
+        await first.handle_message(
+            "shared",
+            {
+                "type": "element_update",
+                "element_id": element.id,
+                "updates": {"label": "Renamed"},
+            },
+            alice,
+        )
+        for _ in range(200):
+            await second._broadcast_service.flush()
+            if any(m["type"] == "element_updated" for m in _received(bob)):
+                break
+            await asyncio.sleep(0.01)
+
+        assert second.sessions["shared"].builder.elements[element.id].label == (
+            "Renamed"
+        )
+        assert _stored_label(store, element.id) == "Renamed"
+        assert "PUBLISH" in redis_server.commands
+        for backplane in backplanes:
+            await backplane.close()
+
+    @pytest.mark.asyncio
+    async def test_rest_changes_across_workers(self) -> None:
+        """Test that sessions and edits made through REST reach other workers."""
+        store, backplane = MemorySessionStore(), LocalBackplane()
+        first, second = (
+            InteractiveServer(session_store=store, backplane=backplane)
+            for _ in range(2)
+        )
+        clients = [
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=server.app), base_url="http://test"
+            )
+            for server in (first, second)
+        ]
+        response = await clients[0].post("/api/sessions")
+        session_id = response.json()["session_id"]
+        assert (await clients[1].get(f"/api/sessions/{session_id}")).status_code == 200
+
+        bob = _websocket()
+        await second.websocket_handler.connect(bob, session_id)
+        response = await clients[0].post(
+            f"/api/sessions/{session_id}/elements",
+            json={
+                "element_type": "node",
+                "label": "Start",
+                "position": {"x": 0, "y": 0},
+            },
+        )
+        element_id = response.json()["id"]
+        await second.websocket_handler._broadcast_service.flush()
+
+        assert element_id in second.sessions[session_id].builder.elements
+        response = await clients[1].get(f"/api/sessions/{session_id}")
+        assert element_id in response.json()["elements"]
+        assert "element_added" in [m["type"] for m in _received(bob)]
+
+        await clients[0].delete(f"/api/sessions/{session_id}")
+        await second.websocket_handler._broadcast_service.flush()
+        assert session_id not in second.sessions
+        assert _received(bob)[-1] == {
+            "type": "session_removed",
+            "session_id": session_id,
+        }
+        for client in clients:
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unloading_unsubscribes(self) -> None:
+        """Test that a worker stops listening to sessions it unloaded."""
+        backplane = LocalBackplane()
+        handler = _worker(MemorySessionStore(), backplane)
+        websocket = _websocket()
+        await handler.connect(websocket, "shared")
+        handler.disconnect(websocket, "shared")
+        handler.session_manager.evict("shared")
+        await asyncio.sleep(0)
+        assert backplane._subscribers == {}
@@ -4,10 +4,14 @@ Unit tests for interactive.websocket.broadcast_service module.
 Tests the BroadcastService class.
 """
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, Mock
 
 from diagramaid.interactive.websocket.broadcast_service import BroadcastService
+from diagramaid.interactive.websocket.session_manager import DiagramSession
 
 
 @pytest.mark.unit
@@ -51,3 +55,90 @@ class TestBroadcastService:
         result = await service.send_error(mock_ws, "Test error", "test_code")
         assert result is True
         mock_ws.send_text.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_does_not_wait_for_slow_client(self) -> None:
+        """Test that a slow client does not delay the others."""
+        service = BroadcastService()
+        release = asyncio.Event()
+
+        async def slow_send(text: str) -> None:
+            await release.wait()
+
+        slow_ws = AsyncMock()
+        slow_ws.send_text.side_effect = slow_send
+        fast_ws = AsyncMock()
+        session = DiagramSession("session1", Mock())
+        session.add_client(slow_ws)
+        session.add_client(fast_ws)
+
+        await service.send_to_session(session, {"type": "element_updated"})
+        await service.flush(fast_ws)
+        fast_ws.send_text.assert_called_once()
+        assert service.get_queue_stats()["sent"] == 1
+
+        release.set()
+        await service.flush()
+        assert service.get_queue_stats()["sent"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cursor_updates_coalesce(self) -> None:
+        """Test that queued cursor updates keep only the latest position."""
+        service = BroadcastService()
+        mock_ws = AsyncMock()
+        session = DiagramSession("session1", Mock())
+        session.add_client(mock_ws)
+
+        for x in range(5):
+            await service.send_to_session(
+                session,
+                {"type": "cursor_update", "client_id": "a", "position": {"x": x}},
+            )
+        await service.send_to_session(
+            session, {"type": "cursor_update", "client_id": "b", "position": {}}
+        )
+        await service.flush()
+
+        sent = [json.loads(call.args[0]) for call in mock_ws.send_text.call_args_list]
+        assert [(m["client_id"], m["position"]) for m in sent] == [
+            ("a", {"x": 4}),
+            ("b", {}),
+        ]
+        assert service.get_queue_stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_overflowing_client_disconnected(self) -> None:
+        """Test that a client whose queue overflows is closed and reported."""
+        service = BroadcastService(max_queue_size=2)
+
+        async def stuck_send(text: str) -> None:
+            await asyncio.Event().wait()
+
+        stuck_ws = AsyncMock()
+        stuck_ws.send_text.side_effect = stuck_send
+        session = DiagramSession("session1", Mock())
+        session.add_client(stuck_ws)
+
+        for index in range(3):
+            disconnected = await service.send_to_session(
+                session, {"type": "element_updated", "index": index}
+            )
+        await asyncio.sleep(0)
+
+        assert disconnected == {stuck_ws}
+        stuck_ws.close.assert_called_once()
+        assert service.get_queue_stats()["overflows"] == 1
+        assert service.get_queue_stats()["clients"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_client_reported_on_next_broadcast(self) -> None:
+        """Test that a client failing in its writer is reported later."""
+        service = BroadcastService()
+        mock_ws = AsyncMock()
+        mock_ws.send_text.side_effect = Exception("Connection closed")
+        session = DiagramSession("session1", Mock())
+        session.add_client(mock_ws)
+
+        assert await service.send_to_session(session, {"type": "a"}) == set()
+        await service.flush()
+        assert await service.send_to_session(session, {"type": "b"}) == {mock_ws}
@@ -55,3 +55,40 @@ class TestMessageDispatcher:
         assert "connection_update" in dispatcher._handlers
         assert "cursor_update" in dispatcher._handlers
         assert "ping" in dispatcher._handlers
+
+    @pytest.mark.asyncio
+    async def test_code_edit_broadcasts_changes(self) -> None:
+        """Test that code edits are applied and their changes broadcast."""
+        from diagramaid.interactive.builder import DiagramBuilder
+        from diagramaid.interactive.websocket.session_manager import DiagramSession
+
+        builder = DiagramBuilder()
+        builder.load_from_mermaid_code("flowchart TD\n    A --> B")
+        session = DiagramSession("session1", builder)
+        broadcast_service = Mock(spec=BroadcastService)
+        broadcast_service.send_to_session = AsyncMock(return_value=[])
+        dispatcher = MessageDispatcher(broadcast_service)
+
+        edit = {
+            "start_line": 1,
+            "start_column": 10,
+            "end_line": 1,
+            "end_column": 11,
+            "text": "C",
+        }
+        await dispatcher.dispatch(session, {"type": "code_edit", "edit": edit})
+        message = broadcast_service.send_to_session.call_args.args[1]
+        assert message["type"] == "code_edited"
+        assert message["revision"] == builder.revision
+        assert {(op["op"], op["path"]) for op in message["ops"]} == {
+            ("add", "/elements/C"),
+            ("add", "/connections/conn_A_C_0"),
+            ("remove", "/connections/conn_A_B_0"),
+            ("remove", "/elements/B"),
+        }
+
+        # Out-of-range edits are ignored
+        broadcast_service.send_to_session.reset_mock()
+        edit["start_line"] = edit["end_line"] = 5
+        await dispatcher.dispatch(session, {"type": "code_edit", "edit": edit})
+        broadcast_service.send_to_session.assert_not_called()
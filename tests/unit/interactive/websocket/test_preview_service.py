@@ -0,0 +1,164 @@
+"""
+Unit tests for interactive.websocket.preview_service module.
+
+Tests revision-keyed preview caching and debounced preview pushes.
+"""
+
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from diagramaid.interactive.builder import DiagramBuilder
+from diagramaid.interactive.models import ElementType, Position
+from diagramaid.interactive.scheduler import RenderScheduler
+from diagramaid.interactive.websocket import (
+    BroadcastService,
+    DiagramSession,
+    MessageDispatcher,
+    PreviewService,
+)
+
+
+@pytest.fixture
+def renderer() -> Mock:
+    renderer = Mock()
+    renderer.render_raw.side_effect = lambda code, format, **options: (
+        f"<svg><desc>{code}</desc></svg>"
+    )
+    return renderer
+
+
+@pytest.fixture
+def session() -> DiagramSession:
+    builder = DiagramBuilder()
+    builder.add_element(ElementType.NODE, "Start", Position(0, 0))
+    return DiagramSession("session1", builder)
+
+
+def _pushed(client: AsyncMock) -> list[dict]:
+    return [json.loads(call.args[0]) for call in client.send_text.call_args_list]
+
+
+@pytest.mark.unit
+class TestPreviewService:
+    """Unit tests for PreviewService class."""
+
+    def test_revision_advances(self, session: DiagramSession) -> None:
+        """Test that builder changes advance the revision."""
+        builder = session.builder
+        revision = builder.revision
+        element_id = next(iter(builder.elements))
+        builder.update_element(element_id, label="Renamed")
+        assert builder.revision == revision + 1
+        builder.from_dict(builder.to_dict())
+        assert builder.revision == revision + 2
+
+    @pytest.mark.asyncio
+    async def test_render_cached_by_revision(
+        self, renderer: Mock, session: DiagramSession
+    ) -> None:
+        """Test that an unchanged revision is rendered once per theme."""
+        service = PreviewService(renderer, RenderScheduler())
+        first = await service.render(session)
+        assert await service.render(session) == first
+        await service.render(session, theme="dark")
+
+        assert renderer.render_raw.call_count == 2
+        assert renderer.render_raw.call_args.kwargs == {"theme": "dark"}
+        assert service.get_stats()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_code_reuses_render(
+        self, renderer: Mock, session: DiagramSession
+    ) -> None:
+        """Test that moving an element does not re-render."""
+        service = PreviewService(renderer, RenderScheduler())
+        await service.render(session)
+        element_id = next(iter(session.builder.elements))
+        session.builder.update_element(element_id, position=Position(50, 50))
+        await service.render(session)
+
+        assert renderer.render_raw.call_count == 1
+        assert service.get_stats()["unchanged_code"] == 1
+
+    @pytest.mark.asyncio
+    async def test_builders_sharing_session_id(
+        self, renderer: Mock, session: DiagramSession
+    ) -> None:
+        """Test that another builder under the same session ID is not cached."""
+        builder = DiagramBuilder()
+        builder.add_element(ElementType.NODE, "Other", Position(0, 0))
+        other = DiagramSession("session1", builder)
+        assert other.builder.revision == session.builder.revision
+
+        service = PreviewService(renderer, RenderScheduler())
+        first = await service.render(session)
+        second = await service.render(other)
+
+        assert "Start" in first and "Other" in second
+        assert renderer.render_raw.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_push_only_when_changed(
+        self, renderer: Mock, session: DiagramSession
+    ) -> None:
+        """Test that identical previews are not pushed twice."""
+        broadcast_service = BroadcastService()
+        service = PreviewService(renderer, RenderScheduler(), broadcast_service)
+        client = AsyncMock()
+        session.add_client(client)
+
+        assert await service.push(session) is True
+        await broadcast_service.flush()
+        element_id = next(iter(session.builder.elements))
+        session.builder.update_element(element_id, position=Position(5, 5))
+        assert await service.push(session) is False
+        session.builder.update_element(element_id, label="Changed")
+        assert await service.push(session) is True
+        await broadcast_service.flush()
+
+        messages = _pushed(client)
+        assert [message["type"] for message in messages] == ["preview_updated"] * 2
+        assert messages[-1]["revision"] == session.builder.revision
+        assert "Changed" in messages[-1]["content"]
+        assert service.get_stats()["skipped_pushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dispatcher_debounces_pushes(
+        self, renderer: Mock, session: DiagramSession
+    ) -> None:
+        """Test that a burst of updates results in a single push."""
+        broadcast_service = BroadcastService()
+        service = PreviewService(
+            renderer, RenderScheduler(), broadcast_service, debounce_delay=0.01
+        )
+        dispatcher = MessageDispatcher(broadcast_service, service)
+        client = AsyncMock()
+        session.add_client(client)
+        element_id = next(iter(session.builder.elements))
+
+        for label in ("A", "B", "C"):
+            await dispatcher.dispatch(
+                session,
+                {
+                    "type": "element_update",
+                    "element_id": element_id,
+                    "updates": {"label": label},
+                },
+            )
+        await service._pending_pushes["session1"]
+        await broadcast_service.flush()
+
+        previews = [m for m in _pushed(client) if m["type"] == "preview_updated"]
+        assert len(previews) == 1
+        assert "C" in previews[0]["content"]
+        assert renderer.render_raw.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_forget(self, renderer: Mock, session: DiagramSession) -> None:
+        """Test that forgetting a session drops its cached previews."""
+        service = PreviewService(renderer, RenderScheduler())
+        await service.render(session)
+        service.forget("session1")
+        assert service.get_stats()["cached_previews"] == 0
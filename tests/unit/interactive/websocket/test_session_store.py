@@ -0,0 +1,168 @@
+"""
+Unit tests for interactive.websocket.session_store module.
+
+Tests session snapshots, LRU eviction and rehydration in SessionManager.
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from diagramaid.interactive.builder import DiagramBuilder
+from diagramaid.interactive.models import ElementType, Position
+from diagramaid.interactive.websocket import (
+    DiagramSession,
+    SessionManager,
+    SessionMapping,
+    SQLiteSessionStore,
+)
+
+
+def _builder(*labels: str) -> DiagramBuilder:
+    builder = DiagramBuilder()
+    for label in labels:
+        builder.add_element(ElementType.NODE, label, Position(0, 0))
+    return builder
+
+
+@pytest.mark.unit
+class TestSQLiteSessionStore:
+    """Unit tests for SQLiteSessionStore class."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test saving, loading, listing and deleting snapshots."""
+        store = SQLiteSessionStore(tmp_path / "sessions.db")
+        store.save("a", {"value": 1})
+        store.save_many([("b", {"value": 2}), ("a", {"value": 3})])
+
+        assert store.load("a") == {"value": 3}
+        assert store.contains("b")
+        assert sorted(store.list_sessions()) == ["a", "b"]
+        assert store.delete("a") is True
+        assert store.delete("a") is False
+        assert store.load("a") is None
+        store.close()
+
+
+@pytest.mark.unit
+class TestSessionEviction:
+    """Unit tests for SessionManager eviction and rehydration."""
+
+    def test_lru_eviction_and_rehydration(self) -> None:
+        """Test that the least recently used empty session is evicted."""
+        store = SQLiteSessionStore()
+        manager = SessionManager(max_sessions=2, store=store)
+        first = manager.create_session("a", _builder("A"))
+        revision = first.builder.revision
+        manager.create_session("b", _builder("B"))
+        manager.get_session("a")
+        manager.create_session("c", _builder("C"))
+
+        assert list(manager.sessions) == ["a", "c"]
+        assert store.contains("b")
+        assert manager.has_session("b")
+
+        restored = manager.get_session("b")
+        assert restored is not None
+        assert [e.label for e in restored.builder.elements.values()] == ["B"]
+        assert list(manager.sessions) == ["c", "b"]
+        assert manager.get_stats()["rehydrated"] == 1
+        # Revisions keep increasing across eviction
+        assert manager.get_session("a") is not None
+        assert manager.get_session("a").builder.revision > revision
+
+    def test_sessions_with_clients_stay_loaded(self) -> None:
+        """Test that sessions with connected clients are never evicted."""
+        manager = SessionManager(max_sessions=1, store=SQLiteSessionStore())
+        manager.create_session("a", _builder()).add_client(Mock())
+        manager.create_session("b", _builder())
+        assert set(manager.sessions) == {"a", "b"}
+
+    def test_idle_and_memory_eviction(self) -> None:
+        """Test eviction by idle time and by memory budget."""
+        manager = SessionManager(store=SQLiteSessionStore(), max_idle=60)
+        manager.create_session("a", _builder("A"))
+        manager.create_session("b", _builder("B"))
+        assert manager.evict_idle() == []
+        assert manager.evict_idle(now=manager._last_access["b"] + 61) == ["a", "b"]
+
+        manager.get_session("a")
+        manager.get_session("b")
+        manager.max_memory = manager.estimate_memory() - 1
+        assert manager.evict_idle() == ["a"]
+
+    def test_checkpoint_writes_changed_sessions(self) -> None:
+        """Test that checkpoints only write sessions changed since the last."""
+        manager = SessionManager(store=SQLiteSessionStore())
+        session = manager.create_session("a", _builder("A"))
+        manager.create_session("b", _builder("B"))
+
+        assert manager.checkpoint() == 2
+        assert manager.checkpoint() == 0
+        session.builder.add_element(ElementType.NODE, "A2", Position(0, 0))
+        assert asyncio.run(manager.checkpoint_async()) == 1
+
+    def test_survives_restart(self, tmp_path: Path) -> None:
+        """Test that sessions are restored by a new manager from the store."""
+        path = tmp_path / "sessions.db"
+        manager = SessionManager(store=SQLiteSessionStore(path))
+        manager.create_session("a", _builder("A", "B"))
+        manager.close()
+
+        restarted = SessionManager(store=SQLiteSessionStore(path))
+        session = restarted.get_session("a")
+        assert session is not None
+        assert len(session.builder.elements) == 2
+
+        restarted.remove_session("a")
+        assert not restarted.has_session("a")
+
+    def test_unload_callbacks(self) -> None:
+        """Test that unloading a session notifies callbacks."""
+        manager = SessionManager(store=SQLiteSessionStore())
+        unloaded: list[str] = []
+        manager.unload_callbacks.append(unloaded.append)
+        manager.create_session("a", _builder())
+        manager.create_session("b", _builder())
+        manager.evict("a")
+        manager.remove_session("b")
+        assert unloaded == ["a", "b"]
+
+    def test_reload(self) -> None:
+        """Test replacing a loaded session with its stored snapshot."""
+        store = SQLiteSessionStore()
+        manager = SessionManager(store=store)
+        other = SessionManager(store=store)
+        session = manager.create_session("a", _builder("A"))
+        manager.checkpoint()
+        assert other.get_session("a") is not None
+        session.builder.add_element(ElementType.NODE, "B", Position(0, 0))
+        manager.checkpoint()
+
+        reloaded = other.reload("a")
+        assert reloaded is not None
+        assert len(reloaded.builder.elements) == 2
+        assert other.checkpoint() == 0
+        manager.remove_session("a")
+        assert other.reload("a") is None
+        assert "a" not in other.sessions
+
+    def test_mapping(self) -> None:
+        """Test the dictionary view over loaded and stored sessions."""
+        store = SQLiteSessionStore()
+        sessions = SessionMapping(SessionManager(max_sessions=1, store=store))
+        sessions["a"] = DiagramSession("a", _builder("A"))
+        sessions["b"] = DiagramSession("b", _builder("B"))
+
+        assert list(sessions) == ["b"] and len(sessions) == 1
+        assert "a" in sessions and "c" not in sessions
+        assert sessions["a"].session_id == "a"
+        assert sessions.get("c") is None
+        del sessions["a"]
+        assert not store.contains("a")
+        with pytest.raises(KeyError):
+            del sessions["a"]
+        with pytest.raises(ValueError):
+            sessions["c"] = DiagramSession("d", _builder())
@@ -0,0 +1,128 @@
+"""
+Unit tests for delta state sync and WebSocket message encodings.
+
+Tests revision-based resumption and codec negotiation.
+"""
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from diagramaid.interactive.builder import DiagramBuilder
+from diagramaid.interactive.models import ElementType, Position
+from diagramaid.interactive.server.websocket_endpoint import setup_websocket_endpoint
+from diagramaid.interactive.websocket import (
+    BroadcastService,
+    DiagramSession,
+    WebSocketHandler,
+    available_encodings,
+    negotiate_codec,
+)
+
+ORIGIN = {"origin": "http://localhost:8080"}
+
+
+@pytest.mark.unit
+class TestStateSync:
+    """Unit tests for full and delta state sync."""
+
+    @pytest.mark.asyncio
+    async def test_delta_when_revision_known(self) -> None:
+        """Test that a known revision yields a delta."""
+        builder = DiagramBuilder()
+        builder.add_element(ElementType.NODE, "A", Position(0, 0))
+        revision = builder.revision
+        element = builder.add_element(ElementType.NODE, "B", Position(0, 0))
+        session = DiagramSession("session1", builder)
+        service = BroadcastService()
+        client = AsyncMock()
+
+        await service.send_state_sync(client, session, since_revision=revision)
+        delta = json.loads(client.send_text.call_args.args[0])
+        assert delta["type"] == "state_delta"
+        assert delta["from_revision"] == revision
+        assert delta["revision"] == builder.revision
+        assert delta["ops"] == [
+            {
+                "op": "add",
+                "path": f"/elements/{element.id}",
+                "value": element.to_dict(),
+            }
+        ]
+
+        await service.send_state_sync(client, session, since_revision=-1)
+        full = json.loads(client.send_text.call_args.args[0])
+        assert full["type"] == "state_sync"
+        assert full["revision"] == builder.revision
+        assert full["encoding"] == "json"
+        assert len(full["elements"]) == 2
+
+    def test_resume_and_sync_request(self) -> None:
+        """Test resuming over the endpoint and requesting a resync."""
+        handler = WebSocketHandler()
+        app = FastAPI()
+        setup_websocket_endpoint(app, handler)
+
+        with TestClient(app) as client:
+            with client.websocket_connect("/ws/session1", headers=ORIGIN) as ws:
+                full = ws.receive_json()
+                ws.receive_json()  # client count update
+                builder = handler.sessions["session1"].builder
+                element = builder.add_element(ElementType.NODE, "A", Position(0, 0))
+                ws.send_json(
+                    {
+                        "type": "sync_request",
+                        "revision": full["revision"],
+                        "history_id": full["history_id"],
+                    }
+                )
+                delta = ws.receive_json()
+
+                url = (
+                    f"/ws/session1?revision={delta['revision']}"
+                    f"&history_id={full['history_id']}&encoding=unknown,json"
+                )
+                with client.websocket_connect(url, headers=ORIGIN) as resumed_ws:
+                    resumed = resumed_ws.receive_json()
+
+                url = "/ws/session1?revision=0&history_id=other"
+                with client.websocket_connect(url, headers=ORIGIN) as stale_ws:
+                    stale = stale_ws.receive_json()
+
+        assert full["type"] == "state_sync"
+        assert delta["type"] == "state_delta"
+        assert delta["ops"][0]["path"] == f"/elements/{element.id}"
+        assert resumed["type"] == "state_delta"
+        assert resumed["from_revision"] == resumed["revision"] == builder.revision
+        assert resumed["ops"] == []
+        assert stale["type"] == "state_sync"
+
+
+@pytest.mark.unit
+class TestCodecs:
+    """Unit tests for message codec negotiation."""
+
+    def test_negotiation_falls_back_to_json(self) -> None:
+        """Test that unknown encodings fall back to JSON."""
+        assert "json" in available_encodings()
+        assert negotiate_codec(None).name == "json"
+        assert negotiate_codec("bson, JSON").name == "json"
+
+    def test_msgpack_round_trip(self) -> None:
+        """Test binary frames with MessagePack."""
+        pytest.importorskip("msgpack")
+        codec = negotiate_codec("msgpack")
+        message = {"type": "element_updated", "updates": {"label": "A"}}
+        data = codec.encode(message)
+        assert codec.binary and isinstance(data, bytes)
+        assert codec.decode(data) == message
+
+    def test_cbor_round_trip(self) -> None:
+        """Test binary frames with CBOR."""
+        pytest.importorskip("cbor2")
+        codec = negotiate_codec("cbor")
+        message = {"type": "state_delta", "ops": [{"op": "remove", "path": "/x"}]}
+        assert codec.decode(codec.encode(message)) == message
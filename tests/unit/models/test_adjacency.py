@@ -0,0 +1,188 @@
+"""
+Unit tests for the adjacency index and its use by FlowchartDiagram.
+
+Object and columnar storage are exercised with the same scenarios.
+"""
+
+import pytest
+
+from diagramaid.exceptions import DiagramError
+from diagramaid.models.adjacency import AdjacencyIndex
+from diagramaid.models.flowchart import FlowchartDiagram, FlowchartEdge
+
+
+class TestAdjacencyIndex:
+    """Test AdjacencyIndex bookkeeping and graph checks."""
+
+    def test_neighbour_queries(self) -> None:
+        """Test outgoing, incoming and degree queries."""
+        index = AdjacencyIndex([("e1", "A", "B"), ("e2", "A", "C"), ("e3", "C", "A")])
+
+        assert index.outgoing("A") == ["e1", "e2"]
+        assert index.incoming("A") == ["e3"]
+        assert index.touching("A") == ["e1", "e2", "e3"]
+        assert index.successors("A") == ["B", "C"]
+        assert index.predecessors("A") == ["C"]
+        assert index.out_degree("A") == 2
+        assert index.in_degree("B") == 1
+        assert index.degree("A") == 3
+        assert index.degree("missing") == 0
+
+    def test_discard_and_replace(self) -> None:
+        """Test that discarding and re-adding keys keeps the index exact."""
+        index = AdjacencyIndex([("e1", "A", "B"), ("e2", "B", "C")])
+
+        assert index.discard("e1") is True
+        assert index.discard("e1") is False
+        assert index.outgoing("A") == []
+        assert "A" not in index.nodes()
+
+        index.add("e2", "C", "A")
+        assert index.endpoints("e2") == ("C", "A")
+        assert index.incoming("C") == []
+        assert len(index) == 1
+
+        assert index.discard_many(["e2", "missing"]) == 1
+        assert len(index) == 0
+
+    def test_self_loop_touching_once(self) -> None:
+        """Test that a self-loop is reported once per node."""
+        index = AdjacencyIndex([("loop", "A", "A")])
+
+        assert index.touching("A") == ["loop"]
+        assert index.degree("A") == 2
+
+    def test_reachability(self) -> None:
+        """Test reachable and has_path."""
+        index = AdjacencyIndex([(1, "A", "B"), (2, "B", "C"), (3, "D", "A")])
+
+        assert index.reachable("A") == {"A", "B", "C"}
+        assert index.has_path("D", "C")
+        assert not index.has_path("C", "A")
+
+    def test_cycle_detection(self) -> None:
+        """Test find_cycle on acyclic and cyclic graphs."""
+        index = AdjacencyIndex([(1, "A", "B"), (2, "A", "C"), (3, "B", "C")])
+        assert index.find_cycle() is None
+        assert not index.has_cycle()
+
+        index.add(4, "C", "B")
+        assert index.find_cycle() == ["B", "C"]
+        assert index.has_cycle()
+
+    def test_cycle_detection_deep_chain(self) -> None:
+        """Test that long chains do not hit the recursion limit."""
+        size = 20000
+        index = AdjacencyIndex((i, i, i + 1) for i in range(size))
+
+        assert not index.has_cycle()
+        index.add("back", size, 0)
+        assert len(index.find_cycle()) == size + 1
+
+
+@pytest.mark.parametrize("storage", ["object", "columnar"])
+class TestFlowchartAdjacency:
+    """Test FlowchartDiagram neighbour queries and node removal."""
+
+    def _diagram(self, storage: str) -> FlowchartDiagram:
+        diagram = FlowchartDiagram(storage=storage)
+        for node_id in "ABCDE":
+            diagram.add_node(node_id, node_id)
+        diagram.add_edge("A", "B")
+        diagram.add_edge("A", "C", label="yes")
+        diagram.add_edge("B", "D")
+        diagram.add_edge("C", "D")
+        diagram.add_edge("D", "E")
+        return diagram
+
+    def test_edge_queries(self, storage: str) -> None:
+        """Test get_edges_from and get_edges_to."""
+        diagram = self._diagram(storage)
+
+        assert [e.to_node for e in diagram.get_edges_from("A")] == ["B", "C"]
+        assert [e.from_node for e in diagram.get_edges_to("D")] == ["B", "C"]
+        assert diagram.get_edges_from("E") == []
+        assert diagram.adjacency.reachable("B") == {"B", "D", "E"}
+
+    def test_remove_nodes_bulk(self, storage: str) -> None:
+        """Test removing several nodes and their edges at once."""
+        diagram = self._diagram(storage)
+        expected = FlowchartDiagram()
+        for node_id in "ADE":
+            expected.add_node(node_id, node_id)
+        expected.add_edge("D", "E")
+
+        diagram.remove_nodes(["B", "C"])
+
+        assert list(diagram.nodes) == ["A", "D", "E"]
+        assert [(e.from_node, e.to_node) for e in diagram.edges] == [("D", "E")]
+        assert diagram.adjacency.touching("A") == []
+        assert diagram.to_mermaid() == expected.to_mermaid()
+
+    def test_remove_nodes_validates_first(self, storage: str) -> None:
+        """Test that an unknown ID leaves the diagram untouched."""
+        diagram = self._diagram(storage)
+
+        with pytest.raises(DiagramError):
+            diagram.remove_nodes(["A", "missing"])
+
+        assert "A" in diagram.nodes
+        assert len(diagram.edges) == 5
+
+    def test_edge_endpoint_change_reindexed(self, storage: str) -> None:
+        """Test that retargeting a bound edge updates the index."""
+        diagram = self._diagram(storage)
+        _ = diagram.adjacency  # Build the index before mutating
+
+        diagram.get_edges_from("D")[0].to_node = "A"
+
+        assert diagram.adjacency.incoming("E") == []
+        assert diagram.adjacency.has_cycle()
+
+
+class TestFlowchartAdjacencyObjectStorage:
+    """Test index maintenance for direct edits of object-mode edge lists."""
+
+    def test_direct_list_edits(self) -> None:
+        """Test that direct list edits are reflected by the index."""
+        diagram = FlowchartDiagram()
+        diagram.add_node("A", "A")
+        diagram.add_node("B", "B")
+        diagram.add_edge("A", "B")
+
+        diagram.edges.append(FlowchartEdge("B", "A"))
+        assert diagram.adjacency.has_cycle()
+
+        diagram.edges.pop()
+        diagram.edges.insert(0, FlowchartEdge("B", "B"))
+        assert diagram.adjacency.touching("B") == [diagram.edges[0], diagram.edges[1]]
+
+    def test_reassigned_edge_list(self) -> None:
+        """Test that assigning a new list re-indexes the edges."""
+        diagram = FlowchartDiagram()
+        diagram.add_node("A", "A")
+        diagram.add_node("B", "B")
+        diagram.add_edge("A", "B")
+        _ = diagram.adjacency
+
+        diagram.edges = [FlowchartEdge("B", "A")]
+
+        assert diagram.adjacency.outgoing("A") == []
+        assert diagram.get_edges_from("B") == diagram.edges
+
+    def test_remove_node_skips_unrelated_edges(self) -> None:
+        """Test that removing a node does not scan the whole edge list."""
+        from unittest.mock import patch
+
+        diagram = FlowchartDiagram()
+        diagram.add_nodes([(f"n{i}", f"N{i}") for i in range(50)])
+        diagram.add_edges([(f"n{i}", f"n{i + 1}") for i in range(49)])
+        _ = diagram.adjacency
+
+        with patch.object(type(diagram.edges), "_list", side_effect=AssertionError):
+            diagram.remove_node("n10")
+
+        assert len(diagram.edges) == 47
+        assert [e.to_node for e in diagram.edges[8:10]] == ["n9", "n12"]
+        assert diagram.edges.pop(0).from_node == "n0"
+        assert diagram.adjacency.outgoing("n0") == []
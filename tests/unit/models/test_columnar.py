@@ -0,0 +1,232 @@
+"""
+Unit tests for columnar flowchart storage.
+
+Tests NodeTable and EdgeTable through FlowchartDiagram(storage="columnar"),
+checking that output and mutation semantics match object storage.
+"""
+
+import pytest
+
+from diagramaid.exceptions import DiagramError
+from diagramaid.models.columnar import EdgeTable, NodeTable, read_columns
+from diagramaid.models.constants import EMPTY_STYLE
+from diagramaid.models.flowchart import FlowchartDiagram, FlowchartNode
+
+
+def _build(storage: str, size: int = 50) -> FlowchartDiagram:
+    diagram = FlowchartDiagram(storage=storage)
+    for i in range(size):
+        diagram.add_node(f"n{i}", f"Node {i}", "rounded" if i % 2 else "rectangle")
+    for i in range(1, size):
+        diagram.add_edge(f"n{i - 1}", f"n{i}", "next" if i % 3 == 0 else None)
+    return diagram
+
+
+class TestColumnarFlowchart:
+    """Test FlowchartDiagram with columnar storage."""
+
+    def test_storage_types(self) -> None:
+        """Test that columnar mode uses table-backed containers."""
+        diagram = FlowchartDiagram(storage="columnar")
+
+        assert isinstance(diagram.nodes, NodeTable)
+        assert isinstance(diagram.edges, EdgeTable)
+
+    def test_invalid_storage_mode(self) -> None:
+        """Test that unknown storage modes are rejected."""
+        with pytest.raises(DiagramError, match="Invalid storage mode"):
+            FlowchartDiagram(storage="invalid")
+
+    def test_output_matches_object_storage(self) -> None:
+        """Test that both storage modes emit identical Mermaid."""
+        assert _build("columnar").to_mermaid() == _build("object").to_mermaid()
+
+    def test_mutations_match_object_storage(self) -> None:
+        """Test write-back of materialized elements, removals and deletions."""
+        objects = _build("object")
+        columns = _build("columnar")
+        objects.to_mermaid()
+        columns.to_mermaid()
+
+        for diagram in (objects, columns):
+            diagram.nodes["n5"].label = "Changed"
+            diagram.nodes["n6"].shape = "circle"
+            diagram.remove_node("n7")
+            del diagram.edges[3]
+            diagram.edges[10].label = "relabelled"
+            diagram.add_node("extra", "Extra")
+            diagram.add_edge("extra", "n0")
+
+        assert columns.to_mermaid() == objects.to_mermaid()
+        assert columns.to_mermaid() == columns._generate_mermaid()
+        assert len(columns.nodes) == len(objects.nodes)
+        assert len(columns.edges) == len(objects.edges)
+
+    def test_materialized_nodes(self) -> None:
+        """Test that nodes are materialized from rows on access."""
+        diagram = FlowchartDiagram(storage="columnar")
+        diagram.add_node("A", "Start", shape="circle")
+
+        node = diagram.nodes["A"]
+
+        assert isinstance(node, FlowchartNode)
+        assert (node.id, node.label, node.shape) == ("A", "Start", "circle")
+        assert node.style is EMPTY_STYLE
+        assert "A" in diagram.nodes
+        assert list(diagram.nodes) == ["A"]
+
+    def test_duplicate_and_invalid_rows(self) -> None:
+        """Test validation performed by the tables."""
+        diagram = FlowchartDiagram(storage="columnar")
+        diagram.add_node("A", "Start")
+
+        with pytest.raises(DiagramError, match="already exists"):
+            diagram.add_node("A", "Again")
+        with pytest.raises(DiagramError, match="Unknown node shape"):
+            diagram.nodes.append_row("B", "Bad", "invalid")  # type: ignore[attr-defined]
+
+    def test_node_id_is_immutable(self) -> None:
+        """Test that renaming a materialized node is rejected."""
+        diagram = FlowchartDiagram(storage="columnar")
+        node = diagram.add_node("A", "Start")
+
+        with pytest.raises(DiagramError, match="cannot be changed"):
+            node.id = "B"
+
+    def test_compaction_keeps_output_consistent(self) -> None:
+        """Test that compacting tombstoned rows does not corrupt the cache."""
+        diagram = _build("columnar", size=3000)
+        diagram.to_mermaid()
+
+        for i in range(0, 2500, 2):
+            diagram.remove_node(f"n{i}")
+
+        assert diagram.to_mermaid() == diagram._generate_mermaid()
+        assert len(diagram.edges) == 0 or diagram.edges[0].from_node != "n0"
+
+
+class TestBulkLoading:
+    """Test add_nodes / add_edges in both storage modes."""
+
+    @pytest.mark.parametrize("storage", ["object", "columnar"])
+    def test_bulk_matches_incremental(self, storage: str) -> None:
+        """Test that bulk loading produces the same diagram as add_node/add_edge."""
+        expected = _build(storage, size=30)
+        ids = [f"n{i}" for i in range(30)]
+        diagram = FlowchartDiagram(storage=storage)
+
+        added_nodes = diagram.add_nodes(
+            {
+                "id": ids,
+                "label": [f"Node {i}" for i in range(30)],
+                "shape": ["rounded" if i % 2 else "rectangle" for i in range(30)],
+            }
+        )
+        added_edges = diagram.add_edges(
+            (ids[i - 1], ids[i], "next" if i % 3 == 0 else None) for i in range(1, 30)
+        )
+
+        assert (added_nodes, added_edges) == (30, 29)
+        assert diagram.to_mermaid() == expected.to_mermaid()
+        assert [e.to_node for e in diagram.get_edges_from("n3")] == ["n4"]
+
+    @pytest.mark.parametrize("storage", ["object", "columnar"])
+    def test_bulk_updates_cached_output(self, storage: str) -> None:
+        """Test that bulk additions after a render reach the next render."""
+        diagram = FlowchartDiagram(storage=storage)
+        diagram.add_node("A", "Start")
+        diagram.to_mermaid()
+
+        diagram.add_nodes([{"id": "B"}, {"id": "C", "label": "End", "shape": "circle"}])
+        diagram.add_edges([{"from_node": "A", "to_node": "B", "arrow_type": "thick"}])
+
+        assert diagram.to_mermaid().splitlines()[1:] == [
+            "    A[Start]",
+            "    B[B]",
+            "    C((End))",
+            "    A ==> B",
+        ]
+
+    @pytest.mark.parametrize("storage", ["object", "columnar"])
+    def test_bulk_validation_is_atomic(self, storage: str) -> None:
+        """Test that invalid bulk input raises without adding anything."""
+        diagram = FlowchartDiagram(storage=storage)
+        diagram.add_node("A", "Start")
+
+        with pytest.raises(DiagramError, match="already exists"):
+            diagram.add_nodes({"id": ["B", "A"]})
+        with pytest.raises(DiagramError, match="already exists"):
+            diagram.add_nodes({"id": ["B", "B"]})
+        with pytest.raises(DiagramError, match="Unknown node shape"):
+            diagram.add_nodes({"id": ["B"], "shape": ["blob"]})
+        with pytest.raises(DiagramError, match="Target node 'Z'"):
+            diagram.add_edges([("A", "Z")])
+        with pytest.raises(DiagramError, match="Invalid edge type"):
+            diagram.add_edges([("A", "A", None, "zigzag")])
+
+        assert list(diagram.nodes) == ["A"]
+        assert len(diagram.edges) == 0
+        assert diagram.add_nodes([]) == 0
+
+    def test_read_columns_inputs(self) -> None:
+        """Test normalization of rows, tuples and array-like columns."""
+
+        class ArrowLike:
+            def __init__(self, values: list) -> None:
+                self.values = values
+
+            def to_pylist(self) -> list:
+                return list(self.values)
+
+        names = ("id", "label")
+        assert read_columns([("a", "A"), ("b", "B")], names) == {
+            "id": ["a", "b"],
+            "label": ["A", "B"],
+        }
+        assert read_columns([("a",), ("b",)], names) == {
+            "id": ["a", "b"],
+            "label": None,
+        }
+        assert read_columns({"id": ArrowLike(["a"])}, names) == {
+            "id": ["a"],
+            "label": None,
+        }
+        with pytest.raises(DiagramError, match="same length"):
+            read_columns({"id": ["a"], "label": []}, names)
+
+
+class TestSlottedElements:
+    """Test compact element storage of object mode."""
+
+    def test_elements_have_no_instance_dict(self) -> None:
+        """Test that flowchart elements use __slots__."""
+        diagram = FlowchartDiagram()
+        node = diagram.add_node("A", "Start")
+        diagram.add_node("B", "End")
+        edge = diagram.add_edge("A", "B")
+
+        assert not hasattr(node, "__dict__")
+        assert not hasattr(edge, "__dict__")
+
+    def test_empty_style_is_shared(self) -> None:
+        """Test that unstyled elements share the immutable sentinel."""
+        first = FlowchartNode("A", "Start")
+        second = FlowchartNode("B", "End")
+
+        assert first.style is EMPTY_STYLE
+        assert second.style is EMPTY_STYLE
+
+        first.update_style({"fill": "#f00"})
+
+        assert first.style == {"fill": "#f00"}
+        assert second.style == {}
+
+    def test_empty_style_survives_copy_and_pickle(self) -> None:
+        """Test that copies of unstyled elements keep the shared sentinel."""
+        import copy
+        import pickle
+
+        node = FlowchartNode("A", "Start")
+
+        assert copy.deepcopy(node).style is EMPTY_STYLE
+        assert pickle.loads(pickle.dumps(EMPTY_STYLE)) is EMPTY_STYLE
@@ -14,6 +14,7 @@ from diagramaid import (
     PieChartDiagram,
     GitGraphDiagram,
     MindmapDiagram,
+    TimelineDiagram,
 )
 from diagramaid.models.class_diagram import ClassAttribute, ClassMethod
 from diagramaid.models.sequence import SequenceMessage
@@ -227,6 +228,187 @@ class TestClassDiagramComprehensive:
         for cls_name in classes:
             assert cls_name in mermaid_code
 
+    def test_nested_member_changes_invalidate_cache(self) -> None:
+        """Test that members added after rendering appear in the output."""
+        diagram = ClassDiagram()
+        animal = diagram.add_class("Animal")
+        diagram.to_mermaid()
+
+        animal.add_method(ClassMethod("eat", "public", "void"))
+        diagram.add_class("Dog")
+        diagram.add_relationship("Dog", "Animal", "inheritance")
+
+        mermaid_code = diagram.to_mermaid()
+        assert "+eat() void" in mermaid_code
+        assert "Dog <|-- Animal" in mermaid_code
+        assert mermaid_code == diagram._generate_mermaid()
+
+
+class TestCacheInvalidationAcrossDiagramTypes:
+    """Test that mutators of every diagram type invalidate cached output."""
+
+    def test_timeline_nested_events_invalidate_cache(self) -> None:
+        """Test events added to sections and periods after rendering."""
+        diagram = TimelineDiagram()
+        section = diagram.add_section("Planning")
+        period = section.add_period("Q1")
+        diagram.to_mermaid()
+
+        period.add_event("Kickoff")
+        section.add_period("Q2").add_event("Design")
+
+        mermaid_code = diagram.to_mermaid()
+        assert "Q1 : Kickoff" in mermaid_code
+        assert "Q2 : Design" in mermaid_code
+
+    def test_simple_diagram_mutators_invalidate_cache(self) -> None:
+        """Test tuple-backed diagram types after rendering."""
+        state = StateDiagram()
+        state.to_mermaid()
+        state.add_transition("Idle", "Busy")
+        assert "Idle --> Busy" in state.to_mermaid()
+
+        pie = PieChartDiagram()
+        pie.to_mermaid()
+        pie.add_slice("Dogs", 3)
+        assert '"Dogs" : 3' in pie.to_mermaid()
+
+        mindmap = MindmapDiagram()
+        mindmap.to_mermaid()
+        mindmap.add_node("root", "child", "Child")
+        assert "Child" in mindmap.to_mermaid()
+
+
+class TestMindmapDiagramComprehensive:
+    """Comprehensive tests for MindmapDiagram."""
+
+    def test_node_index_and_errors(self) -> None:
+        """Test lookup by ID and rejection of bad parents and duplicate IDs."""
+        diagram = MindmapDiagram()
+        child = diagram.add_node("root", "a", "A")
+        diagram.add_node("a", "b", "B", shape="circle")
+
+        assert diagram.get_node("a") is child
+        assert diagram.get_node("missing") is None
+        with pytest.raises(DiagramError):
+            diagram.add_node("missing", "c", "C")
+        with pytest.raises(DiagramError):
+            diagram.add_node("root", "b", "Again")
+        assert diagram.to_mermaid() == "mindmap\nRoot\n  A\n    ((B))"
+
+    def test_remove_node_subtree(self) -> None:
+        """Test that removing a node removes and unindexes its subtree."""
+        diagram = MindmapDiagram()
+        diagram.add_node("root", "a", "A")
+        diagram.add_node("a", "b", "B")
+        diagram.add_node("root", "c", "C")
+
+        diagram.remove_node("a")
+
+        assert diagram.get_node("b") is None
+        assert diagram.to_mermaid() == "mindmap\nRoot\n  C"
+        diagram.add_node("root", "b", "B again")
+        with pytest.raises(DiagramError):
+            diagram.remove_node("root")
+
+    def test_add_tree_and_rows_match_add_node(self) -> None:
+        """Test that bulk loaders produce the same output as add_node."""
+        expected = MindmapDiagram()
+        expected.add_node("root", "a", "A", shape="cloud")
+        expected.add_node("a", "b", "B")
+        expected.add_node("a", "c", "C")
+        expected.add_node("root", "d", "D")
+
+        from_tree = MindmapDiagram()
+        from_tree.add_tree(
+            "root",
+            {
+                "id": "a",
+                "text": "A",
+                "shape": "cloud",
+                "children": [{"id": "b", "text": "B"}, {"id": "c", "text": "C"}],
+            },
+        )
+        from_tree.add_node("root", "d", "D")
+
+        from_rows = MindmapDiagram()
+        from_rows.add_rows(
+            [
+                ("c", "a", "C"),
+                {"id": "d", "parent_id": None, "text": "D"},
+                ("b", "a", "B"),
+                ("a", None, "A", "cloud"),
+            ]
+        )
+
+        assert from_tree.to_mermaid() == expected.to_mermaid()
+        # Rows are attached parent-first; siblings keep table order
+        assert from_rows.get_node("a").children[0].id == "c"
+        assert len(from_rows.to_mermaid().splitlines()) == 6
+
+    def test_bulk_load_errors_leave_diagram_untouched(self) -> None:
+        """Test that invalid trees and tables add nothing."""
+        diagram = MindmapDiagram()
+        diagram.add_node("root", "a", "A")
+
+        with pytest.raises(DiagramError):
+            diagram.add_tree(
+                "root",
+                {"id": "x", "text": "X", "children": [{"id": "a", "text": "Dup"}]},
+            )
+        with pytest.raises(DiagramError):
+            diagram.add_rows([("p", "q", "P"), ("q", "p", "Q")])
+        with pytest.raises(DiagramError):
+            diagram.add_rows([("p", "missing", "P")])
+
+        assert diagram.get_node("x") is None
+        assert diagram.get_node("p") is None
+        assert diagram.to_mermaid() == "mindmap\nRoot\n  A"
+
+    def test_deep_tree_emission(self) -> None:
+        """Test that very deep trees emit without hitting the recursion limit."""
+        depth = 5000
+        diagram = MindmapDiagram()
+        diagram.add_rows(
+            (f"n{i}", f"n{i - 1}" if i else None, f"N{i}") for i in range(depth)
+        )
+
+        lines = diagram.to_mermaid().splitlines()
+
+        assert len(lines) == depth + 2
+        assert lines[-1] == "  " * depth + f"N{depth - 1}"
+
+    def test_direct_child_edits_are_found(self) -> None:
+        """Test that nodes attached with MindmapNode.add_child can be parents."""
+        from diagramaid.models.mindmap import MindmapNode
+
+        diagram = MindmapDiagram()
+        diagram.root.add_child(MindmapNode("manual", "Manual"))
+
+        diagram.add_node("manual", "child", "Child")
+
+        assert "    Child" in diagram.to_mermaid()
+
+    def test_direct_child_edits_are_per_diagram(self) -> None:
+        """Test that add_child indexes into the owning diagram only."""
+        from diagramaid.models.mindmap import MindmapNode
+
+        diagram = MindmapDiagram()
+        other = MindmapDiagram()
+        diagram.add_rows((f"n{i}", None, f"N{i}") for i in range(3))
+        before = diagram.to_mermaid()
+
+        manual = MindmapNode("manual", "Manual")
+        diagram.get_node("n2").add_child(manual)
+        manual.add_child(MindmapNode("nested", "Nested"))
+        assert diagram.get_node("nested") is not None
+        assert diagram.to_mermaid() != before
+        assert other.get_node("manual") is None
+
+        diagram.remove_node("manual")
+        manual.add_child(MindmapNode("orphan", "Orphan"))
+        assert diagram.get_node("orphan") is None
+
 
 class TestStateDiagramComprehensive:
     """Comprehensive tests for StateDiagram."""
@@ -194,6 +194,13 @@ class TestFlowchartEdge:
         
         assert "node1 -->|Test Label| node2" in mermaid
 
+    @pytest.mark.parametrize("arrow_type", list(FlowchartEdge.ARROW_TYPES))
+    def test_to_mermaid_with_label_per_arrow_type(self, arrow_type: str) -> None:
+        """Test that labelled edges render as a labelled solid arrow."""
+        edge = FlowchartEdge("node1", "node2", label="maybe", arrow_type=arrow_type)
+
+        assert edge.to_mermaid() == "node1 -->|maybe| node2"
+
     def test_to_mermaid_with_edge_type(self) -> None:
         """Test Mermaid syntax generation with different edge types."""
         # Dotted edge
@@ -429,3 +436,116 @@ class TestFlowchartDiagram:
 
         with pytest.raises(DiagramError, match="Diagram must contain at least one node"):
             diagram.validate_diagram()
+
+
+class TestFlowchartFragmentCache:
+    """Test dirty-tracked fragment caching of flowchart output."""
+
+    def _build(self) -> FlowchartDiagram:
+        diagram = FlowchartDiagram()
+        diagram.add_node("A", "Start")
+        diagram.add_node("B", "Process")
+        diagram.add_edge("A", "B")
+        return diagram
+
+    def test_mutators_invalidate_cached_output(self) -> None:
+        """Test that every mutator is reflected in the next to_mermaid()."""
+        diagram = self._build()
+        diagram.to_mermaid()
+
+        diagram.add_node("C", "End")
+        diagram.add_edge("B", "C", label="done")
+        subgraph = diagram.add_subgraph("sub1", "Group")
+        subgraph.add_node("C")
+        diagram.add_style("A", {"fill": "#f00"})
+
+        mermaid = diagram.to_mermaid()
+        assert "C[End]" in mermaid
+        assert "B -->|done| C" in mermaid
+        assert "subgraph sub1 [Group]" in mermaid
+        assert "        C" in mermaid
+        assert "style A fill:#f00" in mermaid
+        assert mermaid == diagram._generate_mermaid()
+
+    def test_element_attribute_change_is_tracked(self) -> None:
+        """Test that mutating a bound element re-emits its fragment."""
+        diagram = self._build()
+        diagram.to_mermaid()
+
+        diagram.nodes["A"].label = "Begin"
+        diagram.edges[0].arrow_type = "thick"
+
+        mermaid = diagram.to_mermaid()
+        assert "A[Begin]" in mermaid
+        assert "A ==> B" in mermaid
+        assert mermaid == diagram._generate_mermaid()
+
+    def test_only_dirty_fragments_are_re_emitted(self) -> None:
+        """Test that unchanged elements are not regenerated."""
+        diagram = self._build()
+        diagram.to_mermaid()
+
+        with patch.object(
+            FlowchartNode, "to_mermaid", autospec=True, side_effect=lambda n: n.id
+        ) as node_to_mermaid:
+            diagram.nodes["B"].label = "Changed"
+            diagram.to_mermaid()
+
+        assert node_to_mermaid.call_count == 1
+        assert node_to_mermaid.call_args[0][0] is diagram.nodes["B"]
+
+    def test_remove_node_updates_cached_output(self) -> None:
+        """Test that removed nodes and their edges leave the output."""
+        diagram = self._build()
+        diagram.to_mermaid()
+
+        removed = diagram.nodes["A"]
+        diagram.remove_node("A")
+        removed.label = "Detached"
+
+        mermaid = diagram.to_mermaid()
+        assert "A[" not in mermaid
+        assert "-->" not in mermaid
+        assert mermaid == diagram._generate_mermaid()
+
+    def test_attribute_reassignment_invalidates_output(self) -> None:
+        """Test that reassigning diagram attributes regenerates the output."""
+        diagram = self._build()
+        diagram.to_mermaid()
+
+        diagram.direction = "LR"
+        diagram.title = "Renamed"
+
+        mermaid = diagram.to_mermaid()
+        assert mermaid.startswith("flowchart LR\n    title: Renamed")
+
+    def test_direct_container_mutation_is_detected(self) -> None:
+        """Test that out-of-band container changes trigger a section rebuild."""
+        diagram = self._build()
+        diagram.to_mermaid()
+
+        diagram.edges.append(FlowchartEdge("B", "A"))
+        diagram.clear_cache()
+
+        assert "B --> A" in diagram.to_mermaid()
+
+        diagram.edges.pop()
+        diagram._mark_dirty()
+
+        assert "B --> A" not in diagram.to_mermaid()
+
+    def test_deepcopy_and_pickle_round_trip(self) -> None:
+        """Test that copies keep their edges and an independent edge index."""
+        import copy
+        import pickle
+
+        diagram = self._build()
+        diagram.add_edge("B", "A")
+        assert len(diagram.adjacency.outgoing("A")) == 1
+
+        for clone in (copy.deepcopy(diagram), pickle.loads(pickle.dumps(diagram))):
+            assert clone.to_mermaid() == diagram.to_mermaid()
+            clone.add_node("C", "End")
+            clone.add_edge("A", "C")
+            assert len(clone.adjacency.outgoing("A")) == 2
+            assert len(diagram.adjacency.outgoing("A")) == 1
@@ -0,0 +1,126 @@
+"""
+Unit tests for partitioning large diagrams into tiles.
+"""
+
+from typing import Any
+
+import pytest
+
+from diagramaid.exceptions import DiagramError
+from diagramaid.models import (
+    FlowchartDiagram,
+    PieChartDiagram,
+    StateDiagram,
+    partition_diagram,
+)
+from diagramaid.models.partition import assign_tiles
+
+
+class TestAssignTiles:
+    """Test tile assignment of nodes."""
+
+    def test_components_are_packed_whole(self) -> None:
+        """Test that small components share tiles without being split."""
+        nodes = ["A", "B", "C", "D", "E", "F"]
+        edges = [("A", "B"), ("C", "D"), ("E", "F")]
+
+        tiles = assign_tiles(nodes, edges, max_nodes=4)
+
+        assert tiles["A"] == tiles["B"]
+        assert tiles["C"] == tiles["D"]
+        assert tiles["E"] == tiles["F"]
+        assert max(tiles.values()) == 1
+
+    def test_large_component_is_bounded(self) -> None:
+        """Test that a component larger than a tile is cut into clusters."""
+        nodes = [str(i) for i in range(10)]
+        edges = [(str(i), str(i + 1)) for i in range(9)]
+
+        tiles = assign_tiles(nodes, edges, max_nodes=3)
+
+        counts = [list(tiles.values()).count(tile) for tile in set(tiles.values())]
+        assert max(counts) <= 3
+        assert len(counts) == 4
+
+    def test_groups_stay_together(self) -> None:
+        """Test that a group that fits is never split across tiles."""
+        nodes = ["A", "B", "C", "D"]
+        edges = [("A", "B"), ("B", "C"), ("C", "D")]
+
+        tiles = assign_tiles(nodes, edges, groups=[["B", "D"]], max_nodes=2)
+
+        assert tiles["B"] == tiles["D"]
+
+
+class TestPartitionDiagram:
+    """Test partitioning of flowcharts and state diagrams."""
+
+    def test_small_flowchart_is_one_tile(self, sample_flowchart: Any) -> None:
+        """Test that a diagram that fits is returned as a single tile."""
+        tiles = partition_diagram(sample_flowchart, max_nodes=10)
+
+        assert len(tiles) == 1
+        assert tiles[0].to_mermaid() == sample_flowchart.to_mermaid()
+        assert tiles[0].stub_ids == []
+
+    @pytest.mark.parametrize("storage", ["object", "columnar"])
+    def test_cross_edges_become_stubs(self, storage: str) -> None:
+        """Test that edges between tiles point at stub nodes in both tiles."""
+        diagram = FlowchartDiagram(title="Chain", storage=storage)
+        diagram.add_nodes((f"N{i}", f"Node {i}") for i in range(6))
+        diagram.add_edges((f"N{i}", f"N{i + 1}", "next") for i in range(5))
+        diagram.add_style("N0", {"fill": "#f9f"})
+
+        tiles = partition_diagram(diagram, max_nodes=3)
+
+        assert [tile.node_ids for tile in tiles] == [
+            ["N0", "N1", "N2"],
+            ["N3", "N4", "N5"],
+        ]
+        assert tiles[0].stub_ids == ["N3"]
+        assert tiles[1].stub_ids == ["N2"]
+        first, second = (tile.to_mermaid() for tile in tiles)
+        assert "title: Chain (1/2)" in first
+        assert "N3>Node 3 (part 2)]" in first
+        assert "N2 -->|next| N3" in first and "N2 -->|next| N3" in second
+        assert "style N0 fill:#f9f" in first
+        assert "style N0" not in second
+
+    def test_subgraphs_are_copied(self) -> None:
+        """Test that subgraphs follow their nodes into the tiles."""
+        diagram = FlowchartDiagram()
+        for node_id in "ABCD":
+            diagram.add_node(node_id, node_id)
+        diagram.add_edge("A", "B")
+        diagram.add_edge("C", "D")
+        diagram.add_subgraph("S", "Group")
+        diagram.add_node_to_subgraph("B", "S")
+        diagram.add_node_to_subgraph("D", "S")
+
+        tiles = partition_diagram(diagram, max_nodes=2)
+
+        holders = [tile for tile in tiles if "S" in tile.diagram.subgraphs]
+        assert len(holders) == 1
+        assert holders[0].node_ids == ["B", "D"]
+
+    def test_state_diagram_keeps_terminals_local(self) -> None:
+        """Test that [*] transitions stay with the real state."""
+        diagram = StateDiagram()
+        diagram.add_transition("[*]", "A")
+        diagram.add_transition("A", "B", "go")
+        diagram.add_transition("B", "C")
+        diagram.add_transition("C", "[*]")
+
+        tiles = partition_diagram(diagram, max_nodes=2)
+
+        assert [tile.node_ids for tile in tiles] == [["A", "B"], ["C"]]
+        assert "[*] --> A" in tiles[0].to_mermaid()
+        assert "C --> [*]" in tiles[1].to_mermaid()
+        assert "B : B (part 1)" in tiles[1].to_mermaid()
+
+    def test_unsupported_diagram(self) -> None:
+        """Test that other diagram types and bad sizes are rejected."""
+        with pytest.raises(DiagramError):
+            partition_diagram(PieChartDiagram())
+        with pytest.raises(DiagramError):
+            partition_diagram(FlowchartDiagram(), max_nodes=0)
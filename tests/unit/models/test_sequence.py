@@ -465,3 +465,26 @@ class TestSequenceDiagram:
         assert len(diagram.participants) == 2
         assert "user" in diagram.participants
         assert "api" in diagram.participants
+
+
+class TestSequenceFragmentCache:
+    """Test dirty-tracked fragment caching of sequence diagram output."""
+
+    def test_mutators_and_element_changes_are_tracked(self) -> None:
+        """Test that cached output follows diagram and element mutations."""
+        diagram = SequenceDiagram()
+        diagram.add_participant("A", "Alice")
+        message = diagram.add_message("A", "B", "Hello")
+        diagram.to_mermaid()
+
+        message.message = "Hi"
+        loop = diagram.add_loop("every minute")
+        loop.add_message(SequenceMessage("B", "A", "Ping"))
+        diagram.add_note("Thinking", "A")
+
+        mermaid = diagram.to_mermaid()
+        assert "A->B: Hi" in mermaid
+        assert "loop every minute" in mermaid
+        assert "    B->A: Ping" in mermaid
+        assert "note right of A: Thinking" in mermaid
+        assert mermaid == diagram._generate_mermaid()
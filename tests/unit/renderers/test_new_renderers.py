@@ -152,6 +152,35 @@ class TestNodeJSRenderer:
         assert result.renderer_name == "nodejs"
 
 
+    @patch("subprocess.run")
+    def test_render_chunks_streams_input_file(
+        self, mock_run: Any, tmp_path: Any
+    ) -> None:
+        """Test that streamed chunks are written to the mmdc input file."""
+        written: dict[str, str] = {}
+
+        def fake_mmdc(cmd: list[str], **kwargs: Any) -> Mock:
+            if "-i" not in cmd:  # Version query
+                return Mock(returncode=0, stdout="10.0.0", stderr="")
+            input_file = cmd[cmd.index("-i") + 1]
+            output_file = cmd[cmd.index("-o") + 1]
+            with open(input_file, encoding="utf-8") as f:
+                written["input"] = f.read()
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write("<svg></svg>")
+            return Mock(returncode=0, stdout="", stderr="")
+
+        mock_run.side_effect = fake_mmdc
+
+        renderer = NodeJSRenderer(temp_dir=str(tmp_path))
+        chunks = iter(["flowchart TD\n", "    A --> B", "\n    B --> C"])
+        result = renderer.render_chunks(chunks, "svg")
+
+        assert result.success, result.error
+        assert result.content == "<svg></svg>"
+        assert written["input"] == "flowchart TD\n    A --> B\n    B --> C"
+
+
 class TestGraphvizRenderer:
     """Test the GraphvizRenderer class."""
 
@@ -0,0 +1,142 @@
+"""
+Unit tests for remote request encoding and the stand-in rendering server.
+"""
+
+import logging
+
+import pytest
+
+from diagramaid.exceptions import NetworkError
+from diagramaid.renderers.png_renderer import PNGRenderer
+from diagramaid.renderers.remote import (
+    StandInServer,
+    build_remote_request,
+    decode_payload,
+    encode_payload,
+)
+from diagramaid.renderers.svg_renderer import SVGRenderer
+
+LARGE_CODE = "flowchart TD\n" + "\n".join(
+    f"    N{i}[Node number {i}] --> N{i + 1}[Node number {i + 1}]"
+    for i in range(300)
+)
+
+
+@pytest.fixture
+def stand_in():
+    """Provide a running stand-in server that rejects URLs above 2048 chars."""
+    with StandInServer(max_url_length=2048) as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def _quiet_validation_warnings():
+    """Silence per-node syntax warnings logged for the large diagram."""
+    logging.disable(logging.WARNING)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+class TestPayloadEncoding:
+    """Test pako and base64 payload encoding."""
+
+    @pytest.mark.parametrize("encoding", ["pako", "base64"])
+    def test_round_trip(self, encoding: str) -> None:
+        """Test that code and config survive encoding."""
+        config = {"theme": "dark"}
+        payload = encode_payload(LARGE_CODE, config, encoding)
+        assert decode_payload(payload) == (LARGE_CODE, config)
+        assert decode_payload(encode_payload("graph TD", None, encoding)) == (
+            "graph TD",
+            {},
+        )
+
+    def test_pako_is_url_safe_and_smaller(self) -> None:
+        """Test that the pako payload is compressed and needs no escaping."""
+        pako = encode_payload(LARGE_CODE)
+        plain = encode_payload(LARGE_CODE, encoding="base64")
+        assert pako.startswith("pako:")
+        assert not set(pako[5:]) & set("+/=")
+        assert len(pako) * 3 < len(plain)
+
+    def test_invalid_input(self) -> None:
+        """Test errors for unknown encodings and corrupt payloads."""
+        with pytest.raises(ValueError):
+            encode_payload("graph TD", encoding="gzip")
+        with pytest.raises(ValueError):
+            decode_payload("pako:not-deflate")
+
+    def test_post_above_threshold(self) -> None:
+        """Test switching to POST only when a POST endpoint is configured."""
+        small = build_remote_request("https://ink", "svg", "graph TD", post_url="x")
+        assert small.method == "GET"
+        assert small.url.startswith("https://ink/svg/pako:")
+
+        large = build_remote_request(
+            "https://ink", "img", LARGE_CODE, post_url="http://svc/", post_threshold=100
+        )
+        assert large.method == "POST"
+        assert large.url == "http://svc/img"
+        assert decode_payload(large.body.decode())[0] == LARGE_CODE
+
+        no_post = build_remote_request(
+            "https://ink", "svg", LARGE_CODE, post_threshold=100
+        )
+        assert no_post.method == "GET"
+
+
+class TestStandInRendering:
+    """Test the remote renderers against the stand-in server."""
+
+    def test_svg_renderer_posts_large_diagrams(self, stand_in: StandInServer) -> None:
+        """Test that oversized diagrams are posted and transfer is counted."""
+        renderer = SVGRenderer(
+            server_url=stand_in.url,
+            use_local=False,
+            cache_enabled=False,
+            post_url=stand_in.url,
+            post_threshold=1024,
+        )
+        svg = renderer.render(LARGE_CODE)
+        assert "<svg" in svg
+        renderer.render("flowchart TD\n    A --> B")
+
+        assert [(r.method, r.endpoint) for r in stand_in.requests] == [
+            ("POST", "svg"),
+            ("GET", "svg"),
+        ]
+        assert stand_in.requests[0].mermaid_code == LARGE_CODE
+        transfer = renderer.get_performance_metrics()["transfer"]
+        assert transfer["post_requests"] == 1
+        assert transfer["get_requests"] == 1
+        assert transfer["bytes_sent"] < len(LARGE_CODE)
+        assert transfer["bytes_received"] > 0
+
+    def test_url_limit_without_post(self, stand_in: StandInServer) -> None:
+        """Test that over-long GET URLs fail with the server's status."""
+        renderer = SVGRenderer(
+            server_url=stand_in.url,
+            use_local=False,
+            cache_enabled=False,
+            max_retries=0,
+            encoding="base64",
+        )
+        with pytest.raises(NetworkError, match="414"):
+            renderer.render(LARGE_CODE)
+        assert stand_in.requests == []
+
+    def test_png_renderer(self, stand_in: StandInServer) -> None:
+        """Test PNG rendering over GET and POST."""
+        renderer = PNGRenderer(
+            server_url=stand_in.url, post_url=stand_in.url, post_threshold=1024
+        )
+        assert renderer.render("graph TD; A-->B", theme="dark").startswith(b"\x89PNG")
+        assert renderer.render(LARGE_CODE).startswith(b"\x89PNG")
+
+        assert [(r.method, r.endpoint) for r in stand_in.requests] == [
+            ("GET", "img"),
+            ("POST", "img"),
+        ]
+        assert stand_in.requests[0].config == {"theme": "dark"}
+        metrics = renderer.get_transfer_metrics()
+        assert metrics["requests"] == 2
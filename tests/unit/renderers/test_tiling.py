@@ -0,0 +1,108 @@
+"""
+Unit tests for tiled rendering and SVG stitching.
+"""
+
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from diagramaid.exceptions import RenderingError
+from diagramaid.models import FlowchartDiagram
+from diagramaid.renderers.tiling import TiledRenderer, stitch_svgs, svg_size
+
+
+def _fake_svg(mermaid_code: str, *args: Any) -> str:
+    """Return an SVG whose height reflects the number of lines rendered."""
+    height = 10 * len(mermaid_code.splitlines())
+    return (
+        '<?xml version="1.0"?><svg xmlns="http://www.w3.org/2000/svg" '
+        f'id="mermaid" width="100%" style="max-width: 50px" '
+        f'viewBox="0 0 50 {height}"><style>#mermaid .node{{fill:#fff}}</style>'
+        '<path marker-end="url(#arrow)"/><marker id="arrow"/></svg>'
+    )
+
+
+def _chain(length: int) -> FlowchartDiagram:
+    diagram = FlowchartDiagram()
+    diagram.add_nodes((f"N{i}", f"Node {i}") for i in range(length))
+    diagram.add_edges((f"N{i}", f"N{i + 1}") for i in range(length - 1))
+    return diagram
+
+
+class TestStitching:
+    """Test SVG size detection and stitching."""
+
+    def test_svg_size(self) -> None:
+        """Test viewBox and width/height sizes."""
+        assert svg_size('<svg viewBox="0 0 120.5 80">') == (120.5, 80.0)
+        assert svg_size('<svg width="30px" height="40">') == (30.0, 40.0)
+        with pytest.raises(RenderingError):
+            svg_size("<html></html>")
+
+    def test_stitch_grid_and_ids(self) -> None:
+        """Test grid placement and per-tile id prefixes."""
+        svgs = [_fake_svg("a\nb"), _fake_svg("a"), _fake_svg("a\nb\nc")]
+
+        stitched = stitch_svgs(svgs, columns=2, gap=10)
+
+        assert stitched.startswith("<svg")
+        assert 'viewBox="0 0 110 60"' in stitched
+        assert '<svg x="60" y="0" width="50" height="10"' in stitched
+        assert '<svg x="0" y="30" width="50" height="30"' in stitched
+        assert 'id="t2-arrow"' in stitched and "url(#t2-arrow)" in stitched
+        assert "#t0-mermaid .node" in stitched
+        assert "fill:#fff" in stitched
+        assert "<?xml" not in stitched
+
+    def test_single_document_unchanged(self) -> None:
+        """Test that a single document is returned as is."""
+        svg = _fake_svg("a")
+        assert stitch_svgs([svg]) == svg
+
+
+class TestTiledRenderer:
+    """Test partitioned parallel rendering."""
+
+    def test_render_svg_renders_each_tile(self) -> None:
+        """Test that every tile is rendered once and the results stitched."""
+        svg_renderer = Mock()
+        svg_renderer.render.side_effect = _fake_svg
+        renderer = TiledRenderer(svg_renderer, max_nodes=10, max_workers=4)
+
+        svg = renderer.render_svg(_chain(95))
+
+        assert svg_renderer.render.call_count == 10
+        rendered = [call.args[0] for call in svg_renderer.render.call_args_list]
+        assert all(code.startswith("flowchart") for code in rendered)
+        assert svg.count("<svg ") == 11
+
+    def test_small_diagram_rendered_directly(self) -> None:
+        """Test that a diagram that fits is rendered without stitching."""
+        svg_renderer = Mock()
+        svg_renderer.render.side_effect = _fake_svg
+        renderer = TiledRenderer(svg_renderer, max_nodes=10)
+
+        svg = renderer.render_svg(_chain(3))
+
+        assert svg == _fake_svg(_chain(3).to_mermaid())
+
+    def test_render_pdf_one_page_per_tile(self) -> None:
+        """Test that PDF output receives one SVG page per tile."""
+        svg_renderer = Mock()
+        svg_renderer.render.side_effect = _fake_svg
+        pdf_renderer = Mock()
+        pdf_renderer.render_pages.return_value = b"%PDF"
+        renderer = TiledRenderer(svg_renderer, pdf_renderer, max_nodes=5)
+
+        assert renderer.render_pdf(_chain(12)) == b"%PDF"
+        assert len(pdf_renderer.render_pages.call_args.args[0]) == 3
+
+    def test_tile_failure_is_reported(self) -> None:
+        """Test that a failing tile raises RenderingError naming the tile."""
+        svg_renderer = Mock()
+        svg_renderer.render.side_effect = RuntimeError("timeout")
+        renderer = TiledRenderer(svg_renderer, max_nodes=5)
+
+        with pytest.raises(RenderingError, match="Tile 1 of 3"):
+            renderer.render_tiles(_chain(12))
@@ -0,0 +1,150 @@
+"""
+Unit tests for templates.api_client module.
+
+Tests pooled sessions, conditional requests and pagination of
+APIDataSource against a local stand-in API.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import requests
+from requests.cookies import MockRequest, create_cookie
+
+from diagramaid.exceptions import DataSourceError
+from diagramaid.templates.api_client import (
+    ResponseCache,
+    StandInAPIServer,
+    close_sessions,
+    get_session,
+)
+from diagramaid.templates.data_sources import APIDataSource
+
+HOSTS = [{"name": f"host{i}", "rack": f"r{i % 3}"} for i in range(10)]
+
+
+@pytest.fixture
+def server() -> Iterator[StandInAPIServer]:
+    """A stand-in inventory API; shared sessions are closed afterwards."""
+    with StandInAPIServer({"/hosts": HOSTS, "/racks": {"items": ["r0"]}}) as api:
+        yield api
+    close_sessions()
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Unit tests for ResponseCache and pooled sessions."""
+
+    def test_keys(self) -> None:
+        """Test that keys ignore order and conditional headers."""
+        key = ResponseCache.make_key("http://x/a", {"b": 1, "a": 2}, {"X-Key": "k"})
+        assert key == ResponseCache.make_key(
+            "http://x/a", {"a": 2, "b": 1}, {"x-key": "k", "If-None-Match": '"e"'}
+        )
+        assert key != ResponseCache.make_key("http://x/a", {"a": 2, "b": 1})
+
+    def test_sessions_per_origin(self) -> None:
+        """Test that URLs of one service share a session."""
+        session = get_session("http://inventory.local/api/v1/")
+        assert get_session("http://inventory.local/other") is session
+        assert get_session("https://inventory.local/") is not session
+        close_sessions()
+        assert get_session("http://inventory.local/") is not session
+        close_sessions()
+
+    def test_sessions_per_credentials(self) -> None:
+        """Test that callers with other credentials get their own session."""
+        token = {"Authorization": "Bearer a"}
+        session = get_session("http://inventory.local/", credentials=token)
+        assert (
+            get_session("http://inventory.local/x", credentials=dict(token)) is session
+        )
+        assert get_session("http://inventory.local/") is not session
+        assert (
+            get_session("http://inventory.local/", credentials={"Authorization": "b"})
+            is not session
+        )
+
+        request = requests.Request("GET", "http://inventory.local/").prepare()
+        cookie = create_cookie("sid", "1", domain="inventory.local")
+        assert not session.cookies.get_policy().set_ok(cookie, MockRequest(request))
+        close_sessions()
+
+
+@pytest.mark.unit
+class TestAPIDataSourceFetching:
+    """Unit tests for conditional, concurrent and paginated loads."""
+
+    def test_conditional_requests(self, server: StandInAPIServer) -> None:
+        """Test that unchanged responses are revalidated from the cache."""
+        cache = ResponseCache()
+        source = APIDataSource(server.url, cache=cache)
+
+        first = source.load_data("/hosts")
+        first["data"].clear()
+        assert source.load_data("/hosts") == {"data": HOSTS}
+        assert [r.status for r in server.requests] == [200, 304]
+        assert cache.get_stats()["revalidated"] == 1
+
+        server.set_route("/hosts", HOSTS[:2])
+        assert len(source.load_data("/hosts")["data"]) == 2
+        assert server.requests[-1].status == 200
+
+        uncached = APIDataSource(server.url, cache=False)
+        uncached.load_data("/hosts")
+        assert server.requests[-1].status == 200
+
+    def test_persistent_cache(self, server: StandInAPIServer, tmp_path: Path) -> None:
+        """Test that a cache directory is shared between cache instances."""
+        APIDataSource(server.url, cache=ResponseCache(directory=tmp_path)).load_data(
+            "/racks", extract_path="items"
+        )
+        source = APIDataSource(server.url, cache=ResponseCache(directory=tmp_path))
+        assert source.load_data("/racks", extract_path="items") == {"data": ["r0"]}
+        assert server.requests[-1].status == 304
+
+        (tmp_path / "settings.json").write_text("{}")
+        source.cache.clear()
+        assert [path.name for path in tmp_path.iterdir()] == ["settings.json"]
+
+    def test_load_many(self, server: StandInAPIServer) -> None:
+        """Test fetching several endpoints concurrently."""
+        source = APIDataSource(server.url, cache=False, max_workers=3)
+        results = source.load_many(
+            ["/hosts", ("/racks", {"extract_path": "items"}), "/missing"],
+            return_exceptions=True,
+        )
+        assert results[0] == {"data": HOSTS}
+        assert results[1] == {"data": ["r0"]}
+        assert isinstance(results[2], DataSourceError)
+        with pytest.raises(DataSourceError):
+            source.load_many(["/hosts", "/missing"])
+        assert source.load_many([]) == []
+
+    def test_link_pagination(self, server: StandInAPIServer) -> None:
+        """Test following Link headers while records are consumed."""
+        server.page_size = 4
+        source = APIDataSource(server.url)
+
+        chunks = list(source.iter_records("/hosts", chunk_size=3))
+        assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+        assert [host for chunk in chunks for host in chunk] == HOSTS
+        assert [r.query.get("page") for r in server.requests] == [None, "2", "3"]
+
+        # Cached pages keep their next links when revalidated
+        assert list(source.stream("/hosts", max_pages=2)) == HOSTS[:8]
+        assert [r.status for r in server.requests[3:]] == [304, 304]
+
+    def test_page_parameter(self, server: StandInAPIServer) -> None:
+        """Test paging by a query parameter until a page is empty."""
+        server.page_size = 4
+        source = APIDataSource(server.url, cache=False)
+        records = list(
+            source.stream(
+                "/hosts",
+                page_param="page",
+                transform={"map": {"id": "name"}},
+            )
+        )
+        assert records == [{"id": host["name"]} for host in HOSTS]
@@ -0,0 +1,231 @@
+"""
+Unit tests for templates.columnar_source module.
+
+The plain-Python tests always run; NumPy and pyarrow backends are tested
+when the packages are installed.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from diagramaid.exceptions import DataSourceError
+from diagramaid.templates import ColumnarDataSource, columnar_source
+from diagramaid.templates.columnar_source import (
+    columns_to_flowchart,
+    filter_columns,
+    group_columns,
+    map_columns,
+)
+from diagramaid.templates.data_sources import create_data_source
+
+LINKS = {
+    "src": ["api", "api", "auth", "web", "web"],
+    "dst": ["db", "auth", "db", "api", "cdn"],
+    "kind": ["sql", "http", "sql", "http", "http"],
+    "bytes": [10, 5, 7, 3, None],
+}
+
+
+def _links_csv(tmp_path: Path) -> Path:
+    path = tmp_path / "links.csv"
+    rows = zip(LINKS["src"], LINKS["dst"], LINKS["kind"], strict=True)
+    path.write_text("src,dst,kind\n" + "".join(",".join(r) + "\n" for r in rows))
+    return path
+
+
+@pytest.mark.unit
+class TestColumnOperations:
+    """Unit tests for column operations on plain column lists."""
+
+    def test_filter_and_map(self) -> None:
+        """Test filters by value, membership and predicate, then renaming."""
+        table = filter_columns(LINKS, {"kind": "http", "src": ["api", "web"]})
+        assert table["dst"] == ["auth", "api", "cdn"]
+        table = filter_columns(
+            table, {"dst": lambda column: [d != "api" for d in column]}
+        )
+        assert map_columns(table, {"from_node": "src", "to_node": "dst"}) == {
+            "from_node": ["api", "web"],
+            "to_node": ["auth", "cdn"],
+        }
+        with pytest.raises(DataSourceError):
+            map_columns(LINKS, {"x": "missing"})
+
+    def test_group(self) -> None:
+        """Test aggregations per key, sorted by key, skipping nulls."""
+        table = group_columns(
+            LINKS,
+            "src",
+            {
+                "links": ("src", "count"),
+                "total": ("bytes", "sum"),
+                "largest": ("bytes", "max"),
+                "average": ("bytes", "mean"),
+            },
+        )
+        assert table == {
+            "src": ["api", "auth", "web"],
+            "links": [2, 1, 2],
+            "total": [15, 7, 3],
+            "largest": [10, 7, 3],
+            "average": [7.5, 7.0, 3.0],
+        }
+        with pytest.raises(DataSourceError):
+            group_columns(LINKS, "src", {"x": ("bytes", "median")})
+
+    def test_group_null_keys(self) -> None:
+        """Test that a null key forms its own group, sorted last."""
+        table = {"zone": ["b", None, "a", None], "n": [1, 2, 3, 4]}
+        assert group_columns(table, "zone", {"n": ("n", "sum")}) == {
+            "zone": ["a", "b", None],
+            "n": [3, 1, 6],
+        }
+
+    def test_columns_to_flowchart(self) -> None:
+        """Test building a flowchart from tables with implicit endpoints."""
+        nodes = {"id": ["api", "db"], "label": ["API", "Database"]}
+        edges = map_columns(LINKS, {"from_node": "src", "to_node": "dst"})
+        diagram = columns_to_flowchart(nodes, edges, direction="LR")
+        assert list(diagram.nodes) == ["api", "db", "auth", "web", "cdn"]
+        assert len(diagram.edges) == 5
+        assert diagram.nodes["db"].label == "Database"
+
+
+@pytest.mark.unit
+class TestColumnarDataSource:
+    """Unit tests for ColumnarDataSource class."""
+
+    def test_csv(self, tmp_path: Path) -> None:
+        """Test reading, filtering, mapping and grouping a CSV file."""
+        path = _links_csv(tmp_path)
+        source = create_data_source("columnar")
+        assert isinstance(source, ColumnarDataSource)
+        assert source.validate_source(str(path))
+
+        data = source.load_data(
+            str(path),
+            filters={"kind": "sql"},
+            mapping={"from_node": "src", "to_node": "dst"},
+        )
+        assert data == {"from_node": ["api", "auth"], "to_node": ["db", "db"]}
+
+        grouped = source.load_data(str(path), group_by="kind")
+        assert grouped == {"kind": ["http", "sql"], "count": [3, 2]}
+
+        rows = source.load_data(str(path), columns=["dst"], structure="rows")
+        assert rows["data"][:2] == [{"dst": "db"}, {"dst": "auth"}]
+        chunks = list(source.iter_records(str(path), chunk_size=2))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+    def test_errors(self, tmp_path: Path) -> None:
+        """Test missing files, unknown columns and unsupported formats."""
+        source = ColumnarDataSource()
+        with pytest.raises(DataSourceError):
+            source.load_columns(str(tmp_path / "missing.csv"))
+        with pytest.raises(DataSourceError):
+            source.load_columns(str(_links_csv(tmp_path)), columns=["nope"])
+        with pytest.raises(DataSourceError):
+            source.load_columns(object())
+        (tmp_path / "data.xml").write_text("<x/>")
+        with pytest.raises(DataSourceError):
+            source.load_columns(str(tmp_path / "data.xml"))
+        assert not source.validate_source(str(tmp_path / "data.xml"))
+
+    def test_missing_pyarrow(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that Parquet needs pyarrow and CSV falls back without it."""
+        monkeypatch.setattr(columnar_source, "_PYARROW_AVAILABLE", False)
+        path = tmp_path / "links.parquet"
+        path.write_bytes(b"PAR1")
+        source = ColumnarDataSource()
+        assert not source.validate_source(str(path))
+        with pytest.raises(DataSourceError, match="pyarrow"):
+            source.load_columns(str(path))
+        table = source.load_columns(str(_links_csv(tmp_path)))
+        assert list(table) == ["src", "dst", "kind"]
+
+    def test_csv_numbers_without_pyarrow(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the CSV fallback reads numeric columns as numbers."""
+        monkeypatch.setattr(columnar_source, "_PYARROW_AVAILABLE", False)
+        path = tmp_path / "sizes.csv"
+        path.write_text("src,bytes,ratio\napi,10,0.5\napi,9,\nweb,,1.5\n")
+        table = ColumnarDataSource().load_columns(str(path))
+        grouped = group_columns(
+            table,
+            "src",
+            {
+                "total": ("bytes", "sum"),
+                "largest": ("bytes", "max"),
+                "average": ("ratio", "mean"),
+            },
+        )
+        assert grouped == {
+            "src": ["api", "web"],
+            "total": [19, None],
+            "largest": [10, None],
+            "average": [0.5, 1.5],
+        }
+
+
+@pytest.mark.unit
+class TestVectorizedBackends:
+    """Unit tests for the NumPy and pyarrow backends."""
+
+    def test_numpy_structured_array(self, tmp_path: Path) -> None:
+        """Test NumPy masks and grouping on a structured array file."""
+        np = pytest.importorskip("numpy")
+        array = np.array(
+            list(zip(LINKS["src"], LINKS["dst"], [10, 5, 7, 3, 1], strict=True)),
+            dtype=[("src", "U8"), ("dst", "U8"), ("bytes", "i8")],
+        )
+        path = tmp_path / "links.npy"
+        np.save(path, array)
+        source = ColumnarDataSource()
+
+        table = source.load_columns(
+            str(path),
+            filters={"bytes": lambda column: column > 4},
+            mapping={"from_node": "src", "to_node": "dst", "bytes": "bytes"},
+        )
+        assert table["to_node"].tolist() == ["db", "auth", "db"]
+        grouped = group_columns(
+            table, "from_node", {"n": ("bytes", "count"), "max": ("bytes", "max")}
+        )
+        assert grouped["from_node"].tolist() == ["api", "auth"]
+        assert grouped["n"].tolist() == [2, 1]
+        assert grouped["max"].tolist() == [10, 7]
+
+        diagram = columns_to_flowchart(edges=table)
+        assert sorted(diagram.nodes) == ["api", "auth", "db"]
+
+    def test_pyarrow_formats(self, tmp_path: Path) -> None:
+        """Test Parquet and Arrow IPC files with compute-kernel operations."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        table = pa.table(LINKS)
+        pq.write_table(table, tmp_path / "links.parquet")
+        with pa.OSFile(str(tmp_path / "links.arrow"), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        source = ColumnarDataSource()
+
+        for name in ("links.parquet", "links.arrow"):
+            edges = source.load_columns(
+                str(tmp_path / name),
+                filters={"kind": ["http"]},
+                mapping={"from_node": "src", "to_node": "dst"},
+            )
+            assert edges.column("to_node").to_pylist() == ["auth", "api", "cdn"]
+
+        grouped = source.load_data(
+            str(tmp_path / "links.parquet"),
+            group_by="src",
+            aggregations={"total": ("bytes", "sum")},
+        )
+        assert grouped == {"src": ["api", "auth", "web"], "total": [15, 7, 3]}
+        diagram = columns_to_flowchart(edges=edges)
+        assert len(diagram.edges) == 3
@@ -0,0 +1,180 @@
+"""
+Unit tests for templates.connection_pool module.
+"""
+
+import asyncio
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from diagramaid.exceptions import DataSourceError
+from diagramaid.templates import connection_pool
+from diagramaid.templates.connection_pool import (
+    ConnectionPool,
+    QueryResultCache,
+    close_connection_pools,
+    get_connection_pool,
+)
+from diagramaid.templates.data_sources import DatabaseDataSource
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> Iterator[str]:
+    """A database with a small services table; pools are closed afterwards."""
+    path = str(tmp_path / "services.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE services (name TEXT, tier TEXT)")
+    conn.executemany(
+        "INSERT INTO services VALUES (?, ?)",
+        [("api", "web"), ("auth", "web"), ("db", "data")],
+    )
+    conn.commit()
+    conn.close()
+    yield path
+    close_connection_pools()
+    connection_pool.result_cache.invalidate()
+
+
+def _insert(path: str, name: str, tier: str) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO services VALUES (?, ?)", (name, tier))
+    conn.commit()
+    conn.close()
+
+
+@pytest.mark.unit
+class TestConnectionPool:
+    """Unit tests for ConnectionPool class."""
+
+    def test_thread_affinity(self, database: str) -> None:
+        """Test that each thread reuses its own connection."""
+        pool = ConnectionPool(database)
+        main = pool.connection()
+        assert pool.connection() is main
+
+        others: list[sqlite3.Connection] = []
+        thread = threading.Thread(target=lambda: others.append(pool.connection()))
+        thread.start()
+        thread.join()
+        assert others[0] is not main
+        assert len(pool) == 2
+
+        # Closing drops every thread's connection; the next use reopens
+        pool.close()
+        assert pool.connection() is not main
+        assert pool.get_stats() == {
+            "connections": 1,
+            "opened": 3,
+            "reused": 1,
+            "closed": 2,
+        }
+        pool.close()
+
+    def test_shared_pools(self, database: str) -> None:
+        """Test that pools are shared per connection string."""
+        pool = get_connection_pool(database)
+        assert get_connection_pool(database) is pool
+        close_connection_pools()
+        assert get_connection_pool(database) is not pool
+
+
+@pytest.mark.unit
+class TestQueryResultCache:
+    """Unit tests for QueryResultCache class."""
+
+    def test_ttl_and_lru(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test expiry and eviction of cached results."""
+        now = [100.0]
+        monkeypatch.setattr(connection_pool.time, "monotonic", lambda: now[0])
+        cache = QueryResultCache(max_entries=2)
+        first = cache.make_key("db", "SELECT 1", [1])
+        assert first == cache.make_key("db", "SELECT 1", (1,))
+        named = cache.make_key("db", "SELECT :a", {"a": 1})
+
+        cache.put(first, [{"a": 1}], ttl=10)
+        cached = cache.get(first)
+        assert cached == [{"a": 1}]
+        cached[0]["a"] = 2
+        assert cache.get(first) == [{"a": 1}]
+
+        cache.put(named, [], ttl=60)
+        cache.put(cache.make_key("db", "SELECT 2"), [], ttl=60)
+        assert cache.get(first) is None
+        now[0] += 61
+        assert cache.get(named) is None
+        assert cache.get_stats() == {
+            "entries": 1,
+            "hits": 2,
+            "misses": 2,
+            "expired": 1,
+        }
+
+    def test_invalidate(self) -> None:
+        """Test dropping results by database and query."""
+        cache = QueryResultCache()
+        for db in ("a", "b"):
+            for query in ("q1", "q2"):
+                cache.put(cache.make_key(db, query, (1,)), [], ttl=60)
+        assert cache.invalidate("a", "q1") == 1
+        assert cache.invalidate(query="q2") == 2
+        assert cache.invalidate() == 1
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+class TestPooledDatabaseDataSource:
+    """Unit tests for pooling and caching in DatabaseDataSource."""
+
+    def test_loads_reuse_connection(self, database: str) -> None:
+        """Test that repeated loads share one pooled connection."""
+        source = DatabaseDataSource(database)
+        for _ in range(3):
+            data = source.load_data("services", transform={"filter": {"tier": "web"}})
+            assert [row["name"] for row in data["data"]] == ["api", "auth"]
+        stats = get_connection_pool(database).get_stats()
+        assert (stats["opened"], stats["reused"]) == (1, 2)
+        assert source.validate_source("services")
+        assert not source.validate_source("missing")
+
+    def test_result_cache(self, database: str) -> None:
+        """Test cached results until they are invalidated."""
+        source = DatabaseDataSource(database, cache_ttl=60)
+        query = "SELECT name FROM services WHERE tier = ?"
+        assert len(source.load_data(query, parameters=("web",))["data"]) == 2
+
+        _insert(database, "cdn", "web")
+        assert len(source.load_data(query, parameters=("web",))["data"]) == 2
+        uncached = source.load_data(query, parameters=("web",), cache_ttl=0)
+        assert len(uncached["data"]) == 3
+        assert len(source.load_data(query, parameters=("data",))["data"]) == 1
+
+        assert source.invalidate(query) == 2
+        assert len(source.load_data(query, parameters=("web",))["data"]) == 3
+
+    def test_unpooled(self, database: str) -> None:
+        """Test that unpooled loads still work and leave no pool behind."""
+        source = DatabaseDataSource(database, pooled=False)
+        assert len(source.load_data("services")["data"]) == 3
+        assert database not in connection_pool._pools
+
+    def test_load_many_async(self, database: str) -> None:
+        """Test loading several queries concurrently."""
+        source = DatabaseDataSource(database)
+        results = asyncio.run(
+            source.load_many_async(
+                [
+                    "services",
+                    ("SELECT * FROM services WHERE tier = ?", {"parameters": ["data"]}),
+                    "missing",
+                ],
+                return_exceptions=True,
+            )
+        )
+        assert len(results[0]["data"]) == 3
+        assert results[1]["data"] == [{"name": "db", "tier": "data"}]
+        assert isinstance(results[2], DataSourceError)
+        with pytest.raises(DataSourceError):
+            asyncio.run(source.load_many_async(["missing"]))
@@ -0,0 +1,173 @@
+"""
+Unit tests for templates.search_index module.
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from diagramaid.templates import TemplateManager
+from diagramaid.templates.library import CommunityTemplates
+from diagramaid.templates.search_index import TemplateIndex, tokenize
+
+
+def _index() -> TemplateIndex:
+    index = TemplateIndex()
+    index.add(
+        "arch",
+        name="Software Architecture",
+        description="Services and databases",
+        diagram_type="flowchart",
+        tags=["architecture", "system"],
+        author="diagramaid",
+        source="builtin",
+    )
+    index.add(
+        "seq",
+        name="API Interaction Sequence",
+        description="Request flow between services",
+        diagram_type="sequence",
+        tags=["api"],
+        source="builtin",
+    )
+    index.add(
+        "flow",
+        name="Approval flow",
+        description="Business process",
+        diagram_type="flowchart",
+        tags=["process"],
+        author="someone",
+        source="custom",
+    )
+    return index
+
+
+@pytest.mark.unit
+class TestTemplateIndex:
+    """Unit tests for TemplateIndex class."""
+
+    def test_tokenize(self) -> None:
+        """Test splitting text into lower-case words."""
+        words = tokenize("API-Interaction_flow v2")
+        assert words == ["api", "interaction", "flow", "v2"]
+
+    def test_filters_and_name_order(self) -> None:
+        """Test facet filters with results ordered by name."""
+        index = _index()
+        assert index.search().items == ["seq", "flow", "arch"]
+        assert index.search(diagram_type="flowchart").items == ["flow", "arch"]
+        assert index.search(tags=["api", "process"]).items == ["seq", "flow"]
+        assert index.search(author="someone").items == ["flow"]
+        assert index.search(source=["builtin"], diagram_type="sequence").items == [
+            "seq"
+        ]
+        assert index.count("source", "builtin") == 2
+        assert index.values("diagram_type") == ["flowchart", "sequence"]
+
+    def test_ranked_search(self) -> None:
+        """Test that name matches rank above description matches."""
+        index = _index()
+        page = index.search("services")
+        assert page.items == ["seq", "arch"]
+        assert page.items == index.search("servi").items
+
+        page = index.search("flow")
+        assert page.items == ["flow", "seq"]
+        assert page.scores["flow"] > page.scores["seq"]
+        # Every query word must match
+        assert index.search("flow business").items == ["flow"]
+        assert index.search("flow nothing").items == []
+        assert index.search("flow", fields=["description"]).items == ["seq"]
+
+    def test_pagination(self) -> None:
+        """Test offset and limit for listings and ranked results."""
+        index = _index()
+        page = index.search(offset=1, limit=1)
+        assert (page.items, page.total) == (["flow"], 3)
+        page = index.search("s", limit=1)
+        assert (page.items, page.total) == (["seq"], 2)
+        assert index.search("s", offset=1).items == ["arch"]
+
+    def test_incremental_updates(self) -> None:
+        """Test that the index matches a rebuilt index after changes."""
+        rng = random.Random(3)
+        words = ["alpha", "beta", "gamma", "delta", "flow", "flowchart"]
+        index = TemplateIndex()
+        current: dict[str, dict[str, object]] = {}
+        for step in range(300):
+            key = f"t{rng.randrange(20)}"
+            if key in current and rng.random() < 0.4:
+                assert index.remove(key)
+                del current[key]
+                continue
+            fields = {
+                "name": " ".join(rng.sample(words, 2)) + f" {step}",
+                "description": " ".join(rng.sample(words, 3)),
+                "diagram_type": rng.choice(["flowchart", "sequence"]),
+                "tags": rng.sample(words, 1),
+            }
+            index.add(key, **fields)  # type: ignore[arg-type]
+            current[key] = fields
+
+        rebuilt = TemplateIndex()
+        for key, fields in current.items():
+            rebuilt.add(key, **fields)  # type: ignore[arg-type]
+        for query in (None, "flow", "fl", "beta gamma", "delta"):
+            for diagram_type in (None, "sequence"):
+                expected = rebuilt.search(query, diagram_type=diagram_type)
+                actual = index.search(query, diagram_type=diagram_type)
+                assert actual == expected
+        assert index._vocabulary == rebuilt._vocabulary
+        index.clear()
+        assert len(index) == 0
+        assert index.search("flow").items == []
+
+
+@pytest.mark.unit
+class TestTemplateSearch:
+    """Unit tests for template search through managers and libraries."""
+
+    def test_manager_index_follows_changes(self, tmp_path: Path) -> None:
+        """Test that created, updated and deleted templates are indexed."""
+        manager = TemplateManager(templates_dir=tmp_path)
+        assert manager.count_templates("builtin") == 5
+        template = manager.create_template(
+            name="Deployment pipeline",
+            diagram_type="flowchart",
+            template_content="flowchart LR\n    A --> B",
+            parameters={},
+            tags=["devops"],
+        )
+
+        assert manager.list_templates(tags=["devops"]) == [template]
+        assert manager.search_templates("pipe").items == [template]
+        assert manager.get_template_source(template.id) == "custom"
+
+        updated = manager.update_template(template.id, name="Release train")
+        assert manager.search_templates("pipeline").items == []
+        assert manager.search_templates("release", source="custom").items == [
+            updated
+        ]
+        manager.delete_template(template.id)
+        assert manager.search_templates("release").total == 0
+
+    def test_community_search(self) -> None:
+        """Test searching submitted community templates."""
+        community = CommunityTemplates()
+        for index in range(50):
+            community.submit_template(
+                {
+                    "name": f"Template {index}",
+                    "description": "Kanban board" if index % 10 == 0 else "Other",
+                    "diagram_type": "flowchart" if index % 2 else "kanban",
+                    "tags": ["agile"] if index % 5 == 0 else [],
+                }
+            )
+
+        results = community.search_templates("kanban")
+        assert [t["name"] for t in results] == [
+            f"Template {index}" for index in (0, 10, 20, 30, 40)
+        ]
+        assert len(community.search_templates(tags=["agile"], limit=3)) == 3
+        assert community.search_templates("kanban", diagram_type="flowchart") == []
@@ -3,6 +3,7 @@ Comprehensive tests for the template system.
 """
 
 import json
+import sqlite3
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -19,12 +20,25 @@ from diagramaid.templates import (
     Template,
     TemplateManager,
 )
+from diagramaid.templates import data_sources as data_sources_module
+from diagramaid.templates import template_manager as template_manager_module
 from diagramaid.templates.data_sources import (
     APIDataSource,
     CSVDataSource,
+    DatabaseDataSource,
     JSONDataSource,
+    aggregate_records,
+    filter_records,
+    group_records,
+    map_records,
+    records_to_columns,
 )
 from diagramaid.templates.schema import TemplateSchema, validate_template
+from diagramaid.templates.template_manager import (
+    MANIFEST_FILE,
+    SHARED_RELOAD_INTERVAL,
+    get_shared_manager,
+)
 
 
 class TestTemplateManager:
@@ -114,6 +128,139 @@ class TestTemplateManager:
             invalid_data = {"title": ""}  # Empty string violates minLength
             manager.generate(template.id, invalid_data)
 
+    def test_compiled_templates_cached(self, tmp_path: Path) -> None:
+        """Test that templates compile once and recompile after updates."""
+        manager = TemplateManager(templates_dir=tmp_path, auto_load_builtin=False)
+        template = manager.create_template(
+            name="cached",
+            diagram_type="flowchart",
+            template_content="flowchart TD\n    {{start}} --> B",
+            parameters={},
+        )
+
+        with patch.object(
+            manager._jinja_env, "compile", wraps=manager._jinja_env.compile
+        ) as compile_mock:
+            result = manager.generate("cached", {"start": "A"})
+            assert result == "flowchart TD\n    A --> B"
+            manager.generate(template.id, {"start": "C"})
+            assert compile_mock.call_count == 1
+
+            manager.update_template(
+                template.id, name="renamed", template_content="graph LR\n    {{start}}"
+            )
+            assert manager.generate("renamed", {"start": "D"}) == "graph LR\n    D"
+            assert compile_mock.call_count == 2
+
+        assert manager.get_template_by_name("cached") is None
+        assert manager.delete_template(template.id)
+        assert manager.get_template_by_name("renamed") is None
+        assert template.id not in manager._compiled
+        with pytest.raises(TemplateError):
+            manager.update_template("missing", name="x")
+
+    def test_bytecode_cache_shared(self, tmp_path: Path) -> None:
+        """Test that compiled code is reused by other managers."""
+        cache_dir = tmp_path / "bytecode"
+        first = TemplateManager(
+            templates_dir=tmp_path,
+            auto_load_builtin=False,
+            bytecode_cache_dir=cache_dir,
+        )
+        template = first.create_template(
+            name="shared",
+            diagram_type="flowchart",
+            template_content="flowchart TD\n    {{start}}",
+            parameters={},
+        )
+        first.generate(template.id, {"start": "A"})
+        assert list(cache_dir.iterdir())
+
+        second = TemplateManager(
+            templates_dir=tmp_path,
+            auto_load_builtin=False,
+            bytecode_cache_dir=cache_dir,
+        )
+        with patch.object(second._jinja_env, "compile") as compile_mock:
+            assert second.generate("shared", {"start": "B"}) == "flowchart TD\n    B"
+            compile_mock.assert_not_called()
+
+    def test_lazy_manifest_loading(self, tmp_path: Path) -> None:
+        """Test that templates load from the manifest without opening files."""
+        writer = TemplateManager(templates_dir=tmp_path, auto_load_builtin=False)
+        templates = [
+            writer.create_template(
+                name=f"lazy_{index}",
+                diagram_type="flowchart",
+                template_content=f"flowchart TD\n    {{{{start}}}} --> N{index}",
+                parameters={},
+            )
+            for index in range(3)
+        ]
+        writer.reload()
+        assert (tmp_path / MANIFEST_FILE).exists()
+
+        reader = TemplateManager(templates_dir=tmp_path, auto_load_builtin=False)
+        with patch(
+            "diagramaid.templates.template_manager.json.load", wraps=json.load
+        ) as load_mock:
+            template = reader.get_template_by_name("lazy_1")
+            assert template is not None
+            # Only the manifest was parsed
+            assert load_mock.call_count == 1
+            assert "template_content" not in template.__dict__
+            assert reader.generate("lazy_1", {"start": "A"}).endswith("A --> N1")
+            assert load_mock.call_count == 2
+        assert reader.get_template(templates[0].id).name == "lazy_0"
+
+    def test_reload_reads_changed_files(self, tmp_path: Path) -> None:
+        """Test that reloads only read new and changed template files."""
+        writer = TemplateManager(templates_dir=tmp_path, auto_load_builtin=False)
+        first, second = (
+            writer.create_template(
+                name=name,
+                diagram_type="flowchart",
+                template_content="flowchart TD\n    A",
+                parameters={},
+            )
+            for name in ("first", "second")
+        )
+        reader = TemplateManager(templates_dir=tmp_path, auto_load_builtin=False)
+        # No manifest yet: both files are read, then recorded in the manifest
+        assert reader.reload() == 2
+        assert reader.reload() == 0
+
+        writer.update_template(first.id, description="changed elsewhere")
+        writer.delete_template(second.id)
+        writer.create_template(
+            name="third",
+            diagram_type="flowchart",
+            template_content="flowchart TD\n    C",
+            parameters={},
+        )
+        assert reader.reload() == 2
+        assert reader.get_template(first.id).description == "changed elsewhere"
+        assert reader.get_template(second.id) is None
+        assert reader.get_template_by_name("third") is not None
+        fresh = TemplateManager(templates_dir=tmp_path, auto_load_builtin=False)
+        assert fresh.reload() == 0
+
+    def test_shared_manager(self, tmp_path: Path) -> None:
+        """Test that the shared manager is reused and rescans when stale."""
+        with patch.object(template_manager_module, "_shared_manager", None):
+            with patch.object(
+                template_manager_module.Path, "home", return_value=tmp_path
+            ):
+                shared = get_shared_manager()
+            assert get_shared_manager() is shared
+            shared.reload()
+            with patch.object(shared, "reload") as reload_mock:
+                get_shared_manager()
+                reload_mock.assert_not_called()
+                shared._last_scan -= SHARED_RELOAD_INTERVAL + 1
+                get_shared_manager()
+                reload_mock.assert_called_once()
+
 
 class TestTemplate:
     """Test Template class functionality."""
@@ -240,7 +387,7 @@ class TestDataSources:
         finally:
             Path(temp_path).unlink()
 
-    @patch("diagramaid.templates.data_sources.requests.request")
+    @patch("diagramaid.templates.data_sources.requests.Session.request")
     def test_api_data_source(self, mock_get: Any) -> None:
         """Test API data source."""
         mock_response = Mock()
@@ -268,6 +415,127 @@ class TestDataSources:
             source.load_data("/non/existent/file.json")
 
 
+class TestStreamingDataSources:
+    """Test chunked reading of data sources and the streaming operators."""
+
+    def test_csv_chunks(self, tmp_path: Path) -> None:
+        """Test streaming CSV rows with filters and mapping."""
+        path = tmp_path / "nodes.csv"
+        path.write_text(
+            "id,kind\n" + "".join(f"n{i},{'a' if i % 2 else 'b'}\n" for i in range(25))
+        )
+        source = CSVDataSource()
+
+        chunks = list(source.iter_records(str(path), chunk_size=10))
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert chunks[0][0] == {"id": "n0", "kind": "b"}
+
+        rows = list(
+            source.stream(str(path), filters={"kind": "a"}, mapping={"node": "id"})
+        )
+        assert rows[:2] == [{"node": "n1"}, {"node": "n3"}]
+        assert len(rows) == 12
+        columns = source.load_data(str(path), structure="columns")
+        assert columns["id"][-1] == "n24"
+        with pytest.raises(DataSourceError):
+            list(source.iter_records(str(tmp_path / "missing.csv")))
+
+    def test_json_array_decoded_incrementally(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test streaming a top-level array across small read blocks."""
+        monkeypatch.setattr(data_sources_module, "_JSON_BLOCK_SIZE", 7)
+        items = [
+            {"id": i, "label": f"Node {i}", "meta": {"tags": ["x", "y"]}, "w": 12345}
+            for i in range(40)
+        ]
+        path = tmp_path / "nodes.json"
+        path.write_text(json.dumps(items, indent=1))
+        source = JSONDataSource()
+
+        assert list(source.stream(str(path))) == items
+        chunks = list(
+            source.iter_records(str(path), chunk_size=3, mapping={"tag": "meta.tags"})
+        )
+        assert len(chunks) == 14
+        assert chunks[0][0] == {"tag": ["x", "y"]}
+        assert list(source.stream(str(path), filters={"id": 7})) == [items[7]]
+
+        path.write_text("[]")
+        assert list(source.stream(str(path))) == []
+        path.write_text('[1, 2 3]')
+        with pytest.raises(DataSourceError):
+            list(source.stream(str(path)))
+
+    def test_json_lines_and_paths(self, tmp_path: Path) -> None:
+        """Test JSON Lines files and lists nested in documents."""
+        lines = tmp_path / "edges.jsonl"
+        lines.write_text('{"from": "A", "to": "B"}\n\n{"from": "B", "to": "C"}\n')
+        document = tmp_path / "graph.json"
+        document.write_text(json.dumps({"graph": {"edges": [{"from": "A"}]}}))
+        source = JSONDataSource()
+
+        assert [edge["to"] for edge in source.stream(str(lines))] == ["B", "C"]
+        assert list(source.stream(str(document), path="graph.edges")) == [
+            {"from": "A"}
+        ]
+        assert list(source.stream(str(document), path="graph.nodes")) == []
+
+    def test_database_fetches_in_chunks(self, tmp_path: Path) -> None:
+        """Test streaming query results with fetchmany."""
+        database = str(tmp_path / "graph.db")
+        with sqlite3.connect(database) as conn:
+            conn.execute("CREATE TABLE edges (src TEXT, dst TEXT, kind TEXT)")
+            conn.executemany(
+                "INSERT INTO edges VALUES (?, ?, ?)",
+                [(f"n{i}", f"n{i + 1}", "call" if i % 3 else "data") for i in range(9)],
+            )
+        conn.close()
+        source = DatabaseDataSource(database)
+
+        chunks = list(source.iter_records("edges", chunk_size=4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+        rows = list(
+            source.stream(
+                "SELECT * FROM edges WHERE kind = ?",
+                parameters=("data",),
+                transform={"rename_columns": {"src": "from", "dst": "to"}},
+            )
+        )
+        assert rows == [
+            {"from": f"n{i}", "to": f"n{i + 1}", "kind": "data"} for i in (0, 3, 6)
+        ]
+        assert source.load_data("edges")["data"][0]["src"] == "n0"
+        with pytest.raises(DataSourceError):
+            list(source.iter_records("missing_table"))
+
+    def test_streaming_operators(self) -> None:
+        """Test the lazy filter, map, group and aggregate operators."""
+        records = [
+            {"team": "a", "size": 2, "info": {"owner": "x"}},
+            {"team": "a", "size": 3},
+            {"team": "b", "size": 5, "info": {"owner": "y"}},
+        ]
+
+        assert list(filter_records(iter(records), {"team": "b"})) == [records[2]]
+        assert len(list(filter_records(records, lambda r: r["size"] > 2))) == 2
+        assert list(map_records(records, {"owner": "info.owner"})) == [
+            {"owner": "x"},
+            {},
+            {"owner": "y"},
+        ]
+        groups = group_records(records, "team")
+        assert [(team, len(group)) for team, group in groups] == [("a", 2), ("b", 1)]
+        assert aggregate_records(
+            iter(records), "team", lambda total, r: total + r["size"]
+        ) == {"a": 5, "b": 5}
+        assert records_to_columns(iter(records), ["team", "info"]) == {
+            "team": ["a", "a", "b"],
+            "info": [{"owner": "x"}, None, {"owner": "y"}],
+        }
+        assert records_to_columns([]) == {}
+
+
 class TestTemplateGenerators:
     """Test template generator classes."""
 
@@ -295,6 +563,46 @@ class TestTemplateGenerators:
         assert "Process" in result
         assert "End" in result
 
+    @pytest.mark.parametrize(
+        ("style", "arrow"),
+        [("solid", "-->"), ("dotted", "-.-"), ("thick", "==>"), ("invisible", "~~~")],
+    )
+    def test_flowchart_generator_edge_styles(self, style: str, arrow: str) -> None:
+        """Test that each edge style keeps its arrow, with or without a label."""
+        generator = FlowchartGenerator()
+
+        result = generator.generate(
+            {
+                "nodes": [{"id": "check", "label": "OK?", "shape": "diamond"}],
+                "edges": [
+                    {"from": "check", "to": "done", "label": "yes", "style": style},
+                    {"from": "check", "to": "retry", "style": style},
+                ],
+            }
+        )
+
+        assert result.splitlines() == [
+            "flowchart TD",
+            "    check{OK?}",
+            "",
+            f"    check {arrow}|yes| done",
+            f"    check {arrow} retry",
+        ]
+
+    def test_flowchart_generator_streams_edges(self, tmp_path: Path) -> None:
+        """Test generating a flowchart from streamed records."""
+        path = tmp_path / "edges.csv"
+        path.write_text("from,to\n" + "".join(f"n{i},n{i + 1}\n" for i in range(7)))
+        expected = FlowchartGenerator().generate(
+            {"nodes": [], "edges": CSVDataSource().load_data(str(path))["data"]}
+        )
+
+        result = FlowchartGenerator().generate(
+            {"nodes": iter([]), "edges": CSVDataSource().stream(str(path))}
+        )
+        assert result == expected
+        assert result.count("-->") == 7
+
     def test_sequence_generator(self) -> None:
         """Test SequenceGenerator."""
         generator = SequenceGenerator()
@@ -411,3 +411,37 @@ class TestCLIOutputFormatting:
                 mock_render.assert_called_once()
                 args, kwargs = mock_render.call_args
                 assert kwargs.get("theme") == "dark"
+
+
+class TestCLIServe:
+    """Test the render service subcommand."""
+
+    def test_serve_options_passed(self) -> None:
+        """Test that serve options configure the render service."""
+        with patch.object(
+            sys,
+            "argv",
+            [
+                "diagramaid",
+                "serve",
+                "--port",
+                "9000",
+                "--workers",
+                "2",
+                "--queue-size",
+                "8",
+                "--renderer",
+                "nodejs",
+            ],
+        ):
+            with patch(
+                "diagramaid.interactive.server.render_service.start_render_service"
+            ) as mock_start:
+                result = main()
+
+        assert result == 0
+        kwargs = mock_start.call_args.kwargs
+        assert kwargs["port"] == 9000
+        assert kwargs["max_workers"] == 2
+        assert kwargs["max_queue"] == 8
+        assert kwargs["renderers"] == ["nodejs"]
@@ -8,7 +8,12 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from diagramaid.core import MermaidConfig, MermaidRenderer, MermaidTheme
+from diagramaid.core import (
+    MermaidConfig,
+    MermaidRenderer,
+    MermaidTheme,
+    iter_text_chunks,
+)
 from diagramaid.exceptions import (
     ConfigurationError,
     RenderingError,
@@ -432,3 +437,63 @@ class TestMermaidDiagram:
             # Note: The actual result depends on the validator implementation
             # We're testing that the method can be called without error
             assert isinstance(result, bool)
+
+    def test_iter_mermaid_matches_to_mermaid(self) -> None:
+        """Test that streamed chunks join to the same text as to_mermaid()."""
+        from diagramaid.models import FlowchartDiagram, MindmapDiagram
+
+        flowchart = FlowchartDiagram()
+        flowchart.add_nodes((f"N{i}", f"Node {i}") for i in range(500))
+        flowchart.add_edges((f"N{i}", f"N{i + 1}") for i in range(499))
+        chunks = list(flowchart.iter_mermaid(chunk_size=1000))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) < 1100 for chunk in chunks)
+        assert "".join(chunks) == flowchart.to_mermaid()
+
+        # Once assembled, the cached text is handed out as a single chunk
+        assert list(flowchart.iter_mermaid()) == [flowchart.to_mermaid()]
+
+        mindmap = MindmapDiagram(root_text="Root")
+        mindmap.add_node("root", "a", "A", shape="circle")
+        assert "".join(mindmap.iter_mermaid(chunk_size=4)) == mindmap.to_mermaid()
+
+    def test_iter_mermaid_after_mutation(self, sample_flowchart: Any) -> None:
+        """Test that streaming re-emits fragments changed since the last call."""
+        sample_flowchart.to_mermaid()
+        sample_flowchart.nodes["B"].label = "Work"
+
+        assert "B[Work]" in "".join(sample_flowchart.iter_mermaid())
+        assert "B[Work]" in sample_flowchart.to_mermaid()
+
+    def test_write_mermaid(self, sample_flowchart: Any) -> None:
+        """Test writing to text streams, binary streams and sockets."""
+        import io
+        import socket
+
+        sample_flowchart.add_node("D", "Überprüfung")
+        expected = sample_flowchart.to_mermaid()
+        sample_flowchart.clear_cache()
+
+        text = io.StringIO()
+        assert sample_flowchart.write_mermaid(text) == len(expected)
+        assert text.getvalue() == expected
+
+        binary = io.BytesIO()
+        assert sample_flowchart.write_mermaid(binary) == len(expected.encode())
+        assert binary.getvalue().decode("utf-8") == expected
+
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            sample_flowchart.write_mermaid(sender)
+            sender.shutdown(socket.SHUT_WR)
+            received = b"".join(iter(lambda: receiver.recv(4096), b""))
+        assert received.decode("utf-8") == expected
+
+    def test_iter_text_chunks(self) -> None:
+        """Test chunk boundaries of the line joiner."""
+        lines = ["a" * 3, "b" * 3, "c" * 3]
+
+        assert list(iter_text_chunks([])) == []
+        assert list(iter_text_chunks(lines, chunk_size=8)) == ["aaa\nbbb", "\nccc"]
+        assert "".join(iter_text_chunks(lines, chunk_size=1)) == "\n".join(lines)